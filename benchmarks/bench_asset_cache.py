@@ -0,0 +1,96 @@
+"""Benchmark: cached menu icons vs. loading and scaling them every frame.
+
+Draws the example-menu icons (the ``icon`` of every preset in
+``savefile/default``) at ``--size`` pixels plus the settings button icon
+(``static/settings.png`` at 42 pixels) onto a hidden display for
+``--frames`` frames:
+
+* ``load``  -- ``pygame.image.load``, ``convert_alpha`` and ``smoothscale``
+  every icon every frame, as ``Option.draw`` did (``SettingsButton.draw``
+  loaded once but scaled every frame);
+* ``cache`` -- ``assets.scaled``, which reads and scales each icon once.
+
+A second table times the startup: how long the first frame waits with and
+without ``AssetCache.preload`` having read the files in the background
+(converting and scaling still happen on the first frame).
+
+Usage::
+
+    python -m benchmarks.bench_asset_cache [--size 24] [--frames 60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import time
+
+import pygame
+
+from source.basic import AssetCache
+
+SETTINGS_ICON = "static/settings.png"
+
+
+def icon_sizes(size: int) -> dict[str, list[tuple[int, int]]]:
+    sizes = {SETTINGS_ICON: [(42, 42)]}
+    for path in sorted(glob.glob("savefile/default/*.json")):
+        with open(path, encoding="utf-8") as file:
+            icon = json.load(file).get("icon")
+        if icon:
+            sizes.setdefault(icon, []).append((size, size))
+    return sizes
+
+
+def draw_frame(screen: pygame.Surface, sizes: dict, cache: AssetCache | None,
+               settings: pygame.Surface | None = None) -> None:
+    for path, targets in sizes.items():
+        for target in targets:
+            if cache is None:
+                icon = settings if path == SETTINGS_ICON else pygame.image.load(path).convert_alpha()
+                icon = pygame.transform.smoothscale(icon, target)
+            else:
+                icon = cache.scaled(path, target)
+            screen.blit(icon, (0, 0))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=24)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    # convert_alpha needs a display; a hidden one is enough
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((1024, 768))
+    sizes = icon_sizes(args.size)
+
+    settings = pygame.image.load(SETTINGS_ICON).convert_alpha()
+
+    print(f"{'mode':>6} {'ms/frame':>9} {'disk reads':>11}")
+    for mode in ("load", "cache"):
+        cache = AssetCache() if mode == "cache" else None
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            draw_frame(screen, sizes, cache, settings)
+        ms = (time.perf_counter() - start) * 1000 / args.frames
+        reads = cache.loads if cache else args.frames * (len(sizes) - 1)
+        print(f"{mode:>6} {ms:>9.2f} {reads:>11}")
+
+    print()
+    print(f"{'startup':>10} {'first frame ms':>15}")
+    for preload in (False, True):
+        cache = AssetCache()
+        if preload:
+            cache.preload(list(sizes)).join()  # in the game this overlaps the rest of startup
+        start = time.perf_counter()
+        draw_frame(screen, sizes, cache)
+        label = "preload" if preload else "cold"
+        print(f"{label:>10} {(time.perf_counter() - start) * 1000:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: Barnes--Hut vs. direct-sum gravity.
+
+For each body count, times one full force evaluation with the exact
+direct sum and with the quadtree at several opening angles, and reports
+the tree's relative force error so a suitable ``theta`` can be chosen.
+
+Usage::
+
+    python -m benchmarks.bench_barnes_hut [--sizes 100 1000 5000]
+                                          [--thetas 0.3 0.5 0.8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2, ZERO
+from source.physics.barnes_hut import (
+    BarnesHutTree,
+    direct_gravitation_forces,
+    gravitation_force_error,
+)
+
+
+def make_disc(n: int, seed: int = 0) -> list[Ball]:
+    """A heavy central body plus ``n - 1`` light bodies in a disc."""
+    rng = random.Random(seed)
+    balls = [Ball(Vector2(0, 0), 50, pygame.Color("yellow"), 1e4, ZERO, [],
+                  gravitation=True)]
+    for _ in range(n - 1):
+        r = rng.uniform(200, 5e4)
+        t = rng.uniform(0, 6.2832)
+        balls.append(
+            Ball(Vector2(r * math.cos(t), r * math.sin(t)),
+                 2, pygame.Color("white"), rng.uniform(0.1, 10), ZERO, [],
+                 gravitation=True)
+        )
+    return balls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--thetas", type=float, nargs="+", default=[0.3, 0.5, 0.8])
+    args = parser.parse_args()
+
+    print(f"{'bodies':>7} {'solver':>10} {'ms/eval':>9} {'mean err':>9} {'max err':>9}")
+    for n in args.sizes:
+        balls = make_disc(n)
+
+        start = time.perf_counter()
+        direct_gravitation_forces(balls)
+        direct_ms = (time.perf_counter() - start) * 1e3
+        print(f"{n:>7} {'direct':>10} {direct_ms:>9.1f} {'-':>9} {'-':>9}")
+
+        for theta in args.thetas:
+            start = time.perf_counter()
+            BarnesHutTree(balls, theta).forces()
+            tree_ms = (time.perf_counter() - start) * 1e3
+            err = gravitation_force_error(balls, theta)
+            print(f"{n:>7} {f'bh θ={theta}':>10} {tree_ms:>9.1f} "
+                  f"{err['mean']:>9.2e} {err['max']:>9.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark: block timesteps vs. one global step for celestial orbits.
+
+Builds a sun with ``--planets`` planets on circular orbits, each with
+``--moons`` close moons, and runs ``--duration`` simulated seconds at
+``--hz`` physics steps per second in three modes:
+
+* ``legacy`` -- what ``Game.physicsStep`` does in celestial mode without
+  block timesteps: ``Ball.update`` with last step's forces, then one
+  all-pairs gravity pass per step;
+* ``shared`` -- ``BlockTimestepIntegrator`` with one adaptive global step,
+  the finest any ball needs;
+* ``block``  -- ``BlockTimestepIntegrator`` with a level per ball.
+
+The table reports milliseconds per physics step, force evaluations (one
+ball's pull from all others) per step, the relative drift of total energy
+at the end, and the worst relative change of any moon's distance from its
+planet seen during the run (both ``nan`` if a moon escaped).
+
+Usage::
+
+    python -m benchmarks.bench_block_timesteps [--planets 4] [--moons 3]
+                                               [--duration 2] [--hz 120]
+                                               [--speed 1] [--eta 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2, gravityFactor
+from source.physics.block_timestep import BlockTimestepIntegrator
+from source.physics.engine import PhysicsEngine
+
+# Game.physicsStep uses twice the constant (every pair is visited twice)
+G = 2 * gravityFactor
+SUN_MASS = 1e6
+PLANET_MASS = 1e4
+
+
+def make_ball(x: float, y: float, vx: float, vy: float, mass: float, radius: float) -> Ball:
+    return Ball(Vector2(x, y), radius, pygame.Color("white"), mass, Vector2(vx, vy), [],
+                gravity=0, gravitation=True)
+
+
+def make_scene(planets: int, moons: int) -> tuple[list[Ball], list[tuple[Ball, Ball, float]]]:
+    """Balls, and (moon, planet, initial distance) for every moon."""
+    balls = [make_ball(0, 0, 0, 0, SUN_MASS, 200)]
+    pairs: list[tuple[Ball, Ball, float]] = []
+    for p in range(planets):
+        radius = 3000 * 1.6 ** p
+        angle = 2.4 * p
+        speed = math.sqrt(G * SUN_MASS / radius)
+        cx, cy = radius * math.cos(angle), radius * math.sin(angle)
+        vx, vy = -speed * math.sin(angle), speed * math.cos(angle)
+        planet = make_ball(cx, cy, vx, vy, PLANET_MASS, 40)
+        balls.append(planet)
+        for m in range(moons):
+            distance = 40 + 20 * m
+            phase = 2.1 * m + p
+            orbital = math.sqrt(G * PLANET_MASS / distance)
+            moon = make_ball(
+                cx + distance * math.cos(phase), cy + distance * math.sin(phase),
+                vx - orbital * math.sin(phase), vy + orbital * math.cos(phase), 1, 5,
+            )
+            balls.append(moon)
+            pairs.append((moon, planet, distance))
+    return balls, pairs
+
+
+def energy(balls: list[Ball]) -> float:
+    kinetic = sum(0.5 * b.mass * (b.velocity.x ** 2 + b.velocity.y ** 2) for b in balls)
+    potential = 0.0
+    for i, a in enumerate(balls):
+        for b in balls[i + 1:]:
+            potential -= G * a.mass * b.mass / max(a.position.distance(b.position), 1)
+    return kinetic + potential
+
+
+def legacy_step(engine: PhysicsEngine, balls: list[Ball], dt: float) -> None:
+    for ball in balls:
+        ball.update(dt)
+    for ball in balls:
+        ball.resetForce(True)
+    engine.apply_field_forces(G, 0)
+
+
+def run(mode: str, args: argparse.Namespace) -> tuple[float, float, float, float]:
+    """Return (ms per step, evaluations per step, energy drift, worst moon error)."""
+    balls, pairs = make_scene(args.planets, args.moons)
+    engine = PhysicsEngine([{"type": "ball"}])
+    engine.current_elements["ball"].extend(balls)
+    integrator = BlockTimestepIntegrator(eta=args.eta, shared=mode == "shared")
+    if mode == "legacy":
+        engine.apply_field_forces(G, 0)
+
+    e0 = energy(balls)
+    dt = args.speed / args.hz
+    steps = round(args.duration * args.hz)
+    elapsed = 0.0
+    evaluations = 0
+    worst = 0.0
+    for _ in range(steps):
+        start = time.perf_counter()
+        if mode == "legacy":
+            legacy_step(engine, balls, dt)
+            evaluations += len(balls)
+        else:
+            evaluations += integrator.step(balls, dt, G)
+        elapsed += time.perf_counter() - start
+        for moon, planet, distance in pairs:
+            error = abs(moon.position.distance(planet.position) - distance) / distance
+            worst = max(worst, error)
+    if worst > 1:
+        return elapsed * 1000 / steps, evaluations / steps, math.nan, math.nan
+    return elapsed * 1000 / steps, evaluations / steps, (energy(balls) - e0) / abs(e0), worst
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--planets", type=int, default=4)
+    parser.add_argument("--moons", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--hz", type=int, default=120)
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--eta", type=float, default=BlockTimestepIntegrator.eta)
+    args = parser.parse_args()
+
+    n = 1 + args.planets * (1 + args.moons)
+    print(f"{n} balls, speed {args.speed}x")
+    print(f"{'mode':>7} {'ms/step':>8} {'evals/step':>11} {'energy drift':>13} {'moon err':>9}")
+    for mode in ("legacy", "shared", "block"):
+        ms, evaluations, drift, worst = run(mode, args)
+        print(f"{mode:>7} {ms:>8.2f} {evaluations:>11.1f} {drift:>13.2e} {worst:>9.2e}")
+
+
+if __name__ == "__main__":
+    main()
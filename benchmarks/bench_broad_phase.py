@@ -0,0 +1,83 @@
+"""Benchmark: ball--ball broad phase (uniform grid vs. brute force).
+
+Reports candidate pair tests per frame and physics steps per second for a
+box of randomly placed, similarly-sized balls (a ``zhachi.json``-style
+pile).  Each step runs the engine's ball--ball collision pass followed by
+``Ball.update``.
+
+Usage::
+
+    python -m benchmarks.bench_broad_phase [--sizes 100 1000 10000]
+                                           [--steps 5] [--max-brute 1000]
+
+Brute force is skipped above ``--max-brute`` balls (its pair count is
+reported analytically) because a single 10k-ball frame takes minutes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2, ZERO
+from source.physics.engine import PhysicsEngine
+
+
+def make_scene(n: int, radius: float = 5.0, seed: int = 0) -> list[Ball]:
+    """``n`` balls in a square box at ~30% area coverage."""
+    rng = random.Random(seed)
+    side = (n * 3.1416 * radius * radius / 0.3) ** 0.5
+    return [
+        Ball(
+            Vector2(rng.uniform(0, side), rng.uniform(0, side)),
+            radius,
+            pygame.Color("red"),
+            1,
+            Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50)),
+            [],
+            gravity=0,
+        )
+        for _ in range(n)
+    ]
+
+
+def run(n: int, broad_phase: str, steps: int) -> tuple[int, float]:
+    """Return (pair tests per frame, steps per second)."""
+    engine = PhysicsEngine([{"type": "ball"}], broad_phase=broad_phase)
+    balls = make_scene(n)
+    engine.current_elements["ball"].extend(balls)
+
+    pair_tests = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        engine.resolve_ball_collisions()
+        pair_tests += engine.broad_phase.pair_tests
+        for ball in balls:
+            ball.update(1 / 120)
+    elapsed = time.perf_counter() - start
+    return pair_tests // steps, steps / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[100, 1000, 10000])
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--max-brute", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'balls':>7} {'phase':>6} {'pair tests/frame':>17} {'steps/s':>9}")
+    for n in args.sizes:
+        for name in ("brute", "grid"):
+            if name == "brute" and n > args.max_brute:
+                print(f"{n:>7} {name:>6} {n * (n - 1) // 2:>17} {'skipped':>9}")
+                continue
+            tests, sps = run(n, name, args.steps)
+            print(f"{n:>7} {name:>6} {tests:>17} {sps:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
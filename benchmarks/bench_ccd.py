@@ -0,0 +1,134 @@
+"""Benchmark: continuous collision vs. substepping for fast balls.
+
+Fires balls horizontally at a thin vertical wall, with gravity on, and
+compares three ways of advancing them at 120 Hz:
+
+* ``legacy`` -- one ``Ball.update`` per step (equivalent to the old ten
+  fixed internal substeps), with contacts checked only at the end.
+* ``cfl``    -- ``PhysicsEngine.update_ball`` with CFL substeps and
+  contacts resolved after each substep (``continuous_collision`` off).
+* ``ccd``    -- ``update_ball`` with swept time-of-impact contacts.
+
+Each step is followed by the usual discrete wall pass, as in
+``Game.physicsStep``.  Gravity does not change the horizontal motion, so
+the exact ``x`` after one elastic bounce is known.  The table reports:
+
+* integrations per ball per step (legacy always pays ten);
+* the number of balls that tunnelled through the wall;
+* the mean and maximum ``x`` error against the exact bounce.
+
+Scenes mimic ``flatToss.json`` (radius 3, 4.2-wide plank) and
+``basketball.json`` (radius 5, 1.8-wide rim).
+
+Usage::
+
+    python -m benchmarks.bench_ccd [--speeds 300 1000 3000 10000]
+                                   [--trials 50] [--duration 0.25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2, Wall
+from source.basic.ball import LEGACY_SUBSTEPS
+from source.physics.engine import PhysicsEngine
+
+SCENES = {
+    "flatToss": (3.0, 4.2),
+    "basketball": (5.0, 1.8),
+}
+WALL_X = 0.0
+HZ = 120
+
+
+def make_engine(thickness: float, continuous: bool) -> PhysicsEngine:
+    engine = PhysicsEngine([{"type": "ball"}, {"type": "wall"}])
+    engine.current_elements["wall"].append(
+        Wall(
+            [
+                Vector2(WALL_X, -1e4),
+                Vector2(WALL_X + thickness, -1e4),
+                Vector2(WALL_X + thickness, 1e4),
+                Vector2(WALL_X, 1e4),
+            ],
+            pygame.Color("blue"),
+        )
+    )
+    engine.continuous_collision = continuous
+    return engine
+
+
+def exact_x(x0: float, vx: float, radius: float, t: float) -> float:
+    """``x`` after ``t`` seconds with one elastic bounce off the wall face."""
+    face = WALL_X - radius
+    x = x0 + vx * t
+    return 2 * face - x if x > face else x
+
+
+def run(
+    scene: str, mode: str, speed: float, trials: int, duration: float, seed: int = 0
+) -> tuple[float, int, float, float, float]:
+    """Return (integrations/step, tunnelled, mean err, max err, seconds)."""
+    radius, thickness = SCENES[scene]
+    engine = make_engine(thickness, continuous=(mode == "ccd"))
+    wall_thickness = engine.min_wall_thickness(include_floor=False)
+    steps = round(duration * HZ)
+    dt = 1 / HZ
+    rng = random.Random(seed)
+
+    integrations = tunnelled = 0
+    errors: list[float] = []
+    start = time.perf_counter()
+    for _ in range(trials):
+        x0 = WALL_X - radius - rng.uniform(0.1, 0.9) * speed * duration
+        ball = Ball(Vector2(x0, 0), radius, pygame.Color("red"), 1,
+                    Vector2(speed, 0), [], gravity=1)
+        for _ in range(steps):
+            if mode == "legacy":
+                ball.update(dt)
+                integrations += LEGACY_SUBSTEPS
+            else:
+                integrations += engine.update_ball(
+                    ball, dt, wall_thickness, include_floor=False
+                )
+            engine.resolve_ball_wall_contacts(ball, include_floor=False)
+
+        if ball.position.x > WALL_X:
+            tunnelled += 1
+        else:
+            errors.append(abs(ball.position.x - exact_x(x0, speed, radius, steps * dt)))
+    elapsed = time.perf_counter() - start
+
+    mean = sum(errors) / len(errors) if errors else float("nan")
+    worst = max(errors) if errors else float("nan")
+    return integrations / (trials * steps), tunnelled, mean, worst, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speeds", type=float, nargs="+",
+                        default=[300, 1000, 3000, 10000])
+    parser.add_argument("--trials", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=0.25)
+    args = parser.parse_args()
+
+    print(f"{'scene':>10} {'speed':>7} {'mode':>6} {'integ/step':>10} "
+          f"{'tunnelled':>9} {'mean err':>9} {'max err':>9} {'ms':>7}")
+    for scene in SCENES:
+        for speed in args.speeds:
+            for mode in ("legacy", "cfl", "ccd"):
+                per_step, tunnelled, mean, worst, elapsed = run(
+                    scene, mode, speed, args.trials, args.duration
+                )
+                print(f"{scene:>10} {speed:>7.0f} {mode:>6} {per_step:>10.2f} "
+                      f"{tunnelled:>5}/{args.trials:<3} {mean:>9.3f} "
+                      f"{worst:>9.3f} {elapsed * 1000:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Benchmark: XPBD constraints vs. the legacy stiff-spring rods and ropes.
+
+Two scenes hang from a wall anchor and are released horizontally with
+gravity on:
+
+* ``pendulum`` -- one ball on a rope, as in ``simplePendulum.json``;
+* ``chain``    -- ``--links`` balls joined by rods.
+
+Each step follows ``Game.physicsStep`` in ground mode: two half-step
+integration passes.  ``force`` runs ``Rope/Rod.calculateForce`` between
+balls, as before; ``xpbd`` runs ``PhysicsEngine.solve_constraints`` after
+each pass.  The table reports, per physics rate:
+
+* milliseconds per step;
+* the worst relative length error of any rod (either sign) or rope
+  (stretch only) seen during the run;
+* the drift of total mechanical energy at the end, relative to
+  ``Σ m g r`` with ``r`` each ball's initial distance from the anchor
+  (``nan`` once the scene has blown up).
+
+Usage::
+
+    python -m benchmarks.bench_constraints [--links 20] [--duration 5]
+                                           [--hz 120 60 30] [--iterations 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import pygame
+
+from source.basic import Ball, Rod, Rope, Vector2, Wall, WallPosition
+from source.physics.engine import PhysicsEngine
+
+LINK = 20.0
+
+
+def make_scene(scene: str, links: int) -> PhysicsEngine:
+    engine = PhysicsEngine(
+        [{"type": "ball"}, {"type": "wall"}, {"type": "rope"}, {"type": "rod"}]
+    )
+    elements = engine.current_elements
+    wall = Wall([Vector2(-10, -10), Vector2(10, -10), Vector2(10, 0), Vector2(-10, 0)],
+                pygame.Color("blue"))
+    elements["wall"].append(wall)
+    elements["all"].append(wall)
+    anchor = WallPosition(wall, Vector2(0, 0))
+
+    count = 1 if scene == "pendulum" else links
+    length = 57.0 if scene == "pendulum" else LINK
+    previous: Ball | WallPosition = anchor
+    for i in range(count):
+        ball = Ball(Vector2(length * (i + 1), 0), 3, pygame.Color("red"), 1, Vector2(0, 0), [],
+                    gravity=1)
+        elements["ball"].append(ball)
+        elements["all"].append(ball)
+        if scene == "pendulum":
+            link = Rope(previous, ball, length, 2, pygame.Color("black"))
+            elements["rope"].append(link)
+        else:
+            link = Rod(previous, ball, length, 2, pygame.Color("black"))
+            elements["rod"].append(link)
+        elements["all"].append(link)
+        previous = ball
+    return engine
+
+
+def energy_scale(engine: PhysicsEngine) -> float:
+    """``Σ m g r``; the anchor is at the origin."""
+    return sum(b.mass * 98.6 * b.gravity * abs(b.position) for b in engine.current_elements["ball"])
+
+
+def energy(engine: PhysicsEngine) -> float:
+    return sum(
+        0.5 * b.mass * (b.velocity.x ** 2 + b.velocity.y ** 2) - b.mass * 98.6 * b.gravity * b.position.y
+        for b in engine.current_elements["ball"]
+    )
+
+
+def length_error(engine: PhysicsEngine) -> float:
+    worst = 0.0
+    for rod in engine.current_elements["rod"]:
+        current = rod.start.getPosition().distance(rod.end.getPosition())
+        worst = max(worst, abs(current - rod.restLength) / rod.restLength)
+    for rope in engine.current_elements["rope"]:
+        worst = max(worst, (rope.getCurrentLength() - rope.length) / rope.length)
+    return worst
+
+
+def step(engine: PhysicsEngine, dt: float, xpbd: bool) -> None:
+    """One ``Game.physicsStep`` (ground mode) without collisions."""
+    elements = engine.current_elements
+    if not xpbd:
+        for rope in elements["rope"]:
+            rope.calculateForce()
+    for _ in range(2):
+        for element in elements["all"]:
+            if element.type == "ball":
+                engine.update_ball(element, dt / 2, include_floor=False)
+            elif element.type in ("rod", "rope") and not xpbd:
+                element.update(dt / 2)
+        if xpbd:
+            engine.solve_constraints(dt / 2)
+        for ball in elements["ball"]:
+            ball.resetForce(True)
+
+
+def run(scene: str, mode: str, hz: int, links: int, duration: float,
+        iterations: int) -> tuple[float, float, float]:
+    """Return (ms per step, worst length error, final energy drift)."""
+    engine = make_scene(scene, links)
+    engine.position_based_constraints = mode == "xpbd"
+    engine.constraint_solver.iterations = iterations
+    e0, scale = energy(engine), energy_scale(engine)
+    steps = round(duration * hz)
+    worst = 0.0
+    elapsed = 0.0
+    for _ in range(steps):
+        start = time.perf_counter()
+        step(engine, 1 / hz, mode == "xpbd")
+        elapsed += time.perf_counter() - start
+        error = length_error(engine)
+        if not math.isfinite(error) or error > 10:
+            return elapsed * 1000 / steps, math.inf, math.nan
+        worst = max(worst, error)
+    return elapsed * 1000 / steps, worst, (energy(engine) - e0) / scale
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--hz", type=int, nargs="+", default=[120, 60, 30])
+    parser.add_argument("--iterations", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'scene':>9} {'hz':>4} {'mode':>6} {'ms/step':>8} "
+          f"{'max len err':>12} {'energy drift':>13}")
+    for scene in ("pendulum", "chain"):
+        for hz in args.hz:
+            for mode in ("force", "xpbd"):
+                ms, error, drift = run(scene, mode, hz, args.links, args.duration,
+                                       args.iterations)
+                print(f"{scene:>9} {hz:>4} {mode:>6} {ms:>8.3f} "
+                      f"{error:>12.2e} {drift:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
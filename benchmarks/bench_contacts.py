@@ -0,0 +1,125 @@
+"""Benchmark: persistent warm-started contacts vs. Ball.reboundByBall.
+
+Drops balls onto the floor with gravity on and steps them until every
+ball is asleep (or ``--duration`` simulated seconds have passed):
+
+* ``column``  -- ``--count`` balls stacked vertically, barely touching;
+* ``grid``    -- ``--rows`` rows of ``--width`` balls in square packing,
+  a block of touching columns.
+
+Each step follows ``Game.physicsStep`` in ground mode: a half-step
+integration pass, the ball--ball pass, the floor, a second half-step
+pass, then islands and sleep states.  ``rebound`` resolves each touching
+pair with ``Ball.reboundByBall``; ``cache`` hands them all to
+``ContactCache`` with warm starting, and ``cold`` does the same with warm
+starting off.  The table reports:
+
+* the simulated time until every ball sleeps (``-`` if they never do);
+* physics steps per second of wall time;
+* the mean sequential-impulse sweeps per step (cache modes only);
+* the largest distance any ball drifted from its start (overlap left in
+  the pile, or creep).
+
+Usage::
+
+    python -m benchmarks.bench_contacts [--count 10] [--width 8] [--rows 4]
+                                        [--hz 120] [--duration 10]
+                                        [--restitution 0.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import pygame
+
+from source.basic import Ball, Floor, Vector2
+from source.physics.engine import PhysicsEngine
+
+RADIUS = 10.0
+
+
+def make_scene(scene: str, args: argparse.Namespace) -> PhysicsEngine:
+    engine = PhysicsEngine([{"type": "ball"}])
+    engine.floor = Floor(0, pygame.Color("black"), args.restitution)
+    positions: list[tuple[float, float]] = []
+    if scene == "column":
+        positions = [(0, -RADIUS - 2 * RADIUS * i) for i in range(args.count)]
+    else:
+        positions = [
+            (2 * RADIUS * (i - (args.width - 1) / 2), -RADIUS - 2 * RADIUS * row)
+            for row in range(args.rows) for i in range(args.width)
+        ]
+    for x, y in positions:
+        ball = Ball(Vector2(x, y), RADIUS, pygame.Color("red"), 1, Vector2(0, 0), [],
+                    gravity=1, collisionFactor=args.restitution)
+        engine.current_elements["ball"].append(ball)
+        engine.current_elements["all"].append(ball)
+    return engine
+
+
+def step(engine: PhysicsEngine, dt: float) -> None:
+    """One ``Game.physicsStep`` (ground mode) for balls on the floor."""
+    balls = engine.current_elements["ball"]
+    for ball in balls:
+        engine.update_ball(ball, dt / 2, include_floor=True)
+    for ball in balls:
+        ball.resetForce(True)
+    engine.resolve_ball_collisions()
+    engine.resolve_wall_collisions()
+    for ball in balls:
+        engine.update_ball(ball, dt / 2, include_floor=True)
+    engine.update_islands()
+    engine.update_sleep_states()
+
+
+def run(scene: str, mode: str, args: argparse.Namespace) -> tuple[float, float, float, float]:
+    """Return (settling time, steps per second, mean sweeps, max drift)."""
+    engine = make_scene(scene, args)
+    engine.persistent_contacts = mode != "rebound"
+    engine.contact_cache.warm_starting = mode == "cache"
+    balls = engine.current_elements["ball"]
+    start = [ball.position for ball in balls]
+
+    dt = 1 / args.hz
+    steps = round(args.duration * args.hz)
+    settled = math.inf
+    sweeps = 0
+    elapsed = 0.0
+    done = 0
+    for done in range(1, steps + 1):
+        t0 = time.perf_counter()
+        step(engine, dt)
+        elapsed += time.perf_counter() - t0
+        sweeps += engine.contact_cache.sweeps
+        if all(ball.isSleeping for ball in balls):
+            settled = done * dt
+            break
+    drift = max(ball.position.distance(p) for ball, p in zip(balls, start))
+    return settled, done / elapsed, sweeps / done, drift
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=4)
+    parser.add_argument("--hz", type=int, default=120)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--restitution", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f"{'scene':>8} {'mode':>8} {'settle s':>9} {'steps/s':>9} "
+          f"{'sweeps':>7} {'drift':>8}")
+    for scene in ("column", "grid"):
+        for mode in ("rebound", "cold", "cache"):
+            settled, rate, sweeps, drift = run(scene, mode, args)
+            settle = f"{settled:>9.2f}" if math.isfinite(settled) else f"{'-':>9}"
+            print(f"{scene:>8} {mode:>8} {settle} {rate:>9.0f} "
+                  f"{sweeps:>7.2f} {drift:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark: view-frustum culling vs. drawing every element.
+
+Scatters ``--count`` balls (a tenth of them with trails) and ``--walls``
+walls uniformly over a square world ``--spread`` units across and draws
+``--frames`` frames of a 1024x768 view at zoom ``--ratio`` centred on the
+origin, the way ``Game.drawElements`` does:
+
+* ``all``  -- ``element.draw`` for every element;
+* ``cull`` -- only the elements returned by
+  ``PhysicsEngine.elements_in_view`` for the camera box (walls from the
+  wall BVH).
+
+The table reports milliseconds per frame (selection included) and the
+drawn / culled element counts.
+
+Usage::
+
+    python -m benchmarks.bench_culling [--count 2000] [--walls 200]
+                                       [--spread 20000] [--ratio 1]
+                                       [--frames 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2, Wall
+from source.physics.engine import PhysicsEngine
+
+WIDTH, HEIGHT = 1024, 768
+MARGIN = 20  # pixels, as Game.cullMargin
+
+
+class View:
+    """The parts of ``Game`` that element ``draw`` methods use."""
+
+    def __init__(self, ratio: float) -> None:
+        self.screen = pygame.Surface((WIDTH, HEIGHT))
+        self.ratio = ratio
+        self.x = WIDTH / 2 / ratio
+        self.y = HEIGHT / 2 / ratio
+
+    def realToScreen(self, r: float, x: float | None = None) -> float:
+        return (r + (x or 0)) * self.ratio
+
+    def box(self) -> tuple[float, float, float, float]:
+        margin = MARGIN / self.ratio
+        return (-self.x - margin, -self.y - margin,
+                WIDTH / self.ratio - self.x + margin, HEIGHT / self.ratio - self.y + margin)
+
+
+def make_engine(args: argparse.Namespace) -> PhysicsEngine:
+    rng = random.Random(1)
+    engine = PhysicsEngine([{"type": "ball"}])
+    half = args.spread / 2
+    for i in range(args.count):
+        x, y = rng.uniform(-half, half), rng.uniform(-half, half)
+        ball = Ball(Vector2(x, y), rng.uniform(5, 20), pygame.Color("red"), 1, Vector2(0, 0), [])
+        if i % 10 == 0:
+            ball.leaveTrail = True
+            ball.trailPoints = [Vector2(x - 3 * k, y) for k in range(100)]
+        engine.current_elements["ball"].append(ball)
+        engine.current_elements["all"].append(ball)
+    for _ in range(args.walls):
+        x, y = rng.uniform(-half, half), rng.uniform(-half, half)
+        wall = Wall([Vector2(x, y), Vector2(x + 60, y), Vector2(x + 60, y + 15),
+                     Vector2(x, y + 15)], pygame.Color("blue"))
+        engine.current_elements["wall"].append(wall)
+        engine.current_elements["all"].append(wall)
+    return engine
+
+
+def run(mode: str, args: argparse.Namespace) -> tuple[float, int, int]:
+    """Return (ms per frame, drawn, culled)."""
+    engine = make_engine(args)
+    view = View(args.ratio)
+    everything = engine.current_elements["all"]
+    visible = everything
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        view.screen.fill((255, 255, 255))
+        if mode == "cull":
+            visible = engine.elements_in_view(*view.box())
+        for element in visible:
+            element.draw(view)
+    ms = (time.perf_counter() - start) * 1000 / args.frames
+    return ms, len(visible), len(everything) - len(visible)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--walls", type=int, default=200)
+    parser.add_argument("--spread", type=float, default=20000)
+    parser.add_argument("--ratio", type=float, default=1.0)
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'mode':>5} {'ms/frame':>9} {'drawn':>6} {'culled':>7}")
+    for mode in ("all", "cull"):
+        ms, drawn, culled = run(mode, args)
+        print(f"{mode:>5} {ms:>9.2f} {drawn:>6} {culled:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark: fused gravity + Coulomb kernel vs. per-pair Ball methods.
+
+Times one full field-force evaluation for a cloud of gravitating, partly
+charged balls:
+
+* ``loop``  -- ``Ball.gravitate`` / ``Ball.electricForce`` over unordered
+  pairs (what ``Game`` did before the kernel existed, minus the doubling);
+* ``fused`` -- ``field_kernel.fused_field_forces`` on arrays, with the
+  pair matrix processed in ``--tile`` sized blocks.
+
+Usage::
+
+    python -m benchmarks.bench_field_kernel [--sizes 100 200 1000 5000]
+                                            [--tile 512] [--max-loop 200]
+
+The per-pair loop is skipped above ``--max-loop`` balls.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import numpy as np
+import pygame
+
+from source.basic import Ball, Vector2
+from source.physics.field_kernel import fused_field_forces
+
+
+def make_scene(n: int, seed: int = 0) -> list[Ball]:
+    """``n`` gravitating balls, a third of them charged."""
+    rng = random.Random(seed)
+    return [
+        Ball(
+            Vector2(rng.uniform(-5000, 5000), rng.uniform(-5000, 5000)),
+            5,
+            pygame.Color("red"),
+            rng.uniform(1, 100),
+            Vector2(0, 0),
+            [],
+            gravitation=True,
+            electricCharge=rng.choice([0, 0, 1, -1]),
+        )
+        for _ in range(n)
+    ]
+
+
+def time_loop(balls: list[Ball]) -> float:
+    start = time.perf_counter()
+    for i, b1 in enumerate(balls):
+        for b2 in balls[i + 1:]:
+            b1.gravitate(b2)
+            if b1.electricCharge and b2.electricCharge:
+                b1.electricForce(b2)
+    elapsed = time.perf_counter() - start
+    for ball in balls:
+        ball.resetForce(True)
+    return elapsed
+
+
+def time_fused(balls: list[Ball], tile: int) -> float:
+    pos = np.array([[b.position.x, b.position.y] for b in balls])
+    mass = np.array([b.mass for b in balls])
+    charge = np.array([b.electricCharge for b in balls], dtype=float)
+    gravitation = np.ones(len(balls), dtype=bool)
+    start = time.perf_counter()
+    fused_field_forces(pos, mass, charge, gravitation, tile_size=tile)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 200, 1000, 5000])
+    parser.add_argument("--tile", type=int, default=512)
+    parser.add_argument("--max-loop", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'balls':>7} {'loop ms':>10} {'fused ms':>10} {'speed-up':>9}")
+    for n in args.sizes:
+        balls = make_scene(n)
+        fused = time_fused(balls, args.tile) * 1e3
+        if n > args.max_loop:
+            print(f"{n:>7} {'skipped':>10} {fused:>10.2f} {'-':>9}")
+            continue
+        loop = time_loop(balls) * 1e3
+        print(f"{n:>7} {loop:>10.2f} {fused:>10.2f} {loop / fused:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark: batched spring kernel vs. per-object Spring.calculateForce.
+
+Builds a ``--columns × --rows`` grid of balls joined by structural and
+shear springs (51 × 51 gives 10 100 springs), jitters the positions and
+velocities, and times one full spring-force evaluation:
+
+* ``loop``     -- ``Spring.calculateForce`` over one ``Spring`` element
+  per link (what ``Game`` does without NumPy);
+* ``kernel``   -- ``SpringNetwork.apply`` over the same ``Spring`` elements;
+* ``softbody`` -- ``SpringNetwork.apply`` over a ``SoftBody`` holding the
+  links as index lists, with no per-link objects.
+
+The table reports milliseconds per evaluation (best of ``--repeat``) and
+the largest per-ball force difference from ``loop``.
+
+Usage::
+
+    python -m benchmarks.bench_springs [--columns 51] [--rows 51]
+                                       [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, SoftBody, Spring, Vector2
+from source.physics.spring_kernel import SpringNetwork
+
+
+def make_scene(columns: int, rows: int, seed: int = 0) -> tuple[SoftBody, list[Spring]]:
+    """A jittered grid soft body and the equivalent ``Spring`` elements."""
+    body = SoftBody.grid(Vector2(0, 0), columns, rows, 10, 2, 1, pygame.Color("black"), 100, 0.5)
+    springs = [
+        Spring(body.balls[a], body.balls[b], rest, body.stiffness, 1,
+               pygame.Color("green"), body.dampingFactor)
+        for a, b, rest in zip(body.linkStarts, body.linkEnds, body.restLengths)
+    ]
+    rng = random.Random(seed)
+    for ball in body.balls:
+        ball.position = Vector2(ball.position.x + rng.uniform(-2, 2), ball.position.y + rng.uniform(-2, 2))
+        ball.velocity = Vector2(rng.uniform(-5, 5), rng.uniform(-5, 5))
+    return body, springs
+
+
+def collect(balls: list[Ball]) -> list[tuple[float, float]]:
+    result = [(ball.naturalForce.x, ball.naturalForce.y) for ball in balls]
+    for ball in balls:
+        ball.resetForce(True)
+    return result
+
+
+def time_mode(mode: str, body: SoftBody, springs: list[Spring],
+              repeat: int) -> tuple[float, list[tuple[float, float]]]:
+    """Return (best ms per evaluation, resulting per-ball forces)."""
+    network = SpringNetwork()
+    if mode == "kernel":
+        network.sync(springs, [])
+    elif mode == "softbody":
+        network.sync([], [body])
+
+    best = float("inf")
+    forces: list[tuple[float, float]] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if mode == "loop":
+            for spring in springs:
+                spring.calculateForce()
+        else:
+            network.apply()
+        best = min(best, time.perf_counter() - start)
+        forces = collect(body.balls)
+    return best * 1000, forces
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--columns", type=int, default=51)
+    parser.add_argument("--rows", type=int, default=51)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body, springs = make_scene(args.columns, args.rows)
+    print(f"{len(body.balls)} balls, {len(springs)} springs")
+    print(f"{'mode':>9} {'ms/eval':>9} {'speedup':>8} {'max |ΔF|':>10}")
+    reference_ms, reference = time_mode("loop", body, springs, args.repeat)
+    for mode in ("loop", "kernel", "softbody"):
+        ms, forces = time_mode(mode, body, springs, args.repeat)
+        error = max(
+            max(abs(fx - rx), abs(fy - ry))
+            for (fx, fy), (rx, ry) in zip(forces, reference)
+        )
+        print(f"{mode:>9} {ms:>9.2f} {reference_ms / ms:>7.1f}x {error:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark: gradient sprite cache vs. drawing 20 layers per ball.
+
+Draws ``--count`` balls (``--colors`` distinct colours, random radii) onto
+an off-screen 1024x768 surface for ``--frames`` frames, in two scenes:
+
+* ``static`` -- a fixed zoom;
+* ``zoom``   -- the zoom changes every frame (``--zoom`` per frame), so
+  on-screen radii change continuously.
+
+``layers`` draws every ball as ``Ball.draw`` used to, 20 alpha-blended
+circles on temporary surfaces; ``cache`` calls ``Ball.draw``, which blits
+one cached sprite per (colour, radius bucket).  The table reports
+milliseconds per frame, and the sprite cache's hit rate, number of
+sprites and memory at the end.
+
+Usage::
+
+    python -m benchmarks.bench_sprite_cache [--count 200] [--colors 8]
+                                            [--frames 60] [--zoom 0.005]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2, gradientSprites
+from source.basic.sprite_cache import drawGradientLayers
+
+WIDTH, HEIGHT = 1024, 768
+
+
+class View:
+    """The parts of ``Game`` that ``Ball.draw`` uses."""
+
+    def __init__(self) -> None:
+        self.screen = pygame.Surface((WIDTH, HEIGHT))
+        self.x = 0.0
+        self.y = 0.0
+        self.ratio = 1.0
+
+    def realToScreen(self, r: float, x: float | None = None) -> float:
+        return (r + (x or 0)) * self.ratio
+
+
+def make_balls(count: int, colors: int, rng: random.Random) -> list[Ball]:
+    palette = [pygame.Color(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+               for _ in range(colors)]
+    return [
+        Ball(Vector2(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)), rng.choice((5, 8, 12, 20)),
+             rng.choice(palette), 1, Vector2(0, 0), [])
+        for _ in range(count)
+    ]
+
+
+def draw_layers(view: View, ball: Ball) -> None:
+    center = (view.realToScreen(ball.position.x, view.x), view.realToScreen(ball.position.y, view.y))
+    drawGradientLayers(view.screen, ball.color, center, view.realToScreen(ball.radius))
+
+
+def run(scene: str, mode: str, args: argparse.Namespace) -> float:
+    """Return milliseconds per frame."""
+    balls = make_balls(args.count, args.colors, random.Random(1))
+    view = View()
+    gradientSprites.clear()
+    gradientSprites.resetStats()
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        view.screen.fill((255, 255, 255))
+        for ball in balls:
+            if mode == "layers":
+                draw_layers(view, ball)
+            else:
+                ball.draw(view)
+        if scene == "zoom":
+            view.ratio *= 1 + args.zoom
+    return (time.perf_counter() - start) * 1000 / args.frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--colors", type=int, default=8)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--zoom", type=float, default=0.005)
+    args = parser.parse_args()
+
+    print(f"{'scene':>7} {'mode':>7} {'ms/frame':>9} {'hit rate':>9} {'sprites':>8} {'KiB':>8}")
+    for scene in ("static", "zoom"):
+        for mode in ("layers", "cache"):
+            ms = run(scene, mode, args)
+            stats = gradientSprites.stats()
+            rate = f"{stats['hitRate']:>9.1%}" if mode == "cache" else f"{'-':>9}"
+            print(f"{scene:>7} {mode:>7} {ms:>9.2f} {rate} "
+                  f"{stats['sprites']:>8} {stats['bytes'] / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
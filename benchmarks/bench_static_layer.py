@@ -0,0 +1,91 @@
+"""Benchmark: static wall layer vs. drawing every wall each frame.
+
+Places ``--walls`` static walls over a 1024x768 view and draws ``--frames``
+frames the way ``Game.drawElements`` does, in two scenes:
+
+* ``still`` -- the camera does not move;
+* ``pan``   -- the camera moves ``--pan`` pixels for ``--moving`` frames,
+  then stops (the layer draws directly while the camera moves and is
+  rebuilt once it has stopped).
+
+``direct`` calls ``Wall.draw`` for every wall; ``layer`` blits the
+``StaticLayer`` and draws the walls itself only when the layer is not
+usable.  The table reports milliseconds per frame and layer rebuilds.
+
+Usage::
+
+    python -m benchmarks.bench_static_layer [--walls 200] [--frames 120]
+                                            [--pan 3] [--moving 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pygame
+
+from source.basic import StaticLayer, Vector2, Wall
+
+WIDTH, HEIGHT = 1024, 768
+
+
+class View:
+    """The parts of ``Game`` that ``Wall.draw`` and the layer use."""
+
+    def __init__(self) -> None:
+        self.screen = pygame.Surface((WIDTH, HEIGHT))
+        self.x = 0.0
+        self.y = 0.0
+        self.ratio = 1.0
+
+    def realToScreen(self, r: float, x: float | None = None) -> float:
+        return (r + (x or 0)) * self.ratio
+
+
+def make_walls(count: int, rng: random.Random) -> list[Wall]:
+    walls = []
+    for _ in range(count):
+        x, y = rng.uniform(0, WIDTH - 60), rng.uniform(0, HEIGHT - 15)
+        wall = Wall([Vector2(x, y), Vector2(x + 60, y), Vector2(x + 60, y + 15),
+                     Vector2(x, y + 15)], pygame.Color("blue"))
+        wall.isStatic = True
+        walls.append(wall)
+    return walls
+
+
+def run(scene: str, mode: str, args: argparse.Namespace) -> tuple[float, int]:
+    """Return (ms per frame, layer rebuilds)."""
+    walls = make_walls(args.walls, random.Random(1))
+    view = View()
+    layer = StaticLayer()
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        if scene == "pan" and frame < args.moving:
+            view.x += args.pan
+        view.screen.fill((255, 255, 255))
+        if mode == "direct" or not layer.draw(view, walls):
+            for wall in walls:
+                wall.draw(view)
+        layer.endFrame(view)
+    return (time.perf_counter() - start) * 1000 / args.frames, layer.rebuilds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--walls", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--pan", type=float, default=3)
+    parser.add_argument("--moving", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'scene':>6} {'mode':>7} {'ms/frame':>9} {'rebuilds':>9}")
+    for scene in ("still", "pan"):
+        for mode in ("direct", "layer"):
+            ms, rebuilds = run(scene, mode, args)
+            print(f"{scene:>6} {mode:>7} {ms:>9.2f} {rebuilds:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: cached HUD text vs. rendering every line each frame.
+
+Draws a HUD of ``--lines`` text lines onto an off-screen 1024x768 surface
+for ``--frames`` frames, the way ``Game.updateMenu`` does.  ``--changing``
+of the lines show a value that changes every frame (like the mouse
+position); the rest change once every ``--period`` frames (like the object
+count or the zoom).
+
+``render`` calls ``font.render`` for every line; ``cache`` calls
+``renderText``, which re-renders only lines whose text changed.  The table
+reports milliseconds per frame and renders avoided per frame.
+
+Usage::
+
+    python -m benchmarks.bench_text_cache [--lines 14] [--changing 2]
+                                          [--period 30] [--frames 600]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pygame
+
+from source.basic import renderText, textSprites
+
+WIDTH, HEIGHT = 1024, 768
+
+
+def lines_for(frame: int, args: argparse.Namespace) -> list[str]:
+    slow = frame // args.period
+    return [
+        f"value {i} = {frame if i < args.changing else slow + i: .1f} "
+        for i in range(args.lines)
+    ]
+
+
+def run(mode: str, font: pygame.font.Font, args: argparse.Namespace) -> float:
+    """Return milliseconds per frame."""
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    textSprites.clear()
+    textSprites.resetStats()
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        y = 0
+        for line in lines_for(frame, args):
+            if mode == "render":
+                text = font.render(line, True, "black")
+            else:
+                text = renderText(font, line, True, "black")
+            screen.blit(text, (WIDTH - text.get_width(), y))
+            y += text.get_height()
+    return (time.perf_counter() - start) * 1000 / args.frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=14)
+    parser.add_argument("--changing", type=int, default=2)
+    parser.add_argument("--period", type=int, default=30)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    pygame.font.init()
+    font = pygame.font.Font(None, 16)
+
+    print(f"{'mode':>7} {'ms/frame':>9} {'avoided/frame':>14}")
+    for mode in ("render", "cache"):
+        ms = run(mode, font, args)
+        avoided = f"{textSprites.hits / args.frames:>14.1f}" if mode == "cache" else f"{'-':>14}"
+        print(f"{mode:>7} {ms:>9.3f} {avoided}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark: ball--wall passes with and without the wall BVH.
+
+Builds a course of randomly placed and rotated planks (ramps, a maze) and
+drops balls into it.  Each step integrates the balls and runs the engine's
+three ball--wall passes:
+
+* ``resolve_wall_collisions`` -- containment;
+* ``resolve_vertex_collisions``;
+* ``resolve_line_collisions``.
+
+The ``all`` mode tests every ball against every wall, as before.  The
+``bvh`` mode queries the wall BVH.  The table reports ball--wall
+candidate pairs per step, milliseconds per step, and the largest position
+difference from the ``all`` run, which should be ~0.
+
+Usage::
+
+    python -m benchmarks.bench_wall_bvh [--walls 500] [--balls 1000]
+                                        [--steps 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2, Wall
+from source.physics.engine import PhysicsEngine
+
+
+def make_course(n: int, size: float, seed: int = 0) -> list[Wall]:
+    """``n`` planks, 10--60 long and 4 wide, scattered over a square."""
+    rng = random.Random(seed)
+    walls = []
+    for _ in range(n):
+        x, y = rng.uniform(0, size), rng.uniform(0, size)
+        half, angle = rng.uniform(5, 30), rng.uniform(0, math.pi)
+        c, s = math.cos(angle), math.sin(angle)
+        corners = [(-half, -2), (half, -2), (half, 2), (-half, 2)]
+        walls.append(Wall(
+            [Vector2(x + c * u - s * v, y + s * u + c * v) for u, v in corners],
+            pygame.Color("blue"),
+        ))
+    return walls
+
+
+def make_balls(n: int, size: float, seed: int = 1) -> list[Ball]:
+    rng = random.Random(seed)
+    return [
+        Ball(Vector2(rng.uniform(0, size), rng.uniform(0, size)), 4,
+             pygame.Color("red"), 1,
+             Vector2(rng.uniform(-200, 200), rng.uniform(-200, 200)), [], gravity=1)
+        for _ in range(n)
+    ]
+
+
+def run(
+    walls: int, balls: int, steps: int, use_bvh: bool
+) -> tuple[float, float, list[tuple[float, float]]]:
+    """Return (candidate pairs per step, ms per step, final positions)."""
+    size = 40 * walls ** 0.5
+    engine = PhysicsEngine([{"type": "ball"}, {"type": "wall"}])
+    engine.wall_bvh_threshold = 0 if use_bvh else 10**9
+    engine.current_elements["wall"].extend(make_course(walls, size))
+    scene = make_balls(balls, size)
+    engine.current_elements["ball"].extend(scene)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        for ball in scene:
+            ball.update(1 / 120)
+        engine.resolve_wall_collisions()
+        engine.resolve_vertex_collisions()
+        engine.resolve_line_collisions()
+    elapsed = time.perf_counter() - start
+    positions = [(b.position.x, b.position.y) for b in scene]
+    return engine.wall_pair_tests / steps, elapsed * 1000 / steps, positions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--walls", type=int, default=500)
+    parser.add_argument("--balls", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'walls':>6} {'balls':>6} {'mode':>5} {'pairs/step':>11} "
+          f"{'ms/step':>9} {'max |dx|':>9}")
+    reference: list[tuple[float, float]] = []
+    for use_bvh in (False, True):
+        pairs, ms, positions = run(args.walls, args.balls, args.steps, use_bvh)
+        if not use_bvh:
+            reference = positions
+        drift = max(
+            max(abs(ax - bx), abs(ay - by))
+            for (ax, ay), (bx, by) in zip(positions, reference)
+        )
+        print(f"{args.walls:>6} {args.balls:>6} {'bvh' if use_bvh else 'all':>5} "
+              f"{pairs:>11.0f} {ms:>9.1f} {drift:>9.2g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: NumPy structure-of-arrays step vs. the ``Ball`` object path.
+
+One step = environment application, all-pairs gravity + Coulomb among
+gravitating / charged balls, acceleration and 10-substep integration --
+the per-ball work ``Game.updateElements`` does outside of collisions.
+
+Usage::
+
+    python -m benchmarks.bench_world_state [--sizes 50 100 200] [--steps 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pygame
+
+from source.basic import Ball, Vector2
+from source.physics.engine import PhysicsEngine
+
+ENVIRONMENT = [
+    {"type": "gravity", "value": "0"},
+    {"type": "airResistance", "value": "1"},
+    {"type": "collisionFactor", "value": "1"},
+]
+
+
+def make_balls(n: int, seed: int = 0) -> list[Ball]:
+    rng = random.Random(seed)
+    return [
+        Ball(
+            Vector2(rng.uniform(-1e4, 1e4), rng.uniform(-1e4, 1e4)),
+            5,
+            pygame.Color("white"),
+            rng.uniform(1, 100),
+            Vector2(rng.uniform(-10, 10), rng.uniform(-10, 10)),
+            [],
+            gravitation=True,
+            electricCharge=rng.choice([0, 1, -1]),
+        )
+        for _ in range(n)
+    ]
+
+
+def object_step(engine: PhysicsEngine, dt: float) -> None:
+    balls = engine.current_elements["ball"]
+    for ball in balls:
+        ball.resetForce(True)
+    for i in range(len(balls)):
+        for j in range(i + 1, len(balls)):
+            balls[i].gravitate(balls[j])
+            if balls[i].electricCharge and balls[j].electricCharge:
+                balls[i].electricForce(balls[j])
+    engine.apply_environment(ENVIRONMENT)
+    for ball in balls:
+        ball.update(dt)
+
+
+def time_steps(step, steps: int) -> float:
+    start = time.perf_counter()
+    for _ in range(steps):
+        step()
+    return (time.perf_counter() - start) / steps * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--steps", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'balls':>6} {'object ms/step':>15} {'array ms/step':>14} {'speedup':>8}")
+    for n in args.sizes:
+        obj = PhysicsEngine([{"type": "ball"}])
+        obj.current_elements["ball"].extend(make_balls(n))
+        object_ms = time_steps(lambda: object_step(obj, 1 / 60), args.steps)
+
+        arr = PhysicsEngine([{"type": "ball"}])
+        arr.current_elements["ball"].extend(make_balls(n))
+        arr.enable_array_state()
+        array_ms = time_steps(
+            lambda: arr.step_array_state(1 / 60, ENVIRONMENT), args.steps
+        )
+        print(f"{n:>6} {object_ms:>15.2f} {array_ms:>14.2f} "
+              f"{object_ms / array_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
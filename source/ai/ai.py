@@ -45,6 +45,9 @@ class AI:
 18. delete element [elementIndex] 删除元素
 19. mode [0 | 1] 切换模式（0为地表模式，1为天体模式）
 20. set environment [gravity | airResistance | collisionFactor] [value] 设置环境属性（gravity，airResistance，collisionFactor），gravity是重力系数，取值范围为0-1，0表示不受重力影响，1表示受正常重力影响；airResistance是空气阻力系数，取值范围为0-1，1表示不受空气阻力影响，0.4表示每秒阻力使速度减少为原来的0.4倍；collisionFactor是碰撞系数，取值范围为0-1，1表示碰撞后速度无损失，0.4表示碰撞后使速度减少为原来的0.4倍）
+21. create softbody [x] [y] [columns] [rows] [spacing] [radius] [mass] [stiffness] [color] 创建一个软体（x, y是左上角球的位置；columns, rows是每行、每列球的个数；spacing是相邻球的间距；radius, mass是每个球的半径与质量；stiffness是弹簧的劲度系数；color是球的颜色）
+22. set physics [hz | maxSteps] [value] 设置物理步进参数（hz是每秒的固定物理步数，最小为1；maxSteps是每帧最多补算的物理步数，最小为1，卡顿时超出的步数会被丢弃）
+23. set physics engine [step | event] 设置碰撞引擎（step是按固定步长检测碰撞，event是按碰撞事件的发生时间依次处理碰撞）
 
 注意事项：
 0. 每条命令部分请用<...>括起，一定要括起，否则导致命令无法执行
@@ -1,3 +1,4 @@
+from .asset_cache import AssetCache, assets
 from .ball import Ball
 from .collision_line import CollisionLine
 from .color import (
@@ -10,9 +11,13 @@ from .color import (
 )
 from .coordinator import Coordinator
 from .element import Element, gravityFactor, electrostaticFactor
+from .floor import Floor
 from .rod import Rod
 from .rope import Rope
+from .soft_body import SoftBody
 from .spring import Spring
+from .sprite_cache import SpriteCache, drawGradientCircle, gradientSprites, renderText, textSprites
+from .static_layer import StaticLayer
 from .vector2 import Vector2, ZERO, triangleArea
 from .wall import Wall
 from .wall_position import WallPosition
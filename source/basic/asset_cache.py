@@ -0,0 +1,113 @@
+from collections.abc import Iterable
+import threading
+
+import pygame
+
+from .sprite_cache import SpriteCache
+
+ASSET_MAX_BYTES: int = 16 * 1024 * 1024  # 缩放后图片缓存的内存上限
+
+
+class AssetCache:
+    """静态图片（图标、按钮图片等）的缓存
+
+    每张图片只从磁盘读取、解码一次；按目标尺寸缩放后的图片存入 SpriteCache（LRU），
+    菜单每帧绘制图标只需一次贴图。preload 在后台线程中预先读取、解码图片文件，
+    启动后的第一帧不必等待磁盘；转换格式与缩放仍在主线程中完成（pygame 的显示相关
+    操作不是线程安全的）。
+    """
+
+    def __init__(self, maxBytes: int = ASSET_MAX_BYTES) -> None:
+        self.originals: dict[str, pygame.Surface] = {}
+        self.scaledSprites: SpriteCache = SpriteCache(maxBytes)
+        self.loaded: dict[str, pygame.Surface] = {}  # 后台线程已解码、尚未取用的图片
+        self.missing: set[str] = set()  # 读取失败的路径，不再反复尝试
+        self.loads: int = 0  # 从磁盘读取的次数
+        self.lock: threading.Lock = threading.Lock()  # 保护 originals、loaded、missing 与 loads
+        self.thread: threading.Thread | None = None
+
+    @staticmethod
+    def convert(surface: pygame.Surface) -> pygame.Surface:
+        """转成与屏幕一致的像素格式，贴图更快（没有窗口时保持原样）"""
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+
+    def read(self, path: str) -> pygame.Surface:
+        """从磁盘读取图片，读取失败的路径会被记住，之后直接抛出 FileNotFoundError"""
+        with self.lock:
+            if path in self.missing:
+                raise FileNotFoundError(path)
+        try:
+            surface = pygame.image.load(path)
+        except (FileNotFoundError, pygame.error):
+            with self.lock:
+                self.missing.add(path)
+            raise FileNotFoundError(path)
+        with self.lock:
+            self.loads += 1
+        return surface
+
+    def take(self, path: str) -> pygame.Surface | None:
+        """取出后台线程解码好的图片"""
+        with self.lock:
+            return self.loaded.pop(path, None)
+
+    def image(self, path: str) -> pygame.Surface:
+        """原尺寸的图片（只能在主线程中调用）"""
+        surface = self.originals.get(path)
+        if surface is None:
+            raw = self.take(path)
+            if raw is None:
+                raw = self.read(path)
+            surface = self.convert(raw)
+            with self.lock:
+                self.originals[path] = surface
+                # 主线程先读到了这张图时，后台线程稍后解码的那份已经用不上
+                self.loaded.pop(path, None)
+        return surface
+
+    def scaled(self, path: str, size: tuple[float, float]) -> pygame.Surface:
+        """缩放到 size（取整为像素）的图片，每个 (路径, 尺寸) 只缩放一次"""
+        size = (int(size[0]), int(size[1]))
+
+        def render() -> pygame.Surface:
+            return pygame.transform.smoothscale(self.image(path), size)
+
+        return self.scaledSprites.get((path, size), render)
+
+    def preload(self, paths: Iterable[str]) -> threading.Thread:
+        """在后台线程中读取、解码 paths 中的每张图片
+
+        返回后台线程（守护线程），需要等待时可以 join。
+        """
+        self.thread = threading.Thread(target=self.preloadNow, args=(list(paths),), daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def preloadNow(self, paths: Iterable[str]) -> None:
+        """在当前线程中完成 preload 的工作：只读取文件，转换格式与缩放留给主线程"""
+        for path in paths:
+            with self.lock:
+                if path in self.originals or path in self.loaded:
+                    continue
+            try:
+                surface = self.read(path)
+            except FileNotFoundError:
+                continue
+            with self.lock:
+                # 读取期间主线程可能已经自己读过这张图
+                if path not in self.originals:
+                    self.loaded[path] = surface
+
+    def stats(self) -> dict[str, float]:
+        """缓存统计，供性能分析"""
+        return {
+            "images": len(self.originals),
+            "loads": self.loads,
+            "scaled": len(self.scaledSprites),
+            "hitRate": self.scaledSprites.hitRate(),
+        }
+
+
+assets = AssetCache()
@@ -1,4 +1,5 @@
 import copy
+import math
 from random import random, randint
 from typing import Self
 
@@ -7,12 +8,29 @@ import pygame
 from .collision_line import CollisionLine
 from .color import colorStringToTuple, colorTupleToString, colorMiddle
 from .element import Element, gravityFactor, electrostaticFactor
+from .sprite_cache import drawGradientCircle
 from .vector2 import Vector2, ZERO
 
+# 旧版 update 固定做 10 个匀加速子步（v += a*h; p += (v + a*h*√20)*h），
+# 其总位移恰为 v*t + POSITION_FACTOR*a*t²，这里直接用闭式计算
+LEGACY_SUBSTEPS = 10
+POSITION_FACTOR = (LEGACY_SUBSTEPS + 1) / (2 * LEGACY_SUBSTEPS) + 20**0.5 / LEGACY_SUBSTEPS
+
 
 class Ball(Element):
     """球体物理实体类，处理运动学计算和碰撞响应"""
 
+    # 自适应子步（CFL 条件）：每个子步的位移不超过 cflFactor ×（直径 + 最薄墙厚），
+    # 一步走得比直径加墙厚更远时球才可能整个穿过墙
+    cflFactor: float = 0.5
+    maxSubsteps: int = 10
+
+    # 休眠：速度与（重力以外的）合力连续 sleepFrames 个物理步都低于阈值时进入休眠，
+    # 休眠的球不再积分、不参与碰撞检测，直到被唤醒
+    sleepVelocity: float = 1.0
+    sleepAcceleration: float = 1.0
+    sleepFrames: int = 60
+
     def __init__(
         self,
         position: Vector2,
@@ -33,8 +51,8 @@ class Ball(Element):
         self.velocity: Vector2 = velocity
         self.displayedVelocity: Vector2 = ZERO
         self.displayedVelocityFactor: float = 0
-        self.naturalForces: list[Vector2] = []
-        self.artificialForces: list[Vector2] = artificialForces
+        self.naturalForce: Vector2 = Vector2(0, 0)  # 本帧自然力合力
+        self.artificialForce: Vector2 = sum(artificialForces, Vector2(0, 0))  # 外力合力
         self.acceleration: Vector2 = ZERO
         self.displayedAcceleration: Vector2 = ZERO
         self.displayedAccelerationFactor: float = 0
@@ -50,6 +68,8 @@ class Ball(Element):
         self.electricCharge: float = electricCharge
         self.leaveTrail: bool = False
         self.trailPoints: list[Vector2] = []
+        self.isSleeping: bool = False
+        self.restingFrames: int = 0
         
         self.id = randint(0, 100000000)
         self.updateAttrsList()
@@ -168,37 +188,71 @@ class Ball(Element):
 
     def accelerate(self) -> Vector2:
         """计算当前加速度"""
-        self.acceleration.zero()
-
-        for force in self.artificialForces:
-            self.acceleration += force / self.mass
-
-        for force in self.naturalForces:
-            self.acceleration += force / self.mass
-
-        self.acceleration += Vector2(0, 98.6 * self.gravity)
+        totalForce = self.naturalForce + self.artificialForce
+        self.acceleration = Vector2(
+            totalForce.x / self.mass, totalForce.y / self.mass + 98.6 * self.gravity
+        )
         return self.acceleration
 
+    def netForce(self) -> Vector2:
+        """当前合力（自然力与外力之和）"""
+        return self.naturalForce + self.artificialForce
+
     def force(self, force: Vector2, isNatural: bool = False) -> Vector2:
-        """施加外力并更新加速度"""
-        if isNatural:
-            self.naturalForces.append(force)
+        """施加外力并更新加速度（累加到合力，不再逐个求和）"""
+        if self.isSleeping and abs(force) > self.sleepAcceleration * self.mass:
+            self.wake()
 
+        if isNatural:
+            self.naturalForce = self.naturalForce + force
         else:
-            self.artificialForces.append(force)
+            self.artificialForce = self.artificialForce + force
 
         return self.accelerate()
 
     def resetForce(self, isNatural: bool = False) -> None:
         """重置外力"""
         if isNatural:
-            self.naturalForces.clear()
+            self.naturalForce = Vector2(0, 0)
         else:
-            self.artificialForces.clear()
+            self.artificialForce = Vector2(0, 0)
 
-        self.acceleration.zero()
         self.accelerate()
 
+    def wake(self) -> None:
+        """唤醒球"""
+        self.isSleeping = False
+        self.restingFrames = 0
+
+    def updateSleepState(self) -> bool:
+        """根据速度与合力更新休眠状态，返回是否处于休眠"""
+        if self.isSleeping:
+            return True
+
+        if (
+            abs(self.velocity) < self.sleepVelocity
+            and abs(self.netForce()) < self.sleepAcceleration * self.mass
+        ):
+            self.restingFrames += 1
+            if self.restingFrames >= self.sleepFrames:
+                self.isSleeping = True
+                self.velocity = Vector2(0, 0)
+        else:
+            self.restingFrames = 0
+
+        return self.isSleeping
+
+    def substepCount(self, deltaTime: float, wallThickness: float = math.inf) -> int:
+        """按 CFL 条件估算本步所需的子步数（至少 1，至多 maxSubsteps）"""
+        travel = (
+            abs(self.velocity) * deltaTime
+            + 0.5 * abs(self.acceleration) * deltaTime * deltaTime
+        )
+        limit = self.cflFactor * (2 * self.radius + wallThickness)
+        if travel <= limit:
+            return 1
+        return min(math.ceil(travel / limit), self.maxSubsteps)
+
     def updateAttrsList(self) -> None:
         """更新属性列表"""
         self.attrs = [
@@ -209,20 +263,28 @@ class Ball(Element):
             {"type": "electricCharge", "value": self.electricCharge, "min": -1000000, "max": 1000000},
         ]
 
-    def update(self, deltaTime: float) -> Self:
-        """更新物理状态"""
+    def integrate(self, deltaTime: float) -> None:
+        """按当前合力推进位置与速度（不更新显示量与轨迹）"""
         self.accelerate()
-        substeps = 10  # 从4增加到10
-        deltaTime /= substeps
+        # 与旧版 10 个子步的结果相同，但只需一次计算
+        self.position += (
+            self.velocity * deltaTime
+            + self.acceleration * (POSITION_FACTOR * deltaTime * deltaTime)
+        )
+        self.velocity += self.acceleration * deltaTime
 
-        for _ in range(substeps):
-            self.velocity += self.acceleration * deltaTime
-            self.position += (
-                self.velocity + self.acceleration * deltaTime * 20**0.5
-            ) * deltaTime
+        self.velocity *= self.airResistance ** (deltaTime / LEGACY_SUBSTEPS)
 
-        self.velocity *= self.airResistance**deltaTime
+    def update(self, deltaTime: float) -> Self:
+        """更新物理状态"""
+        if self.isSleeping:
+            return self
+
+        self.integrate(deltaTime)
+        return self.recordStep()
 
+    def recordStep(self) -> Self:
+        """一个物理步结束：衰减显示量并记录轨迹点"""
         # self.displayedVelocity += (self.velocity - self.displayedVelocity) * 0.05
         # self.displayedAcceleration += (self.acceleration - self.displayedAcceleration) * 0.05
         self.displayedVelocityFactor *= 0.95
@@ -238,6 +300,18 @@ class Ball(Element):
                 ...
         return self
 
+    def boundingBox(self) -> tuple[float, float, float, float]:
+        """球面（含高亮描边）与轨迹点的包围盒"""
+        x, y = self.position.x, self.position.y
+        r = self.radius + 0.5
+        x0, y0, x1, y1 = x - r, y - r, x + r, y + r
+        if self.leaveTrail and self.trailPoints:
+            xs = [p.x for p in self.trailPoints]
+            ys = [p.y for p in self.trailPoints]
+            x0, y0 = min(x0, min(xs)), min(y0, min(ys))
+            x1, y1 = max(x1, max(xs)), max(y1, max(ys))
+        return x0, y0, x1, y1
+
     def draw(self, game) -> None:
         """绘制带渐变效果的小球"""
         if self.leaveTrail and self.trailPoints:
@@ -267,48 +341,16 @@ class Ball(Element):
         else:
             color = self.color
 
-        circleNumber = 20  # 固定20个同心圆
-
-        # 绘制渐变效果
-        for number in range(circleNumber):
-            # 计算当前半径比例（从1.0到0.0）
-            ratio = number / (circleNumber - 1)  # 修正比例计算
-
-            # 当前实际半径
-            currentRadius = self.radius * (1 - ratio)
-
-            # 颜色混合计算（外部保持原色，内部变浅）
-            # 混合比例：外部（ratio=0）保持原色，内部（ratio=1）变浅50%
-            mixRatio = ratio  # 使用ratio来控制混合比例
-            red = int(color[0] + (255 - color[0]) * mixRatio * 0.5)
-            green = int(color[1] + (255 - color[1]) * mixRatio * 0.5)
-            blue = int(color[2] + (255 - color[2]) * mixRatio * 0.5)
-
-            # 透明度控制（外部不透明，内部半透明）
-            alpha = int(255 * (1 - ratio * 0.5))  # 保持最低50%透明度
-
-            # 转换坐标和尺寸
-            pos = (
+        # 渐变球面按 (颜色, 屏幕半径档位) 预渲染为精灵并缓存，每帧只需贴图一次
+        drawGradientCircle(
+            game.screen,
+            color,
+            (
                 game.realToScreen(self.position.x, game.x),
                 game.realToScreen(self.position.y, game.y),
-            )
-
-            drawRadius = game.realToScreen(currentRadius)
-
-            # 创建临时surface实现透明度
-            tempSurface = pygame.Surface(
-                (drawRadius * 2, drawRadius * 2), pygame.SRCALPHA)
-
-            pygame.draw.circle(
-                tempSurface,
-                (red, green, blue, alpha),
-                (drawRadius, drawRadius),
-                drawRadius,
-                0,
-            )
-
-            game.screen.blit(
-                tempSurface, (pos[0] - drawRadius, pos[1] - drawRadius))
+            ),
+            game.realToScreen(self.radius),
+        )
 
         self.highLighted = False
 
@@ -415,6 +457,19 @@ class Ball(Element):
 
         return self.velocity
 
+    def reboundByNormal(self, normal: Vector2, collisionFactor: float = 1) -> Vector2:
+        """沿给定法线反弹（连续碰撞检测在接触时刻求得的法线，不做位置修正）"""
+        self.displayedVelocity = (
+            self.velocity + (self.displayedVelocity - self.velocity) * self.displayedVelocityFactor)
+        self.displayedVelocityFactor = 1
+
+        velocityNormal = self.velocity.dot(normal)
+        if velocityNormal < 0:
+            self.velocity -= normal * (
+                velocityNormal * (1 + self.collisionFactor * collisionFactor)
+            )
+        return self.velocity
+
     def reboundByBall(self, ball: Self) -> Vector2:
         """处理球与球之间的碰撞响应"""
         # 计算总质量
@@ -614,7 +669,7 @@ class Ball(Element):
         totalVelocity = (self.velocity * self.mass + other.velocity * other.mass) / (
             self.mass + other.mass
         )
-        totalForce = self.artificialForces + other.artificialForces
+        totalForce = [self.artificialForce + other.artificialForce]
         totalRadius = round((self.radius**2 + other.radius**2) ** 0.5, 1)
         totalMass = self.mass + other.mass
         totalColor = colorTupleToString(
@@ -0,0 +1,68 @@
+import math
+from functools import lru_cache
+
+SEGMENTS: int = 24  # 每条松弛绳索的折线段数
+RATIO_STEP: float = 1e-4  # 松弛比 L/d 的量化步长，决定缓存精度
+NEWTON_ITERATIONS: int = 100
+NEWTON_TOLERANCE: float = 1e-12
+
+
+def catenaryParameter(slackRatio: float) -> float:
+    """求解 sinh(z) = k·z 的正根 z（k = L/d > 1），悬链线参数 a = d / (2z)
+
+    从 z = √(6(k-1)) 出发做牛顿迭代；函数在正根右侧是凸的，迭代单调收敛。
+    """
+    k = slackRatio
+    if k <= 1:
+        return 0.0
+    z = math.sqrt(6 * (k - 1))
+    for _ in range(NEWTON_ITERATIONS):
+        if z < 1e-8 or z > 700:
+            break
+        derivative = math.cosh(z) - k
+        if abs(derivative) < 1e-12:
+            break
+        step = (math.sinh(z) - k * z) / derivative
+        z -= step
+        if abs(step) < NEWTON_TOLERANCE * max(z, 1):
+            break
+    return min(max(z, 0.0), 700)
+
+
+def catenaryShape(slackRatio: float) -> tuple[float, ...]:
+    """长度为 L、两端相距 d 的绳索的归一化悬链线形状
+
+    返回 SEGMENTS + 1 个下垂量（以 d 为单位），第 i 个对应弦上 t = i / SEGMENTS 处。
+    形状只取决于松弛比 L/d，按 RATIO_STEP 量化后缓存，
+    每条绳索只需把它沿弦方向平移、旋转并按 d 缩放。
+    """
+    return _cachedShape(round(slackRatio / RATIO_STEP))
+
+
+@lru_cache(maxsize=4096)
+def _cachedShape(key: int) -> tuple[float, ...]:
+    """量化后的松弛比对应的形状（见 catenaryShape）"""
+    k = key * RATIO_STEP
+    if k <= 1:
+        return (0.0,) * (SEGMENTS + 1)
+
+    z = catenaryParameter(k)
+    if z > 1e-8:
+        try:
+            # y(t) = c - a·cosh(x/a)，x = d(t - 1/2)，a = d/(2z)，再除以 d
+            coshZ = math.cosh(z)
+            return tuple(
+                (coshZ - math.cosh(z * (2 * i / SEGMENTS - 1))) / (2 * z)
+                for i in range(SEGMENTS + 1)
+            )
+        except OverflowError:
+            pass
+
+    # 退化情形：用正弦曲线近似
+    maxSag = math.sqrt(k * k - 1) / 2
+    return tuple(maxSag * math.sin(math.pi * i / SEGMENTS) for i in range(SEGMENTS + 1))
+
+
+def clearCatenaryCache() -> None:
+    """清空形状缓存"""
+    _cachedShape.cache_clear()
@@ -46,6 +46,13 @@ class Element(abc.ABC):
         """更新方法（子类应重写此方法）"""
         return self
 
+    def boundingBox(self) -> tuple[float, float, float, float] | None:
+        """绘制范围的轴对齐包围盒 (x0, y0, x1, y1)，世界坐标（子类应重写此方法）
+
+        返回 None 表示没有界限，总要绘制。
+        """
+        return None
+
     def draw(self, game: Game) -> None:
         """绘制方法（子类应重写此方法）"""
         ...
@@ -0,0 +1,72 @@
+import math
+
+import pygame
+
+from .ball import Ball
+from .collision_line import CollisionLine
+from .vector2 import Vector2
+
+UP = Vector2(0, -1)  # 地面法线（屏幕坐标 y 轴向下）
+
+
+class Floor:
+    """地面：y 以下的无限半平面
+
+    与四边形墙体不同，地面不随镜头移动、不重建碰撞线段，
+    球与地面的检测只需比较一次纵坐标。
+    """
+
+    def __init__(self, y: float, color: pygame.Color, collisionFactor: float = 1.0) -> None:
+        self.color: pygame.Color = color
+        self.collisionFactor: float = collisionFactor
+        self.type: str = "floor"
+        self.thickness: float = math.inf  # 半平面不会被穿透，不限制 CFL 子步
+        self.y = y
+
+    @property
+    def y(self) -> float:
+        """地面表面的纵坐标"""
+        return self._y
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._y: float = value
+        # 表面直线，供连续碰撞检测与事件驱动引擎使用
+        self.lines: list[CollisionLine] = [
+            CollisionLine(Vector2(0, value), Vector2(1, value), True, display=False)
+        ]
+
+    def isBallTouching(self, ball: Ball) -> bool:
+        """球是否接触或陷入地面"""
+        return ball.position.y + ball.radius > self._y
+
+    def checkCollision(self, ball: Ball) -> bool:
+        """检测并处理球与地面的碰撞，返回是否发生接触"""
+        overlap = ball.position.y + ball.radius - self._y
+        if overlap <= 0:
+            return False
+
+        # 位置修正与线段碰撞一致：穿透越深，额外推出越多
+        energyLossFactor = 1 + min(1, overlap / ball.radius)
+        ball.position = Vector2(ball.position.x, ball.position.y - overlap * energyLossFactor)
+        ball.reboundByNormal(UP, self.collisionFactor)
+        return True
+
+    def getVertexes(self, game) -> list[Vector2]:
+        """当前屏幕内可见部分的四个顶点（实际坐标）"""
+        left = game.screenToReal(0, game.x)
+        right = game.screenToReal(game.screen.get_width(), game.x)
+        bottom = max(game.screenToReal(game.screen.get_height(), game.y), self._y)
+        return [
+            Vector2(left, self._y),
+            Vector2(right, self._y),
+            Vector2(right, bottom),
+            Vector2(left, bottom),
+        ]
+
+    def draw(self, game) -> None:
+        """绘制地面：从表面到屏幕底部铺满整个宽度"""
+        top = max(game.realToScreen(self._y, game.y), 0)
+        width, height = game.screen.get_size()
+        if top < height:
+            pygame.draw.rect(game.screen, self.color, (0, top, width, height - top))
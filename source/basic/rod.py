@@ -29,6 +29,7 @@ class Rod(Element):
         color: pygame.Color,
         dampingFactor: float = 0.1,  # 阻尼系数
         stiffness: float = 100000.0,  # 极大的弹性系数
+        compliance: float = 0.0,  # XPBD 柔度（刚度的倒数），0 表示完全刚性
     ) -> None:
         self.start: Ball | WallPosition = start
         self.end: Ball | WallPosition = end
@@ -38,6 +39,7 @@ class Rod(Element):
         self.color: pygame.Color = color
         self.dampingFactor: float = dampingFactor  # 阻尼系数
         self.stiffness: float = stiffness  # 极大的弹性系数
+        self.compliance: float = compliance
         self.isLegal: bool = True
         self.type: str = "rod"
         
@@ -75,6 +77,21 @@ class Rod(Element):
         # 计算角度（相对于x轴正方向）
         self.angle = math.atan2(direction.y, direction.x)
     
+    def updateRotation(self, deltaTime: float) -> None:
+        """更新角度，并由角度变化计算角速度"""
+        prevAngle = self.angle
+        self.updateAngle()
+
+        angleDiff = self.angle - prevAngle
+        # 处理角度跨越2π的情况
+        if angleDiff > math.pi:
+            angleDiff -= 2 * math.pi
+        elif angleDiff < -math.pi:
+            angleDiff += 2 * math.pi
+
+        if deltaTime > 0:
+            self.angularVelocity = angleDiff / deltaTime
+
     def calculateForce(self) -> bool:
         """计算弹簧力并应用到连接的物体上
 
@@ -117,34 +134,17 @@ class Rod(Element):
         if isinstance(self.end, Ball):
             self.end.force(-(springForceOnStart + dampingForceOnStart), isNatural=True)
 
-        # 更新角度
-        prevAngle = self.angle
-        self.updateAngle()
-        
-        # 计算角速度（角度变化/时间）
-        # 使用更小的时间步长以提高精度
-        angleDiff = self.angle - prevAngle
-        # 处理角度跨越2π的情况
-        if angleDiff > math.pi:
-            angleDiff -= 2 * math.pi
-        elif angleDiff < -math.pi:
-            angleDiff += 2 * math.pi
-            
-        # 使用更小的时间步长（1/120秒）以提高精度
-        self.angularVelocity = angleDiff * 120
+        # 更新角度与角速度，使用更小的时间步长（1/120秒）以提高精度
+        self.updateRotation(1 / 120)
 
         # 如果两端都是球体，则进行力矩传递和位置修正
         if isinstance(self.start, Ball) and isinstance(self.end, Ball):
             # 力矩传递 - 计算垂直于杆的力分量
             # 对于start球体，考虑所有作用在其上的力
-            if isinstance(self.start, Ball) and (len(self.start.naturalForces) > 0 or len(self.start.artificialForces) > 0):
-                # 计算所有力的合力
-                totalForce = Vector2(0, 0)
-                for force in self.start.naturalForces:
-                    totalForce += force
-                for force in self.start.artificialForces:
-                    totalForce += force
-                
+            if isinstance(self.start, Ball):
+                # 直接读取累加的合力
+                totalForce = self.start.netForce()
+
                 if totalForce.magnitude() > 0:
                     # 计算外力在垂直于杆方向上的分量
                     perpendicular = direction.vertical()
@@ -156,14 +156,10 @@ class Rod(Element):
                         self.end.force(perpendicularForceStart * 0.3, isNatural=True)
             
             # 对于end球体，考虑所有作用在其上的力
-            if isinstance(self.end, Ball) and (len(self.end.naturalForces) > 0 or len(self.end.artificialForces) > 0):
-                # 计算所有力的合力
-                totalForce = Vector2(0, 0)
-                for force in self.end.naturalForces:
-                    totalForce += force
-                for force in self.end.artificialForces:
-                    totalForce += force
-                
+            if isinstance(self.end, Ball):
+                # 直接读取累加的合力
+                totalForce = self.end.netForce()
+
                 if totalForce.magnitude() > 0:
                     # 计算外力在垂直于杆方向上的分量
                     perpendicular = direction.vertical()
@@ -194,14 +190,10 @@ class Rod(Element):
             
             # 力矩传递 - 计算垂直于杆的力分量
             # 对于start球体，考虑所有作用在其上的力
-            if isinstance(self.start, Ball) and (len(self.start.naturalForces) > 0 or len(self.start.artificialForces) > 0):
-                # 计算所有力的合力
-                totalForce = Vector2(0, 0)
-                for force in self.start.naturalForces:
-                    totalForce += force
-                for force in self.start.artificialForces:
-                    totalForce += force
-                
+            if isinstance(self.start, Ball):
+                # 直接读取累加的合力
+                totalForce = self.start.netForce()
+
                 if totalForce.magnitude() > 0:
                     # 计算外力在垂直于杆方向上的分量
                     perpendicular = direction.vertical()
@@ -213,14 +205,10 @@ class Rod(Element):
                         self.end.force(perpendicularForceStart * 0.5, isNatural=True)
             
             # 对于end球体，考虑所有作用在其上的力
-            if isinstance(self.end, Ball) and (len(self.end.naturalForces) > 0 or len(self.end.artificialForces) > 0):
-                # 计算所有力的合力
-                totalForce = Vector2(0, 0)
-                for force in self.end.naturalForces:
-                    totalForce += force
-                for force in self.end.artificialForces:
-                    totalForce += force
-                
+            if isinstance(self.end, Ball):
+                # 直接读取累加的合力
+                totalForce = self.end.netForce()
+
                 if totalForce.magnitude() > 0:
                     # 计算外力在垂直于杆方向上的分量
                     perpendicular = direction.vertical()
@@ -303,8 +291,18 @@ class Rod(Element):
         """
         # 计算约束力和应用位置修正
         self.calculateForce()
+        self.updatePosition()
+
+        return self
+
+    def updatePosition(self, deltaTime: float = 0) -> None:
+        """更新轻杆中心位置与墙上端点（XPBD 求解器求解后直接调用）
+
+        deltaTime 大于 0 时同时更新角度与角速度。
+        """
+        if deltaTime > 0:
+            self.updateRotation(deltaTime)
 
-        # 更新轻杆中心位置
         if isinstance(self.start, Ball) and isinstance(self.end, Ball):
             self.position = (self.start.position + self.end.position) / 2
 
@@ -321,7 +319,16 @@ class Rod(Element):
             self.start.update()
             self.end.update()
 
-        return self
+    def boundingBox(self) -> tuple[float, float, float, float]:
+        """两端点的包围盒（线宽与端点圆点按像素绘制，由视野边距覆盖）"""
+        startPos = self.start.getPosition()
+        endPos = self.end.getPosition()
+        return (
+            min(startPos.x, endPos.x),
+            min(startPos.y, endPos.y),
+            max(startPos.x, endPos.x),
+            max(startPos.y, endPos.y),
+        )
 
     def draw(self, game) -> None:
         """绘制弹簧
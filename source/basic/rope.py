@@ -5,6 +5,7 @@ from typing import Self
 import pygame
 
 from .ball import Ball
+from .catenary import SEGMENTS, catenaryShape
 from .color import colorMiddle
 from .element import Element
 from .vector2 import Vector2, ZERO
@@ -30,6 +31,7 @@ class Rope(Element):
         collisionFactor: float = 1.0,
         tensionStiffness: float = 5000.0,  # 张力刚度系数
         dampingFactor: float = 0.2,  # 阻尼系数
+        compliance: float = 0.0,  # XPBD 柔度（刚度的倒数），0 表示不可伸长
     ) -> None:
         self.start: Ball | WallPosition = start
         self.end: Ball | WallPosition = end
@@ -40,6 +42,7 @@ class Rope(Element):
         self.collisionFactor: float = collisionFactor
         self.tensionStiffness: float = tensionStiffness  # 张力刚度系数
         self.dampingFactor: float = dampingFactor  # 阻尼系数
+        self.compliance: float = compliance
         self.isLegal: bool = True
         self.type: str = "rope"
         self.tension: float = 0.0  # 当前张力大小
@@ -126,6 +129,11 @@ class Rope(Element):
     def update(self, deltaTime: float) -> Self:
         """更新绳索位置和物理状态"""
         self.calculateForce()
+        self.updatePosition()
+        return self
+
+    def updatePosition(self, deltaTime: float = 0) -> None:
+        """更新绳索中心位置与墙上端点（XPBD 求解器求解后直接调用）"""
         if isinstance(self.start, Ball) and isinstance(self.end, Ball):
             self.position = (self.start.position + self.end.position) / 2
         elif isinstance(self.start, WallPosition) and isinstance(self.end, Ball):
@@ -134,9 +142,22 @@ class Rope(Element):
         elif isinstance(self.start, Ball) and isinstance(self.end, WallPosition):
             self.position = (self.start.position + self.end.getPosition()) / 2
             self.end.update()
-        else:
-            pass
-        return self
+
+    def boundingBox(self) -> tuple[float, float, float, float]:
+        """两端点的包围盒，四周扩展最大下垂量
+
+        长为 L 的绳索上任一点到两端距离之和不超过 L，两端相距 d 时离弦最远 √(L² - d²) / 2。
+        """
+        startPos = self.start.getPosition()
+        endPos = self.end.getPosition()
+        d = startPos.distance(endPos)
+        sag = math.sqrt(max(self.length * self.length - d * d, 0)) / 2
+        return (
+            min(startPos.x, endPos.x) - sag,
+            min(startPos.y, endPos.y) - sag,
+            max(startPos.x, endPos.x) + sag,
+            max(startPos.y, endPos.y) + sag,
+        )
 
     def draw(self, game) -> None:
         """绘制绳索，实现拉紧（直线）和松弛（悬链线）之间的平滑过渡"""
@@ -166,144 +187,47 @@ class Rope(Element):
 
     def _drawCatenary(self, game, startPos: Vector2, endPos: Vector2, actualDistance: float) -> None:
         """绘制悬链线"""
-        num_segments = 24
-        points = []
-        d = actualDistance
-        L = self.length
-
-        if d < 1e-6: return
+        self._drawSlackRope(game, startPos, endPos, actualDistance, 1.0)
 
-        direction = (endPos - startPos).normalize()
+    def _drawTransitionRope(self, game, startPos: Vector2, endPos: Vector2, actualDistance: float, transition_factor: float) -> None:
+        """绘制过渡状态的绳索：直线与悬链线按过渡因子插值，即把下垂量缩小"""
+        self._drawSlackRope(game, startPos, endPos, actualDistance, 1 - transition_factor)
+
+    def _drawSlackRope(self, game, startPos: Vector2, endPos: Vector2, d: float, sagScale: float) -> None:
+        """按缓存的归一化悬链线形状绘制松弛绳索
+
+        形状只取决于松弛比 L/d（见 catenaryShape），这里只做平移、旋转和缩放。
+        """
+        if d < 1e-6:
+            return
+
+        ux = (endPos.x - startPos.x) / d
+        uy = (endPos.y - startPos.y) / d
+        sagDir = self._sagDirection(Vector2(ux, uy))
+        shape = catenaryShape(self.length / d)
+
+        step = d / SEGMENTS
+        sx, sy = sagDir.x * d * sagScale, sagDir.y * d * sagScale
+        points = [
+            (
+                game.realToScreen(startPos.x + ux * step * i + sx * sag, game.x),
+                game.realToScreen(startPos.y + uy * step * i + sy * sag, game.y),
+            )
+            for i, sag in enumerate(shape)
+        ]
+        pygame.draw.lines(game.screen, self.color, False, points, self.width)
+
+    def _sagDirection(self, direction: Vector2) -> Vector2:
+        """下垂方向：重力在绳索法向上的分量，逐帧平滑过渡"""
         gravityDir = Vector2(0, 1)
         sagComponent = gravityDir - direction * direction.dot(gravityDir)
-        
-        # 计算新的下垂方向
-        new_sag_dir = sagComponent.normalize() if sagComponent.magnitude() > 1e-6 else direction.vertical()
-        
-        # 平滑过渡到新方向
+        newSagDir = sagComponent.normalize() if sagComponent.magnitude() > 1e-6 else direction.vertical()
+
         if self.last_sag_direction.magnitude() > 0:
-            lerp_factor = self.sag_direction_smooth_factor
+            lerpFactor = self.sag_direction_smooth_factor
             self.last_sag_direction = (
-                self.last_sag_direction * (1 - lerp_factor) + new_sag_dir * lerp_factor
+                self.last_sag_direction * (1 - lerpFactor) + newSagDir * lerpFactor
             ).normalize()
-            sagDir = self.last_sag_direction
         else:
-            sagDir = new_sag_dir
-            self.last_sag_direction = new_sag_dir
-
-        a = 0.0
-        if L > d:
-            try:
-                k = L / d
-                z = math.sqrt(6 * (k - 1))
-                for _ in range(5):
-                    if z < 1e-8: break
-                    if z > 700: z = 700; break
-                    sinh_z = math.sinh(z)
-                    cosh_z = math.cosh(z)
-                    f_z = sinh_z - k * z
-                    fp_z = cosh_z - k
-                    if abs(fp_z) < 1e-9: break
-                    z_new = z - f_z / fp_z
-                    if abs(z_new - z) < 1e-9: z = z_new; break
-                    z = z_new
-                if z > 1e-8: a = d / (2 * z)
-            except (ValueError, OverflowError):
-                a = 0.0
-
-        if a > 1e-6:
-            try:
-                c = a * math.cosh(d / (2 * a))
-                for i in range(num_segments + 1):
-                    t = i / num_segments
-                    x_local = d * (t - 0.5)
-                    y_local = c - a * math.cosh(x_local / a)
-                    basePos = startPos + direction * (d * t)
-                    finalPos = basePos + sagDir * y_local
-                    points.append((game.realToScreen(finalPos.x, game.x), game.realToScreen(finalPos.y, game.y)))
-            except (ValueError, OverflowError):
-                a = 0.0
-
-        if a < 1e-6:
-            maxSag = math.sqrt(max(0, L*L - d*d)) / 2
-            for i in range(num_segments + 1):
-                t = i / num_segments
-                basePos = startPos + direction * (d * t)
-                sag = maxSag * math.sin(math.pi * t)
-                finalPos = basePos + sagDir * sag
-                points.append((game.realToScreen(finalPos.x, game.x), game.realToScreen(finalPos.y, game.y)))
-
-        if len(points) > 1:
-            pygame.draw.lines(game.screen, self.color, False, points, self.width)
-
-    def _drawTransitionRope(self, game, startPos: Vector2, endPos: Vector2, actualDistance: float, transition_factor: float) -> None:
-        """绘制过渡状态的绳索"""
-        # 在过渡状态下，我们通过插值方式混合直线和悬链线
-        num_segments = 24
-        points = []
-        d = actualDistance
-        L = self.length
-
-        if d < 1e-6: return
-
-        direction = (endPos - startPos).normalize()
-        gravityDir = Vector2(0, 1)
-        sagComponent = gravityDir - direction * direction.dot(gravityDir)
-        sagDir = sagComponent.normalize() if sagComponent.magnitude() > 1e-6 else direction.vertical()
-
-        # 计算悬链线点
-        catenary_points = []
-        a = 0.0
-        if L > d:
-            try:
-                k = L / d
-                z = math.sqrt(6 * (k - 1))
-                for _ in range(5):
-                    if z < 1e-8: break
-                    if z > 700: z = 700; break
-                    sinh_z = math.sinh(z)
-                    cosh_z = math.cosh(z)
-                    f_z = sinh_z - k * z
-                    fp_z = cosh_z - k
-                    if abs(fp_z) < 1e-9: break
-                    z_new = z - f_z / fp_z
-                    if abs(z_new - z) < 1e-9: z = z_new; break
-                    z = z_new
-                if z > 1e-8: a = d / (2 * z)
-            except (ValueError, OverflowError):
-                a = 0.0
-
-        if a > 1e-6:
-            try:
-                c = a * math.cosh(d / (2 * a))
-                for i in range(num_segments + 1):
-                    t = i / num_segments
-                    x_local = d * (t - 0.5)
-                    y_local = c - a * math.cosh(x_local / a)
-                    basePos = startPos + direction * (d * t)
-                    finalPos = basePos + sagDir * y_local
-                    catenary_points.append(finalPos)
-            except (ValueError, OverflowError):
-                a = 0.0
-
-        if a < 1e-6 or len(catenary_points) == 0:
-            maxSag = math.sqrt(max(0, L*L - d*d)) / 2
-            for i in range(num_segments + 1):
-                t = i / num_segments
-                basePos = startPos + direction * (d * t)
-                sag = maxSag * math.sin(math.pi * t)
-                finalPos = basePos + sagDir * sag
-                catenary_points.append(finalPos)
-
-        # 通过插值生成过渡点
-        for i in range(num_segments + 1):
-            t = i / num_segments
-            catenary_point = catenary_points[i]
-            linear_point = startPos + direction * (d * t)
-            
-            # 根据过渡因子插值
-            interpolated_point = linear_point * transition_factor + catenary_point * (1 - transition_factor)
-            points.append((game.realToScreen(interpolated_point.x, game.x), game.realToScreen(interpolated_point.y, game.y)))
-
-        if len(points) > 1:
-            pygame.draw.lines(game.screen, self.color, False, points, self.width)
+            self.last_sag_direction = newSagDir
+        return self.last_sag_direction
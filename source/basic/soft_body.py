@@ -0,0 +1,180 @@
+import math
+from random import randint
+from typing import Self
+
+import pygame
+
+from .ball import Ball
+from .element import Element
+from .vector2 import Vector2
+
+
+class SoftBody(Element):
+    """软体：由弹簧网络连接起来的一组球
+
+    球仍放在 elements["ball"] 中，照常积分、碰撞；软体本身只保存连接关系
+    （起点下标、终点下标、自然长度三个平行列表），不为每条边创建 Spring 对象。
+    弹簧力由物理引擎的批量弹簧核与普通弹簧一起计算，
+    没有 NumPy 时退回到 calculateForce 的逐边循环。
+    """
+
+    def __init__(
+        self,
+        balls: list[Ball],
+        links: list[tuple[int, int]],  # 以 balls 下标表示的边
+        stiffness: float,  # 弹簧刚度系数
+        dampingFactor: float,  # 阻尼系数
+        color: pygame.Color,
+        width: float = 1,
+    ) -> None:
+        super().__init__(self.centroidOf(balls), color)
+        self.balls: list[Ball] = balls
+        self.linkStarts: list[int] = [a for a, _ in links]
+        self.linkEnds: list[int] = [b for _, b in links]
+        self.restLengths: list[float] = [
+            balls[a].position.distance(balls[b].position) for a, b in links
+        ]
+        self.stiffness: float = stiffness
+        self.dampingFactor: float = dampingFactor
+        self.width: float = width
+        self.type: str = "softbody"
+        self.revision: int = 0  # 连接关系每变化一次加一，批量弹簧核据此重建
+        self.id = randint(0, 100000000)
+
+    @classmethod
+    def grid(
+        cls,
+        position: Vector2,  # 左上角球心
+        columns: int,
+        rows: int,
+        spacing: float,
+        radius: float,
+        mass: float,  # 每个球的质量
+        color: pygame.Color,
+        stiffness: float,
+        dampingFactor: float = 0.5,
+        shear: bool = True,  # 是否添加对角（抗剪切）弹簧
+    ) -> "SoftBody":
+        """创建 columns × rows 的网格软体：横竖相邻的球相连，可选对角线"""
+        balls = [
+            Ball(
+                Vector2(position.x + i * spacing, position.y + j * spacing),
+                radius, color, mass, Vector2(0, 0), [],
+            )
+            for j in range(rows)
+            for i in range(columns)
+        ]
+        links: list[tuple[int, int]] = []
+        for j in range(rows):
+            for i in range(columns):
+                k = j * columns + i
+                if i + 1 < columns:
+                    links.append((k, k + 1))
+                if j + 1 < rows:
+                    links.append((k, k + columns))
+                if shear and i + 1 < columns and j + 1 < rows:
+                    links.append((k, k + columns + 1))
+                    links.append((k + 1, k + columns))
+        return cls(balls, links, stiffness, dampingFactor, color)
+
+    @staticmethod
+    def centroidOf(balls: list[Ball]) -> Vector2:
+        """一组球的几何中心"""
+        if not balls:
+            return Vector2(0, 0)
+        return Vector2(
+            sum(ball.position.x for ball in balls) / len(balls),
+            sum(ball.position.y for ball in balls) / len(balls),
+        )
+
+    def linkCount(self) -> int:
+        """弹簧（边）数量"""
+        return len(self.linkStarts)
+
+    def removeBall(self, ball: Ball) -> bool:
+        """移除一个球及与之相连的边，返回该球是否属于本软体"""
+        if ball not in self.balls:
+            return False
+        removed = self.balls.index(ball)
+        self.balls.pop(removed)
+
+        starts, ends, restLengths = [], [], []
+        for a, b, restLength in zip(self.linkStarts, self.linkEnds, self.restLengths):
+            if removed in (a, b):
+                continue
+            starts.append(a - (a > removed))
+            ends.append(b - (b > removed))
+            restLengths.append(restLength)
+        self.linkStarts, self.linkEnds, self.restLengths = starts, ends, restLengths
+        self.revision += 1
+        return True
+
+    def calculateForce(self) -> None:
+        """逐边计算胡克力与阻尼力（没有 NumPy 时的后备实现）"""
+        for a, b, restLength in zip(self.linkStarts, self.linkEnds, self.restLengths):
+            start, end = self.balls[a], self.balls[b]
+            dx = end.position.x - start.position.x
+            dy = end.position.y - start.position.y
+            length = math.sqrt(dx * dx + dy * dy)
+            if length < 1e-6:
+                continue
+            nx, ny = dx / length, dy / length
+            relativeVelocity = (
+                (end.velocity.x - start.velocity.x) * nx
+                + (end.velocity.y - start.velocity.y) * ny
+            )
+            magnitude = (
+                self.stiffness * (length - restLength)
+                + self.dampingFactor * relativeVelocity
+            )
+            force = Vector2(nx * magnitude, ny * magnitude)
+            start.force(force, isNatural=True)
+            end.force(-force, isNatural=True)
+
+    def to_dict(self) -> dict:
+        """序列化为预设数据，球以 id 引用（球本身随 elements["ball"] 保存）"""
+        return {
+            "type": self.type,
+            "id": self.id,
+            "position": [self.position.x, self.position.y],
+            "ball_ids": [ball.id for ball in self.balls],
+            "links": [[a, b] for a, b in zip(self.linkStarts, self.linkEnds)],
+            "restLengths": list(self.restLengths),
+            "stiffness": self.stiffness,
+            "dampingFactor": self.dampingFactor,
+            "width": self.width,
+            "color": str(self.color),
+        }
+
+    def setAttr(self, key: str, value: str) -> None:
+        """设置属性值"""
+        if value != "":
+            if key == "color":
+                self.color = value
+            elif key == "stiffness":
+                self.stiffness = float(value)
+            elif key == "dampingFactor":
+                self.dampingFactor = float(value)
+
+    def update(self, deltaTime: float) -> Self:
+        """更新软体中心位置（球由物理引擎单独积分）"""
+        self.position = self.centroidOf(self.balls)
+        return self
+
+    def boundingBox(self) -> tuple[float, float, float, float] | None:
+        """所有球心的包围盒（连接边画在球心之间）"""
+        if not self.balls:
+            return None
+        xs = [ball.position.x for ball in self.balls]
+        ys = [ball.position.y for ball in self.balls]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def draw(self, game) -> None:
+        """绘制所有连接边"""
+        points = [
+            (game.realToScreen(ball.position.x, game.x), game.realToScreen(ball.position.y, game.y))
+            for ball in self.balls
+        ]
+        width = max(1, int(self.width))
+        for a, b in zip(self.linkStarts, self.linkEnds):
+            pygame.draw.line(game.screen, self.color, points[a], points[b], width)
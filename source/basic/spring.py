@@ -114,8 +114,11 @@ class Spring(Element):
         """
         # 计算弹簧力和弹性势能
         self.calculateForce()
+        self.updatePosition()
+        return self
 
-        # 更新弹簧中心位置
+    def updatePosition(self) -> None:
+        """更新弹簧中心位置与墙上端点（弹簧力由批量弹簧核计算时直接调用）"""
         if isinstance(self.start, Ball) and isinstance(self.end, Ball):
             self.position = (self.start.position + self.end.position) / 2
 
@@ -132,7 +135,19 @@ class Spring(Element):
             self.start.update()
             self.end.update()
 
-        return self
+    def boundingBox(self) -> tuple[float, float, float, float]:
+        """两端点的包围盒，四周扩展线圈振幅（不超过两端球的较大半径）"""
+        startPos = self.start.getPosition()
+        endPos = self.end.getPosition()
+        startRadius = self.start.radius if isinstance(self.start, Ball) else self.width
+        endRadius = self.end.radius if isinstance(self.end, Ball) else self.width
+        amplitude = max(startRadius, endRadius)
+        return (
+            min(startPos.x, endPos.x) - amplitude,
+            min(startPos.y, endPos.y) - amplitude,
+            max(startPos.x, endPos.x) + amplitude,
+            max(startPos.y, endPos.y) + amplitude,
+        )
 
     def draw(self, game) -> None:
         """绘制弹簧 - 固定频率振幅版本
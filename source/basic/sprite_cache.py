@@ -0,0 +1,160 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+import math
+
+import pygame
+
+GRADIENT_CIRCLES: int = 20  # 渐变球面的同心圆层数
+EXACT_RADIUS: int = 64  # 不超过该屏幕半径（像素）时按整数像素分档
+RADIUS_STEP: float = 2 ** (1 / 32)  # 更大的半径按等比分档，相邻档位相差约 2.2%
+MAX_BYTES: int = 32 * 1024 * 1024  # 精灵缓存的默认内存上限
+TEXT_MAX_BYTES: int = 4 * 1024 * 1024  # 文字缓存的内存上限
+
+
+class SpriteCache:
+    """按键缓存预渲染的 Surface
+
+    按最近最少使用（LRU）的顺序淘汰，所有精灵的像素内存之和不超过 maxBytes；
+    单个超过上限的精灵不缓存。记录命中、未命中与淘汰次数，供界面显示命中率。
+    """
+
+    def __init__(self, maxBytes: int = MAX_BYTES) -> None:
+        self.maxBytes: int = maxBytes
+        self.sprites: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self.bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    @staticmethod
+    def sizeOf(surface: pygame.Surface) -> int:
+        """Surface 的像素内存（字节）"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, key: Hashable, render: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """取出 key 对应的精灵，没有时调用 render 生成并缓存"""
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = render()
+        size = self.sizeOf(sprite)
+        if size > self.maxBytes:
+            return sprite
+        self.sprites[key] = sprite
+        self.bytes += size
+        while self.bytes > self.maxBytes:
+            _, evicted = self.sprites.popitem(last=False)
+            self.bytes -= self.sizeOf(evicted)
+            self.evictions += 1
+        return sprite
+
+    def clear(self) -> None:
+        """清空缓存（统计数据保留）"""
+        self.sprites.clear()
+        self.bytes = 0
+
+    def resetStats(self) -> None:
+        """清零命中、未命中与淘汰计数"""
+        self.hits = self.misses = self.evictions = 0
+
+    def hitRate(self) -> float:
+        """命中率（还没有查询时为 0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """缓存统计，供界面显示与性能分析"""
+        return {
+            "sprites": len(self.sprites),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRate": self.hitRate(),
+        }
+
+
+gradientSprites = SpriteCache()
+textSprites = SpriteCache(TEXT_MAX_BYTES)
+
+
+def radiusBucket(radius: float) -> int:
+    """屏幕半径所在的档位（同一档位的球共用一张精灵）
+
+    小半径按整数像素分档，与逐层绘制时的取整一致；
+    大半径按等比分档，缩放时半径连续变化也只会在少数档位之间切换，不必每帧重绘。
+    """
+    if radius < EXACT_RADIUS:
+        return max(int(radius), 0)
+    step = round(math.log(radius / EXACT_RADIUS, RADIUS_STEP))
+    return int(EXACT_RADIUS * RADIUS_STEP**step)
+
+
+def drawGradientLayers(
+    surface: pygame.Surface, color: tuple, center: tuple[float, float], radius: float
+) -> None:
+    """在 surface 上逐层绘制渐变球面（外部为原色、不透明，向内逐渐变浅、半透明）"""
+    for number in range(GRADIENT_CIRCLES):
+        ratio = number / (GRADIENT_CIRCLES - 1)
+        drawRadius = int(radius * (1 - ratio))
+        if drawRadius <= 0:
+            continue
+
+        red = int(color[0] + (255 - color[0]) * ratio * 0.5)
+        green = int(color[1] + (255 - color[1]) * ratio * 0.5)
+        blue = int(color[2] + (255 - color[2]) * ratio * 0.5)
+        alpha = int(255 * (1 - ratio * 0.5))
+
+        # 每层画在临时 surface 上再贴图，才能与下面的层做透明度混合
+        layer = pygame.Surface((drawRadius * 2, drawRadius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(
+            layer, (red, green, blue, alpha), (drawRadius, drawRadius), drawRadius, 0
+        )
+        surface.blit(layer, (center[0] - drawRadius, center[1] - drawRadius))
+
+
+def gradientSprite(color: tuple, radius: int) -> pygame.Surface:
+    """半径为 radius（像素）的渐变球面精灵，每种 (颜色, 半径) 只渲染一次"""
+
+    def render() -> pygame.Surface:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        drawGradientLayers(sprite, color, (radius, radius), radius)
+        # 转成与屏幕一致的像素格式，贴图更快（没有窗口时保持原样）
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+    return gradientSprites.get((tuple(color[:3]), radius), render)
+
+
+def drawGradientCircle(
+    surface: pygame.Surface, color: tuple, center: tuple[float, float], radius: float
+) -> None:
+    """以 center 为圆心绘制屏幕半径为 radius 的渐变球面
+
+    使用缓存的精灵；精灵大于缓存上限时（放得很大的球）直接逐层绘制。
+    """
+    bucket = radiusBucket(radius)
+    if bucket <= 0:
+        return
+    if (2 * bucket) ** 2 * 4 > gradientSprites.maxBytes:
+        drawGradientLayers(surface, color, center, radius)
+        return
+    surface.blit(gradientSprite(color, bucket), (center[0] - bucket, center[1] - bucket))
+
+
+def renderText(font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+    """带缓存的 font.render，参数与之相同
+
+    (字体, 文字, 抗锯齿, 颜色) 都没变时直接返回上次渲染的 Surface，
+    所以界面上数值没变的行不会重新渲染。返回的 Surface 是共享的，只能贴图，不要修改。
+    """
+    key = (font, text, antialias, tuple(color) if isinstance(color, pygame.Color) else color)
+    return textSprites.get(key, lambda: font.render(text, antialias, color))
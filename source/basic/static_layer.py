@@ -0,0 +1,120 @@
+import pygame
+
+COLOR_KEY: tuple[int, int, int] = (1, 2, 3)  # 透明色的初始候选，与墙体颜色冲突时依次换用下一个
+
+
+class StaticLayer:
+    """静态墙体的离屏图层
+
+    把所有静止（isStatic）的墙体按当前视角光栅化到一张屏幕大小的 Surface 上，
+    之后每帧只需一次贴图。图层使用透明色（colorkey）与 RLE 压缩，
+    空白区域贴图时几乎不花时间。
+
+    以下情况图层失效：静态墙体的列表、几何（geometryKey）或颜色变化
+    （新建、删除、编辑、拖动墙体都会使墙体离开静止状态），
+    以及视角（x、y、ratio）或屏幕大小变化。
+    视角正在移动或缩放时重建图层并不划算（见 draw），此时直接绘制墙体，
+    视角停下一帧后再重建。
+    """
+
+    def __init__(self) -> None:
+        self.surface: pygame.Surface | None = None
+        self.camera: tuple | None = None  # 图层对应的视角
+        self.previousCamera: tuple | None = None  # 上一帧结束时的视角
+        self.walls: list = []
+        self.geometryKeys: list[tuple[float, ...]] = []
+        self.colors: list = []
+        self.rebuilds: int = 0
+        self.blits: int = 0
+        self.misses: int = 0  # 因视角移动而直接绘制墙体的次数
+
+    @staticmethod
+    def cameraOf(game) -> tuple:
+        """决定图层内容的视角状态"""
+        return (game.x, game.y, game.ratio, game.screen.get_size())
+
+    def isValid(self, camera: tuple, walls: list) -> bool:
+        """图层是否与视角和静态墙体一致（墙体按身份比较，与墙体 BVH 的做法相同）"""
+        if self.surface is None or camera != self.camera or len(walls) != len(self.walls):
+            return False
+        for wall, cached, key, color in zip(walls, self.walls, self.geometryKeys, self.colors):
+            if wall is not cached or wall.geometryKey is not key or wall.color != color:
+                return False
+        return True
+
+    def draw(self, game, walls: list) -> bool:
+        """把静态墙体图层贴到屏幕上，返回图层是否可用
+
+        返回 False 时调用者应照常逐个绘制静态墙体。
+        重建需要整屏填充与 RLE 编码（约数毫秒），比逐个绘制几十面墙慢得多，
+        所以只在视角与上一帧相同时才重建，拖动或缩放视角的过程中不重建。
+        """
+        staticWalls = [wall for wall in walls if wall.isStatic]
+        if not staticWalls:
+            self.surface = None
+            return False
+
+        camera = self.cameraOf(game)
+        if not self.isValid(camera, staticWalls):
+            if camera != self.previousCamera:
+                self.misses += 1
+                return False
+            self.render(game, staticWalls, camera)
+
+        game.screen.blit(self.surface, (0, 0))
+        self.blits += 1
+        return True
+
+    def endFrame(self, game) -> None:
+        """每帧结束时调用，记录本帧的视角"""
+        self.previousCamera = self.cameraOf(game)
+
+    def render(self, game, walls: list, camera: tuple) -> None:
+        """按当前视角重建图层"""
+        self.rebuilds += 1
+        colorKey = self.colorKeyFor(walls)
+        surface = pygame.Surface(game.screen.get_size(), 0, game.screen)
+        surface.fill(colorKey)
+
+        # 借用 Wall.draw 绘制，保证与直接绘制的像素一致；本帧的高亮不画进图层
+        screen = game.screen
+        game.screen = surface
+        try:
+            for wall in walls:
+                highLighted = wall.highLighted
+                wall.highLighted = False
+                wall.draw(game)
+                wall.highLighted = highLighted
+        finally:
+            game.screen = screen
+
+        # 画完再开启 RLE：往 RLE 压缩过的 Surface 上绘图非常慢
+        surface.set_colorkey(colorKey, pygame.RLEACCEL)
+        self.surface = surface
+        self.camera = camera
+        self.walls = walls
+        self.geometryKeys = [wall.geometryKey for wall in walls]
+        self.colors = [wall.color for wall in walls]
+
+    @staticmethod
+    def colorKeyFor(walls: list) -> tuple[int, int, int]:
+        """选一个不是任何墙体颜色的透明色"""
+        used = set()
+        for wall in walls:
+            try:
+                used.add(tuple(pygame.Color(wall.color))[:3])
+            except ValueError:
+                used.add((0, 0, 0))  # 无效颜色的墙体画成黑色
+        red, green, blue = COLOR_KEY
+        while (red, green, blue) in used:
+            blue = (blue + 1) % 256
+        return red, green, blue
+
+    def stats(self) -> dict[str, int]:
+        """图层统计，供界面显示与性能分析"""
+        return {
+            "walls": len(self.walls) if self.surface is not None else 0,
+            "rebuilds": self.rebuilds,
+            "blits": self.blits,
+            "misses": self.misses,
+        }
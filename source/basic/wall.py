@@ -1,4 +1,5 @@
 import copy
+import math
 from random import randint
 from typing import Self
 
@@ -13,6 +14,11 @@ from .vector2 import Vector2, ZERO
 class Wall(Element):
     """墙体类，处理多边形碰撞和显示"""
 
+    # 静态 / 运动学：墙体放置后几乎不再移动。静态墙冻结在碰撞结构（BVH）中，
+    # 逐帧更新也会跳过它；被拖动或用命令移动时转为运动学，
+    # 连续 staticFrames 次更新都没有移动后重新变为静态
+    staticFrames: int = 30
+
     def __init__(
         self, vertexes: list[Vector2], color: pygame.Color, isLine: bool = False
     ) -> None:
@@ -40,6 +46,13 @@ class Wall(Element):
         self.type: str = "wall"
         self.collisionFactor: float = 1.0
 
+        # 几何缓存：顶点变化时才重新计算（见 updateGeometry）
+        self.linesUpdated: bool = False  # lines 是否已按 update 的规则重建
+        self.updateGeometry()
+
+        # 新放置的墙先作为运动学墙，经过若干次更新（重建碰撞线段）后再冻结
+        self.isStatic: bool = False
+        self.stillFrames: int = 0
 
         self.id = randint(0, 100000000)
         self.attrs: list[dict] = []
@@ -52,6 +65,7 @@ class Wall(Element):
                 self.color = value
             elif key == "collisionFactor":
                 self.collisionFactor = float(value)
+            self.updateAttrsList()
 
     def copy(self, game) -> None:
         """自我复制"""
@@ -92,25 +106,109 @@ class Wall(Element):
                 "min": "#000000", "max": "#FFFFFF"}
         ]
 
+    def makeKinematic(self) -> None:
+        """转为运动学墙：恢复逐帧更新，直到再次静止 staticFrames 次"""
+        self.isStatic = False
+        self.stillFrames = 0
+
     def update(self, deltaTime: float) -> Self:
-        """更新墙体位置并维护碰撞线段"""
+        """更新墙体位置，顶点变化时才重建碰撞线段与几何缓存"""
         # 计算位置
         offset = self.position - self.originalPosition
-        for i in range(len(self.vertexes)):
-            self.vertexes[i] += offset
-
-        self.lines = [
-            CollisionLine(self.vertexes[0], self.vertexes[1], self.isLine),
-            CollisionLine(self.vertexes[1], self.vertexes[2]),
-            CollisionLine(self.vertexes[2], self.vertexes[3]),
-            CollisionLine(self.vertexes[3], self.vertexes[0]),
-        ]
+        if offset.x or offset.y:
+            for i in range(len(self.vertexes)):
+                self.vertexes[i] += offset
+            self.originalPosition = self.position.copy()
+
+        if not self.linesUpdated or self.geometryKey != self.getGeometryKey():
+            self.lines = [
+                CollisionLine(self.vertexes[0], self.vertexes[1], self.isLine),
+                CollisionLine(self.vertexes[1], self.vertexes[2]),
+                CollisionLine(self.vertexes[2], self.vertexes[3]),
+                CollisionLine(self.vertexes[3], self.vertexes[0]),
+            ]
+            self.linesUpdated = True
+            self.updateGeometry()
+            self.makeKinematic()
+        elif not self.isStatic:
+            self.stillFrames += 1
+            if self.stillFrames >= self.staticFrames:
+                self.isStatic = True
 
-        self.originalPosition = self.position.copy()
         self.updateAttrsList()
 
         return self
 
+    def getGeometryKey(self) -> tuple[float, ...]:
+        """顶点坐标组成的键，用于判断几何缓存是否过期"""
+        return tuple(c for vertex in self.vertexes for c in (vertex.x, vertex.y))
+
+    def updateGeometry(self) -> None:
+        """缓存边的外法线与偏移量、包围盒、凸性与厚度
+
+        第 i 条边为 vertexes[i] -> vertexes[i + 1]，点 p 在其外侧当且仅当
+        normals[i] · p > offsets[i]。
+        """
+        vertexes = self.vertexes
+        count = len(vertexes)
+        self.geometryKey: tuple[float, ...] = self.getGeometryKey()
+
+        xs = [vertex.x for vertex in vertexes]
+        ys = [vertex.y for vertex in vertexes]
+        self.aabb: tuple[float, float, float, float] = (min(xs), min(ys), max(xs), max(ys))
+
+        # 有向面积的符号决定外法线朝向
+        area = sum(
+            xs[i] * ys[(i + 1) % count] - xs[(i + 1) % count] * ys[i]
+            for i in range(count)
+        )
+        self.isDegenerate: bool = abs(area) < 1e-9
+        orientation = 1 if area > 0 else -1
+
+        self.normals: list[tuple[float, float]] = []
+        self.offsets: list[float] = []
+        turns: set[bool] = set()
+        thickness = math.inf
+        for i in range(count):
+            ax, ay = xs[i], ys[i]
+            ex, ey = xs[(i + 1) % count] - ax, ys[(i + 1) % count] - ay
+            length = math.hypot(ex, ey)
+            if length == 0:
+                self.normals.append((0.0, 0.0))
+                self.offsets.append(0.0)
+                continue
+            nx, ny = orientation * ey / length, -orientation * ex / length
+            self.normals.append((nx, ny))
+            self.offsets.append(nx * ax + ny * ay)
+
+            # 凸性：相邻两边的转向一致
+            fx, fy = xs[(i + 2) % count] - xs[(i + 1) % count], ys[(i + 2) % count] - ys[(i + 1) % count]
+            turn = ex * fy - ey * fx
+            if turn:
+                turns.add(turn > 0)
+
+            # 厚度：垂直于各边方向上的最小宽度
+            width = max(abs(ex * (y - ay) - ey * (x - ax)) for x, y in zip(xs, ys)) / length
+            thickness = min(thickness, width)
+
+        self.isConvex: bool = len(turns) <= 1
+        self.thickness: float = 0.0 if thickness == math.inf else thickness
+
+    def getClosestEdge(self, pos: Vector2) -> tuple[int, float]:
+        """返回有向距离最大的边的下标及该距离（负数表示点在内部）
+
+        对凸多边形内部的点，这就是离它最近的边。
+        """
+        x, y = pos.x, pos.y
+        closest, distance = -1, -math.inf
+        for i, ((nx, ny), offset) in enumerate(zip(self.normals, self.offsets)):
+            if nx == 0 and ny == 0:
+                continue
+            d = nx * x + ny * y - offset
+            if d > distance:
+                closest, distance = i, d
+        return closest, distance
+
     def checkVertexCollision(self, ball: Ball) -> None:
         """检测球与墙体顶点的碰撞"""
         for vertex in self.vertexes:
@@ -134,22 +232,36 @@ class Wall(Element):
             ball.velocity -= normal * (2 * velocityNormal)
 
     def isPosOn(self, game, pos: Vector2) -> bool:
-        """使用射线法判断点是否在多边形内部"""
-        mx = pos.x
-        my = pos.y
-
-        # 射线法检测点是否在多边形内
-        # 创建一条从点开始的水平射线
-        ray = CollisionLine(Vector2(mx, my), Vector2(
-            mx + 10000, my))  # 假设射线足够长
-        intersections = 0
-
-        for line in self.lines:
-            if line.isLineIntersect(ray):
-                intersections += 1
-
-        # 如果射线与多边形的边相交的次数是奇数，则点在多边形内
-        return intersections % 2 == 1
+        """判断点是否在多边形内部（使用缓存的几何，不创建新对象）"""
+        x, y = pos.x, pos.y
+        minX, minY, maxX, maxY = self.aabb
+        if x < minX or x > maxX or y < minY or y > maxY or self.isDegenerate:
+            return False
+
+        # 凸多边形：点在每条边的内侧半平面上
+        if self.isConvex:
+            for (nx, ny), offset in zip(self.normals, self.offsets):
+                if nx * x + ny * y > offset:
+                    return False
+            return True
+
+        # 凹多边形：射线法，从点向右发射水平射线，交点数为奇数则在内部
+        vertexes = self.vertexes
+        inside = False
+        j = len(vertexes) - 1
+        for i in range(len(vertexes)):
+            xi, yi = vertexes[i].x, vertexes[i].y
+            xj, yj = vertexes[j].x, vertexes[j].y
+            if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+                inside = not inside
+            j = i
+        return inside
+
+    def boundingBox(self) -> tuple[float, float, float, float]:
+        """顶点的包围盒（高亮时向外扩展 1）"""
+        xs = [vertex.x for vertex in self.vertexes]
+        ys = [vertex.y for vertex in self.vertexes]
+        return min(xs) - 1, min(ys) - 1, max(xs) + 1, max(ys) + 1
 
     def draw(self, game) -> None:
         """绘制带高亮效果的墙体"""
@@ -1,4 +1,4 @@
-from ..basic import Ball, Element, Vector2, Wall, ZERO
+from ..basic import Ball, Element, SoftBody, Vector2, Wall, ZERO
 from ..config_manager import config_manager
 from ..game import Game
 
@@ -24,6 +24,14 @@ def ballsToString(balls: list[Element]) -> str:
     return text
 
 
+def removeFromSoftBodies(game: Game, ball: Element) -> None:
+    """把球从所在的软体中移除，球全部删除后软体一并删除（与右键菜单的删除一致）"""
+    for softBody in list(game.elements["softbody"]):
+        if softBody.removeBall(ball) and not softBody.balls:
+            game.elements["all"].remove(softBody)
+            game.elements["softbody"].remove(softBody)
+
+
 def wallsToString(walls: list[Element]) -> str:
     """walls列表转字符串"""
     text: str = ""
@@ -87,12 +95,31 @@ def command(text: str, game: Game) -> bool:
             game.elements["all"].append(wall)
             game.elements["wall"].append(wall)
 
+        elif commands[1] == "softbody":
+            """create softbody [x] [y] [columns] [rows] [spacing] [radius] [mass] [stiffness] [color]"""
+            softBody = SoftBody.grid(
+                Vector2(float(commands[2]), float(commands[3])),
+                int(commands[4]),
+                int(commands[5]),
+                float(commands[6]),
+                float(commands[7]),
+                float(commands[8]),
+                commands[10],
+                float(commands[9]),
+            )
+            # 软体画在它的球下方
+            game.elements["all"].append(softBody)
+            game.elements["softbody"].append(softBody)
+            game.elements["all"].extend(softBody.balls)
+            game.elements["ball"].extend(softBody.balls)
+
         else:
             return False
 
     elif commands[0] == "set":
 
         if commands[1] == "ball":
+            game.elements["ball"][int(commands[2])].wake()
 
             if commands[3] in ["radius", "mass"]:
                 """set ball [ballIndex] [attr] [value]"""
@@ -120,9 +147,9 @@ def command(text: str, game: Game) -> bool:
 
                 elif commands[3] == "force":
                     """set ball [ballIndex] force [fx] [fy]"""
-                    game.elements["ball"][int(commands[2])].artificialForces = [
-                        Vector2(float(commands[4]), float(commands[5]))
-                    ]
+                    ball = game.elements["ball"][int(commands[2])]
+                    ball.resetForce()
+                    ball.force(Vector2(float(commands[4]), float(commands[5])))
 
                 elif commands[3] == "gravity":
                     """set ball [ballIndex] gravity [value]"""
@@ -152,9 +179,11 @@ def command(text: str, game: Game) -> bool:
 
             elif commands[3] == "position":
                 """set wall [wallIndex] position [x] [y]"""
-                game.elements["wall"][int(commands[2])].position = Vector2(
-                    float(commands[4]), float(commands[5])
-                )
+                wall = game.elements["wall"][int(commands[2])]
+                wall.position = Vector2(float(commands[4]), float(commands[5]))
+                wall.makeKinematic()
+                for ball in game.elements["ball"]:
+                    ball.wake()
 
             else:
                 return False
@@ -182,16 +211,35 @@ def command(text: str, game: Game) -> bool:
             else:
                 return False
 
+        elif commands[1] == "physics":
+
+            if commands[2] == "hz":
+                """set physics hz [value]"""
+                game.physicsHz = max(1.0, float(commands[3]))
+
+            elif commands[2] == "maxSteps":
+                """set physics maxSteps [value]"""
+                game.maxPhysicsSteps = max(1, int(commands[3]))
+
+            elif commands[2] == "engine":
+                """set physics engine [step | event]"""
+                if commands[3] not in ["step", "event"]:
+                    return False
+                game.collisionEngine = commands[3]
+
+            else:
+                return False
+
     elif commands[0] == "clear":
         if commands[1] == "ball":
             """clear ball [ballIndex] [velocity | force]"""
+            game.elements["ball"][int(commands[2])].wake()
 
             if commands[3] == "velocity":
                 game.elements["ball"][int(commands[2])].velocity = ZERO
 
             elif commands[3] == "force":
-                game.elements["ball"][int(
-                    commands[2])].artificialForces.clear()
+                game.elements["ball"][int(commands[2])].resetForce()
 
             else:
                 return False
@@ -199,6 +247,7 @@ def command(text: str, game: Game) -> bool:
     elif commands[0] == "add":
         if commands[1] == "ball":
             "add ball [ballIndex] [velocity | force] [x] [y]"
+            game.elements["ball"][int(commands[2])].wake()
 
             if commands[3] == "velocity":
                 game.elements["ball"][int(commands[2])].velocity += Vector2(
@@ -206,7 +255,7 @@ def command(text: str, game: Game) -> bool:
                 )
 
             elif commands[3] == "force":
-                game.elements["ball"][int(commands[2])].artificialForces.append(
+                game.elements["ball"][int(commands[2])].force(
                     Vector2(float(commands[4]), float(commands[5]))
                 )
 
@@ -220,6 +269,7 @@ def command(text: str, game: Game) -> bool:
             ball = game.elements["ball"][int(commands[2])]
             game.elements["all"].remove(ball)
             game.elements["ball"].remove(ball)
+            removeFromSoftBodies(game, ball)
 
         elif commands[1] == "wall":
             """delete wall [wallIndex]"""
@@ -234,6 +284,7 @@ def command(text: str, game: Game) -> bool:
 
             if element.type == "ball":
                 game.elements["ball"].remove(element)
+                removeFromSoftBodies(game, element)
 
             elif element.type == "wall":
                 game.elements["wall"].remove(element)
@@ -86,6 +86,12 @@ class ControlOption:
                     ):
                         to_remove.append(spring)
 
+            # 软体只去掉这个球及与之相连的边，球全部删除后软体一并删除
+            if target.type == "ball":
+                for softBody in game.elements["softbody"]:
+                    if softBody.removeBall(target) and not softBody.balls:
+                        to_remove.append(softBody)
+
             # 删除相关的连接元素
             for element in to_remove:
                 try:
@@ -362,7 +368,7 @@ class ControlOption:
         """清除所有外力"""
         target.displayedAcceleration = target.acceleration
         target.displayedAccelerationFactor = 1
-        target.artificialForces.clear()
+        target.resetForce()
 
     def isMouseOn(self) -> bool:
         """判断鼠标是否在控件上"""
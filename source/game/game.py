@@ -1,6 +1,7 @@
 
 import json
 import copy
+import math
 import multiprocessing
 import os
 import sys
@@ -11,12 +12,13 @@ import pygame
 
 from shared_game_state import SharedGameState
 
-from ..basic import Ball, Element, Rope, Vector2, Wall, WallPosition, ZERO
+from ..basic import Ball, Element, Floor, Rope, SoftBody, Vector2, Wall, WallPosition, StaticLayer, ZERO, electrostaticFactor, gradientSprites, gravityFactor, renderText, textSprites, assets
 from ..config_manager import config_manager
 from ..physics.engine import PhysicsEngine
 from .element_controller import ElementController
 from .input_menu import InputMenu
 from .menu import Menu
+from .option import Option
 from .set_caps_lock import setCapsLock
 from .settings_button import SettingsButton
 
@@ -28,6 +30,17 @@ if TYPE_CHECKING:
 class Game:
     """物理运动模拟系统主游戏类"""
 
+    # 不写入预设、也不从预设恢复的属性：运行时对象、物理步与插值状态、缓存与每帧统计，
+    # 以及本机的性能设置（物理步频、视野剔除、静态图层等）
+    presetExcludedAttributes: frozenset[str] = frozenset({
+        "fpsSaver", "elements", "groundElements", "celestialElements", "screen", "projection_queue",
+        "wall_positions", "examples",
+        "physicsHz", "maxPhysicsSteps", "physicsAccumulator", "physicsStepsLastFrame", "substepsLastFrame",
+        "eventsLastFrame", "isEventDriven", "lastWakeSignature", "previousPositions",
+        "viewCulling", "cullMargin", "drawnElementsLastFrame", "culledElementsLastFrame",
+        "staticLayerCaching", "textRendersAvoidedLastFrame", "textHitsBeforeFrame",
+    })
+
     def __init__(self) -> None:
         os.environ["SDL_WINDOWS_DPI_AWARENESS"] = "permonitorv2"
         pygame.init()
@@ -101,6 +114,40 @@ class Game:
         self.settingsButton: SettingsButton = SettingsButton(0, 0, 50, 50)
         self.fpsSaver: list[float] = []
         self.tempFrames: int = 0
+
+        # 固定步长物理：physicsHz 为物理步频率，倍速改变每帧步数而非步长
+        self.physicsHz: float = 120
+        self.maxPhysicsSteps: int = 8  # 每帧（1 倍速下）最多追赶的步数，防止"死亡螺旋"
+        self.physicsAccumulator: float = 0
+        self.physicsStepsLastFrame: int = 0
+        self.substepsLastFrame: int = 0  # 本帧所有球实际花费的子步总数
+        self.eventsLastFrame: int = 0  # 事件驱动模式下本帧处理的碰撞数
+        self.isEventDriven: bool = False  # 最近一个物理步是否由事件驱动引擎推进
+        self.lastWakeSignature: tuple = ()  # 环境参数与元素数量，变化时唤醒所有球
+        self.previousPositions: dict[int, tuple[float, float]] = {}  # 最后一步之前的球位置，用于插值渲染
+
+        # 视野剔除：只绘制包围盒与屏幕范围相交的元素
+        self.viewCulling: bool = True
+        self.cullMargin: float = 20  # 屏幕四周多留的像素，覆盖按像素绘制的线宽、端点圆点等
+        self.drawnElementsLastFrame: int = 0
+        self.culledElementsLastFrame: int = 0
+
+        # 静态墙体图层：静止的墙体预先画在离屏图层上，每帧整体贴图一次
+        self.staticLayerCaching: bool = True
+        self.staticLayer: StaticLayer = StaticLayer()
+
+        # 文字缓存：界面文字按 (字体, 文字, 颜色) 缓存，数值没变的行不重新渲染
+        self.textRendersAvoidedLastFrame: int = 0  # 上一帧命中缓存、省下的渲染次数
+        self.textHitsBeforeFrame: int = 0
+
+        # 示例菜单的图标与设置按钮图片在后台预先读盘、解码，第一帧绘制菜单时不必等待磁盘
+        self.examples: list[dict] = self.loadExamples()
+        preloadPaths: list[str] = [self.settingsButton.iconPath]
+        for example in self.examples:
+            for attr in example["attrs"]:
+                if attr["type"] == "icon" and attr["value"]:
+                    preloadPaths.append(attr["value"])
+        assets.preload(preloadPaths)
         
         # 多进程通信队列（用于向投影显示进程发送数据）
         self.projection_queue: multiprocessing.Queue = None
@@ -111,16 +158,7 @@ class Game:
         # -- Physics engine (owns element collections + floor) -----------
         self._physics: PhysicsEngine = PhysicsEngine(self.optionsList)
 
-        self._physics.floor = Wall(
-            [
-                Vector2(0, -10),
-                Vector2(self.screen.get_width(), -10),
-                Vector2(self.screen.get_width(), self.screen.get_height()),
-                Vector2(0, self.screen.get_height()),
-            ],
-            (200, 200, 200),
-            True,
-        )
+        self._physics.floor = Floor(-10, (200, 200, 200))
 
         self.translation: dict[str, str] = {}
         self.inputMenu: InputMenu = None
@@ -171,12 +209,12 @@ class Game:
         self._physics.celestial_elements = value
 
     @property
-    def floor(self) -> Wall | None:
+    def floor(self) -> Floor | None:
         """Delegate to physics engine's floor."""
         return self._physics.floor
 
     @floor.setter
-    def floor(self, value: Wall | None) -> None:
+    def floor(self, value: Floor | None) -> None:
         self._physics.floor = value
 
     @property
@@ -187,6 +225,24 @@ class Game:
     def isFloorIllegal(self, value: bool) -> None:
         self._physics.is_floor_illegal = value
 
+    @property
+    def collisionEngine(self) -> str:
+        """Delegate to physics engine's collision engine ("step" / "event")."""
+        return self._physics.collision_engine
+
+    @collisionEngine.setter
+    def collisionEngine(self, value: str) -> None:
+        self._physics.set_collision_engine(value)
+
+    @property
+    def usePositionConstraints(self) -> bool:
+        """Delegate to physics engine: rods and ropes as XPBD constraints (False = stiff springs)."""
+        return self._physics.position_based_constraints
+
+    @usePositionConstraints.setter
+    def usePositionConstraints(self, value: bool) -> None:
+        self._physics.position_based_constraints = value
+
     def getPresetFileByIndex(self, index: int) -> str:
         """根据索引获取按字典序排序的预设文件名"""
         try:
@@ -477,7 +533,7 @@ class Game:
         # 保存基本属性（排除复杂对象）
         for key, value in self.__dict__.items():
             # print(key, value)
-            if isinstance(value, (int, float, str, list, tuple, dict)) and key not in ["fpsSaver", "elements", "groundElements", "celestialElements", "screen", "projection_queue", "wall_positions"]:
+            if isinstance(value, (int, float, str, list, tuple, dict)) and key not in self.presetExcludedAttributes:
                 data["attributes"][key] = value
                 
         # print(json.dumps(data, ensure_ascii=False, indent=4))
@@ -519,8 +575,10 @@ class Game:
                     for element_list in self.elements.values():
                         element_list.clear()
                     
-                    # 恢复基本属性
-                    self.__dict__.update(attributes)
+                    # 恢复基本属性（旧预设中可能存有运行时状态，一并跳过）
+                    self.__dict__.update(
+                        {key: value for key, value in attributes.items() if key not in self.presetExcludedAttributes}
+                    )
                     # 确保ratio正确应用
                     if hasattr(self, 'ratio') and self.ratio > 0:
                         self.lastRatio = self.ratio
@@ -715,6 +773,27 @@ class Game:
                             self.elements["rod"].append(rod)
                             self.elements["all"].append(rod)
 
+                    # 重新创建软体（连接已创建的球，画在球的下方）
+                    ballsById = {ball.id: ball for ball in self.elements["ball"]}
+                    for softBodyData in elements_data.get("softbody", []):
+                        balls = [ballsById.get(ballId) for ballId in softBodyData.get("ball_ids", [])]
+                        if not balls or None in balls:
+                            continue
+                        softBody = SoftBody(
+                            balls,
+                            [tuple(link) for link in softBodyData.get("links", [])],
+                            softBodyData.get("stiffness", 100.0),
+                            softBodyData.get("dampingFactor", 0.5),
+                            softBodyData.get("color", "black"),
+                            softBodyData.get("width", 1),
+                        )
+                        if "restLengths" in softBodyData:
+                            softBody.restLengths = list(softBodyData["restLengths"])
+                        if "id" in softBodyData:
+                            softBody.id = softBodyData["id"]
+                        self.elements["softbody"].append(softBody)
+                        self.elements["all"].insert(0, softBody)
+
             else:
                 print(f"\n未找到预设：{filename}.json")
                 return
@@ -738,9 +817,12 @@ class Game:
                 self.floor = currentFloor
             self.translation = dict(config_manager.translation)
 
-            # 重置部分状态与时间戳
+            # 重置部分状态与时间戳；物理步从头累计，新场景的球没有上一步的位置可插值
             self.rightMove = 0
             self.upMove = 0
+            self.physicsAccumulator = 0
+            self.previousPositions = {}
+            self.lastWakeSignature = ()
             self.lastTime = time.time()
             self.currentTime = time.time()
             print("\n预设数据加载成功")
@@ -1184,7 +1266,7 @@ class Game:
         self.x += self.rightMove
         self.y += self.upMove
         if (
-            self.realToScreen(self.floor.vertexes[0].y, self.y)
+            self.realToScreen(self.floor.y, self.y)
             < self.screen.get_height() * 2 / 3
             and not self.isCelestialBodyMode
         ):
@@ -1204,8 +1286,7 @@ class Game:
         self.settingsButton.draw(self)
         
         # 绘制所有物理元素
-        for element in self.elements["all"]:
-            element.draw(self)
+        self.drawElements()
         
         # 绘制地板（如果不是天体模式且地板合法）
         if not self.isCelestialBodyMode and not self.isFloorIllegal:
@@ -1246,6 +1327,45 @@ class Game:
     def set_shared_state(self, state: SharedGameState) -> None:
         self.shared_state = state
 
+    def loadExamples(self) -> list[dict]:
+        """读取 savefile/default 中的预设，生成示例菜单的选项列表"""
+        examples = []
+        for dirpath, dirnames, filenames in os.walk("savefile/default"):
+            for file in filenames:
+
+                try:
+                    with open(os.path.join(dirpath, file), "r", encoding="utf-8") as tempFile:
+                        data = json.load(tempFile)
+
+                    # 尝试从attributes中获取gameName，如果没有则使用顶层的gameName
+                    game_name = data.get("attributes", {}).get("gameName") or data.get("gameName", data.get("name", "未命名"))
+
+                    example = {
+                        "name": game_name,
+                        "type": "example",
+                        "attrs": [
+                            {"type": "path", "value": "default/" + file},
+                            {"type": "icon", "value": data["icon"]},
+                        ],
+                    }
+
+                    examples.append(example)
+
+                except KeyError:
+                    with open(os.path.join(dirpath, file), "r", encoding="utf-8") as tempFile:
+                        data = json.load(tempFile)
+
+                    example = {
+                        "name": os.path.basename(dirpath),
+                        "type": "example",
+                        "attrs": [{"type": "path", "value": "default/" + file}],
+                    }
+
+                    examples.append(example)
+                    continue
+
+        return examples
+
     def updateMenu(self) -> None:
         """更新菜单界面"""
         width, height = self.screen.get_size()
@@ -1256,42 +1376,7 @@ class Game:
         self.elementMenu.draw(game=self)
 
         if self.exampleMenu is None:
-            examples = []
-            for dirpath, dirnames, filenames in os.walk("savefile/default"):
-                for file in filenames:
-
-                    try:
-                        with open(os.path.join(dirpath, file), "r", encoding="utf-8") as tempFile:
-                            data = json.load(tempFile)
-
-                        # 尝试从attributes中获取gameName，如果没有则使用顶层的gameName
-                        game_name = data.get("attributes", {}).get("gameName") or data.get("gameName", data.get("name", "未命名"))
-
-                        example = {
-                            "name": game_name,
-                            "type": "example",
-                            "attrs": [
-                                {"type": "path", "value": "default/" + file},
-                                {"type": "icon", "value": data["icon"]},
-                            ],
-                        }
-
-                        examples.append(example)
-
-                    except KeyError:
-                        with open(os.path.join(dirpath, file), "r", encoding="utf-8") as tempFile:
-                            data = json.load(tempFile)
-
-                        example = {
-                            "name": os.path.basename(dirpath),
-                            "type": "example",
-                            "attrs": [{"type": "path", "value": "default/" + file}],
-                        }
-
-                        examples.append(example)
-                        continue
-
-            self.exampleMenu = Menu(ZERO, examples)
+            self.exampleMenu = Menu(ZERO, self.examples)
 
         self.exampleMenu.draw(game=self)
 
@@ -1308,7 +1393,8 @@ class Game:
         else:
             fpsTextColor = "darkgreen"
 
-        fpsText = self.fontSmall.render(
+        fpsText = renderText(
+            self.fontSmall,
             f"fps = {self.fpsAverage: .0f} / {self.fpsMinimum: .0f} ",
             True,
             fpsTextColor,
@@ -1333,7 +1419,8 @@ class Game:
             else:
                 objectCountTextColor = "black"
 
-        objectCountText = self.fontSmall.render(
+        objectCountText = renderText(
+            self.fontSmall,
             f"物体数量 = {len(self.elements["all"])} ", True, objectCountTextColor
         )
         objectCountTextRect = objectCountText.get_rect()
@@ -1341,7 +1428,8 @@ class Game:
         objectCountTextRect.y = fpsText.get_height()
         self.screen.blit(objectCountText, objectCountTextRect)
 
-        mousePosText = self.fontSmall.render(
+        mousePosText = renderText(
+            self.fontSmall,
             "鼠标位置 = ("
             f" {int(self.screenToReal(pygame.mouse.get_pos()[0] / 10, self.x))},"
             f" {-int(self.screenToReal(pygame.mouse.get_pos()[1] / 10, self.y))} ) ",
@@ -1353,7 +1441,8 @@ class Game:
         mousePosTextRect.y = fpsText.get_height() + objectCountText.get_height()
         self.screen.blit(mousePosText, mousePosTextRect)
 
-        ratioText = self.fontSmall.render(
+        ratioText = renderText(
+            self.fontSmall,
             f"缩放比例 = {self.ratio: .1f}x ", True, "black"
         )
         ratioTextRect = ratioText.get_rect()
@@ -1365,7 +1454,8 @@ class Game:
         )
         self.screen.blit(ratioText, ratioTextRect)
 
-        speedText = self.fontSmall.render(
+        speedText = renderText(
+            self.fontSmall,
             f"倍速 = {self.speed: .1f}x ", True, "black")
         speedTextRect = speedText.get_rect()
         speedTextRect.x = self.screen.get_width() - speedText.get_width()
@@ -1377,7 +1467,108 @@ class Game:
         )
         self.screen.blit(speedText, speedTextRect)
 
-        pauseText = self.fontSmall.render(f"已暂停 ", True, "red")
+        substepText = renderText(
+            self.fontSmall,
+            f"碰撞事件 = {self.eventsLastFrame} "
+            if self.isEventDriven
+            else f"子步 = {self.substepsLastFrame} ",
+            True,
+            "black",
+        )
+        substepTextRect = substepText.get_rect()
+        substepTextRect.x = self.screen.get_width() - substepText.get_width()
+        substepTextRect.y = (
+            fpsText.get_height()
+            + objectCountText.get_height()
+            + mousePosText.get_height()
+            + ratioText.get_height()
+            + speedText.get_height()
+        )
+        self.screen.blit(substepText, substepTextRect)
+
+        sleepText = renderText(
+            self.fontSmall,
+            f"活动 / 休眠 = {self._physics.awake_balls} / {self._physics.sleeping_balls} ",
+            True,
+            "black",
+        )
+        sleepTextRect = sleepText.get_rect()
+        sleepTextRect.x = self.screen.get_width() - sleepText.get_width()
+        sleepTextRect.y = substepTextRect.y + substepText.get_height()
+        self.screen.blit(sleepText, sleepTextRect)
+
+        wallStateText = renderText(
+            self.fontSmall,
+            f"静态 / 运动学墙 = {self._physics.static_walls} / {self._physics.kinematic_walls} ",
+            True,
+            "black",
+        )
+        wallStateTextRect = wallStateText.get_rect()
+        wallStateTextRect.x = self.screen.get_width() - wallStateText.get_width()
+        wallStateTextRect.y = sleepTextRect.y + sleepText.get_height()
+        self.screen.blit(wallStateText, wallStateTextRect)
+
+        islandStats = self._physics.island_stats()
+        islandText = renderText(
+            self.fontSmall,
+            f"孤岛 = {islandStats['islands']} (最大 {islandStats['largest_island']}, "
+            f"休眠 {islandStats['sleeping_islands']}) ",
+            True,
+            "black",
+        )
+        islandTextRect = islandText.get_rect()
+        islandTextRect.x = self.screen.get_width() - islandText.get_width()
+        islandTextRect.y = wallStateTextRect.y + wallStateText.get_height()
+        self.screen.blit(islandText, islandTextRect)
+
+        spriteStats = gradientSprites.stats()
+        spriteText = renderText(
+            self.fontSmall,
+            f"精灵缓存 = 命中 {spriteStats['hitRate']:.0%} / "
+            f"{spriteStats['bytes'] / 1024**2:.1f} MB ",
+            True,
+            "black",
+        )
+        spriteTextRect = spriteText.get_rect()
+        spriteTextRect.x = self.screen.get_width() - spriteText.get_width()
+        spriteTextRect.y = islandTextRect.y + islandText.get_height()
+        self.screen.blit(spriteText, spriteTextRect)
+
+        cullText = renderText(
+            self.fontSmall,
+            f"绘制 / 剔除 = {self.drawnElementsLastFrame} / {self.culledElementsLastFrame} ",
+            True,
+            "black",
+        )
+        cullTextRect = cullText.get_rect()
+        cullTextRect.x = self.screen.get_width() - cullText.get_width()
+        cullTextRect.y = spriteTextRect.y + spriteText.get_height()
+        self.screen.blit(cullText, cullTextRect)
+
+        layerStats = self.staticLayer.stats()
+        layerText = renderText(
+            self.fontSmall,
+            f"静态图层 = {layerStats['walls']} 面墙 / 重建 {layerStats['rebuilds']} 次 ",
+            True,
+            "black",
+        )
+        layerTextRect = layerText.get_rect()
+        layerTextRect.x = self.screen.get_width() - layerText.get_width()
+        layerTextRect.y = cullTextRect.y + cullText.get_height()
+        self.screen.blit(layerText, layerTextRect)
+
+        textText = renderText(
+            self.fontSmall,
+            f"文字缓存 = 本帧省下 {self.textRendersAvoidedLastFrame} 次渲染 ",
+            True,
+            "black",
+        )
+        textTextRect = textText.get_rect()
+        textTextRect.x = self.screen.get_width() - textText.get_width()
+        textTextRect.y = layerTextRect.y + layerText.get_height()
+        self.screen.blit(textText, textTextRect)
+
+        pauseText = renderText(self.fontSmall, f"已暂停 ", True, "red")
         pauseTextRect = pauseText.get_rect()
         pauseTextRect.x = self.screen.get_width() - pauseText.get_width()
         pauseTextRect.y = (
@@ -1386,6 +1577,14 @@ class Game:
             + mousePosText.get_height()
             + ratioText.get_height()
             + speedText.get_height()
+            + substepText.get_height()
+            + sleepText.get_height()
+            + wallStateText.get_height()
+            + islandText.get_height()
+            + spriteText.get_height()
+            + cullText.get_height()
+            + layerText.get_height()
+            + textText.get_height()
         )
         if self.isPaused and self.tempFrames == 0:
             self.screen.blit(pauseText, pauseTextRect)
@@ -1394,7 +1593,7 @@ class Game:
         for option in self.exampleMenu.options:
             if option.isMouseOn():
                 option.highLighted = True
-                nameText = self.fontSmall.render(option.name, True, (0, 0, 0))
+                nameText = renderText(self.fontSmall, option.name, True, (0, 0, 0))
                 nameTextRect = nameText.get_rect(
                     center=(x + nameText.get_width(), y))
                 self.screen.blit(nameText, nameTextRect)
@@ -1404,7 +1603,7 @@ class Game:
         for option in self.elementMenu.options:
             if option.isMouseOn():
                 option.highLighted = True
-                nameText = self.fontSmall.render(option.name, True, (0, 0, 0))
+                nameText = renderText(self.fontSmall, option.name, True, (0, 0, 0))
                 nameTextRect = nameText.get_rect(
                     center=(x - nameText.get_width(), y))
                 self.screen.blit(nameText, nameTextRect)
@@ -1412,25 +1611,299 @@ class Game:
                 if not option.selected:
                     option.highLighted = False
 
-    def updateElements(self) -> None:
-        """更新所有物理元素状态"""
+    def stepPhysics(self) -> None:
+        """以固定步长推进物理模拟：帧时间（乘以倍速）累加后按整步消耗"""
         # -- Handle ground↔celestial boundary transitions via engine ------
         self._physics.handle_boundary_transitions()
 
-        deltaTime = self.currentTime - self.lastTime
+        # 环境参数改变、增删元素或拖动时唤醒休眠的球
+        wakeSignature = (
+            tuple((option["type"], option["value"]) for option in self.environmentOptions),
+            len(self.elements["all"]),
+            self.isCelestialBodyMode,
+        )
+        if wakeSignature != self.lastWakeSignature or self.isMoving:
+            self.lastWakeSignature = wakeSignature
+            self._physics.wake_all()
+        for element in self.elements["controlling"]:
+            if element.type == "ball":
+                element.wake()
+
+        fixedDeltaTime = 1 / self.physicsHz
+        if self.isPaused:
+            self.physicsAccumulator = 0
+            steps = 1 if self.tempFrames > 0 else 0
+        else:
+            self.physicsAccumulator += (self.currentTime - self.lastTime) * self.speed
+            steps = int(self.physicsAccumulator / fixedDeltaTime)
+            self.physicsAccumulator -= steps * fixedDeltaTime
+
+            maxSteps = self.maxPhysicsSteps * max(1, math.ceil(self.speed))
+            if steps > maxSteps:
+                # 追赶不上时丢弃积压的时间，让模拟变慢而不是越来越卡
+                steps = maxSteps
+                self.physicsAccumulator = 0
+
+        self.physicsStepsLastFrame = steps
+        self._physics.substeps = 0
+        self.eventsLastFrame = 0
+        for i in range(steps):
+            if i == steps - 1:
+                self.previousPositions = {
+                    id(ball): (ball.position.x, ball.position.y)
+                    for ball in self.elements["ball"]
+                }
+            self.physicsStep(fixedDeltaTime)
+        self.substepsLastFrame = self._physics.substeps
+
+    def physicsStep(self, deltaTime: float) -> None:
+        """执行一个固定步长的物理步"""
+        # 没有任何持续外力（重力、阻力、场力、绳簧杆）时，球只做匀速直线运动，
+        # 可选用事件驱动引擎按精确碰撞时刻推进，不再逐步修正重叠
+        self._physics.apply_environment(self.environmentOptions)
+        self.isEventDriven = (
+            not self.isCelestialBodyMode and self._physics.uses_event_driven()
+        )
+        if self.isEventDriven:
+            self.eventsLastFrame += self._physics.step_event_driven(deltaTime)
+            return
+
+        # 轻杆与绳索：默认由 XPBD 约束求解器在每次积分后统一修正位置，
+        # 关闭时仍按旧的刚性弹簧力计算
+        usePositionConstraints = self.usePositionConstraints
+        if not usePositionConstraints:
+            for rope in self.elements["rope"]:
+                rope.calculateForce()
+
+        # 弹簧与软体：所有弹簧边由批量弹簧核一次算出，确保在球更新之前计算力
+        self._physics.apply_spring_forces()
+
+        # element.update(...) 为了实现电场力效果挪到了下面，bug待发现
+        # 好的我们发现了bug，上面有下面没有就会导致电场力不作用，下面有上面没有就会导致绳子出bug
+        # 所以我们两个都写了，然后把帧间时间缩短为原来的一半
+        # 好的我们又发现了bug，两个都写的话天体运动会不正常
+        # 所以我们只在地表运动模式下更新两次，天体模式下暂时只保留绳子的功能
+        # 球由物理引擎按 CFL 条件自适应细分子步，靠近薄墙的快球才会多走几步
+        useFloor = not self.isCelestialBodyMode
+        wallThickness = self._physics.min_wall_thickness(useFloor)
+        self._physics.refresh_wall_tree()
+        # 静态墙不逐帧更新，被拖动或移动后转为运动学墙才会更新
+        elementDeltaTime = deltaTime / 2 if useFloor else deltaTime
+        # 天体模式下互相吸引的球按分块时间步推进：每个球取帧长的 2 的幂分之一为步长，
+        # 近距离绕行的卫星走细步，远处的行星走粗步，引力只在各自步长结束时重新计算
+        useBlockTimesteps = self.isCelestialBodyMode and self._physics.uses_block_timesteps(
+            sum(1 for ball in self.elements["ball"] if ball.gravitation)
+        )
+        blockBalls: set[int] = set()
+        if useBlockTimesteps:
+            blockBalls = {
+                id(ball)
+                for ball in self._physics.step_block_timesteps(deltaTime, 2 * gravityFactor)
+            }
         for element in self.elements["all"]:
+            if element.type == "ball":
+                if id(element) not in blockBalls:
+                    self._physics.update_ball(element, elementDeltaTime, wallThickness, useFloor)
+            elif element.type in ("rod", "rope") and usePositionConstraints:
+                continue
+            elif element.type == "spring":
+                element.updatePosition()
+            elif element.type != "wall" or not element.isStatic:
+                element.update(elementDeltaTime)
+        if usePositionConstraints:
+            self._physics.solve_constraints(elementDeltaTime)
+
+        for ball in self.elements["ball"]:
+            ball.resetForce(True)
+
+        # 球与球碰撞：由宽相位（均匀网格）给出候选球对，避免逐对检测
+        # 地表模式下接触的球对统一交给接触缓存，沿用上一步的冲量热启动
+        mergedBalls: set[int] = set()
+        touchingBalls: list[tuple[Ball, Ball]] = []
+        for ball1, ball2 in self._physics.ball_collision_pairs():
+            if id(ball1) in mergedBalls or id(ball2) in mergedBalls:
+                continue
+
+            if ball1.isSleeping and ball2.isSleeping:
+                continue
+
+            if not ball1.isCollidedByBall(ball2):
+                continue
+
+            # 被运动的球碰到时唤醒（静止的球压在上面不会唤醒）
+            self._physics.wake_touching(ball1, ball2)
+
+            if self.isCelestialBodyMode:
+
+                newBall = ball1.merge(ball2, self)
+
+                if ball1.isFollowing or ball2.isFollowing:
+                    newBall.isFollowing = True
+
+                if (
+                    ball1 in self.elements["controlling"]
+                    and ball1.mass >= ball2.mass
+                ) or (
+                    ball2 in self.elements["controlling"]
+                    and ball2.mass >= ball1.mass
+                ):
+                    self.elements["controlling"].clear()
+                    self.elements["controlling"].append(newBall)
+                    newBall.highLighted = True
+
+                self.elements["all"].remove(ball1)
+                self.elements["ball"].remove(ball1)
+                self.elements["all"].remove(ball2)
+                self.elements["ball"].remove(ball2)
+                self.elements["all"].append(newBall)
+                self.elements["ball"].append(newBall)
+                mergedBalls.add(id(ball1))
+                mergedBalls.add(id(ball2))
+
+                for ball in self.elements["ball"]:
+                    ball.displayedAcceleration = (
+                        ball.acceleration
+                        + (ball.displayedAcceleration - ball.acceleration)
+                        * ball.displayedAccelerationFactor
+                    )
+                    ball.displayedAccelerationFactor = 1
+            else:
+                self._physics.record_contact(ball1, ball2)
+                touchingBalls.append((ball1, ball2))
+        self._physics.resolve_ball_contacts(touchingBalls)
+
+        # 引力与电力：只在受影响的球之间两两计算
+        # 下面的有序遍历中每对球会相互作用两次，其它求解器用两倍常数保持强度一致
+        # 分块时间步已在积分时计算了引力，这里只剩电力
+        gravitationBalls = [ball for ball in self.elements["ball"] if ball.gravitation]
+        useBarnesHut = not useBlockTimesteps and self._physics.uses_barnes_hut(
+            len(gravitationBalls)
+        )
+        useDirectGravity = not useBlockTimesteps and not useBarnesHut
+        if useBarnesHut:
+            self._physics.apply_gravitation_force(2 * gravityFactor)
+
+        if self._physics.vectorized_fields:
+            # 融合核：一次遍历同时计算引力与电力
+            self._physics.apply_field_forces(
+                2 * gravityFactor if useDirectGravity else 0, 2 * electrostaticFactor
+            )
+        else:
+            if useDirectGravity:
+                for ball1 in gravitationBalls:
+                    for ball2 in gravitationBalls:
+                        if ball1 is not ball2:
+                            ball1.gravitate(ball2)
+
+            chargedBalls = [ball for ball in self.elements["ball"] if ball.electricCharge]
+            for ball1 in chargedBalls:
+                for ball2 in chargedBalls:
+                    if ball1 is not ball2:
+                        ball1.electricForce(ball2)
+
+        # 墙体较多时由包围盒层次树（BVH）只给出球附近的墙
+        # 接触缓存已处理过地面接触的球（压在球堆下面的）不再重复处理
+        awakeBalls = [ball for ball in self.elements["ball"] if not ball.isSleeping]
+        floorBalls = self._physics.floor_contact_balls()
+        self._physics.refresh_wall_tree()
+        for ball1 in awakeBalls:
+            for wall in self._physics.walls_near_ball(ball1):
+                if wall.isPosOn(self, ball1.position):
+                    ball1.reboundByWall(wall)
+
+            if not self.isCelestialBodyMode and id(ball1) not in floorBalls:
+                self.floor.checkCollision(ball1)
+
+        # -- Apply environment parameters via engine ---------------------
+        self._physics.apply_environment(self.environmentOptions)
+
+        if not self.isCelestialBodyMode:
+            self._physics.apply_spring_forces()
+            for element in self.elements["all"]:
+                if element.type == "ball":
+                    self._physics.update_ball(element, deltaTime / 2, wallThickness)
+                elif element.type in ("rod", "rope") and usePositionConstraints:
+                    continue
+                elif element.type == "spring":
+                    element.updatePosition()
+                elif element.type != "wall" or not element.isStatic:
+                    element.update(deltaTime / 2)
+            if usePositionConstraints:
+                self._physics.solve_constraints(deltaTime / 2)
+        
+        self._physics.resolve_vertex_collisions()
+        self._physics.resolve_line_collisions()
+
+        # 由连接与本步接触划分孤岛，孤岛整体休眠与唤醒
+        self._physics.update_islands()
+        self._physics.update_sleep_states()
+        self._physics.count_wall_states()
+
+    def renderInterpolationFactor(self) -> float:
+        """渲染插值系数：0 为上一物理状态，1 为当前物理状态"""
+        if self.isPaused:
+            return 1
+        return min(self.physicsAccumulator * self.physicsHz, 1)
+
+    def viewBox(self) -> tuple[float, float, float, float]:
+        """屏幕在世界坐标中的范围 (x0, y0, x1, y1)，四周各多留 cullMargin 像素"""
+        width, height = self.screen.get_size()
+        margin = self.cullMargin / self.ratio
+        return (
+            self.screenToReal(0, self.x) - margin,
+            self.screenToReal(0, self.y) - margin,
+            self.screenToReal(width, self.x) + margin,
+            self.screenToReal(height, self.y) + margin,
+        )
+
+    def interpolatedPosition(self, ball: Ball, alpha: float) -> Vector2:
+        """球在最近两个物理状态之间的插值位置（跟随中的球、刚加入的球就是当前位置）"""
+        previous = self.previousPositions.get(id(ball))
+        if alpha >= 1 or previous is None or ball.isFollowing:
+            return ball.position
+        return Vector2(
+            previous[0] + (ball.position.x - previous[0]) * alpha,
+            previous[1] + (ball.position.y - previous[1]) * alpha,
+        )
+
+    def drawElements(self) -> None:
+        """绘制所有物理元素，球画在最近两个物理状态之间的插值位置"""
+        alpha = self.renderInterpolationFactor()
+        saved: list[tuple[Ball, float, float]] = []
+        if alpha < 1:
+            for ball in self.elements["ball"]:
+                position = self.interpolatedPosition(ball, alpha)
+                if position is ball.position:
+                    continue
+                saved.append((ball, ball.position.x, ball.position.y))
+                ball.position.x = position.x
+                ball.position.y = position.y
+
+        # 只绘制视野内的元素（墙体较多时由墙体 BVH 给出）
+        if self.viewCulling:
+            visible = self._physics.elements_in_view(*self.viewBox())
+        else:
+            visible = self.elements["all"]
+        self.drawnElementsLastFrame = len(visible)
+        self.culledElementsLastFrame = len(self.elements["all"]) - len(visible)
+
+        # 图层可用时静态墙体已在图层中，只有高亮的需要再画一次
+        useStaticLayer = self.staticLayerCaching and self.staticLayer.draw(self, self.elements["wall"])
+        for element in visible:
+            if useStaticLayer and element.type == "wall" and element.isStatic and not element.highLighted:
+                continue
             element.draw(self)
-            # element.update(...) 为了实现电场力效果挪到了下面，bug待发现
-            # 好的我们发现了bug，上面有下面没有就会导致电场力不作用，下面有上面没有就会导致绳子出bug
-            # 所以我们两个都写了，然后把帧间时间缩短为原来的一半
-            # 好的我们又发现了bug，两个都写的话天体运动会不正常
-            # 所以我们只在地表运动模式下更新两次，天体模式下暂时只保留绳子的功能
-            if not self.isPaused or self.tempFrames > 0:
-                if not self.isCelestialBodyMode:
-                    element.update(deltaTime * self.speed / 2)
-                else:
-                    element.update(deltaTime * self.speed)
 
+        for ball, x, y in saved:
+            ball.position.x = x
+            ball.position.y = y
+
+    def updateElements(self) -> None:
+        """绘制物理元素并处理跟随、信息显示、拖动与地板"""
+        self.drawElements()
+
+        # 信息与箭头画在与球相同的插值位置上
+        alpha = self.renderInterpolationFactor()
         for ball in self.elements["ball"]:
 
             if ball.isFollowing:
@@ -1443,13 +1916,14 @@ class Game:
                 ball.highLighted = True
                 ball.follow(self)
 
-                followingTipsText = self.fontBig.render(f"视角跟随中", True, "blue")
+                followingTipsText = renderText(self.fontBig, f"视角跟随中", True, "blue")
                 followingTipsTextRect = followingTipsText.get_rect()
                 followingTipsTextRect.x = self.screen.get_width() / 2
                 followingTipsTextRect.y = self.screen.get_height() / 50
                 self.screen.blit(followingTipsText, followingTipsTextRect)
 
-                massTipsText = self.fontBig.render(
+                massTipsText = renderText(
+                    self.fontBig,
                     f"质量：{ball.mass: .1f}", True, "darkgreen"
                 )
                 massTipsTextRect = massTipsText.get_rect()
@@ -1459,7 +1933,8 @@ class Game:
                 )
                 self.screen.blit(massTipsText, massTipsTextRect)
 
-                radiusTipsText = self.fontBig.render(
+                radiusTipsText = renderText(
+                    self.fontBig,
                     f"半径：{ball.radius: .1f}", True, "darkgreen"
                 )
                 radiusTipsTextRect = radiusTipsText.get_rect()
@@ -1471,7 +1946,8 @@ class Game:
                 )
                 self.screen.blit(radiusTipsText, radiusTipsTextRect)
                 
-                electricChargeTipsText = self.fontBig.render(
+                electricChargeTipsText = renderText(
+                    self.fontBig,
                     f"电荷：{ball.electricCharge: .1f}", True, "darkgreen"
                 )
                 electricChargeTipsTextRect = electricChargeTipsText.get_rect()
@@ -1484,7 +1960,7 @@ class Game:
                 )
                 self.screen.blit(electricChargeTipsText, electricChargeTipsTextRect)
 
-                ballPos = ball.position
+                ballPos = self.interpolatedPosition(ball, alpha)
                 tempOption = Option(ZERO, ZERO, "temp", [], self.elementMenu)
 
                 acceleration = (
@@ -1508,7 +1984,8 @@ class Game:
                     ),
                     "red",
                 )
-                accelerationTipsText = self.fontBig.render(
+                accelerationTipsText = renderText(
+                    self.fontBig,
                     f"加速度：{abs(acceleration) / 10: .1f} m/s²", True, "red"
                 )
                 accelerationTipsTextRect = accelerationTipsText.get_rect()
@@ -1541,7 +2018,8 @@ class Game:
                     ),
                     "blue",
                 )
-                velocityTipsText = self.fontBig.render(
+                velocityTipsText = renderText(
+                    self.fontBig,
                     f"速度：{abs(velocity) / 10: .1f} m/s", True, "blue"
                 )
                 velocityTipsTextRect = velocityTipsText.get_rect()
@@ -1555,8 +2033,9 @@ class Game:
 
                 ball.highLighted = True
 
-                ballPos = ball.position
-                massTipsText = self.fontSmall.render(
+                ballPos = self.interpolatedPosition(ball, alpha)
+                massTipsText = renderText(
+                    self.fontSmall,
                     f"质量：{ball.mass: .1f}", True, "darkgreen"
                 )
                 massTipsTextRect = massTipsText.get_rect()
@@ -1567,7 +2046,8 @@ class Game:
                 )
                 self.screen.blit(massTipsText, massTipsTextRect)
                 
-                electricChargeTipsText = self.fontSmall.render(
+                electricChargeTipsText = renderText(
+                    self.fontSmall,
                     f"电荷：{ball.electricCharge: .1f}", True, "darkgreen"
                 )
                 electricChargeTipsTextRect = electricChargeTipsText.get_rect()
@@ -1601,7 +2081,8 @@ class Game:
                     ),
                     "red",
                 )
-                accelerationTipsText = self.fontSmall.render(
+                accelerationTipsText = renderText(
+                    self.fontSmall,
                     f"加速度：{abs(acceleration) / 10: .1f} m/s²", True, "red"
                 )
                 accelerationTipsTextRect = accelerationTipsText.get_rect()
@@ -1634,7 +2115,8 @@ class Game:
                     ),
                     "blue",
                 )
-                velocityTipsText = self.fontSmall.render(
+                velocityTipsText = renderText(
+                    self.fontSmall,
                     f"速度：{abs(velocity) / 10: .1f} m/s", True, "blue"
                 )
                 velocityTipsTextRect = velocityTipsText.get_rect()
@@ -1644,101 +2126,7 @@ class Game:
                     velocityPosition.y, self.y)
                 self.screen.blit(velocityTipsText, velocityTipsTextRect)
 
-        for ball in self.elements["ball"]:
-            ball.resetForce(True)
-
-        for ball1 in self.elements["ball"]:
-            try:
-                for ball2 in self.elements["ball"]:
-                    if ball1 != ball2:
-
-                        if ball1.isCollidedByBall(ball2):
-                            if self.isCelestialBodyMode:
-
-                                newBall = ball1.merge(ball2, self)
-
-                                if ball1.isFollowing or ball2.isFollowing:
-                                    newBall.isFollowing = True
-
-                                if (
-                                    ball1 in self.elements["controlling"]
-                                    and ball1.mass >= ball2.mass
-                                ) or (
-                                    ball2 in self.elements["controlling"]
-                                    and ball2.mass >= ball1.mass
-                                ):
-                                    self.elements["controlling"].clear()
-                                    self.elements["controlling"].append(
-                                        newBall)
-                                    newBall.highLighted = True
-
-                                self.elements["all"].remove(ball1)
-                                self.elements["ball"].remove(ball1)
-                                self.elements["all"].remove(ball2)
-                                self.elements["ball"].remove(ball2)
-                                self.elements["all"].append(newBall)
-                                self.elements["ball"].append(newBall)
-
-                                for ball in self.elements["ball"]:
-                                    ball.displayedAcceleration = (
-                                        ball.acceleration
-                                        + (
-                                            ball.displayedAcceleration
-                                            - ball.acceleration
-                                        )
-                                        * ball.displayedAccelerationFactor
-                                    )
-                                    ball.displayedAccelerationFactor = 1
-                            else:
-                                ball1.reboundByBall(ball2)
-
-                        if ball1.gravitation and ball2.gravitation:
-                            ball1.gravitate(ball2)
-                        if ball1.electricCharge and ball2.electricCharge:
-                            ball1.electricForce(ball2)
-                            # print(ball1.acceleration.toTuple())
-                            # ball1.update(deltaTime * self.speed)
-
-            except ValueError as e:
-                ...
-
-            for wall in self.elements["wall"]:
-                if wall.isPosOn(self, ball1.position):
-                    ball1.reboundByWall(wall)
-
-            if not self.isCelestialBodyMode:
-                for line in self.floor.lines:
-                    if ball1.isCollidedByLine(line):
-                        ball1.reboundByLine(line)
-                if self.floor.isPosOn(self, ball1.position):
-                    ball1.reboundByWall(self.floor)
-
-            # -- Apply environment parameters via engine -----------------
-            self._physics.apply_environment(self.environmentOptions)
-        
-        for element in self.elements["all"]:
-            # element.draw(self)
-            if not self.isPaused or self.tempFrames > 0:
-                if not self.isCelestialBodyMode:
-                    element.update(deltaTime * self.speed / 2)
-        
-        for wall in self.elements["wall"]:
-            for ball in self.elements["ball"]:
-                wall.checkVertexCollision(ball)
-
-        for wall in self.elements["wall"]:
-            for line in wall.lines:
-                for ball in self.elements["ball"]:
-                    if ball.isCollidedByLine(line) and not wall.isPosOn(
-                        self, ball.position
-                    ):
-                        ball.reboundByLine(line)
-
         if not self.isCelestialBodyMode:
-            self.floor.position.x = self.screenToReal(
-                self.screen.get_width() / 2, self.x
-            )
-            self.floor.update(deltaTime)
             self.floor.draw(self)
 
         if self.isMoving and not self.isElementCreating:
@@ -1782,19 +2170,23 @@ class Game:
     def update(self) -> None:
         """主更新循环"""
         self.eventLoop()
-        self.updateScreen()
+        self.stepPhysics()
 
         # 即使在暂停状态下也要更新绳子的位置
-        for rope in self.elements["rope"]:
-            rope.calculateForce()  # 确保绳子两端位置正确
-
-        # 更新弹簧力，确保在球更新之前计算力
-        for spring in self.elements["spring"]:
-            spring.calculateForce()
+        if self.physicsStepsLastFrame == 0:
+            if self.usePositionConstraints:
+                self._physics.solve_constraints(0)  # 只修正位置，不改变速度
+            else:
+                for rope in self.elements["rope"]:
+                    rope.calculateForce()  # 确保绳子两端位置正确
 
+        self.updateScreen()
         self.updateElements()
+        self.staticLayer.endFrame(self)
         self.update_shared_state()
         self.updateMenu()
+        self.textRendersAvoidedLastFrame = textSprites.hits - self.textHitsBeforeFrame
+        self.textHitsBeforeFrame = textSprites.hits
         if self.tempFrames > 0:
             self.tempFrames -= 1
 
@@ -1886,7 +2278,7 @@ class Game:
 
             for ball in self.elements["ball"]:
                 ball.gravitation = False
-                ball.naturalForces.clear()
+                ball.resetForce(True)
 
     def update_shared_state(self):
         if self.shared_state is None:
@@ -1913,7 +2305,7 @@ class Game:
 
         if not self.isCelestialBodyMode and not self.isFloorIllegal:
             floor_data = {
-                'vertices': [(v.x, v.y) for v in self.floor.vertexes],
+                'vertices': [(v.x, v.y) for v in self.floor.getVertexes(self)],
                 'color': self.floor.color
             }
             walls_data.append(floor_data)
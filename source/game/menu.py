@@ -22,7 +22,7 @@ class Menu:
                     self.x + self.width * 1 / 10,
                     self.y + self.width * 1 / 10 + i * self.width * 9 / 10,
                 ),
-                Vector2(self.width * 8 / 10, self.width * 8 / 10),
+                Vector2(self.optionSize(width), self.optionSize(width)),
                 self.optionsList[i]["type"],
                 self.optionsList[i]["attrs"],
                 self,
@@ -30,6 +30,11 @@ class Menu:
             option.name = self.optionsList[i]["name"]
             self.options.append(option)
 
+    @staticmethod
+    def optionSize(screenWidth: float) -> float:
+        """菜单中每个选项（图标）的边长"""
+        return screenWidth * 3 / 100 * 8 / 10
+
     def isMouseOn(self) -> bool:
         """判断鼠标是否在菜单区域"""
         pos = Vector2(pygame.mouse.get_pos())
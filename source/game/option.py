@@ -9,9 +9,11 @@ from ..basic import (
     Wall,
     WallPosition,
     ZERO,
+    assets,
     colorMiddle,
     colorSuitable,
     colorStringToTuple,
+    drawGradientCircle,
 )
 from .set_caps_lock import setCapsLock
 
@@ -76,25 +78,12 @@ class Option:
     def isPointInsideWall(self, point: Vector2, wall: Wall, game: "Game") -> bool:
         """
         检查点是否在墙体内部
-        使用射线法判断点是否在多边形内部
         """
         if wall.type != "wall":
             return False
 
-        # 射线法：从点向右发射一条射线，计算与多边形边的交点数
-        intersect_count = 0
-        for i in range(len(wall.vertexes)):
-            v1 = wall.vertexes[i]
-            v2 = wall.vertexes[(i + 1) % len(wall.vertexes)]
-
-            if (v1.y > point.y) != (v2.y > point.y):
-                x_intersect = (v2.x - v1.x) * (point.y -
-                                               v1.y) / (v2.y - v1.y) + v1.x
-
-                if point.x < x_intersect:
-                    intersect_count += 1
-
-        return intersect_count % 2 == 1
+        # 墙体缓存了边的半平面，直接复用
+        return wall.isPosOn(game, point)
 
     def doLinesIntersect(
         self, p1: Vector2, p2: Vector2, p3: Vector2, p4: Vector2
@@ -239,25 +228,12 @@ class Option:
     def isPointInsideWall(self, point: Vector2, wall: Wall, game: "Game") -> bool:
         """
         检查点是否在墙体内部
-        使用射线法判断点是否在多边形内部
         """
         if wall.type != "wall":
             return False
 
-        # 射线法：从点向右发射一条射线，计算与多边形边的交点数
-        intersect_count = 0
-        for i in range(len(wall.vertexes)):
-            v1 = wall.vertexes[i]
-            v2 = wall.vertexes[(i + 1) % len(wall.vertexes)]
-
-            if (v1.y > point.y) != (v2.y > point.y):
-                x_intersect = (v2.x - v1.x) * (point.y -
-                                               v1.y) / (v2.y - v1.y) + v1.x
-
-                if point.x < x_intersect:
-                    intersect_count += 1
-
-        return intersect_count % 2 == 1
+        # 墙体缓存了边的半平面，直接复用
+        return wall.isPosOn(game, point)
 
     def isMouseOn(self) -> bool:
         """判断鼠标是否在选项区域"""
@@ -1668,31 +1644,8 @@ class Option:
             cy = self.y + self.height / 2
             r = min(self.width, self.height) / 3 * scale_factor
 
-            circleNumber = 20
-            for number in range(circleNumber):
-                ratio = number / (circleNumber - 1)
-                currentRadius = r * (1 - ratio)
-
-                mixRatio = ratio
-                red = int(color[0] + (255 - color[0]) * mixRatio * 0.5)
-                green = int(color[1] + (255 - color[1]) * mixRatio * 0.5)
-                blue = int(color[2] + (255 - color[2]) * mixRatio * 0.5)
-                alpha = int(255 * (1 - ratio * 0.5))
-
-                drawRadius = int(currentRadius)
-                if drawRadius <= 0:
-                    continue
-
-                tempSurface = pygame.Surface((drawRadius * 2, drawRadius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    tempSurface,
-                    (red, green, blue, alpha),
-                    (drawRadius, drawRadius),
-                    drawRadius,
-                    0,
-                )
-                # 按 scale_factor 居中贴图
-                game.screen.blit(tempSurface, (cx - drawRadius, cy - drawRadius))
+            # 与实体小球共用渐变精灵缓存
+            drawGradientCircle(game.screen, color, (cx, cy), r)
 
         if self.type == "wall":
             hover = self.isMouseOn()
@@ -1757,8 +1710,7 @@ class Option:
 
         if self.type == "example":
             try:
-                icon = pygame.image.load(self.attrs["icon"]).convert_alpha()
-                scaled_icon = pygame.transform.smoothscale(icon, (int(self.width), int(self.height)))
+                scaled_icon = assets.scaled(self.attrs["icon"], (self.width, self.height))
                 icon_x = self.x + self.width / 2 - scaled_icon.get_width() / 2
                 icon_y = self.y + self.height / 2 - scaled_icon.get_height() / 2
                 game.screen.blit(scaled_icon, (icon_x, icon_y))
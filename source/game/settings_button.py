@@ -1,24 +1,25 @@
 import pygame
 
-from ..basic import Vector2
+from ..basic import Vector2, assets
 
 
 class SettingsButton:
     """设置按钮控件类"""
 
+    iconPath: str = "static/settings.png"
+    baseScale: float = 0.85  # 图标相对按钮的大小，保留基础留白
+    hoverScale: float = 1.08  # 悬停时的放大系数，与右侧栏一致
+
     def __init__(self, x: float, y: float, width: float, height: float) -> None:
         self.x: float = x
         self.y: float = y
         self.width: float = width
         self.height: float = height
 
-        # 加载图片并转换为透明格式
-        self.originalIcon = pygame.image.load("static/settings.png").convert_alpha()
-
-        # 预设图标（初始缩放）
-        self.icon: pygame.Surface = pygame.transform.smoothscale(
-            self.originalIcon, (self.width, self.height)
-        )
+    def iconSize(self, hover: bool) -> tuple[int, int]:
+        """图标的绘制尺寸"""
+        factor = self.hoverScale if hover else 1.0
+        return int(self.width * self.baseScale * factor), int(self.height * self.baseScale * factor)
 
     def draw(self, game: "Game") -> None:
         """绘制设置按钮（与右侧栏一致：悬停阴影 + 白色卡片 + 悬停放大）"""
@@ -44,12 +45,9 @@ class SettingsButton:
             border_radius=radius,
         )
 
-        # 图标（与右侧栏悬停缩放系数一致：1.08；保留基础留白）
-        base_scale = 0.85
-        scale_factor = 1.08 if hover else 1.0
-        icon_w = int(self.width * base_scale * scale_factor)
-        icon_h = int(self.height * base_scale * scale_factor)
-        icon_scaled = pygame.transform.smoothscale(self.originalIcon, (icon_w, icon_h))
+        # 图标（原图很大，按尺寸缓存缩放结果，不在每帧缩放）
+        icon_w, icon_h = self.iconSize(hover)
+        icon_scaled = assets.scaled(self.iconPath, (icon_w, icon_h))
 
         icon_x = self.x + (self.width - icon_w) / 2
         icon_y = self.y + (self.height - icon_h) / 2
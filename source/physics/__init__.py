@@ -1,3 +1,37 @@
+from .barnes_hut import (
+    BarnesHutTree,
+    barnes_hut_gravitation_forces,
+    direct_gravitation_forces,
+    gravitation_force_error,
+)
+from .block_timestep import BlockTimestepIntegrator
+from .broad_phase import (
+    BroadPhase,
+    BruteForceBroadPhase,
+    UniformGridBroadPhase,
+    make_broad_phase,
+)
+from .constraints import ConstraintSolver
+from .contacts import Contact, ContactCache
 from .engine import PhysicsEngine
+from .event_driven import EventDrivenSimulation
+from .islands import DisjointSet, IslandGraph
 
-__all__ = ["PhysicsEngine"]
+__all__ = [
+    "BarnesHutTree",
+    "BlockTimestepIntegrator",
+    "BroadPhase",
+    "BruteForceBroadPhase",
+    "ConstraintSolver",
+    "Contact",
+    "ContactCache",
+    "DisjointSet",
+    "EventDrivenSimulation",
+    "IslandGraph",
+    "PhysicsEngine",
+    "UniformGridBroadPhase",
+    "barnes_hut_gravitation_forces",
+    "direct_gravitation_forces",
+    "gravitation_force_error",
+    "make_broad_phase",
+]
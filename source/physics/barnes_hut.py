@@ -0,0 +1,260 @@
+"""Barnes--Hut quadtree gravity solver.
+
+Approximates the gravitational pull of a distant group of bodies by a
+single pseudo-body at the group's centre of mass.  A tree node of edge
+length ``s`` seen from distance ``d`` is *opened* (its children visited)
+only when ``s / d >= theta``; smaller ``theta`` is more accurate, and
+``theta = 0`` degenerates to the exact direct sum.  Building the tree and
+evaluating all forces is O(N log N).
+
+Force law and softening match ``Ball.gravitate``::
+
+    d = max(|r|, 1)
+    F = G * m1 * m2 / (d**2 + 1e-6)
+
+so switching between the direct sum and the tree changes only the
+approximation error, never the physics.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from ..basic import gravityFactor
+
+if TYPE_CHECKING:
+    from ..basic import Ball
+
+# Same clamp as Ball.gravitate
+MIN_DISTANCE: float = 1.0
+SOFTENING: float = 1e-6
+
+# Leaves smaller than this stop splitting (coincident bodies share a leaf).
+_MIN_NODE_SIZE: float = 1e-3
+
+
+# ---------------------------------------------------------------------------
+# Quadtree
+# ---------------------------------------------------------------------------
+
+class _Node:
+    """Square quadtree cell holding either bodies (leaf) or 4 children."""
+
+    __slots__ = ("cx", "cy", "half", "mass", "mx", "my", "bodies", "children")
+
+    def __init__(self, cx: float, cy: float, half: float) -> None:
+        self.cx: float = cx
+        self.cy: float = cy
+        self.half: float = half
+        self.mass: float = 0.0
+        self.mx: float = 0.0  # centre of mass (after finalize)
+        self.my: float = 0.0
+        self.bodies: list[int] | None = []
+        self.children: list[_Node] | None = None
+
+    def _child_for(self, x: float, y: float) -> _Node:
+        index = (1 if x >= self.cx else 0) + (2 if y >= self.cy else 0)
+        return self.children[index]  # type: ignore[index]
+
+    def _split(self) -> None:
+        h = self.half / 2
+        self.children = [
+            _Node(self.cx - h, self.cy - h, h),
+            _Node(self.cx + h, self.cy - h, h),
+            _Node(self.cx - h, self.cy + h, h),
+            _Node(self.cx + h, self.cy + h, h),
+        ]
+
+
+class BarnesHutTree:
+    """Quadtree over a snapshot of ball positions and masses.
+
+    The tree holds plain floats copied from the balls, so it stays valid
+    while the forces it returns are being applied.
+    """
+
+    def __init__(self, balls: list[Ball], theta: float = 0.5) -> None:
+        self.theta: float = theta
+        self.xs: list[float] = [b.position.x for b in balls]
+        self.ys: list[float] = [b.position.y for b in balls]
+        self.ms: list[float] = [b.mass for b in balls]
+        self.root: _Node | None = None
+        #: Node/body interactions evaluated by the last ``forces`` call.
+        self.interactions: int = 0
+        if balls:
+            self._build()
+
+    # -- construction ----------------------------------------------------
+
+    def _build(self) -> None:
+        xs, ys = self.xs, self.ys
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        half = max(max_x - min_x, max_y - min_y) / 2 + _MIN_NODE_SIZE
+        self.root = _Node((min_x + max_x) / 2, (min_y + max_y) / 2, half)
+        for i in range(len(xs)):
+            self._insert(self.root, i)
+        self._finalize(self.root)
+
+    def _insert(self, node: _Node, i: int) -> None:
+        x, y = self.xs[i], self.ys[i]
+        while node.children is not None:
+            node = node._child_for(x, y)
+
+        bodies = node.bodies
+        assert bodies is not None
+        if not bodies or node.half < _MIN_NODE_SIZE:
+            bodies.append(i)
+            return
+
+        # Occupied leaf: split and push the existing bodies down.
+        node._split()
+        node.bodies = None
+        for j in bodies:
+            self._insert(node, j)
+        self._insert(node, i)
+
+    def _finalize(self, node: _Node) -> None:
+        """Accumulate mass and centre of mass bottom-up."""
+        if node.children is None:
+            mass = mx = my = 0.0
+            for i in node.bodies:  # type: ignore[union-attr]
+                m = self.ms[i]
+                mass += m
+                mx += m * self.xs[i]
+                my += m * self.ys[i]
+        else:
+            mass = mx = my = 0.0
+            for child in node.children:
+                self._finalize(child)
+                mass += child.mass
+                mx += child.mass * child.mx
+                my += child.mass * child.my
+        node.mass = mass
+        if mass > 0:
+            node.mx = mx / mass
+            node.my = my / mass
+        else:
+            node.mx, node.my = node.cx, node.cy
+
+    # -- evaluation ------------------------------------------------------
+
+    def force_on(self, i: int, gravity_factor: float = gravityFactor) -> tuple[float, float]:
+        """Net gravitational force on body ``i`` as ``(fx, fy)``."""
+        if self.root is None:
+            return 0.0, 0.0
+        xs, ys, ms = self.xs, self.ys, self.ms
+        x, y, m = xs[i], ys[i], ms[i]
+        theta = self.theta
+        fx = fy = 0.0
+        interactions = 0
+        sqrt = math.sqrt
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.mass == 0:
+                continue
+
+            if node.children is None:
+                for j in node.bodies:  # type: ignore[union-attr]
+                    if j == i:
+                        continue
+                    dx = xs[j] - x
+                    dy = ys[j] - y
+                    r = sqrt(dx * dx + dy * dy)
+                    if r == 0:
+                        continue
+                    d = r if r > MIN_DISTANCE else MIN_DISTANCE
+                    f = gravity_factor * m * ms[j] / (d * d + SOFTENING) / r
+                    fx += f * dx
+                    fy += f * dy
+                    interactions += 1
+                continue
+
+            dx = node.mx - x
+            dy = node.my - y
+            r = sqrt(dx * dx + dy * dy)
+            outside = abs(x - node.cx) > node.half or abs(y - node.cy) > node.half
+            if outside and 2 * node.half < theta * r:
+                d = r if r > MIN_DISTANCE else MIN_DISTANCE
+                f = gravity_factor * m * node.mass / (d * d + SOFTENING) / r
+                fx += f * dx
+                fy += f * dy
+                interactions += 1
+            else:
+                stack.extend(node.children)
+
+        self.interactions += interactions
+        return fx, fy
+
+    def forces(self, gravity_factor: float = gravityFactor) -> list[tuple[float, float]]:
+        """Net force on every body, in input order."""
+        self.interactions = 0
+        return [self.force_on(i, gravity_factor) for i in range(len(self.xs))]
+
+
+# ---------------------------------------------------------------------------
+# Direct sum & error report
+# ---------------------------------------------------------------------------
+
+def direct_gravitation_forces(
+    balls: list[Ball], gravity_factor: float = gravityFactor
+) -> list[tuple[float, float]]:
+    """Exact O(N²) forces with the same softening as the tree."""
+    n = len(balls)
+    xs = [b.position.x for b in balls]
+    ys = [b.position.y for b in balls]
+    ms = [b.mass for b in balls]
+    fx = [0.0] * n
+    fy = [0.0] * n
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = xs[j] - xs[i]
+            dy = ys[j] - ys[i]
+            r = math.sqrt(dx * dx + dy * dy)
+            if r == 0:
+                continue
+            d = r if r > MIN_DISTANCE else MIN_DISTANCE
+            f = gravity_factor * ms[i] * ms[j] / (d * d + SOFTENING) / r
+            fx[i] += f * dx
+            fy[i] += f * dy
+            fx[j] -= f * dx
+            fy[j] -= f * dy
+    return list(zip(fx, fy))
+
+
+def barnes_hut_gravitation_forces(
+    balls: list[Ball], theta: float = 0.5, gravity_factor: float = gravityFactor
+) -> list[tuple[float, float]]:
+    """Approximate forces on every ball via a freshly built tree."""
+    return BarnesHutTree(balls, theta).forces(gravity_factor)
+
+
+def gravitation_force_error(balls: list[Ball], theta: float = 0.5) -> dict[str, float]:
+    """Compare Barnes--Hut against the direct sum for the given balls.
+
+    Returns the maximum, mean and RMS of the per-body relative force error
+    ``|F_bh - F_exact| / |F_exact|`` (bodies with zero exact force are
+    skipped), plus the average number of interactions per body.
+    """
+    tree = BarnesHutTree(balls, theta)
+    approx = tree.forces()
+    exact = direct_gravitation_forces(balls)
+
+    errors: list[float] = []
+    for (ax, ay), (ex, ey) in zip(approx, exact):
+        norm = math.hypot(ex, ey)
+        if norm == 0:
+            continue
+        errors.append(math.hypot(ax - ex, ay - ey) / norm)
+
+    if not errors:
+        return {"max": 0.0, "mean": 0.0, "rms": 0.0, "interactions": 0.0}
+    return {
+        "max": max(errors),
+        "mean": sum(errors) / len(errors),
+        "rms": math.sqrt(sum(e * e for e in errors) / len(errors)),
+        "interactions": tree.interactions / len(balls),
+    }
@@ -0,0 +1,283 @@
+"""Hierarchical (block) timesteps for celestial gravity.
+
+With one global step, the tightest orbit in the scene -- a moon close to
+its planet -- sets the step for every body, although a distant planet
+could take steps a hundred times longer.  ``BlockTimestepIntegrator``
+instead gives each gravitating ball its own step
+
+    Δt_i = Δt / 2^k_i,    k_i ∈ [0, max_level],
+
+where ``Δt`` is the physics step and the *level* ``k_i`` is the smallest
+one whose step fits Aarseth's acceleration/jerk criterion::
+
+    Δt_i ≤ η · |a_i| / |ȧ_i|
+
+Steps are powers of two of one finest tick, so they nest: at every tick
+only the balls whose step ends there are *active*, and gravity is
+evaluated for those alone (against all sources).  The integrator is the
+block kick--drift--kick leapfrog used by tree codes such as GADGET:
+
+* at the start of its step a ball gets an opening half kick
+  ``v += a · Δt_i / 2``;
+* every tick all balls drift, ``x += v · h``, so inactive balls are
+  at the right place as sources;
+* at the end of its step an active ball gets the closing half kick with
+  its new acceleration, then picks its next level.  A ball may move to a
+  finer level at any of its step ends, but to a coarser one only where
+  the coarser step would start.
+
+At the end of ``step`` every ball is synchronised again.  The closing
+accelerations are kept and reused as the next step's opening ones if no
+ball was moved, added or removed in between.
+
+Gravity matches ``Ball.gravitate`` (``d = max(r, 1)``, ``F = G m m' /
+(d² + 1e-6)``).  Other forces on a ball (charges, controls, ground
+gravity) are taken from ``Ball.accelerate`` at the start of the step and
+held constant over it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+
+from ..basic import Ball, Vector2, gravityFactor
+from ..basic.ball import LEGACY_SUBSTEPS
+from .barnes_hut import MIN_DISTANCE, SOFTENING
+
+
+class BlockTimestepIntegrator:
+    """Block-timestep KDK leapfrog for mutually gravitating balls."""
+
+    #: Finest step is ``Δt / 2**max_level``.
+    max_level: int = 10
+
+    #: Accuracy parameter η of the step criterion.
+    eta: float = 0.05
+
+    def __init__(
+        self, max_level: int | None = None, eta: float | None = None, shared: bool = False
+    ) -> None:
+        if max_level is not None:
+            self.max_level = max_level
+        if eta is not None:
+            self.eta = eta
+        # Shared: every ball takes the finest level any ball needs -- one
+        # adaptive global step, for comparison
+        self.shared: bool = shared
+
+        # Level of each ball (by id) at the end of the last step
+        self.levels: dict[int, int] = {}
+
+        # Closing accelerations of the last step, reused when nothing moved
+        self._cached_balls: list[Ball] = []
+        self._cached_state: list[tuple[float, float, float]] = []
+        self._cached_accelerations: list[tuple[float, float, float, float, float]] = []
+
+        # Statistics of the last step: ticks with active balls, and force
+        # evaluations (one per active ball per tick)
+        self.ticks: int = 0
+        self.evaluations: int = 0
+
+    # ------------------------------------------------------------------
+    # Forces
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _gravity(
+        i: int, x: list[float], y: list[float], vx: list[float], vy: list[float],
+        gm: list[float],
+    ) -> tuple[float, float, float, float, float]:
+        """Acceleration, jerk and shortest pair timescale of body ``i``.
+
+        Returns ``(ax, ay, jx, jy, t)`` with ``t = min_j sqrt(r³ / (G (m_i +
+        m_j)))``, the orbital timescale of the tightest pair ``i`` is in.
+        """
+        xi, yi, vxi, vyi, gmi = x[i], y[i], vx[i], vy[i], gm[i]
+        ax = ay = jx = jy = 0.0
+        shortest = math.inf
+        for j in range(len(x)):
+            if j == i or not gm[j]:
+                continue
+            dx, dy = x[j] - xi, y[j] - yi
+            r2 = dx * dx + dy * dy
+            if r2 == 0:
+                continue
+            r = math.sqrt(r2)
+            d = r if r > MIN_DISTANCE else MIN_DISTANCE
+            # a = G m (p_j - p_i) / (r (d² + ε)),  ȧ = G m (v / r³ - 3 (r·v) r / r⁵)
+            inverse = gm[j] / (r * (d * d + SOFTENING))
+            dvx, dvy = vx[j] - vxi, vy[j] - vyi
+            rv = 3 * (dx * dvx + dy * dvy) / r2
+            ax += dx * inverse
+            ay += dy * inverse
+            jx += (dvx - rv * dx) * inverse
+            jy += (dvy - rv * dy) * inverse
+            pair = r2 * r / (gmi + gm[j])
+            if pair < shortest:
+                shortest = pair
+        return ax, ay, jx, jy, math.sqrt(shortest)
+
+    def level_for(
+        self, ax: float, ay: float, jx: float, jy: float, timescale: float, delta_time: float
+    ) -> int:
+        """Smallest level whose step satisfies ``Δt_i ≤ η min(|a| / |ȧ|, t)``."""
+        jerk = math.hypot(jx, jy)
+        limit = self.eta * min(math.hypot(ax, ay) / jerk if jerk else math.inf, timescale)
+        if limit == math.inf:
+            return 0
+        if limit <= 0:
+            return self.max_level
+        level = math.ceil(math.log2(delta_time / limit)) if limit < delta_time else 0
+        return min(max(level, 0), self.max_level)
+
+    # ------------------------------------------------------------------
+    # Step
+    # ------------------------------------------------------------------
+
+    def step(
+        self, balls: list[Ball], delta_time: float, gravity_factor: float = gravityFactor
+    ) -> int:
+        """Advance the awake ``balls`` by ``delta_time``; return force evaluations.
+
+        Every ball in ``balls`` is a source of gravity (sleeping ones stay
+        put); positions, velocities and accelerations are written back,
+        and ``Ball.recordStep`` is called for each ball advanced.
+        """
+        n = len(balls)
+        self.ticks = 0
+        self.evaluations = 0
+        if n == 0:
+            return 0
+
+        x = [ball.position.x for ball in balls]
+        y = [ball.position.y for ball in balls]
+        vx = [ball.velocity.x for ball in balls]
+        vy = [ball.velocity.y for ball in balls]
+        gm = [gravity_factor * ball.mass for ball in balls]
+        moving = [not ball.isSleeping for ball in balls]
+        external = []
+        for ball in balls:
+            acceleration = ball.accelerate() if not ball.isSleeping else Vector2(0, 0)
+            external.append((acceleration.x, acceleration.y))
+
+        # Opening accelerations: reuse the last closing ones if nothing changed
+        state = list(zip(x, y, gm))
+        if (
+            len(self._cached_balls) == n
+            and all(a is b for a, b in zip(balls, self._cached_balls))
+            and state == self._cached_state
+        ):
+            gravity = list(self._cached_accelerations)
+        else:
+            gravity = [self._gravity(i, x, y, vx, vy, gm) for i in range(n)]
+            self.evaluations += n
+
+        ticks = 1 << self.max_level
+        h = delta_time / ticks
+        size = [0] * n  # step of each ball, in ticks
+        end = [0] * n  # tick at which its current step ends
+        # State at the start of each ball's step, for predicting it as a source
+        start = [0] * n
+        x0, y0, vx0, vy0 = list(x), list(y), list(vx), list(vy)
+
+        def kick(i: int, steps: int) -> None:
+            ax, ay = gravity[i][0] + external[i][0], gravity[i][1] + external[i][1]
+            vx[i] += ax * steps * h / 2
+            vy[i] += ay * steps * h / 2
+
+        def schedule(indices: list[int], tick: int) -> None:
+            """Pick the next step of balls whose step ends at ``tick``."""
+            sizes = []
+            for i in indices:
+                new_size = ticks >> self.level_for(*gravity[i], delta_time)
+                # Coarser steps must start on their own grid
+                while new_size > size[i] and tick % new_size:
+                    new_size >>= 1
+                sizes.append(new_size)
+            if self.shared and sizes:
+                sizes = [min(sizes)] * len(sizes)
+            for i, new_size in zip(indices, sizes):
+                size[i] = new_size
+                end[i] = tick + new_size
+                start[i] = tick
+                x0[i], y0[i], vx0[i], vy0[i] = x[i], y[i], vx[i], vy[i]
+                kick(i, new_size)
+
+        for i in range(n):
+            if not moving[i]:
+                end[i] = ticks
+        schedule([i for i in range(n) if moving[i]], 0)
+
+        # Positions and velocities of the sources at the current tick
+        px, py, pvx, pvy = list(x), list(y), list(vx0), list(vy0)
+        tick = 0
+        while tick < ticks:
+            tick = min(end)
+            self.ticks += 1
+
+            active = []
+            for i in range(n):
+                if not moving[i]:
+                    continue
+                if end[i] == tick:
+                    # Drift with the half-kicked velocity (leapfrog)
+                    x[i] += vx[i] * size[i] * h
+                    y[i] += vy[i] * size[i] * h
+                    px[i], py[i] = x[i], y[i]
+                    active.append(i)
+                # Every other ball is predicted along its Taylor series, so
+                # a moon does not see its planet moving in a straight line
+                # through the planet's long step
+                tau = (tick - start[i]) * h
+                ax, ay = gravity[i][0] + external[i][0], gravity[i][1] + external[i][1]
+                jx, jy = gravity[i][2], gravity[i][3]
+                pvx[i] = vx0[i] + (ax + jx * tau / 2) * tau
+                pvy[i] = vy0[i] + (ay + jy * tau / 2) * tau
+                if end[i] != tick:
+                    px[i] = x0[i] + (vx0[i] + (ax / 2 + jx * tau / 6) * tau) * tau
+                    py[i] = y0[i] + (vy0[i] + (ay / 2 + jy * tau / 6) * tau) * tau
+
+            for i in active:
+                gravity[i] = self._gravity(i, px, py, pvx, pvy, gm)
+            self.evaluations += len(active)
+            for i in active:
+                kick(i, size[i])
+            if tick < ticks:
+                schedule(active, tick)
+
+        # Write back
+        self.levels = {}
+        for i, ball in enumerate(balls):
+            if not moving[i]:
+                continue
+            self.levels[id(ball)] = self.max_level - (size[i].bit_length() - 1)
+            ball.position = Vector2(x[i], y[i])
+            ball.velocity = Vector2(vx[i], vy[i])
+            ball.velocity *= ball.airResistance ** (delta_time / LEGACY_SUBSTEPS)
+            ball.acceleration = Vector2(
+                gravity[i][0] + external[i][0], gravity[i][1] + external[i][1]
+            )
+            ball.recordStep()
+
+        # Keep the closing accelerations: they use the final velocities for
+        # the jerk, which is only needed for picking levels
+        self._cached_balls = list(balls)
+        self._cached_state = [
+            (ball.position.x, ball.position.y, gravity_factor * ball.mass) for ball in balls
+        ]
+        self._cached_accelerations = gravity
+        return self.evaluations
+
+    def level_counts(self) -> dict[int, int]:
+        """Number of balls on each level after the last step."""
+        return dict(sorted(Counter(self.levels.values()).items()))
+
+    def stats(self) -> dict[str, int]:
+        """Tick and evaluation counts of the last step, for profiling."""
+        return {
+            "balls": len(self.levels),
+            "ticks": self.ticks,
+            "evaluations": self.evaluations,
+            "finest_level": max(self.levels.values(), default=0),
+        }
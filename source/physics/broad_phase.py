@@ -0,0 +1,183 @@
+"""Broad-phase collision culling for ball--ball contacts.
+
+The narrow phase (``Ball.isCollidedByBall`` / ``Ball.reboundByBall``) is
+exact but expensive to run for every pair of balls.  A broad phase cheaply
+produces a short list of *candidate* pairs that might be touching; only
+those pairs are handed to the narrow phase.
+
+Two strategies are provided:
+
+* ``BruteForceBroadPhase`` -- every unordered pair, i.e. the historical
+  O(N²) behaviour.  Kept as a reference and for tiny scenes.
+* ``UniformGridBroadPhase`` -- a spatial hash over a uniform grid whose
+  cell size is derived from the largest ball radius, giving ~O(N) pair
+  generation for scenes of similarly-sized balls.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..basic import Ball
+
+
+# ---------------------------------------------------------------------------
+# Base class
+# ---------------------------------------------------------------------------
+
+class BroadPhase:
+    """Common interface: ``candidate_pairs(balls)`` plus statistics."""
+
+    name: str = "base"
+
+    def __init__(self) -> None:
+        #: Candidate pairs produced by the last call (= narrow-phase tests).
+        self.pair_tests: int = 0
+
+    def candidate_pairs(self, balls: list[Ball]) -> list[tuple[Ball, Ball]]:
+        """Return unordered ball pairs that may be in contact."""
+        raise NotImplementedError
+
+
+# ---------------------------------------------------------------------------
+# Brute force
+# ---------------------------------------------------------------------------
+
+class BruteForceBroadPhase(BroadPhase):
+    """Every unordered pair of balls (O(N²))."""
+
+    name = "brute"
+
+    def candidate_pairs(self, balls: list[Ball]) -> list[tuple[Ball, Ball]]:
+        pairs: list[tuple[Ball, Ball]] = []
+        n = len(balls)
+        for i in range(n):
+            b1 = balls[i]
+            for j in range(i + 1, n):
+                pairs.append((b1, balls[j]))
+        self.pair_tests = len(pairs)
+        return pairs
+
+
+# ---------------------------------------------------------------------------
+# Uniform grid / spatial hash
+# ---------------------------------------------------------------------------
+
+# Forward half of the 3x3 neighbourhood.  Visiting only these neighbours
+# (plus the cell itself) reports every adjacent cell pair exactly once.
+_FORWARD_NEIGHBOURS: tuple[tuple[int, int], ...] = (
+    (1, -1),
+    (1, 0),
+    (1, 1),
+    (0, 1),
+)
+
+
+class UniformGridBroadPhase(BroadPhase):
+    """Spatial hash keyed by integer cell coordinates.
+
+    Each ball is inserted into the single cell containing its centre.  With
+    ``cell_size >= 2 * max_radius`` two touching balls are always in the
+    same or in adjacent cells, so scanning each cell against itself and its
+    four forward neighbours finds every contact without duplicates.
+
+    The grid is rebuilt on every call; rebuilding a dict of lists is O(N)
+    and far cheaper than tracking cell migration for fast-moving balls.
+    Balls at a non-finite position (blown up by a huge force, say) have no
+    cell and are left out: they cannot touch a ball at a finite position.
+
+    Parameters
+    ----------
+    cell_size:
+        Fixed cell edge length.  ``None`` (default) derives it from the
+        largest radius in the scene on every rebuild.
+    cell_size_factor:
+        Multiplier applied to ``2 * max_radius`` when ``cell_size`` is
+        derived automatically.  Values below 1 would miss contacts and are
+        clamped.
+    """
+
+    name = "grid"
+
+    def __init__(
+        self, cell_size: float | None = None, cell_size_factor: float = 1.0
+    ) -> None:
+        super().__init__()
+        self.fixed_cell_size: float | None = cell_size
+        self.cell_size_factor: float = max(1.0, cell_size_factor)
+        self.cell_size: float = cell_size or 1.0
+        self.cells: dict[tuple[int, int], list[Ball]] = {}
+
+    def _derive_cell_size(self, balls: list[Ball]) -> float:
+        max_radius = 0.0
+        for ball in balls:
+            if ball.radius > max_radius:
+                max_radius = ball.radius
+        required = 2.0 * max_radius
+        if self.fixed_cell_size is not None:
+            return max(self.fixed_cell_size, required)
+        return max(required * self.cell_size_factor, 1e-6)
+
+    def rebuild(self, balls: list[Ball]) -> None:
+        """Re-bucket every ball by the cell containing its centre."""
+        self.cell_size = self._derive_cell_size(balls)
+        inv = 1.0 / self.cell_size
+        cells: dict[tuple[int, int], list[Ball]] = {}
+        floor = math.floor
+        for ball in balls:
+            try:
+                key = (floor(ball.position.x * inv), floor(ball.position.y * inv))
+            except (OverflowError, ValueError):  # inf / NaN
+                continue
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [ball]
+            else:
+                bucket.append(ball)
+        self.cells = cells
+
+    def candidate_pairs(self, balls: list[Ball]) -> list[tuple[Ball, Ball]]:
+        self.rebuild(balls)
+        cells = self.cells
+        pairs: list[tuple[Ball, Ball]] = []
+
+        for (cx, cy), bucket in cells.items():
+            n = len(bucket)
+            # Same cell
+            for i in range(n):
+                b1 = bucket[i]
+                for j in range(i + 1, n):
+                    pairs.append((b1, bucket[j]))
+            # Forward neighbours
+            for dx, dy in _FORWARD_NEIGHBOURS:
+                other = cells.get((cx + dx, cy + dy))
+                if other is None:
+                    continue
+                for b1 in bucket:
+                    for b2 in other:
+                        pairs.append((b1, b2))
+
+        self.pair_tests = len(pairs)
+        return pairs
+
+
+# ---------------------------------------------------------------------------
+# Factory
+# ---------------------------------------------------------------------------
+
+BROAD_PHASES: dict[str, type[BroadPhase]] = {
+    BruteForceBroadPhase.name: BruteForceBroadPhase,
+    UniformGridBroadPhase.name: UniformGridBroadPhase,
+}
+
+
+def make_broad_phase(name: str) -> BroadPhase:
+    """Instantiate a broad phase by name (``"grid"`` or ``"brute"``)."""
+    try:
+        return BROAD_PHASES[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown broad phase {name!r}; expected one of {sorted(BROAD_PHASES)}"
+        ) from None
@@ -0,0 +1,74 @@
+"""Continuous collision detection for balls against walls.
+
+``Ball.isCollidedByLine`` only tests for overlap where a step *ends*, so a
+fast ball can pass through a thin wall between two checks.  The CFL
+substeps in ``PhysicsEngine.update_ball`` guard against that by shortening
+the step, at up to ``Ball.maxSubsteps`` integrations per ball.
+
+Here the ball's motion over a step is swept instead.  The chord from its
+start to its end position is tested against every wall edge, every floor
+line and every wall vertex, and the earliest time of impact is returned.
+The caller rewinds to that moment, reflects the velocity and integrates
+the rest of the step.  A step therefore costs one integration per contact
+rather than one per substep.
+"""
+
+from __future__ import annotations
+
+import math
+
+from .event_driven import Edge, Vertex, ball_contact_time, edge_contact_time
+
+
+def time_of_impact(
+    x0: float, y0: float, x1: float, y1: float, radius: float,
+    edges: list[Edge], vertices: list[Vertex],
+) -> tuple[float, float, float, float] | None:
+    """Earliest contact of a disc moving from ``(x0, y0)`` to ``(x1, y1)``.
+
+    Returns ``(s, nx, ny, collision_factor)``.  ``s`` in ``[0, 1]`` is the
+    fraction of the move completed at contact, and ``(nx, ny)`` is the unit
+    contact normal pointing towards the disc.  Returns ``None`` if the
+    sweep touches nothing.  A disc that already overlaps a feature it is
+    moving into reports ``s = 0``.
+    """
+    dx, dy = x1 - x0, y1 - y0
+    bx0, bx1 = (x0, x1) if x0 < x1 else (x1, x0)
+    by0, by1 = (y0, y1) if y0 < y1 else (y1, y0)
+    bx0 -= radius
+    by0 -= radius
+    bx1 += radius
+    by1 += radius
+
+    best = math.inf
+    hit: tuple[float, float, float] | None = None
+
+    for ax, ay, ex, ey, infinite, factor in edges:
+        if not infinite and (
+            (ax < bx0 and ex < bx0) or (ax > bx1 and ex > bx1)
+            or (ay < by0 and ey < by0) or (ay > by1 and ey > by1)
+        ):
+            continue
+        s = edge_contact_time(x0, y0, dx, dy, radius, ax, ay, ex, ey, infinite)
+        if s < best:
+            tx, ty = ex - ax, ey - ay
+            length = math.hypot(tx, ty)
+            nx, ny = -ty / length, tx / length
+            if (x0 - ax) * nx + (y0 - ay) * ny < 0:
+                nx, ny = -nx, -ny
+            best, hit = s, (nx, ny, factor)
+
+    for vx, vy, factor in vertices:
+        if vx < bx0 or vx > bx1 or vy < by0 or vy > by1:
+            continue
+        s = ball_contact_time(vx - x0, vy - y0, -dx, -dy, radius)
+        if s < best:
+            cx, cy = x0 + dx * s - vx, y0 + dy * s - vy
+            dist = math.hypot(cx, cy)
+            if dist == 0:
+                continue
+            best, hit = s, (cx / dist, cy / dist, factor)
+
+    if hit is None or best > 1:
+        return None
+    return best, hit[0], hit[1], hit[2]
@@ -0,0 +1,309 @@
+"""Persistent ball--ball contacts with warm-started sequential impulses.
+
+``Ball.reboundByBall`` treats every overlap as a fresh collision: it swaps
+normal velocities, pushes the balls 5 % further apart than the overlap and
+then adds ad-hoc separation velocities (``min_sep_speed``,
+``gravityBoost``).  In a stack every resting contact is re-solved from
+scratch each step, so the injected velocities make piles jitter and creep.
+
+``ContactCache`` keeps one ``Contact`` per touching ball pair, keyed by the
+pair's ids, for as long as the balls stay in contact; balls of those pairs
+that rest on the floor also get a floor contact, and ``floor_balls``
+tells the caller not to run ``Floor.checkCollision`` on them again in the
+same step.  Each ``solve``:
+
+1. refreshes the normal, depth and effective mass of every touching pair;
+2. *warm-starts* each contact by re-applying the normal impulse it
+   accumulated in the previous step;
+3. bounces *impacts* -- new contacts that approach, and carried-over
+   contacts approaching faster than ``restitution_threshold`` -- pair by
+   pair with restitution
+   ``e = collisionFactor_a · collisionFactor_b``, repeating the pass until
+   no impact is left, so a hit travels along a row of touching balls as in
+   Newton's cradle.  Impact impulses are one-off and are not cached;
+4. runs sequential-impulse (projected Gauss--Seidel) sweeps on the
+   accumulated resting impulses, clamped to ``λ ≥ 0``, until a sweep
+   changes no relative velocity by more than ``tolerance``;
+5. pushes still-overlapping balls apart by a fraction ``correction`` of
+   the depth beyond ``slop``, without touching their velocities.
+
+A resting contact needs nearly the same impulse every step (the weight it
+carries), so the warm start already cancels the approach velocity and the
+sweeps stop after one or two.  Contacts not seen in a step are dropped.
+Sleeping balls take part as fixed bodies.
+"""
+
+from __future__ import annotations
+
+import math
+
+from ..basic import Ball, Floor, Vector2
+
+
+class Contact:
+    """A touching ball pair (or ball and floor) and its accumulated impulse."""
+
+    __slots__ = ("a", "b", "nx", "ny", "depth", "mass", "restitution", "impulse", "age")
+
+    def __init__(self, a: Ball, b: Ball | Floor) -> None:
+        self.a: Ball = a
+        self.b: Ball | Floor = b
+        # Unit normal from b to a, and overlap depth (world units)
+        self.nx: float = 1.0
+        self.ny: float = 0.0
+        self.depth: float = 0.0
+        # Effective mass 1 / (w_a + w_b) along the normal
+        self.mass: float = 0.0
+        self.restitution: float = a.collisionFactor * b.collisionFactor
+        # Accumulated resting normal impulse (≥ 0), carried across steps
+        self.impulse: float = 0.0
+        # Consecutive steps this pair has been in contact
+        self.age: int = 0
+
+
+class ContactCache:
+    """Ball--ball contact manifolds that persist across steps."""
+
+    #: Maximum sequential-impulse sweeps per ``solve``.
+    iterations: int = 8
+
+    #: Sweeps stop once none changes a relative velocity by more than this
+    #: (world units per second).
+    tolerance: float = 1e-2
+
+    #: Contacts carried over from the previous step that approach slower
+    #: than this (world units per second) are resting: they get no
+    #: restitution bounce.  A new contact bounces at any approach speed.
+    restitution_threshold: float = 10.0
+
+    #: Overlap tolerated without position correction (world units), and
+    #: the fraction of the remaining overlap removed per step.
+    slop: float = 0.01
+    correction: float = 0.8
+
+    def __init__(self, iterations: int | None = None, warm_starting: bool = True) -> None:
+        if iterations is not None:
+            self.iterations = iterations
+        self.warm_starting: bool = warm_starting
+
+        self.contacts: dict[tuple[int, int], Contact] = {}
+
+        # Statistics of the last solve: how many contacts were carried over
+        # (warm-started) or new, impacts bounced, and resting sweeps used
+        self.created: int = 0
+        self.persisted: int = 0
+        self.impacts: int = 0
+        self.sweeps: int = 0
+
+        #: Ids of the balls that got a floor contact in the last solve; their
+        #: floor response is done and must not be repeated this step.
+        self.floor_balls: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.contacts)
+
+    def clear(self) -> None:
+        """Forget every cached contact."""
+        self.contacts.clear()
+
+    # ------------------------------------------------------------------
+    # Solve
+    # ------------------------------------------------------------------
+
+    def solve(self, pairs: list[tuple[Ball, Ball]], floor: Floor | None = None) -> int:
+        """Resolve the touching ball ``pairs``; return the number of contacts.
+
+        Pairs that do not overlap are ignored.  With a ``floor``, every ball
+        of a pair that also rests on it gets a floor contact in the same
+        solve, so a stack's weight reaches the ground instead of bouncing
+        between the ball pass and ``Floor.checkCollision``.  Velocities and
+        positions of the balls are written back once at the end.
+        """
+        index: dict[int, int] = {}
+        bodies: list[Ball] = []
+        vx: list[float] = []
+        vy: list[float] = []
+        w: list[float] = []
+
+        def body(ball: Ball) -> int:
+            key = id(ball)
+            i = index.get(key)
+            if i is None:
+                i = index[key] = len(bodies)
+                bodies.append(ball)
+                vx.append(ball.velocity.x)
+                vy.append(ball.velocity.y)
+                # A sleeping ball is not woken by resting contacts: treat it as fixed
+                w.append(0.0 if ball.isSleeping else 1 / ball.mass)
+            return i
+
+        previous = self.contacts
+        current: dict[tuple[int, int], Contact] = {}
+        active: list[tuple[Contact, int, int]] = []
+        self.created = self.persisted = 0
+
+        def refresh(key: tuple[int, int], a: Ball, b: Ball | Floor,
+                    nx: float, ny: float, depth: float) -> None:
+            i = body(a)
+            j = body(b) if isinstance(b, Ball) else -1
+            wj = w[j] if j >= 0 else 0.0
+            if not w[i] + wj:
+                return
+            contact = previous.get(key)
+            if contact is None:
+                contact = Contact(a, b)
+                self.created += 1
+            else:
+                contact.age += 1
+                self.persisted += 1
+            current[key] = contact
+            contact.nx, contact.ny, contact.depth = nx, ny, depth
+            contact.mass = 1 / (w[i] + wj)
+            contact.restitution = a.collisionFactor * b.collisionFactor
+            if not self.warm_starting:
+                contact.impulse = 0.0
+            active.append((contact, i, j))
+
+        # 1. Refresh the manifolds
+        for a, b in pairs:
+            if id(a) > id(b):
+                a, b = b, a
+            key = (id(a), id(b))
+            if key in current:
+                continue
+            dx = a.position.x - b.position.x
+            dy = a.position.y - b.position.y
+            distance = math.hypot(dx, dy)
+            depth = a.radius + b.radius - distance
+            if depth < 0:
+                continue
+            contact = previous.get(key)
+            if distance > 1e-9:
+                nx, ny = dx / distance, dy / distance
+            elif contact is not None:
+                nx, ny = contact.nx, contact.ny
+            else:
+                nx, ny = 1.0, 0.0
+            refresh(key, a, b, nx, ny, depth)
+
+        if floor is not None:
+            for ball in list(bodies):
+                depth = ball.position.y + ball.radius - floor.y
+                if depth >= 0:
+                    refresh((id(ball), id(floor)), ball, floor, 0.0, -1.0, depth)
+        self.contacts = current
+        self.floor_balls = {id(contact.a) for contact, _, j in active if j < 0}
+
+        # 2. Warm start
+        for contact, i, j in active:
+            if contact.impulse:
+                px, py = contact.nx * contact.impulse, contact.ny * contact.impulse
+                vx[i] += px * w[i]
+                vy[i] += py * w[i]
+                if j >= 0:
+                    vx[j] -= px * w[j]
+                    vy[j] -= py * w[j]
+
+        # 3. Impacts
+        self.impacts = 0
+        threshold = -self.restitution_threshold
+        for _ in range(self.iterations if active else 0):
+            bounced = False
+            for contact, i, j in active:
+                nx, ny = contact.nx, contact.ny
+                relative = vx[i] * nx + vy[i] * ny
+                if j >= 0:
+                    relative -= vx[j] * nx + vy[j] * ny
+                if relative >= (threshold if contact.age else 0.0):
+                    continue
+                delta = -(1 + contact.restitution) * relative * contact.mass
+                vx[i] += nx * delta * w[i]
+                vy[i] += ny * delta * w[i]
+                if j >= 0:
+                    vx[j] -= nx * delta * w[j]
+                    vy[j] -= ny * delta * w[j]
+                self.impacts += 1
+                bounced = True
+            if not bounced:
+                break
+
+        # 4. Sequential impulses on resting contacts
+        self.sweeps = 0
+        tolerance = self.tolerance
+        for _ in range(self.iterations if active else 0):
+            self.sweeps += 1
+            converged = True
+            for contact, i, j in active:
+                nx, ny = contact.nx, contact.ny
+                relative = vx[i] * nx + vy[i] * ny
+                if j >= 0:
+                    relative -= vx[j] * nx + vy[j] * ny
+                impulse = max(contact.impulse - contact.mass * relative, 0.0)
+                delta = impulse - contact.impulse
+                if not delta:
+                    continue
+                contact.impulse = impulse
+                vx[i] += nx * delta * w[i]
+                vy[i] += ny * delta * w[i]
+                if j >= 0:
+                    vx[j] -= nx * delta * w[j]
+                    vy[j] -= ny * delta * w[j]
+                if abs(delta) / contact.mass > tolerance:
+                    converged = False
+            if converged:
+                break
+
+        # 5. Position correction (velocities untouched)
+        px = [ball.position.x for ball in bodies]
+        py = [ball.position.y for ball in bodies]
+        slop, correction = self.slop, self.correction
+        for contact, i, j in active:
+            if j < 0:
+                nx, ny = contact.nx, contact.ny
+                depth = py[i] + contact.a.radius - contact.b.y
+            else:
+                dx, dy = px[i] - px[j], py[i] - py[j]
+                distance = math.hypot(dx, dy)
+                depth = contact.a.radius + contact.b.radius - distance
+                if distance > 1e-9:
+                    nx, ny = dx / distance, dy / distance
+                else:
+                    nx, ny = contact.nx, contact.ny
+            if depth <= slop:
+                continue
+            shift = correction * (depth - slop) * contact.mass
+            px[i] += nx * shift * w[i]
+            py[i] += ny * shift * w[i]
+            if j >= 0:
+                px[j] -= nx * shift * w[j]
+                py[j] -= ny * shift * w[j]
+
+        # Write back, freezing the displayed (smoothed) velocity as
+        # reboundByBall does
+        for k, ball in enumerate(bodies):
+            if ball.isSleeping:
+                continue
+            ball.displayedVelocity = (
+                ball.velocity + (ball.displayedVelocity - ball.velocity) * ball.displayedVelocityFactor
+            )
+            ball.displayedVelocityFactor = 1
+            ball.velocity = Vector2(vx[k], vy[k])
+            ball.position = Vector2(px[k], py[k])
+
+        # Touching balls share their charge
+        for contact, _, j in active:
+            if j >= 0:
+                a, b = contact.a, contact.b
+                a.electricCharge = b.electricCharge = (a.electricCharge + b.electricCharge) / 2
+
+        return len(active)
+
+    def stats(self) -> dict[str, int]:
+        """Contact counts of the last ``solve``, for profiling."""
+        return {
+            "contacts": len(self.contacts),
+            "persisted": self.persisted,
+            "created": self.created,
+            "impacts": self.impacts,
+            "sweeps": self.sweeps,
+        }
@@ -7,9 +7,30 @@ problem and enable unit-testing of physics logic in isolation.
 
 from __future__ import annotations
 
-from typing import Any
-
-from ..basic import Ball, Wall, gravityFactor
+import math
+from typing import TYPE_CHECKING, Any
+
+from ..basic import Ball, Floor, Vector2, Wall, electrostaticFactor, gravityFactor
+from .barnes_hut import barnes_hut_gravitation_forces, gravitation_force_error
+from .block_timestep import BlockTimestepIntegrator
+from .broad_phase import BroadPhase, make_broad_phase
+from .ccd import time_of_impact
+from .constraints import ConstraintSolver
+from .contacts import ContactCache
+from .event_driven import Edge, EventDrivenSimulation, Vertex, wall_features
+from .islands import IslandGraph, link_pairs
+from .wall_bvh import WallBVH
+
+try:
+    from .field_kernel import apply_field_forces as _apply_field_forces
+    from .spring_kernel import SpringNetwork as _SpringNetwork
+except ImportError:  # NumPy is optional
+    _apply_field_forces = None
+    _SpringNetwork = None
+
+if TYPE_CHECKING:
+    from .spring_kernel import SpringNetwork
+    from .world_state import WorldState
 
 
 # ---------------------------------------------------------------------------
@@ -23,15 +44,32 @@ class PhysicsEngine:
     ----------------
     * Maintaining ``elements``, ``groundElements``, ``celestialElements``.
     * Boundary transitions (ground ↔ celestial).
-    * Ball--ball, ball--wall and ball--floor collision detection & response.
-    * Gravitational force calculation.
+    * Ball--ball, ball--wall and ball--floor collision detection & response
+      (ball--ball candidates come from a selectable broad phase, ball--wall
+      candidates from a BVH over wall boxes in wall-heavy scenes; the floor
+      is an analytic half-plane tested in O(1) per ball).  Ball--ball
+      contacts persist across steps and are warm-started.
+    * Selecting the elements inside the camera view for drawing.
+    * Ball integration, with swept (time-of-impact) wall contacts or
+      adaptive CFL substeps for fast balls, or an event-driven hard-sphere
+      engine for force-free scenes.
+    * Rod and rope constraints, solved as XPBD position constraints.
+    * Spring and soft-body forces, from one batched kernel over all links.
+    * Grouping balls into islands (connected through links and contacts),
+      putting resting islands to sleep and waking them again, and counting
+      static vs. kinematic walls.
+    * Gravitational force calculation (exact direct sum or Barnes--Hut)
+      and a fused gravity + Coulomb kernel; block (per-ball power-of-two)
+      timesteps for direct-sum celestial scenes.
     * Environment parameter application (gravity, air resistance, ...).
 
     The engine deliberately does **not** handle rendering or UI input,
     making it testable in isolation.
     """
 
-    def __init__(self, options_list: list[dict[str, Any]]) -> None:
+    def __init__(
+        self, options_list: list[dict[str, Any]], broad_phase: str = "grid"
+    ) -> None:
         # -- element collections -------------------------------------------
 
         _base: dict[str, list] = {
@@ -39,6 +77,7 @@ class PhysicsEngine:
             "ball": [],
             "wall": [],
             "rope": [],
+            "softbody": [],
             "controlling": [],
         }
 
@@ -61,9 +100,86 @@ class PhysicsEngine:
         self.current_elements: dict[str, list] = self.ground_elements
 
         # Floor (also a wall, positioned by Game)
-        self.floor: Wall | None = None
+        self.floor: Floor | None = None
         self.is_floor_illegal: bool = False
 
+        # Ball--ball broad phase ("grid" or "brute")
+        self.broad_phase: BroadPhase = make_broad_phase(broad_phase)
+
+        # Ball--wall candidates: a BVH over wall polygon boxes once the scene has
+        # ``wall_bvh_threshold`` walls, otherwise every wall.
+        self.wall_bvh: WallBVH = WallBVH()
+        self.wall_bvh_threshold: int = 16
+        # Ball--wall pairs handed to the narrow phase since the last reset
+        self.wall_pair_tests: int = 0
+
+        # Gravity solver: "direct", "barnes_hut", or "auto" (tree once the
+        # number of gravitating balls reaches ``barnes_hut_threshold``).
+        self.gravity_solver: str = "auto"
+        self.barnes_hut_theta: float = 0.5
+        self.barnes_hut_threshold: int = 64
+
+        # Direct-sum celestial gravity on block timesteps: each gravitating
+        # ball steps at the power-of-two fraction of the frame its orbit
+        # needs (see uses_block_timesteps).
+        self.block_timesteps: bool = True
+        self.block_integrator: BlockTimestepIntegrator = BlockTimestepIntegrator()
+
+        # Fused NumPy gravity + Coulomb kernel (falls back to per-pair
+        # loops when NumPy is missing or this is switched off).
+        self.vectorized_fields: bool = _apply_field_forces is not None
+
+        # Collision engine: "step" (fixed timestep + overlap repair) or
+        # "event" (exact event-driven hard spheres, used whenever the scene
+        # has no continuous forces -- see supports_event_driven).
+        self.collision_engine: str = "step"
+        self.event_simulation: EventDrivenSimulation = EventDrivenSimulation()
+
+        # Fast balls are swept against walls for their time of impact
+        # instead of being split into CFL substeps; at most
+        # ``max_impacts`` contacts are resolved per ball per step.
+        self.continuous_collision: bool = True
+        self.max_impacts: int = 4
+
+        # Ball--ball contacts: cached manifolds solved by warm-started
+        # sequential impulses, or (switched off) Ball.reboundByBall per pair.
+        self.persistent_contacts: bool = True
+        self.contact_cache: ContactCache = ContactCache()
+
+        # Rods and ropes: XPBD position constraints solved after each ball
+        # integration pass, or (switched off) the legacy stiff-spring forces
+        # in Rod/Rope.calculateForce.
+        self.position_based_constraints: bool = True
+        self.constraint_solver: ConstraintSolver = ConstraintSolver()
+
+        # Springs and soft-body links: one batched NumPy pass over all of
+        # them (falls back to Spring/SoftBody.calculateForce without NumPy
+        # or when this is switched off).
+        self.vectorized_springs: bool = _SpringNetwork is not None
+        self.spring_network: SpringNetwork | None = (
+            _SpringNetwork() if _SpringNetwork is not None else None
+        )
+
+        # Islands: balls connected by links or this step's contacts.  With
+        # ``island_sleeping`` an island sleeps and wakes as a unit.
+        self.island_graph: IslandGraph = IslandGraph()
+        self.island_sleeping: bool = True
+        self._contacts: list[tuple[Ball, Ball]] = []
+        self._island_inputs: list[list] = [[] for _ in range(5)]
+        self._island_revisions: list[int] = []
+
+        # Ball substeps spent by update_ball since the counter was last reset
+        self.substeps: int = 0
+
+        # Awake / asleep ball counts from the last update_sleep_states call
+        self.awake_balls: int = 0
+        self.sleeping_balls: int = 0
+        self.static_walls: int = 0
+        self.kinematic_walls: int = 0
+
+        # Optional NumPy structure-of-arrays store (see enable_array_state)
+        self.world_state: WorldState | None = None
+
     # ------------------------------------------------------------------
     # Public helpers -- used by Game properties / methods
     # ------------------------------------------------------------------
@@ -79,6 +195,54 @@ class PhysicsEngine:
             self.celestial_elements if use_celestial else self.ground_elements
         )
 
+    def set_broad_phase(self, name: str) -> None:
+        """Select the ball--ball broad phase by name (``"grid"``/``"brute"``)."""
+        self.broad_phase = make_broad_phase(name)
+
+    def set_collision_engine(self, name: str) -> None:
+        """Select the collision engine by name (``"step"``/``"event"``)."""
+        if name not in ("step", "event"):
+            raise ValueError(
+                f"Unknown collision engine {name!r}; expected one of ['event', 'step']"
+            )
+        self.collision_engine = name
+
+    # ------------------------------------------------------------------
+    # Array-backed state
+    # ------------------------------------------------------------------
+
+    def enable_array_state(self, enabled: bool = True) -> None:
+        """Bind the active balls to a NumPy ``WorldState`` (or release them).
+
+        Requires NumPy; the import is deferred so the object path never
+        depends on it.
+        """
+        if enabled:
+            if self.world_state is None:
+                from .world_state import WorldState
+
+                self.world_state = WorldState()
+            self.world_state.sync(self.current_elements["ball"])
+        elif self.world_state is not None:
+            self.world_state.clear()
+            self.world_state = None
+
+    def step_array_state(
+        self,
+        delta_time: float,
+        environment_options: list[dict[str, Any]] | None = None,
+        gravity_factor: float = gravityFactor,
+    ) -> None:
+        """Whole-array environment, gravity, Coulomb and integration step.
+
+        Newly added balls are bound and removed balls released first.
+        """
+        if self.world_state is None:
+            self.enable_array_state()
+        assert self.world_state is not None
+        self.world_state.sync(self.current_elements["ball"])
+        self.world_state.step(delta_time, environment_options, gravity_factor)
+
     # ------------------------------------------------------------------
     # Boundary transitions
     # ------------------------------------------------------------------
@@ -128,54 +292,489 @@ class PhysicsEngine:
     # Collision detection & response
     # ------------------------------------------------------------------
 
+    def ball_collision_pairs(self) -> list[tuple[Ball, Ball]]:
+        """Candidate ball--ball pairs for the narrow phase.
+
+        The number of pairs produced is available afterwards as
+        ``self.broad_phase.pair_tests``.
+        """
+        return self.broad_phase.candidate_pairs(self.current_elements["ball"])
+
     def resolve_ball_collisions(self) -> None:
-        """Detect and respond to ball-ball collisions."""
-        balls: list[Ball] = self.current_elements["ball"]
-        for i in range(len(balls)):
-            for j in range(i + 1, len(balls)):
-                if balls[i].isCollidedByBall(balls[j]):
-                    balls[i].reboundByBall(balls[j])
+        """Detect and respond to ball-ball collisions.
+
+        Pairs of sleeping balls are skipped; a sleeping ball touched by a
+        moving one is woken (see ``wake_touching``).
+        """
+        touching: list[tuple[Ball, Ball]] = []
+        for b1, b2 in self.ball_collision_pairs():
+            if b1.isSleeping and b2.isSleeping:
+                continue
+            if b1.isCollidedByBall(b2):
+                self.wake_touching(b1, b2)
+                self.record_contact(b1, b2)
+                touching.append((b1, b2))
+        self.resolve_ball_contacts(touching)
+
+    @staticmethod
+    def wake_touching(b1: Ball, b2: Ball) -> None:
+        """Wake a sleeping ball of a touching pair if the other one moves.
+
+        A ball that is merely resting (``restingFrames > 0``) does not wake
+        what it rests on, so a settling pile can fall asleep.
+        """
+        if b1.isSleeping and not b2.restingFrames:
+            b1.wake()
+        elif b2.isSleeping and not b1.restingFrames:
+            b2.wake()
+
+    def resolve_ball_contacts(
+        self, pairs: list[tuple[Ball, Ball]], include_floor: bool = True
+    ) -> int:
+        """Respond to touching ball pairs; return the number of contacts.
+
+        With ``persistent_contacts`` the pairs -- and the floor under them --
+        go to the contact cache as one batch (see ``ContactCache.solve``);
+        otherwise each pair is handled by ``Ball.reboundByBall``.
+        """
+        if self.persistent_contacts:
+            floor = self.floor if include_floor else None
+            return self.contact_cache.solve(pairs, floor)
+        for b1, b2 in pairs:
+            b1.reboundByBall(b2)
+        return len(pairs)
+
+    def floor_contact_balls(self) -> set[int]:
+        """Ids of balls whose floor contact the contact cache already resolved.
+
+        ``Floor.checkCollision`` skips them, so a ball under a stack is not
+        pushed out and bounced a second time in the same step.
+        """
+        return self.contact_cache.floor_balls if self.persistent_contacts else set()
+
+    def refresh_wall_tree(self) -> None:
+        """Sync the wall BVH with the active walls (see ``WallBVH.sync``).
+
+        Call once per collision pass, after walls have been updated; below
+        ``wall_bvh_threshold`` walls the tree is not used.
+        """
+        walls = self.current_elements["wall"]
+        if len(walls) >= self.wall_bvh_threshold:
+            self.wall_bvh.sync(walls)
+
+    def walls_near(self, x0: float, y0: float, x1: float, y1: float) -> list[Wall]:
+        """Walls that may touch the box ``[x0, x1] × [y0, y1]``, in list order."""
+        walls: list[Wall] = self.current_elements["wall"]
+        if len(walls) < self.wall_bvh_threshold:
+            result = walls
+        else:
+            if len(walls) != len(self.wall_bvh.walls):
+                self.wall_bvh.sync(walls)
+            result = self.wall_bvh.query_walls(x0, y0, x1, y1)
+        self.wall_pair_tests += len(result)
+        return result
+
+    def elements_in_view(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Active elements whose drawing may touch the box, in draw order.
+
+        Walls come from the wall BVH once the scene has
+        ``wall_bvh_threshold`` walls; every other element is tested by its
+        ``boundingBox`` (``None`` means unbounded, always included).
+        """
+        elements = self.current_elements
+        walls: list[Wall] = elements["wall"]
+        visible_walls: set[int] | None = None
+        if len(walls) >= self.wall_bvh_threshold:
+            self.wall_bvh.sync(walls)
+            # The tree holds polygon boxes; grow the query by the highlight
+            # border that ``Wall.boundingBox`` adds.
+            visible_walls = {
+                id(wall) for wall in self.wall_bvh.query_walls(x0 - 1, y0 - 1, x1 + 1, y1 + 1)
+            }
+
+        result = []
+        for element in elements["all"]:
+            if visible_walls is not None and element.type == "wall":
+                if id(element) in visible_walls:
+                    result.append(element)
+                continue
+            box = element.boundingBox()
+            if box is None or not (box[0] > x1 or box[2] < x0 or box[1] > y1 or box[3] < y0):
+                result.append(element)
+        return result
+
+    def walls_near_ball(self, ball: Ball) -> list[Wall]:
+        """Walls that may touch ``ball``.
+
+        The query box reaches one radius past the ball, so a wall the ball
+        is pushed into while being resolved is still included.
+        """
+        reach = 2 * ball.radius
+        x, y = ball.position.x, ball.position.y
+        return self.walls_near(x - reach, y - reach, x + reach, y + reach)
 
     def resolve_wall_collisions(self) -> None:
         """Ball-wall and ball-floor collisions."""
-        balls: list[Ball] = self.current_elements["ball"]
-        for wall in self.current_elements["wall"]:
-            for ball in balls:
+        balls = [b for b in self.current_elements["ball"] if not b.isSleeping]
+        self.refresh_wall_tree()
+        for ball in balls:
+            for wall in self.walls_near_ball(ball):
                 if wall.isPosOn(None, ball.position):
                     ball.reboundByWall(wall)
 
         if self.floor is not None:
+            resolved = self.floor_contact_balls()
             for ball in balls:
-                for line in self.floor.lines:
-                    if ball.isCollidedByLine(line):
-                        ball.reboundByLine(line)
-                if self.floor.isPosOn(None, ball.position):
-                    ball.reboundByWall(self.floor)
+                if id(ball) not in resolved:
+                    self.floor.checkCollision(ball)
 
     def resolve_vertex_collisions(self) -> None:
         """Check wall vertex collisions with balls."""
-        for wall in self.current_elements["wall"]:
-            for ball in self.current_elements["ball"]:
+        balls = [b for b in self.current_elements["ball"] if not b.isSleeping]
+        self.refresh_wall_tree()
+        for ball in balls:
+            for wall in self.walls_near_ball(ball):
                 wall.checkVertexCollision(ball)
 
     def resolve_line_collisions(self) -> None:
         """Check ball-wall line segment collisions."""
-        for wall in self.current_elements["wall"]:
-            for line in wall.lines:
-                for ball in self.current_elements["ball"]:
+        balls = [b for b in self.current_elements["ball"] if not b.isSleeping]
+        self.refresh_wall_tree()
+        for ball in balls:
+            for wall in self.walls_near_ball(ball):
+                for line in wall.lines:
                     if (
                         ball.isCollidedByLine(line)
                         and not wall.isPosOn(None, ball.position)
                     ):
                         ball.reboundByLine(line)
 
+    def resolve_ball_wall_contacts(self, ball: Ball, include_floor: bool = True) -> None:
+        """Wall, vertex, edge and (optionally) floor response for one ball."""
+        for wall in self.walls_near_ball(ball):
+            if wall.isPosOn(None, ball.position):
+                ball.reboundByWall(wall)
+            wall.checkVertexCollision(ball)
+            for line in wall.lines:
+                if ball.isCollidedByLine(line) and not wall.isPosOn(None, ball.position):
+                    ball.reboundByLine(line)
+
+        if include_floor and self.floor is not None:
+            self.floor.checkCollision(ball)
+
+    # ------------------------------------------------------------------
+    # Integration
+    # ------------------------------------------------------------------
+
+    def min_wall_thickness(self, include_floor: bool = True) -> float:
+        """Thickness of the thinnest wall (``inf`` when there are none)."""
+        walls = list(self.current_elements["wall"])
+        if include_floor and self.floor is not None:
+            walls.append(self.floor)
+        return min((w.thickness for w in walls), default=math.inf)
+
+    def update_ball(
+        self,
+        ball: Ball,
+        delta_time: float,
+        wall_thickness: float = math.inf,
+        include_floor: bool = True,
+    ) -> int:
+        """Advance ``ball`` by ``delta_time`` and return the substeps used.
+
+        A ball that could cross the thinnest wall in one step (see
+        ``Ball.substepCount``) is swept against the walls (see
+        ``sweep_ball``) or, with ``continuous_collision`` off, split into
+        substeps with wall contacts resolved after each.  Everything else
+        takes a single step and leaves contacts to the caller's usual
+        collision pass.  Sleeping balls are not advanced and use no
+        substeps.
+        """
+        if ball.isSleeping:
+            return 0
+
+        n = ball.substepCount(delta_time, wall_thickness)
+        if n > 1 and self.continuous_collision:
+            n = self.sweep_ball(ball, delta_time, include_floor)
+        elif n > 1:
+            h = delta_time / n
+            for _ in range(n - 1):
+                ball.integrate(h)
+                self.resolve_ball_wall_contacts(ball, include_floor)
+            ball.update(h)
+            self.resolve_ball_wall_contacts(ball, include_floor)
+        else:
+            ball.update(delta_time)
+        self.substeps += n
+        return n
+
+    def sweep_ball(
+        self, ball: Ball, delta_time: float, include_floor: bool = True
+    ) -> int:
+        """Advance ``ball`` with continuous wall collision; return legs used.
+
+        Each leg integrates the remaining time and sweeps the chord from
+        the old to the new position (see ``ccd.time_of_impact``).  On a hit
+        the ball is rewound, integrated up to the impact and reflected, and
+        the rest of the step becomes the next leg.  After ``max_impacts``
+        contacts the remainder is integrated unswept.
+        """
+        remaining = delta_time
+        legs = 1
+        for _ in range(self.max_impacts):
+            position, velocity = ball.position.copy(), ball.velocity.copy()
+            ball.integrate(remaining)
+            edges, vertices = self.swept_wall_features(
+                position, ball.position, ball.radius, include_floor
+            )
+            impact = time_of_impact(
+                position.x, position.y, ball.position.x, ball.position.y,
+                ball.radius, edges, vertices,
+            )
+            if impact is None:
+                break
+            s, nx, ny, factor = impact
+            ball.position, ball.velocity = position, velocity
+            h = remaining * s
+            ball.integrate(h)
+            ball.reboundByNormal(Vector2(nx, ny), factor)
+            remaining -= h
+            legs += 1
+        else:
+            ball.integrate(remaining)
+
+        ball.recordStep()
+        return legs
+
+    def swept_wall_features(
+        self, start: Vector2, end: Vector2, radius: float, include_floor: bool = True
+    ) -> tuple[list[Edge], list[Vertex]]:
+        """Edges and vertices of the walls near a ball moving ``start`` -> ``end``."""
+        walls = list(self.walls_near(
+            min(start.x, end.x) - radius, min(start.y, end.y) - radius,
+            max(start.x, end.x) + radius, max(start.y, end.y) + radius,
+        ))
+        if include_floor and self.floor is not None:
+            walls.append(self.floor)
+        return wall_features(walls)
+
+    # ------------------------------------------------------------------
+    # Constraints
+    # ------------------------------------------------------------------
+
+    def solve_constraints(self, delta_time: float) -> int:
+        """Project balls onto the active rods and ropes; return their number.
+
+        Call after each ball integration pass of length ``delta_time``; pass
+        ``0`` to only restore lengths without touching velocities (see
+        ``ConstraintSolver.solve``).
+        """
+        elements = self.current_elements
+        self.constraint_solver.sync(elements.get("rod", []), elements.get("rope", []))
+        return self.constraint_solver.solve(delta_time)
+
+    # ------------------------------------------------------------------
+    # Springs
+    # ------------------------------------------------------------------
+
+    def apply_spring_forces(self) -> int:
+        """Apply Hooke + damping forces of all springs and soft bodies.
+
+        Returns the number of springs (soft-body links included) evaluated.
+        """
+        springs = self.current_elements.get("spring", [])
+        soft_bodies = self.current_elements["softbody"]
+        if self.vectorized_springs and self.spring_network is not None:
+            self.spring_network.sync(springs, soft_bodies)
+            return self.spring_network.apply()
+
+        for spring in springs:
+            spring.calculateForce()
+        for soft_body in soft_bodies:
+            soft_body.calculateForce()
+        return len(springs) + sum(body.linkCount() for body in soft_bodies)
+
+    # ------------------------------------------------------------------
+    # Event-driven engine
+    # ------------------------------------------------------------------
+
+    def supports_event_driven(self) -> bool:
+        """Whether balls move in straight lines between contacts.
+
+        True when the active set holds only balls and walls, and no ball
+        feels gravity, air resistance, an applied force, or a gravitational
+        or Coulomb partner.
+        """
+        elements = self.current_elements
+        balls: list[Ball] = elements["ball"]
+        if len(elements["all"]) != len(balls) + len(elements["wall"]):
+            return False
+        gravitating = charged = 0
+        for ball in balls:
+            if ball.gravity or ball.airResistance != 1 or abs(ball.netForce()):
+                return False
+            gravitating += bool(ball.gravitation)
+            charged += bool(ball.electricCharge)
+        return gravitating < 2 and charged < 2
+
+    def uses_event_driven(self) -> bool:
+        """Whether the event engine is selected and applicable right now."""
+        return self.collision_engine == "event" and self.supports_event_driven()
+
+    def step_event_driven(self, delta_time: float, include_floor: bool = True) -> int:
+        """Advance all balls by ``delta_time`` between exact collision events.
+
+        Walls (and optionally the floor) are treated as static.  Balls are
+        woken first, since a contact can set any of them moving.  Returns
+        the number of contacts handled; see ``self.event_simulation`` for
+        statistics.
+        """
+        self.wake_all()
+        walls = list(self.current_elements["wall"])
+        if include_floor and self.floor is not None:
+            walls.append(self.floor)
+        return self.event_simulation.advance(
+            self.current_elements["ball"], walls, delta_time
+        )
+
+    # ------------------------------------------------------------------
+    # Islands
+    # ------------------------------------------------------------------
+
+    def record_contact(self, ball1: Ball, ball2: Ball) -> None:
+        """Note a ball--ball contact for this step's islands."""
+        self._contacts.append((ball1, ball2))
+
+    def update_islands(self) -> int:
+        """Rebuild this step's islands; return their number.
+
+        The persistent islands are only re-synced when a ball, link or
+        soft-body topology changed; the contacts recorded since the last
+        call are then merged in and cleared.
+        """
+        elements = self.current_elements
+        inputs = [elements["ball"]] + [
+            elements.get(kind, []) for kind in ("rod", "rope", "spring", "softbody")
+        ]
+        revisions = [body.revision for body in elements["softbody"]]
+        if revisions != self._island_revisions or any(
+            len(new) != len(old) or any(a is not b for a, b in zip(new, old))
+            for new, old in zip(inputs, self._island_inputs)
+        ):
+            self.island_graph.sync(elements["ball"], link_pairs(elements))
+            self._island_inputs = [list(items) for items in inputs]
+            self._island_revisions = revisions
+
+        islands = self.island_graph.merge_contacts(self._contacts)
+        self._contacts = []
+        return len(islands)
+
+    def island_stats(self) -> dict[str, int]:
+        """Island counts from the last ``update_islands`` call, for profiling."""
+        return self.island_graph.stats()
+
+    # ------------------------------------------------------------------
+    # Sleeping
+    # ------------------------------------------------------------------
+
+    def update_sleep_states(self) -> int:
+        """Let resting balls fall asleep; return the number asleep.
+
+        With ``island_sleeping``, a moving ball wakes every sleeping ball of
+        its island (see ``update_islands``), so linked or touching balls only
+        stay asleep together.
+        """
+        balls: list[Ball] = self.current_elements["ball"]
+        for ball in balls:
+            ball.updateSleepState()
+
+        sleeping_islands = 0
+        if self.island_sleeping:
+            for island in self.island_graph.islands:
+                asleep = sum(1 for ball in island if ball.isSleeping)
+                if asleep == len(island):
+                    sleeping_islands += 1
+                elif asleep and any(
+                    not ball.isSleeping and ball.restingFrames == 0 for ball in island
+                ):
+                    for ball in island:
+                        ball.wake()
+        self.island_graph.sleeping_islands = sleeping_islands
+
+        self.sleeping_balls = sum(1 for ball in balls if ball.isSleeping)
+        self.awake_balls = len(balls) - self.sleeping_balls
+        return self.sleeping_balls
+
+    def wake_all(self) -> None:
+        """Wake every ball in the active set."""
+        for ball in self.current_elements["ball"]:
+            ball.wake()
+        self.awake_balls = len(self.current_elements["ball"])
+        self.sleeping_balls = 0
+
+    def count_wall_states(self) -> int:
+        """Count static and kinematic walls; return the number static.
+
+        Static walls (``Wall.isStatic``) skip per-frame updates and are not
+        re-checked by the wall BVH; see ``Wall.makeKinematic``.
+        """
+        walls: list[Wall] = self.current_elements["wall"]
+        self.static_walls = sum(1 for wall in walls if wall.isStatic)
+        self.kinematic_walls = len(walls) - self.static_walls
+        return self.static_walls
+
     # ------------------------------------------------------------------
     # Gravitation
     # ------------------------------------------------------------------
 
-    def apply_gravitation_force(self) -> None:
+    def uses_barnes_hut(self, n_bodies: int) -> bool:
+        """Whether ``gravity_solver`` selects the tree for ``n_bodies``."""
+        if self.gravity_solver == "barnes_hut":
+            return True
+        if self.gravity_solver == "auto":
+            return n_bodies >= self.barnes_hut_threshold
+        return False
+
+    def uses_block_timesteps(self, n_bodies: int) -> bool:
+        """Whether ``n_bodies`` gravitating balls take block timesteps.
+
+        Only for the direct sum (each active ball is evaluated against all
+        others, so the tree is cheaper for large scenes) and only without
+        walls, which block steps do not sweep against.
+        """
+        return (
+            self.block_timesteps
+            and not self.uses_barnes_hut(n_bodies)
+            and not self.current_elements["wall"]
+        )
+
+    def step_block_timesteps(
+        self, delta_time: float, gravity_factor: float = gravityFactor
+    ) -> list[Ball]:
+        """Advance the gravitating balls by ``delta_time``; return them.
+
+        Gravity between them is integrated by ``block_integrator``; their
+        other forces (charges, controls) are held at their current values.
+        The caller must not integrate these balls again this step, nor add
+        their mutual gravity to ``naturalForce``.
+        """
+        bodies = [b for b in self.current_elements["ball"] if b.gravitation]
+        self.block_integrator.step(bodies, delta_time, gravity_factor)
+        return bodies
+
+    def apply_gravitation_force(self, gravity_factor: float = gravityFactor) -> None:
         """Apply inter-body gravitational force for celestial-mode balls."""
         balls: list[Ball] = self.current_elements["ball"]
+
+        bodies = [b for b in balls if b.gravitation]
+        if self.uses_barnes_hut(len(bodies)):
+            forces = barnes_hut_gravitation_forces(
+                bodies, self.barnes_hut_theta, gravity_factor
+            )
+            for ball, (fx, fy) in zip(bodies, forces):
+                ball.force(Vector2(fx, fy), isNatural=True)
+            return
+
         for i in range(len(balls)):
             for j in range(i + 1, len(balls)):
                 b1, b2 = balls[i], balls[j]
@@ -185,11 +784,61 @@ class PhysicsEngine:
                 dist = dv.magnitude()
                 if dist < 1e-6:
                     continue
-                f_mag = gravityFactor * b1.mass * b2.mass / (dist * dist)
+                f_mag = gravity_factor * b1.mass * b2.mass / (dist * dist)
                 dir_vec = dv / dist
                 b1.force(dir_vec * f_mag, isNatural=True)
                 b2.force(-dir_vec * f_mag, isNatural=True)
 
+    def apply_field_forces(
+        self,
+        gravity_factor: float = gravityFactor,
+        electrostatic_factor: float = electrostaticFactor,
+    ) -> None:
+        """Apply all-pairs gravity and Coulomb force in a single pass.
+
+        Only balls that gravitate or carry charge take part.  Each receives
+        one net natural force.  Pass a factor of ``0`` to skip that field
+        (e.g. gravity already handled by Barnes--Hut).
+        """
+        balls = [
+            b for b in self.current_elements["ball"]
+            if (gravity_factor and b.gravitation)
+            or (electrostatic_factor and b.electricCharge)
+        ]
+        if len(balls) < 2:
+            return
+        if self.vectorized_fields and _apply_field_forces is not None:
+            _apply_field_forces(balls, gravity_factor, electrostatic_factor)
+            return
+
+        for i in range(len(balls)):
+            b1 = balls[i]
+            for j in range(i + 1, len(balls)):
+                b2 = balls[j]
+                coef = -electrostatic_factor * b1.electricCharge * b2.electricCharge
+                if b1.gravitation and b2.gravitation:
+                    coef += gravity_factor * b1.mass * b2.mass
+                if not coef:
+                    continue
+                dv = b2.position - b1.position
+                r = dv.magnitude()
+                if r == 0:
+                    continue
+                d = max(r, 1)
+                f = dv * (coef / (d * d + 1e-6) / r)
+                b1.force(f, isNatural=True)
+                b2.force(-f, isNatural=True)
+
+    def gravitation_error(self, theta: float | None = None) -> dict[str, float]:
+        """Barnes--Hut force error vs. the direct sum for the current balls.
+
+        See :func:`gravitation_force_error` for the returned keys.
+        """
+        bodies = [b for b in self.current_elements["ball"] if b.gravitation]
+        return gravitation_force_error(
+            bodies, self.barnes_hut_theta if theta is None else theta
+        )
+
     # ------------------------------------------------------------------
     # Utility
     # ------------------------------------------------------------------
@@ -0,0 +1,429 @@
+"""Event-driven hard-sphere simulation.
+
+Time-stepping moves every ball a fixed ``dt`` and then repairs overlaps,
+which costs a narrow-phase pass per step and leaks energy through the
+position correction in ``Ball.reboundByBall``.  When nothing accelerates
+the balls between contacts -- no gravity, fields, ropes, springs or air
+resistance -- their motion is piecewise linear and every contact time can
+be computed exactly.  ``EventDrivenSimulation`` does that:
+
+* A priority queue holds predicted ball--ball, ball--wall-edge,
+  ball--wall-vertex and grid-cell-crossing events.
+* Events are invalidated lazily.  Each ball carries a collision counter,
+  and an event whose counters no longer match is discarded when popped.
+* Balls live in a uniform grid whose cells are at least one ball diameter
+  across.  Ball--ball events are only predicted against the 3x3
+  neighbourhood, and re-predicted when a ball crosses into a new cell.
+* Every ball keeps its own reference time.  A ball's position is only
+  brought up to date when one of its events fires, so a step costs
+  O(events log events) plus one final O(N) write-back.
+
+The collision response matches the time-stepped engine.  Normal
+velocities use the elastic formula scaled by the product of the
+``collisionFactor`` values; tangential velocities are kept.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import TYPE_CHECKING
+
+from ..basic import Vector2
+
+if TYPE_CHECKING:
+    from ..basic import Ball, Wall
+
+
+# Event kinds
+BALL = 0
+EDGE = 1
+VERTEX = 2
+CELL = 3
+
+
+# ---------------------------------------------------------------------------
+# Wall geometry
+# ---------------------------------------------------------------------------
+
+#: ``(ax, ay, bx, by, infinite, collision_factor)``
+Edge = tuple[float, float, float, float, bool, float]
+#: ``(x, y, collision_factor)``
+Vertex = tuple[float, float, float]
+
+
+def wall_features(walls: list[Wall]) -> tuple[list[Edge], list[Vertex]]:
+    """Flatten wall outlines into plain-float edges and vertices.
+
+    A ``CollisionLine`` with ``isLine`` set becomes an infinite edge.  Each
+    finite edge contributes its start point as a vertex, which covers every
+    corner of a closed outline.
+    """
+    edges: list[Edge] = []
+    vertices: list[Vertex] = []
+    for wall in walls:
+        factor = wall.collisionFactor
+        for line in wall.lines:
+            edges.append(
+                (line.start.x, line.start.y, line.end.x, line.end.y,
+                 line.isLine, factor)
+            )
+            if not line.isLine:
+                vertices.append((line.start.x, line.start.y, factor))
+    return edges, vertices
+
+
+# ---------------------------------------------------------------------------
+# Contact-time prediction
+# ---------------------------------------------------------------------------
+
+def ball_contact_time(
+    dx: float, dy: float, dvx: float, dvy: float, sigma: float
+) -> float:
+    """Time until two discs touch, or ``inf`` if they never do.
+
+    ``(dx, dy)`` and ``(dvx, dvy)`` are the relative position and velocity
+    of the second disc with respect to the first.  ``sigma`` is the sum of
+    the radii.  Discs that already overlap and are still approaching touch
+    at ``0``.
+    """
+    b = dx * dvx + dy * dvy
+    if b >= 0:
+        return math.inf
+    c = dx * dx + dy * dy - sigma * sigma
+    if c <= 0:
+        return 0.0
+    a = dvx * dvx + dvy * dvy
+    disc = b * b - a * c
+    if disc < 0:
+        return math.inf
+    # Numerically stable root of a t² + 2 b t + c = 0
+    return c / (-b + math.sqrt(disc))
+
+
+def edge_contact_time(
+    px: float, py: float, vx: float, vy: float, radius: float,
+    ax: float, ay: float, bx: float, by: float, infinite: bool = False,
+) -> float:
+    """Time until a disc touches the segment ``a``--``b``, or ``inf``.
+
+    Only contacts with the segment's interior are reported.  Contacts past
+    either end are left to the vertex test, unless ``infinite`` is set and
+    the segment is treated as a full line.
+    """
+    ex, ey = bx - ax, by - ay
+    length = math.hypot(ex, ey)
+    if length == 0:
+        return math.inf
+    nx, ny = -ey / length, ex / length
+    d = (px - ax) * nx + (py - ay) * ny
+    vn = vx * nx + vy * ny
+    if d < 0:
+        d, vn = -d, -vn
+    if vn >= 0:
+        return math.inf
+    t = max(d - radius, 0.0) / -vn
+    if not infinite:
+        s = ((px + vx * t - ax) * ex + (py + vy * t - ay) * ey) / (length * length)
+        if s < 0 or s > 1:
+            return math.inf
+    return t
+
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+class EventDrivenSimulation:
+    """Advance force-free balls between exact collision events."""
+
+    def __init__(self, max_events: int = 200_000) -> None:
+        #: Safety cap on events per ``advance`` call.  Inelastic collapse
+        #: (``collisionFactor < 1``) can otherwise schedule an unbounded
+        #: number of contacts within a finite time.
+        self.max_events: int = max_events
+
+        # Statistics from the last advance() call: events handled (including
+        # cell crossings), of which contacts, and stale events discarded
+        self.events: int = 0
+        self.collisions: int = 0
+        self.stale_events: int = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def advance(
+        self, balls: list[Ball], walls: list[Wall], delta_time: float
+    ) -> int:
+        """Move ``balls`` forward by ``delta_time``; return contacts handled.
+
+        ``walls`` are static obstacles.  Their edges and vertices are
+        collided against exactly; a ``CollisionLine`` with ``isLine`` set
+        acts as an infinite line.
+        """
+        self.events = 0
+        self.collisions = 0
+        self.stale_events = 0
+        n = len(balls)
+        if n == 0 or delta_time <= 0:
+            return 0
+
+        end = delta_time
+        self._setup(balls, walls, end)
+        queue = self._queue
+
+        while queue:
+            t, _, kind, i, j, ci, cj = queue[0]
+            if t > end:
+                break
+            heapq.heappop(queue)
+            if ci != self._count[i] or (kind == BALL and cj != self._count[j]):
+                self.stale_events += 1
+                continue
+            if self.events >= self.max_events:
+                break
+            self.events += 1
+
+            if kind == CELL:
+                self._cross_cell(i, j, t, end)
+                continue
+            self.collisions += 1
+            if kind == BALL:
+                self._collide_balls(i, j, t)
+                self._predict(i, t, end)
+                self._predict(j, t, end, skip=i)
+            else:
+                self._collide_wall(i, kind, j, t)
+                self._predict(i, t, end)
+
+        self._write_back(balls, end)
+        return self.collisions
+
+    # ------------------------------------------------------------------
+    # Setup / teardown
+    # ------------------------------------------------------------------
+
+    def _setup(self, balls: list[Ball], walls: list[Wall], end: float) -> None:
+        self._px = [b.position.x for b in balls]
+        self._py = [b.position.y for b in balls]
+        self._vx = [b.velocity.x for b in balls]
+        self._vy = [b.velocity.y for b in balls]
+        self._t = [0.0] * len(balls)
+        self._count = [0] * len(balls)
+        self._radius = [b.radius for b in balls]
+        self._mass = [b.mass for b in balls]
+        self._factor = [b.collisionFactor for b in balls]
+
+        self._edges, self._vertices = wall_features(walls)
+
+        # Uniform grid, cells at least one diameter wide
+        self._cell = 2 * max(self._radius) if balls else 1.0
+        if self._cell <= 0:
+            self._cell = 1.0
+        self._cx = [math.floor(x / self._cell) for x in self._px]
+        self._cy = [math.floor(y / self._cell) for y in self._py]
+        self._grid: dict[tuple[int, int], set[int]] = {}
+        for i in range(len(balls)):
+            self._grid.setdefault((self._cx[i], self._cy[i]), set()).add(i)
+
+        self._queue: list[tuple] = []
+        self._seq = 0
+        for i in range(len(balls)):
+            self._predict(i, 0.0, end, pairs_above=i)
+
+    def _write_back(self, balls: list[Ball], end: float) -> None:
+        for i, ball in enumerate(balls):
+            dt = end - self._t[i]
+            ball.position = Vector2(self._px[i] + self._vx[i] * dt,
+                                    self._py[i] + self._vy[i] * dt)
+            ball.velocity = Vector2(self._vx[i], self._vy[i])
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _push(self, t: float, kind: int, i: int, j: int) -> None:
+        self._seq += 1
+        cj = self._count[j] if kind == BALL else 0
+        heapq.heappush(self._queue, (t, self._seq, kind, i, j, self._count[i], cj))
+
+    def _sync(self, i: int, now: float) -> None:
+        """Bring ball ``i``'s stored position up to time ``now``."""
+        dt = now - self._t[i]
+        if dt:
+            self._px[i] += self._vx[i] * dt
+            self._py[i] += self._vy[i] * dt
+            self._t[i] = now
+
+    def _predict(
+        self,
+        i: int,
+        now: float,
+        end: float,
+        skip: int = -1,
+        pairs_above: int = -1,
+    ) -> None:
+        """Schedule every future event of ball ``i`` up to ``end``.
+
+        ``pairs_above`` restricts ball--ball predictions to partners with a
+        larger index, so the initial fill schedules each pair only once.
+        """
+        self._sync(i, now)
+        cx, cy = self._cx[i], self._cy[i]
+        cells = [(gx, gy) for gx in (cx - 1, cx, cx + 1) for gy in (cy - 1, cy, cy + 1)]
+        self._predict_balls(i, now, end, cells, skip, pairs_above)
+        self._predict_walls(i, now, end)
+        self._predict_crossing(i, now)
+
+    def _predict_balls(
+        self,
+        i: int,
+        now: float,
+        end: float,
+        cells: list[tuple[int, int]],
+        skip: int = -1,
+        pairs_above: int = -1,
+    ) -> None:
+        px, py, vx, vy = self._px[i], self._py[i], self._vx[i], self._vy[i]
+        r = self._radius[i]
+        grid = self._grid
+        for key in cells:
+            cell = grid.get(key)
+            if not cell:
+                continue
+            for j in cell:
+                if j == i or j == skip or j <= pairs_above:
+                    continue
+                dtj = now - self._t[j]
+                dt = ball_contact_time(
+                    self._px[j] + self._vx[j] * dtj - px,
+                    self._py[j] + self._vy[j] * dtj - py,
+                    self._vx[j] - vx,
+                    self._vy[j] - vy,
+                    r + self._radius[j],
+                )
+                if now + dt <= end:
+                    self._push(now + dt, BALL, i, j)
+
+    def _predict_walls(self, i: int, now: float, end: float) -> None:
+        px, py, vx, vy = self._px[i], self._py[i], self._vx[i], self._vy[i]
+        r = self._radius[i]
+
+        # Box swept by the ball until the end of the step; finite edges and
+        # vertices outside it cannot be reached.
+        h = end - now
+        qx, qy = px + vx * h, py + vy * h
+        x0, x1 = (px, qx) if px < qx else (qx, px)
+        y0, y1 = (py, qy) if py < qy else (qy, py)
+        x0 -= r
+        y0 -= r
+        x1 += r
+        y1 += r
+
+        for k, (ax, ay, bx, by, infinite, _) in enumerate(self._edges):
+            if not infinite and (
+                (ax < x0 and bx < x0) or (ax > x1 and bx > x1)
+                or (ay < y0 and by < y0) or (ay > y1 and by > y1)
+            ):
+                continue
+            dt = edge_contact_time(px, py, vx, vy, r, ax, ay, bx, by, infinite)
+            if now + dt <= end:
+                self._push(now + dt, EDGE, i, k)
+        for k, (x, y, _) in enumerate(self._vertices):
+            if x < x0 or x > x1 or y < y0 or y > y1:
+                continue
+            dt = ball_contact_time(x - px, y - py, -vx, -vy, r)
+            if now + dt <= end:
+                self._push(now + dt, VERTEX, i, k)
+
+    def _predict_crossing(self, i: int, now: float) -> None:
+        """Schedule ball ``i`` leaving its grid cell (axis 0 = x, 1 = y)."""
+        px, py, vx, vy = self._px[i], self._py[i], self._vx[i], self._vy[i]
+        cx, cy = self._cx[i], self._cy[i]
+        size = self._cell
+        tx = ty = math.inf
+        if vx > 0:
+            tx = ((cx + 1) * size - px) / vx
+        elif vx < 0:
+            tx = (cx * size - px) / vx
+        if vy > 0:
+            ty = ((cy + 1) * size - py) / vy
+        elif vy < 0:
+            ty = (cy * size - py) / vy
+        if tx <= ty and tx < math.inf:
+            self._push(now + max(tx, 0.0), CELL, i, 0)
+        elif ty < tx:
+            self._push(now + max(ty, 0.0), CELL, i, 1)
+
+    # ------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------
+
+    def _cross_cell(self, i: int, axis: int, now: float, end: float) -> None:
+        self._sync(i, now)
+        self._grid[(self._cx[i], self._cy[i])].discard(i)
+        if axis == 0:
+            step = 1 if self._vx[i] > 0 else -1
+            self._cx[i] += step
+            gx = self._cx[i] + step
+            cells = [(gx, self._cy[i] + d) for d in (-1, 0, 1)]
+        else:
+            step = 1 if self._vy[i] > 0 else -1
+            self._cy[i] += step
+            gy = self._cy[i] + step
+            cells = [(self._cx[i] + d, gy) for d in (-1, 0, 1)]
+        self._grid.setdefault((self._cx[i], self._cy[i]), set()).add(i)
+        # The velocity is unchanged, so queued events stay valid; only the
+        # newly adjacent strip of cells and the next crossing are predicted.
+        self._predict_balls(i, now, end, cells)
+        self._predict_crossing(i, now)
+
+    def _collide_balls(self, i: int, j: int, now: float) -> None:
+        self._sync(i, now)
+        self._sync(j, now)
+        dx = self._px[i] - self._px[j]
+        dy = self._py[i] - self._py[j]
+        dist = math.hypot(dx, dy)
+        if dist == 0:
+            return
+        nx, ny = dx / dist, dy / dist
+
+        m1, m2 = self._mass[i], self._mass[j]
+        vn1 = self._vx[i] * nx + self._vy[i] * ny
+        vn2 = self._vx[j] * nx + self._vy[j] * ny
+        factor = self._factor[i] * self._factor[j]
+        new1 = ((m1 - m2) * vn1 + 2 * m2 * vn2) / (m1 + m2) * factor
+        new2 = (2 * m1 * vn1 + (m2 - m1) * vn2) / (m1 + m2) * factor
+
+        self._vx[i] += (new1 - vn1) * nx
+        self._vy[i] += (new1 - vn1) * ny
+        self._vx[j] += (new2 - vn2) * nx
+        self._vy[j] += (new2 - vn2) * ny
+        self._count[i] += 1
+        self._count[j] += 1
+
+    def _collide_wall(self, i: int, kind: int, k: int, now: float) -> None:
+        self._sync(i, now)
+        px, py = self._px[i], self._py[i]
+        if kind == EDGE:
+            ax, ay, bx, by, _, factor = self._edges[k]
+            ex, ey = bx - ax, by - ay
+            length = math.hypot(ex, ey)
+            nx, ny = -ey / length, ex / length
+            if (px - ax) * nx + (py - ay) * ny < 0:
+                nx, ny = -nx, -ny
+        else:
+            x, y, factor = self._vertices[k]
+            dx, dy = px - x, py - y
+            dist = math.hypot(dx, dy)
+            if dist == 0:
+                return
+            nx, ny = dx / dist, dy / dist
+
+        vn = self._vx[i] * nx + self._vy[i] * ny
+        if vn < 0:
+            bounce = -vn * (1 + self._factor[i] * factor)
+            self._vx[i] += bounce * nx
+            self._vy[i] += bounce * ny
+        self._count[i] += 1
@@ -0,0 +1,280 @@
+"""Constraint-graph islands: connected groups of balls.
+
+Balls are the nodes of the graph.  Rods, ropes, springs and soft-body links
+are *persistent* edges; ball--ball contacts found during the current step
+are *transient* edges.  Walls and wall anchors (``WallPosition``) are
+static and never join two islands -- two pendulums hanging from the same
+wall are independent.
+
+``IslandGraph`` keeps the persistent components up to date incrementally:
+
+* a new ball becomes a singleton island, and a new link merges two
+  islands by relabelling the smaller one;
+* removing a link or a ball only marks its island dirty, and dirty islands
+  are re-split by a breadth-first search over their own members.
+
+Each step, ``merge_contacts`` joins persistent islands through the current
+contacts with a small union-find over island labels, so contacts never
+disturb the persistent structure.  The resulting islands are independent
+units of work: they can be solved separately, put to sleep as a whole, or
+handed to different workers.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from ..basic import Ball
+
+if TYPE_CHECKING:
+    from ..basic import SoftBody
+
+
+# ---------------------------------------------------------------------------
+# Union-find
+# ---------------------------------------------------------------------------
+
+class DisjointSet:
+    """Union-find over ``0 .. n-1`` with path halving and union by size."""
+
+    def __init__(self, n: int = 0) -> None:
+        self.parent: list[int] = list(range(n))
+        self.size: list[int] = [1] * n
+
+    def add(self) -> int:
+        """Add a new singleton set; return its element."""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        """Merge the sets of ``i`` and ``j``; return whether they differed."""
+        ri, rj = self.find(i), self.find(j)
+        if ri == rj:
+            return False
+        if self.size[ri] < self.size[rj]:
+            ri, rj = rj, ri
+        self.parent[rj] = ri
+        self.size[ri] += self.size[rj]
+        return True
+
+    def groups(self) -> list[list[int]]:
+        """Elements grouped by set, in order of first appearance."""
+        index: dict[int, int] = {}
+        result: list[list[int]] = []
+        for i in range(len(self.parent)):
+            root = self.find(i)
+            if root not in index:
+                index[root] = len(result)
+                result.append([])
+            result[index[root]].append(i)
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Links
+# ---------------------------------------------------------------------------
+
+def link_pairs(elements: dict[str, list]) -> list[tuple[Ball, Ball]]:
+    """Ball pairs joined by a rod, rope, spring or soft-body link."""
+    pairs: list[tuple[Ball, Ball]] = []
+    for kind in ("rod", "rope", "spring"):
+        for link in elements.get(kind, []):
+            if isinstance(link.start, Ball) and isinstance(link.end, Ball):
+                pairs.append((link.start, link.end))
+    soft_body: SoftBody
+    for soft_body in elements.get("softbody", []):
+        balls = soft_body.balls
+        pairs.extend(
+            (balls[a], balls[b]) for a, b in zip(soft_body.linkStarts, soft_body.linkEnds)
+        )
+    return pairs
+
+
+# ---------------------------------------------------------------------------
+# IslandGraph
+# ---------------------------------------------------------------------------
+
+class IslandGraph:
+    """Incrementally maintained connected components of balls."""
+
+    def __init__(self) -> None:
+        self._balls: dict[int, Ball] = {}
+        self._edges: Counter[tuple[int, int]] = Counter()
+        self._adjacency: dict[int, Counter[int]] = {}
+        self._label: dict[int, int] = {}
+        self._members: dict[int, set[int]] = {}
+        self._next_label: int = 0
+
+        # Islands of the last merge_contacts call, largest first
+        self.islands: list[list[Ball]] = []
+
+        # Statistics
+        self.merges: int = 0  # persistent islands merged by new links
+        self.splits: int = 0  # dirty islands re-split after removals
+        self.contact_merges: int = 0  # islands joined by contacts (last step)
+        self.sleeping_islands: int = 0
+
+    # ------------------------------------------------------------------
+    # Persistent structure
+    # ------------------------------------------------------------------
+
+    def sync(self, balls: list[Ball], links: list[tuple[Ball, Ball]]) -> None:
+        """Apply the difference to the current balls and persistent links."""
+        current = {id(ball): ball for ball in balls}
+        edges: Counter[tuple[int, int]] = Counter()
+        for a, b in links:
+            ka, kb = id(a), id(b)
+            if ka != kb and ka in current and kb in current:
+                edges[(ka, kb) if ka < kb else (kb, ka)] += 1
+
+        dirty: set[int] = set()
+        for key in self._balls.keys() - current.keys():
+            dirty.add(self._remove_ball(key))
+        for edge, count in list(self._edges.items()):
+            removed = count - edges.get(edge, 0)
+            if removed > 0 and edge[0] in self._balls:
+                dirty.add(self._label[edge[0]])
+                self._unlink(edge, removed)
+        for label in dirty:
+            if label in self._members:
+                self._split(label)
+
+        for key in current.keys() - self._balls.keys():
+            self._add_ball(key, current[key])
+        for edge, count in edges.items():
+            added = count - self._edges.get(edge, 0)
+            if added > 0:
+                self._link(edge, added)
+
+    def island_of(self, ball: Ball) -> int | None:
+        """Persistent island label of ``ball`` (``None`` if unknown)."""
+        return self._label.get(id(ball))
+
+    @property
+    def persistent_count(self) -> int:
+        """Number of persistent islands (links only, no contacts)."""
+        return len(self._members)
+
+    def _add_ball(self, key: int, ball: Ball) -> None:
+        self._balls[key] = ball
+        self._adjacency[key] = Counter()
+        label = self._next_label
+        self._next_label += 1
+        self._label[key] = label
+        self._members[label] = {key}
+
+    def _remove_ball(self, key: int) -> int:
+        """Forget a ball and its edges; return its island label."""
+        label = self._label.pop(key)
+        self._members[label].discard(key)
+        if not self._members[label]:
+            del self._members[label]
+        for neighbour in self._adjacency.pop(key):
+            if neighbour in self._adjacency:
+                del self._adjacency[neighbour][key]
+            self._edges.pop((key, neighbour) if key < neighbour else (neighbour, key), None)
+        del self._balls[key]
+        return label
+
+    def _unlink(self, edge: tuple[int, int], count: int) -> None:
+        a, b = edge
+        self._edges[edge] -= count
+        if self._edges[edge] <= 0:
+            del self._edges[edge]
+            del self._adjacency[a][b]
+            del self._adjacency[b][a]
+        else:
+            self._adjacency[a][b] -= count
+            self._adjacency[b][a] -= count
+
+    def _link(self, edge: tuple[int, int], count: int) -> None:
+        a, b = edge
+        self._edges[edge] += count
+        self._adjacency[a][b] += count
+        self._adjacency[b][a] += count
+        la, lb = self._label[a], self._label[b]
+        if la == lb:
+            return
+        # Relabel the smaller island
+        if len(self._members[la]) < len(self._members[lb]):
+            la, lb = lb, la
+        for key in self._members[lb]:
+            self._label[key] = la
+        self._members[la] |= self._members.pop(lb)
+        self.merges += 1
+
+    def _split(self, label: int) -> None:
+        """Re-split a dirty island into its connected components."""
+        remaining = self._members.pop(label)
+        self.splits += 1
+        first = True
+        while remaining:
+            seed = remaining.pop()
+            component = {seed}
+            frontier = [seed]
+            while frontier:
+                for neighbour in self._adjacency[frontier.pop()]:
+                    if neighbour not in component:
+                        component.add(neighbour)
+                        frontier.append(neighbour)
+            remaining -= component
+
+            # The first component keeps the label
+            if first:
+                new_label = label
+                first = False
+            else:
+                new_label = self._next_label
+                self._next_label += 1
+            self._members[new_label] = component
+            for key in component:
+                self._label[key] = new_label
+
+    # ------------------------------------------------------------------
+    # Per-step islands
+    # ------------------------------------------------------------------
+
+    def merge_contacts(self, contacts: list[tuple[Ball, Ball]]) -> list[list[Ball]]:
+        """Join persistent islands through this step's contacts.
+
+        Returns (and stores in ``self.islands``) the resulting islands,
+        largest first.
+        """
+        labels = list(self._members)
+        index = {label: i for i, label in enumerate(labels)}
+        sets = DisjointSet(len(labels))
+        self.contact_merges = 0
+        for a, b in contacts:
+            la, lb = self._label.get(id(a)), self._label.get(id(b))
+            if la is None or lb is None:
+                continue
+            self.contact_merges += sets.union(index[la], index[lb])
+
+        balls = self._balls
+        self.islands = [
+            [balls[key] for i in group for key in self._members[labels[i]]]
+            for group in sets.groups()
+        ]
+        self.islands.sort(key=len, reverse=True)
+        return self.islands
+
+    def stats(self) -> dict[str, int]:
+        """Island counts for profiling."""
+        return {
+            "islands": len(self.islands),
+            "persistent_islands": self.persistent_count,
+            "largest_island": len(self.islands[0]) if self.islands else 0,
+            "sleeping_islands": self.sleeping_islands,
+            "contact_merges": self.contact_merges,
+            "merges": self.merges,
+            "splits": self.splits,
+        }
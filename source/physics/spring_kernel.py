@@ -0,0 +1,223 @@
+"""Batched Hooke + damping kernel for spring networks (NumPy).
+
+``Spring.calculateForce`` evaluates one spring per Python call and applies
+its force with two ``Ball.force`` calls, so a mesh of a few hundred springs
+already dominates a physics step.  Here every spring is a row of a few
+parallel arrays -- start and end body indices, rest length, stiffness and
+damping -- and all forces are computed in one vectorized pass::
+
+    n   = (p_end − p_start) / |p_end − p_start|
+    F   = (k · (|p_end − p_start| − L) + c · (v_end − v_start)·n) · n
+
+with ``F`` acting on the start body and ``−F`` on the end body, exactly the
+force law of ``Spring.calculateForce``.  Per-body sums are gathered with
+``np.bincount``.
+
+``SpringNetwork`` gathers the game's ``Spring`` elements and every link of
+every ``SoftBody`` into one such set of arrays, rebuilt only when the
+springs or soft-body topology change, and applies one net natural force
+per ball.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..basic import Ball, Vector2
+
+if TYPE_CHECKING:
+    from ..basic import SoftBody, Spring, WallPosition
+
+MIN_LENGTH: float = 1e-6
+
+
+def spring_forces(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    rest: np.ndarray,
+    stiffness: np.ndarray | float,
+    damping: np.ndarray | float,
+    out: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Net spring force on every body and each spring's deformation.
+
+    ``pos`` and ``vel`` are ``(N, 2)``; ``start`` and ``end`` are ``(M,)``
+    body indices; ``rest``, ``stiffness`` and ``damping`` are ``(M,)`` or
+    scalars.  Returns the ``(N, 2)`` forces (written to ``out`` if given)
+    and the ``(M,)`` deformations ``|p_end − p_start| − L``.  Springs
+    shorter than ``MIN_LENGTH`` have no direction and exert no force.
+    """
+    n = len(pos)
+    d = pos[end] - pos[start]
+    length = np.sqrt(np.einsum("ij,ij->i", d, d))
+    valid = length >= MIN_LENGTH
+    direction = d / np.where(valid, length, 1.0)[:, None]
+
+    deformation = np.where(valid, length - rest, 0.0)
+    v_rel = np.einsum("ij,ij->i", vel[end] - vel[start], direction)
+    magnitude = np.where(valid, stiffness * deformation + damping * v_rel, 0.0)
+    f = direction * magnitude[:, None]
+
+    if out is None:
+        out = np.empty((n, 2))
+    for axis in range(2):
+        out[:, axis] = (
+            np.bincount(start, f[:, axis], minlength=n)
+            - np.bincount(end, f[:, axis], minlength=n)
+        )
+    return out, deformation
+
+
+class SpringNetwork:
+    """All springs and soft-body links of a scene as one batched kernel."""
+
+    def __init__(self) -> None:
+        self._gathered: list[Spring] = []
+        self._springs: list[Spring] = []
+        self._soft_bodies: list[tuple[SoftBody, int]] = []
+
+        # Bodies: the distinct spring end points (balls or wall anchors)
+        self.bodies: list[Ball | WallPosition] = []
+        self._balls: list[tuple[int, Ball]] = []
+        self._ball_rows: np.ndarray = np.empty(0, dtype=np.intp)
+
+        # Springs, as parallel arrays; the first len(self._springs) rows
+        # belong to Spring elements, the rest to soft-body links
+        self._start: np.ndarray = np.empty(0, dtype=np.intp)
+        self._end: np.ndarray = np.empty(0, dtype=np.intp)
+        self._rest: np.ndarray = np.empty(0)
+        self._stiffness: np.ndarray = np.empty(0)
+        self._damping: np.ndarray = np.empty(0)
+
+        # Statistics: rebuilds of the spring arrays
+        self.rebuilds: int = 0
+
+    @property
+    def size(self) -> int:
+        """Number of springs in the network."""
+        return len(self._start)
+
+    # ------------------------------------------------------------------
+    # Gathering
+    # ------------------------------------------------------------------
+
+    def sync(self, springs: list[Spring], soft_bodies: list[SoftBody]) -> None:
+        """Rebuild the arrays if the springs or any soft-body topology changed."""
+        if (
+            len(springs) != len(self._gathered)
+            or len(soft_bodies) != len(self._soft_bodies)
+            or any(a is not b for a, b in zip(springs, self._gathered))
+            or any(
+                body is not known or body.revision != revision
+                for body, (known, revision) in zip(soft_bodies, self._soft_bodies)
+            )
+        ):
+            self.build(springs, soft_bodies)
+
+    def build(self, springs: list[Spring], soft_bodies: list[SoftBody]) -> None:
+        """Gather all legal springs and soft-body links into arrays."""
+        self.rebuilds += 1
+        self._gathered = list(springs)
+        self._springs = [spring for spring in springs if spring.isLegal]
+        self._soft_bodies = [(body, body.revision) for body in soft_bodies]
+        self.bodies = []
+
+        index: dict[int, int] = {}
+
+        def body_index(end: Ball | WallPosition) -> int:
+            key = id(end)
+            if key not in index:
+                index[key] = len(self.bodies)
+                self.bodies.append(end)
+            return index[key]
+
+        start: list[int] = []
+        end: list[int] = []
+        rest: list[float] = []
+        stiffness: list[float] = []
+        damping: list[float] = []
+        for spring in self._springs:
+            start.append(body_index(spring.start))
+            end.append(body_index(spring.end))
+            rest.append(spring.restLength)
+            stiffness.append(spring.stiffness)
+            damping.append(spring.dampingFactor)
+        for soft_body in soft_bodies:
+            local = [body_index(ball) for ball in soft_body.balls]
+            start.extend(local[a] for a in soft_body.linkStarts)
+            end.extend(local[b] for b in soft_body.linkEnds)
+            rest.extend(soft_body.restLengths)
+            count = soft_body.linkCount()
+            stiffness.extend([soft_body.stiffness] * count)
+            damping.extend([soft_body.dampingFactor] * count)
+
+        self._start = np.array(start, dtype=np.intp)
+        self._end = np.array(end, dtype=np.intp)
+        self._rest = np.array(rest, dtype=np.float64)
+        self._stiffness = np.array(stiffness, dtype=np.float64)
+        self._damping = np.array(damping, dtype=np.float64)
+        self._balls = [(i, b) for i, b in enumerate(self.bodies) if isinstance(b, Ball)]
+        self._ball_rows = np.array([i for i, _ in self._balls], dtype=np.intp)
+
+    # ------------------------------------------------------------------
+    # Applying
+    # ------------------------------------------------------------------
+
+    def apply(self) -> int:
+        """Apply one net spring force to every ball; return springs evaluated."""
+        m = self.size
+        if m == 0:
+            return 0
+        self._load_parameters()
+
+        positions = [body.getPosition() for body in self.bodies]
+        pos = np.array([(p.x, p.y) for p in positions], dtype=np.float64)
+        vel = np.zeros_like(pos)
+        vel[self._ball_rows] = [(ball.velocity.x, ball.velocity.y) for _, ball in self._balls]
+
+        forces, deformation = spring_forces(
+            pos, vel, self._start, self._end, self._rest, self._stiffness, self._damping
+        )
+
+        rows = forces.tolist()
+        for i, ball in self._balls:
+            fx, fy = rows[i]
+            if fx or fy:
+                ball.force(Vector2(fx, fy), isNatural=True)
+
+        self._report(deformation)
+        return m
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _load_parameters(self) -> None:
+        """Pick up edited rest lengths, stiffnesses and damping factors."""
+        k = len(self._springs)
+        for i, spring in enumerate(self._springs):
+            self._rest[i] = spring.restLength
+            self._stiffness[i] = spring.stiffness
+            self._damping[i] = spring.dampingFactor
+        for soft_body, _ in self._soft_bodies:
+            count = soft_body.linkCount()
+            self._stiffness[k:k + count] = soft_body.stiffness
+            self._damping[k:k + count] = soft_body.dampingFactor
+            k += count
+
+    def _report(self, deformation: np.ndarray) -> None:
+        """Write deformation, force and energy back to the Spring elements."""
+        k = len(self._springs)
+        if k == 0:
+            return
+        x = deformation[:k]
+        force = (self._stiffness[:k] * x).tolist()
+        energy = (0.5 * self._stiffness[:k] * x * x).tolist()
+        for spring, dx, f, e in zip(self._springs, x.tolist(), force, energy):
+            spring.deformation = dx
+            spring.currentForce = f
+            spring.potentialEnergy = e
@@ -0,0 +1,196 @@
+"""Bounding-volume hierarchy over walls.
+
+Every ball--wall pass (containment, vertex and edge contacts) used to test
+each ball against every wall, i.e. walls × balls × lines per frame.
+``WallBVH`` stores the axis-aligned box of every wall polygon in a binary
+tree.  A ball's query box then only descends into nearby subtrees, and the
+walls whose boxes it reaches are returned.  The polygon box covers the
+wall's edges and vertices as well as its interior, so a ball deep inside a
+large wall (far from every edge) still finds it for the containment
+push-out.
+
+Walls that contain an infinite line (``CollisionLine.isLine``) cannot be
+bounded; they are kept aside and returned by every query.
+
+Walls rarely move.  When one is dragged, ``sync`` notices that its cached
+geometry (``Wall.geometryKey``) changed and refits only that wall's leaf
+and its ancestors, instead of rebuilding the whole tree.  Static walls
+(``Wall.isStatic``) are frozen and not checked at all.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..basic import Wall
+
+
+class WallBVH:
+    """AABB tree over the polygons of a list of walls."""
+
+    #: Maximum number of walls stored in one leaf.
+    leaf_size: int = 4
+
+    def __init__(self) -> None:
+        self.walls: list[Wall] = []
+        self._keys: list[tuple[float, ...]] = []
+        self._lines: list[list] = []
+
+        # Per wall: polygon box and leaf (bounded walls only)
+        self._wall_box: list[tuple[float, float, float, float] | None] = []
+        self._wall_leaf: list[int] = []
+        self._unbounded: list[int] = []
+
+        # Nodes, stored as parallel lists; a leaf has ``left == -1``
+        self._box: list[list[float]] = []
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._parent: list[int] = []
+        self._items: list[list[int]] = []
+
+        # Statistics: full rebuilds and per-wall refits performed
+        self.rebuilds: int = 0
+        self.refits: int = 0
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def sync(self, walls: list[Wall]) -> None:
+        """Bring the tree up to date with ``walls``.
+
+        A changed wall list triggers a rebuild; a kinematic wall whose
+        geometry changed in place is refitted.
+        """
+        if len(walls) != len(self.walls) or any(
+            a is not b for a, b in zip(walls, self.walls)
+        ):
+            self.build(walls)
+            return
+
+        for i, wall in enumerate(walls):
+            if wall.isStatic or (
+                wall.geometryKey is self._keys[i] and wall.lines is self._lines[i]
+            ):
+                continue
+            if self._is_bounded(wall) != (self._wall_box[i] is not None):
+                # A line switched between finite and infinite: the leaf
+                # layout changes, so start over.
+                self.build(walls)
+                return
+            self.refit(i)
+
+    def build(self, walls: list[Wall]) -> None:
+        """Rebuild the whole tree for ``walls``."""
+        self.rebuilds += 1
+        self.walls = list(walls)
+        self._keys = [wall.geometryKey for wall in walls]
+        self._lines = [wall.lines for wall in walls]
+
+        self._wall_box = [
+            self._polygon_box(wall) if self._is_bounded(wall) else None for wall in walls
+        ]
+        self._unbounded = [i for i, box in enumerate(self._wall_box) if box is None]
+        self._wall_leaf = [-1] * len(walls)
+
+        self._box, self._left, self._right, self._parent, self._items = [], [], [], [], []
+        bounded = [i for i, box in enumerate(self._wall_box) if box is not None]
+        if bounded:
+            self._build_node(bounded, -1)
+
+    def refit(self, wall_index: int) -> None:
+        """Update the box of one wall and of its ancestors."""
+        self.refits += 1
+        wall = self.walls[wall_index]
+        self._keys[wall_index] = wall.geometryKey
+        self._lines[wall_index] = wall.lines
+        if self._wall_box[wall_index] is None:
+            return
+
+        self._wall_box[wall_index] = self._polygon_box(wall)
+        node = self._wall_leaf[wall_index]
+        while node != -1:
+            self._box[node] = self._union_box(node)
+            node = self._parent[node]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> list[int]:
+        """Indices (ascending) of walls whose polygon box touches the box."""
+        found: set[int] = set(self._unbounded)
+        if self._box:
+            box, left, right = self._box, self._left, self._right
+            wall_box = self._wall_box
+            stack = [0]
+            while stack:
+                node = stack.pop()
+                bx0, by0, bx1, by1 = box[node]
+                if bx0 > x1 or bx1 < x0 or by0 > y1 or by1 < y0:
+                    continue
+                if left[node] == -1:
+                    for i in self._items[node]:
+                        wx0, wy0, wx1, wy1 = wall_box[i]
+                        if not (wx0 > x1 or wx1 < x0 or wy0 > y1 or wy1 < y0):
+                            found.add(i)
+                else:
+                    stack.append(left[node])
+                    stack.append(right[node])
+        return sorted(found)
+
+    def query_walls(self, x0: float, y0: float, x1: float, y1: float) -> list[Wall]:
+        """Walls whose polygon box touches the box, in list order."""
+        walls = self.walls
+        return [walls[i] for i in self.query(x0, y0, x1, y1)]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_bounded(wall: Wall) -> bool:
+        return not any(line.isLine for line in wall.lines)
+
+    @staticmethod
+    def _polygon_box(wall: Wall) -> tuple[float, float, float, float]:
+        xs = [c for line in wall.lines for c in (line.start.x, line.end.x)]
+        ys = [c for line in wall.lines for c in (line.start.y, line.end.y)]
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def _union_box(self, node: int) -> list[float]:
+        if self._left[node] == -1:
+            boxes = [self._wall_box[i] for i in self._items[node]]
+        else:
+            boxes = [self._box[self._left[node]], self._box[self._right[node]]]
+        return [
+            min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes),
+        ]
+
+    def _build_node(self, items: list[int], parent: int) -> int:
+        node = len(self._box)
+        self._box.append([0.0, 0.0, 0.0, 0.0])
+        self._left.append(-1)
+        self._right.append(-1)
+        self._parent.append(parent)
+        self._items.append([])
+
+        if len(items) <= self.leaf_size:
+            self._items[node] = items
+            for i in items:
+                self._wall_leaf[i] = node
+        else:
+            # Median split along the longer axis of the box centres
+            boxes = self._wall_box
+            cx = [(boxes[i][0] + boxes[i][2]) for i in items]
+            cy = [(boxes[i][1] + boxes[i][3]) for i in items]
+            axis = 0 if max(cx) - min(cx) >= max(cy) - min(cy) else 1
+            items = sorted(items, key=lambda i: boxes[i][axis] + boxes[i][axis + 2])
+            half = len(items) // 2
+            self._left[node] = self._build_node(items[:half], node)
+            self._right[node] = self._build_node(items[half:], node)
+
+        self._box[node] = self._union_box(node)
+        return node
@@ -0,0 +1,361 @@
+"""Structure-of-arrays (SoA) world state for balls, backed by NumPy.
+
+``WorldState`` keeps every bound ball's kinematic state and per-ball
+factors in contiguous ``float64`` arrays, one row per ball.  Bound balls
+become *thin views* over their row: ``ball.position`` returns a
+``RowVector2`` that reads and writes the array directly, and assigning
+``ball.position = Vector2(...)`` copies into the row.  Existing code such
+as ``ball.position.x += 1`` or ``ball.velocity = ZERO`` keeps working.
+
+With the state in arrays, integration, gravitation, electrostatics and
+environment application run as whole-array operations (``step``), while
+per-ball code paths (collisions, ropes, springs, drawing) still see
+ordinary ``Ball`` objects.
+
+This module requires NumPy; ``PhysicsEngine`` imports it lazily so the
+object path keeps working without it.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import numpy as np
+
+from ..basic import Ball, Vector2, electrostaticFactor, gravityFactor
+from .field_kernel import fused_field_forces
+
+# Same constants as Ball.update / Ball.accelerate
+GRAVITY_ACCELERATION: float = 98.6
+SUBSTEPS: int = 10
+
+
+# ---------------------------------------------------------------------------
+# Row views
+# ---------------------------------------------------------------------------
+
+class RowVector2(Vector2):
+    """A ``Vector2`` whose ``x``/``y`` live in a ``WorldState`` array row.
+
+    The view follows its ball rather than a fixed row index, so it stays
+    valid when the store grows or compacts.  Arithmetic still returns
+    plain ``Vector2`` objects; use ``copy()`` for a detached snapshot.
+    """
+
+    def __init__(self, ball: ArrayBall, field: str) -> None:  # noqa: D107
+        object.__setattr__(self, "_ball", ball)
+        object.__setattr__(self, "_field", field)
+
+    def __copy__(self) -> Vector2:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Vector2:
+        return self.copy()
+
+    def _row(self) -> np.ndarray:
+        ball = self._ball
+        return getattr(ball._state, self._field)[ball._row]
+
+    @property
+    def x(self) -> float:  # type: ignore[override]
+        return float(self._row()[0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._row()[0] = value
+
+    @property
+    def y(self) -> float:  # type: ignore[override]
+        return float(self._row()[1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._row()[1] = value
+
+
+def _vector_property(field: str, doc: str) -> property:
+    def fget(self: ArrayBall) -> RowVector2:
+        return RowVector2(self, field)
+
+    def fset(self: ArrayBall, value: Vector2) -> None:
+        row = getattr(self._state, field)[self._row]
+        row[0] = value.x
+        row[1] = value.y
+
+    return property(fget, fset, doc=doc)
+
+
+def _scalar_property(field: str, cast: type, doc: str) -> property:
+    def fget(self: ArrayBall) -> Any:
+        return cast(getattr(self._state, field)[self._row])
+
+    def fset(self: ArrayBall, value: Any) -> None:
+        getattr(self._state, field)[self._row] = value
+
+    return property(fget, fset, doc=doc)
+
+
+# Ball attributes mirrored into the store
+_VECTOR_FIELDS: tuple[str, ...] = ("position", "velocity", "acceleration")
+_SCALAR_FIELDS: tuple[str, ...] = (
+    "mass",
+    "radius",
+    "electricCharge",
+    "gravity",
+    "collisionFactor",
+    "airResistance",
+    "gravitation",
+)
+
+# Store arrays: name -> (columns, dtype); 0 columns means a 1-D array
+_ARRAY_SPECS: dict[str, tuple[int, type]] = {
+    "pos": (2, np.float64),
+    "vel": (2, np.float64),
+    "acc": (2, np.float64),
+    "field_force": (2, np.float64),
+    "mass": (0, np.float64),
+    "radius": (0, np.float64),
+    "charge": (0, np.float64),
+    "gravity": (0, np.float64),
+    "collision_factor": (0, np.float64),
+    "air_resistance": (0, np.float64),
+    "gravitation": (0, np.bool_),
+}
+
+
+class ArrayBall(Ball):
+    """A ``Ball`` whose physical state lives in a ``WorldState`` row.
+
+    Instances are never constructed directly: ``WorldState.add`` re-classes
+    an existing ``Ball`` and ``WorldState.remove`` turns it back.
+    """
+
+    _state: WorldState
+    _row: int
+
+    position = _vector_property("pos", "Position (view over ``pos`` row).")
+    velocity = _vector_property("vel", "Velocity (view over ``vel`` row).")
+    acceleration = _vector_property("acc", "Acceleration (view over ``acc`` row).")
+
+    mass = _scalar_property("mass", float, "Mass.")
+    radius = _scalar_property("radius", float, "Radius.")
+    electricCharge = _scalar_property("charge", float, "Electric charge.")
+    gravity = _scalar_property("gravity", float, "Gravity factor.")
+    collisionFactor = _scalar_property("collision_factor", float, "Collision factor.")
+    airResistance = _scalar_property("air_resistance", float, "Air resistance.")
+    gravitation = _scalar_property("gravitation", bool, "Takes part in gravitation.")
+
+    def accelerate(self) -> Vector2:
+        """Accumulated forces plus the store's field force (gravity/Coulomb)."""
+        acceleration = Ball.accelerate(self)
+        fx, fy = self._state.field_force[self._row]
+        if fx or fy:
+            mass = self.mass
+            self.acceleration = acceleration + Vector2(fx / mass, fy / mass)
+        return self.acceleration
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Ball:
+        """Copies are detached, plain ``Ball`` objects."""
+        clone = Ball.__new__(Ball)
+        memo[id(self)] = clone
+        for key, value in self.__dict__.items():
+            if key not in ("_state", "_row"):
+                clone.__dict__[key] = copy.deepcopy(value, memo)
+        for name in _VECTOR_FIELDS:
+            clone.__dict__[name] = getattr(self, name).copy()
+        for name in _SCALAR_FIELDS:
+            clone.__dict__[name] = getattr(self, name)
+        return clone
+
+
+# ---------------------------------------------------------------------------
+# World state
+# ---------------------------------------------------------------------------
+
+class WorldState:
+    """Contiguous per-ball arrays plus whole-array physics kernels.
+
+    Arrays are over-allocated and grown by doubling; only the first
+    ``len(self)`` rows are live.  ``balls[i]`` is the ball viewing row
+    ``i``.  Removal swaps the last row into the hole.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.balls: list[ArrayBall] = []
+        self._allocate(max(1, capacity))
+
+    # -- storage ---------------------------------------------------------
+
+    def _allocate(self, capacity: int) -> None:
+        n = len(self.balls)
+        for name, (columns, dtype) in _ARRAY_SPECS.items():
+            shape = (capacity, columns) if columns else (capacity,)
+            array = np.zeros(shape, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                array[:n] = old[:n]
+            setattr(self, name, array)
+        self.capacity: int = capacity
+
+    def __len__(self) -> int:
+        return len(self.balls)
+
+    def __contains__(self, ball: object) -> bool:
+        return isinstance(ball, ArrayBall) and ball._state is self
+
+    def view(self, name: str) -> np.ndarray:
+        """Live slice of array ``name`` (first ``len(self)`` rows)."""
+        return getattr(self, name)[: len(self.balls)]
+
+    # -- binding ---------------------------------------------------------
+
+    def add(self, ball: Ball) -> ArrayBall:
+        """Move ``ball``'s state into a new row and make it a view."""
+        if ball in self:
+            return ball  # type: ignore[return-value]
+        if isinstance(ball, ArrayBall):
+            ball._state.remove(ball)
+
+        row = len(self.balls)
+        if row >= self.capacity:
+            self._allocate(self.capacity * 2)
+
+        values = {name: getattr(ball, name) for name in _VECTOR_FIELDS + _SCALAR_FIELDS}
+        for name in values:
+            ball.__dict__.pop(name, None)
+
+        ball.__class__ = ArrayBall
+        ball._state = self
+        ball._row = row
+        self.balls.append(ball)  # type: ignore[arg-type]
+        self.field_force[row] = 0.0
+        for name, value in values.items():
+            setattr(ball, name, value)
+        return ball  # type: ignore[return-value]
+
+    def remove(self, ball: ArrayBall) -> Ball:
+        """Detach ``ball`` (it becomes a plain ``Ball`` again)."""
+        if ball not in self:
+            return ball
+        values = {name: getattr(ball, name) for name in _VECTOR_FIELDS + _SCALAR_FIELDS}
+        for name in _VECTOR_FIELDS:
+            values[name] = values[name].copy()
+
+        row = ball._row
+        last = len(self.balls) - 1
+        if row != last:
+            moved = self.balls[last]
+            for name in _ARRAY_SPECS:
+                array = getattr(self, name)
+                array[row] = array[last]
+            moved._row = row
+            self.balls[row] = moved
+        self.balls.pop()
+
+        ball.__class__ = Ball
+        del ball._state
+        del ball._row
+        ball.__dict__.update(values)
+        return ball
+
+    def sync(self, balls: list[Ball]) -> None:
+        """Bind every ball in ``balls`` and release bound balls not in it."""
+        wanted = {id(b) for b in balls}
+        for ball in [b for b in self.balls if id(b) not in wanted]:
+            self.remove(ball)
+        for ball in balls:
+            if ball not in self:
+                self.add(ball)
+
+    def clear(self) -> None:
+        """Detach every ball."""
+        for ball in list(self.balls):
+            self.remove(ball)
+
+    # -- whole-array physics ----------------------------------------------
+
+    def apply_environment(self, environment_options: list[dict[str, Any]]) -> None:
+        """Vectorised ``PhysicsEngine.apply_environment`` for bound balls."""
+        n = len(self.balls)
+        for opt in environment_options:
+            t = opt["type"]
+            if t == "gravity":
+                self.gravity[:n] = float(opt["value"])
+            elif t == "airResistance":
+                self.air_resistance[:n] = float(opt["value"])
+            elif t == "collisionFactor":
+                self.collision_factor[:n] = float(opt["value"])
+
+    def reset_field_forces(self) -> None:
+        """Zero the accumulated gravity/Coulomb forces."""
+        self.field_force[: len(self.balls)] = 0.0
+
+    def apply_field_forces(
+        self,
+        gravity_factor: float = gravityFactor,
+        electrostatic_factor: float = electrostaticFactor,
+    ) -> None:
+        """Add all-pairs gravity and Coulomb force in one fused, tiled pass."""
+        n = len(self.balls)
+        self.field_force[:n] += fused_field_forces(
+            self.pos[:n], self.mass[:n], self.charge[:n], self.gravitation[:n],
+            gravity_factor, electrostatic_factor,
+        )
+
+    def apply_gravitation(self, gravity_factor: float = gravityFactor) -> None:
+        """Add all-pairs gravity between balls with ``gravitation`` set."""
+        self.apply_field_forces(gravity_factor, 0.0)
+
+    def apply_electric(self, electrostatic_factor: float = electrostaticFactor) -> None:
+        """Add all-pairs Coulomb force between charged balls."""
+        self.apply_field_forces(0.0, electrostatic_factor)
+
+    def accelerate(self) -> None:
+        """Vectorised ``Ball.accelerate`` for every bound ball."""
+        n = len(self.balls)
+        force = self.field_force[:n].copy()
+        for i, ball in enumerate(self.balls):
+            f = ball.naturalForce + ball.artificialForce
+            force[i, 0] += f.x
+            force[i, 1] += f.y
+        acc = self.acc[:n]
+        acc[:] = force / self.mass[:n, None]
+        acc[:, 1] += GRAVITY_ACCELERATION * self.gravity[:n]
+
+    def integrate(self, delta_time: float, substeps: int = SUBSTEPS) -> None:
+        """Vectorised kinematics of ``Ball.update`` (no bookkeeping)."""
+        n = len(self.balls)
+        pos, vel, acc = self.pos[:n], self.vel[:n], self.acc[:n]
+        # Closed form of ``substeps`` constant-acceleration substeps.
+        factor = (substeps + 1) / (2 * substeps) + 20**0.5 / substeps
+        pos += vel * delta_time + acc * (factor * delta_time * delta_time)
+        vel += acc * delta_time
+        vel *= (self.air_resistance[:n] ** (delta_time / substeps))[:, None]
+
+    def finish_step(self) -> None:
+        """Per-ball bookkeeping that ``Ball.update`` does after integrating."""
+        for ball in self.balls:
+            ball.displayedVelocityFactor *= 0.95
+            ball.displayedAccelerationFactor *= 0.95
+            ball.updateAttrsList()
+            if ball.leaveTrail:
+                ball.trailPoints.append(ball.position.copy())
+                if len(ball.trailPoints) > 2000:
+                    del ball.trailPoints[0]
+
+    def step(
+        self,
+        delta_time: float,
+        environment_options: list[dict[str, Any]] | None = None,
+        gravity_factor: float = gravityFactor,
+        electrostatic_factor: float = electrostaticFactor,
+    ) -> None:
+        """Environment, field forces, acceleration and integration in one go."""
+        if environment_options is not None:
+            self.apply_environment(environment_options)
+        self.reset_field_forces()
+        self.apply_field_forces(gravity_factor, electrostatic_factor)
+        self.accelerate()
+        self.integrate(delta_time)
+        self.finish_step()
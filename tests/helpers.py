@@ -0,0 +1,61 @@
+"""Element and engine factories shared by the unit tests."""
+
+from __future__ import annotations
+
+import pygame
+
+from source.basic import Ball, Element, Floor, Vector2, Wall, WallPosition
+from source.physics.engine import PhysicsEngine
+
+#: Element types every test engine gets a bucket for.
+ELEMENT_TYPES: tuple[str, ...] = ("ball", "wall", "rope", "rod", "spring")
+
+
+def make_ball(
+    x: float = 0,
+    y: float = 0,
+    vx: float = 0,
+    vy: float = 0,
+    *,
+    radius: float = 5,
+    mass: float = 1,
+    gravity: float = 0,
+    gravitation: bool = False,
+    charge: float = 0,
+    forces: list[Vector2] | None = None,
+) -> Ball:
+    """A red ball; ground gravity is off unless ``gravity`` is given."""
+    return Ball(
+        position=Vector2(x, y),
+        radius=radius,
+        color=pygame.Color("red"),
+        mass=mass,
+        velocity=Vector2(vx, vy),
+        artificialForces=forces or [],
+        gravity=gravity,
+        gravitation=gravitation,
+        electricCharge=charge,
+    )
+
+
+def make_anchor(x: float = 0, y: float = 0) -> WallPosition:
+    """A point on the bottom edge of a small wall hanging above ``(x, y)``."""
+    wall = Wall([Vector2(x - 5, y - 5), Vector2(x + 5, y - 5), Vector2(x + 5, y), Vector2(x - 5, y)],
+                pygame.Color("blue"))
+    return WallPosition(wall, Vector2(x, y))
+
+
+def add(engine: PhysicsEngine, *elements: Element) -> None:
+    """Put ``elements`` into the engine's active set."""
+    for element in elements:
+        engine.current_elements[element.type].append(element)
+        engine.current_elements["all"].append(element)
+
+
+def make_engine(*elements: Element, floor_y: float | None = None) -> PhysicsEngine:
+    """An engine holding ``elements``, with a floor at ``floor_y`` if given."""
+    engine = PhysicsEngine([{"type": t} for t in ELEMENT_TYPES])
+    if floor_y is not None:
+        engine.floor = Floor(floor_y, (200, 200, 200))
+    add(engine, *elements)
+    return engine
@@ -0,0 +1,106 @@
+"""Unit tests for the image asset cache used by menu icons and buttons."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pygame
+import pytest
+
+from source.basic import AssetCache
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def icon(tmp_path: Path) -> str:
+    surface = pygame.Surface((64, 64), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+    pygame.draw.circle(surface, (200, 30, 30, 255), (32, 32), 20)
+    pygame.draw.rect(surface, (30, 30, 200, 128), (0, 0, 16, 64))
+    path = str(tmp_path / "icon.png")
+    pygame.image.save(surface, path)
+    return path
+
+
+def pixels(surface: pygame.Surface) -> bytes:
+    return pygame.image.tostring(surface, "RGBA")
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+class TestLoading:
+    def test_image_is_read_once(self, icon: str) -> None:
+        cache = AssetCache()
+        first = cache.image(icon)
+        assert cache.image(icon) is first
+        assert cache.loads == 1
+
+    def test_scaled_variants_are_cached_per_size(self, icon: str) -> None:
+        cache = AssetCache()
+        small = cache.scaled(icon, (24.6, 24.2))
+        assert small.get_size() == (24, 24)
+        assert cache.scaled(icon, (24, 24)) is small
+        assert cache.scaled(icon, (32, 32)) is not small
+        assert cache.loads == 1
+        expected = pygame.transform.smoothscale(pygame.image.load(icon), (24, 24))
+        assert pixels(small) == pixels(expected)
+
+    def test_missing_file_is_not_retried(self, tmp_path: Path) -> None:
+        cache = AssetCache()
+        path = str(tmp_path / "missing.png")
+        for _ in range(3):
+            with pytest.raises(FileNotFoundError):
+                cache.scaled(path, (24, 24))
+        assert cache.missing == {path}
+        assert cache.loads == 0
+
+
+# ---------------------------------------------------------------------------
+# Preloading
+# ---------------------------------------------------------------------------
+
+class TestPreload:
+    def test_preloaded_files_need_no_further_reads(self, icon: str) -> None:
+        cache = AssetCache()
+        cache.preload([icon]).join()
+        assert cache.loads == 1
+        assert list(cache.loaded) == [icon]
+        direct = AssetCache().scaled(icon, (24, 24))
+        assert pixels(cache.scaled(icon, (24, 24))) == pixels(direct)
+        cache.scaled(icon, (26, 26))
+        assert cache.loads == 1
+        assert not cache.loaded
+
+    def test_images_read_on_the_main_thread_are_skipped(self, icon: str) -> None:
+        cache = AssetCache()
+        cache.scaled(icon, (24, 24))
+        cache.preloadNow([icon])
+        assert cache.loads == 1
+        assert not cache.loaded
+
+    def test_image_read_during_preload_is_not_kept_twice(
+        self, icon: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = AssetCache()
+        read = cache.read
+
+        def readWhileMainThreadLoads(path: str) -> pygame.Surface:
+            surface = read(path)
+            cache.originals[path] = surface  # the main thread got there first
+            return surface
+
+        monkeypatch.setattr(cache, "read", readWhileMainThreadLoads)
+        cache.preloadNow([icon])
+        assert not cache.loaded
+
+    def test_missing_files_are_skipped(self, icon: str, tmp_path: Path) -> None:
+        cache = AssetCache()
+        missing = str(tmp_path / "missing.png")
+        cache.preloadNow([missing, icon])
+        assert list(cache.loaded) == [icon]
+        assert cache.missing == {missing}
@@ -0,0 +1,137 @@
+"""Unit tests for the Ball force accumulator."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import pytest
+
+from source.basic import Ball, Vector2
+from tests import helpers
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, mass=2)
+
+
+# ---------------------------------------------------------------------------
+# Accumulator
+# ---------------------------------------------------------------------------
+
+class TestForceAccumulator:
+    def test_initial_artificial_forces_summed(self) -> None:
+        ball = make_ball(forces=[Vector2(1, 0), Vector2(0, 3)])
+        assert ball.artificialForce == Vector2(1, 3)
+        assert ball.naturalForce == Vector2(0, 0)
+
+    def test_force_accumulates_and_updates_acceleration(self) -> None:
+        ball = make_ball(mass=2)
+        ball.force(Vector2(2, 0), isNatural=True)
+        ball.force(Vector2(4, 0), isNatural=True)
+        ball.force(Vector2(0, 6))
+        assert ball.naturalForce == Vector2(6, 0)
+        assert ball.netForce() == Vector2(6, 6)
+        assert ball.acceleration == Vector2(3, 3)
+
+    def test_gravity_added_to_acceleration(self) -> None:
+        ball = make_ball()
+        ball.gravity = 1
+        assert ball.accelerate().y == pytest.approx(98.6)
+
+    def test_reset_natural_keeps_artificial(self) -> None:
+        ball = make_ball(forces=[Vector2(2, 0)])
+        ball.force(Vector2(0, 4), isNatural=True)
+        ball.resetForce(True)
+        assert ball.naturalForce == Vector2(0, 0)
+        assert ball.acceleration == Vector2(1, 0)
+
+    def test_reset_artificial(self) -> None:
+        ball = make_ball(forces=[Vector2(2, 0)])
+        ball.resetForce()
+        assert ball.netForce() == Vector2(0, 0)
+
+    def test_merge_combines_artificial_forces(self) -> None:
+        class FakeGame:
+            isCelestialBodyMode = False
+
+        a = make_ball(forces=[Vector2(1, 0)])
+        b = make_ball(forces=[Vector2(0, 2)])
+        merged = a.merge(b, FakeGame())
+        assert merged.artificialForce == Vector2(1, 2)
+
+
+# ---------------------------------------------------------------------------
+# Integration
+# ---------------------------------------------------------------------------
+
+class TestIntegration:
+    def test_closed_form_matches_ten_substeps(self) -> None:
+        ball = make_ball(forces=[Vector2(3, -2)])
+        ball.velocity = Vector2(5, 7)
+        ball.gravity = 1
+        ball.airResistance = 0.5
+        dt = 1 / 60
+
+        # The fixed ten-substep loop Ball.update used to run
+        acc = ball.accelerate()
+        v, p = ball.velocity.copy(), ball.position.copy()
+        h = dt / 10
+        for _ in range(10):
+            v += acc * h
+            p += (v + acc * h * 20**0.5) * h
+        v *= ball.airResistance**h
+
+        ball.update(dt)
+        assert ball.position.x == pytest.approx(p.x)
+        assert ball.position.y == pytest.approx(p.y)
+        assert ball.velocity.x == pytest.approx(v.x)
+        assert ball.velocity.y == pytest.approx(v.y)
+
+    def test_substep_count(self) -> None:
+        ball = make_ball()
+        ball.velocity = Vector2(0, 0)
+        assert ball.substepCount(1 / 120, wallThickness=0) == 1
+        ball.velocity = Vector2(100 * 120, 0)  # 100 units per step
+        assert ball.substepCount(1 / 120, wallThickness=0) == 10
+        ball.velocity = Vector2(15 * 120, 0)  # 15 units vs limit 0.5 * 10
+        assert ball.substepCount(1 / 120, wallThickness=0) == 3
+
+
+# ---------------------------------------------------------------------------
+# Sleeping
+# ---------------------------------------------------------------------------
+
+class TestSleep:
+    def test_falls_asleep_after_resting_frames(self) -> None:
+        ball = make_ball()
+        ball.velocity = Vector2(0.1, 0)
+        for _ in range(Ball.sleepFrames - 1):
+            assert not ball.updateSleepState()
+        assert ball.updateSleepState()
+        assert ball.velocity == Vector2(0, 0)
+
+    def test_motion_resets_the_count(self) -> None:
+        ball = make_ball()
+        for _ in range(Ball.sleepFrames - 1):
+            ball.updateSleepState()
+        ball.velocity = Vector2(50, 0)
+        assert not ball.updateSleepState()
+        assert ball.restingFrames == 0
+
+    def test_sleeping_ball_does_not_move(self) -> None:
+        ball = make_ball()
+        ball.gravity = 1
+        ball.isSleeping = True
+        ball.update(1 / 60)
+        assert ball.position == Vector2(0, 0)
+
+    def test_large_force_wakes(self) -> None:
+        ball = make_ball(mass=2)
+        ball.isSleeping = True
+        ball.force(Vector2(1, 0))
+        assert ball.isSleeping
+        ball.force(Vector2(10, 0))
+        assert not ball.isSleeping
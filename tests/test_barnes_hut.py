@@ -0,0 +1,150 @@
+"""Unit tests for source.physics.barnes_hut."""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+
+import pytest
+
+from source.basic import Ball, gravityFactor
+from source.physics.barnes_hut import (
+    BarnesHutTree,
+    barnes_hut_gravitation_forces,
+    direct_gravitation_forces,
+    gravitation_force_error,
+)
+from source.physics.engine import PhysicsEngine
+from tests import helpers
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, radius=1, gravity=1, gravitation=True)
+
+
+def random_cluster(n: int, seed: int = 0) -> list[Ball]:
+    rng = random.Random(seed)
+    return [
+        make_ball(rng.gauss(0, 1000), rng.gauss(0, 1000), mass=rng.uniform(1, 100))
+        for _ in range(n)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Direct sum
+# ---------------------------------------------------------------------------
+
+class TestDirectSum:
+    def test_matches_ball_gravitate(self) -> None:
+        b1 = make_ball(0, 0, mass=10)
+        b2 = make_ball(30, 40, mass=2)
+        (fx, fy), _ = direct_gravitation_forces([b1, b2])
+
+        expected = b1.gravitate(b2)
+        # gravitate returns the force on b1
+        assert fx == pytest.approx(expected.x)
+        assert fy == pytest.approx(expected.y)
+
+    def test_newtons_third_law(self) -> None:
+        forces = direct_gravitation_forces(random_cluster(20))
+        assert sum(f[0] for f in forces) == pytest.approx(0, abs=1e-3)
+        assert sum(f[1] for f in forces) == pytest.approx(0, abs=1e-3)
+
+    def test_coincident_bodies_no_force(self) -> None:
+        forces = direct_gravitation_forces([make_ball(5, 5), make_ball(5, 5)])
+        assert forces == [(0.0, 0.0), (0.0, 0.0)]
+
+
+# ---------------------------------------------------------------------------
+# Tree
+# ---------------------------------------------------------------------------
+
+class TestBarnesHutTree:
+    def test_empty(self) -> None:
+        assert BarnesHutTree([]).forces() == []
+
+    def test_theta_zero_is_exact(self) -> None:
+        balls = random_cluster(50)
+        approx = barnes_hut_gravitation_forces(balls, theta=0)
+        exact = direct_gravitation_forces(balls)
+        for (ax, ay), (ex, ey) in zip(approx, exact):
+            assert ax == pytest.approx(ex, rel=1e-9, abs=1e-9)
+            assert ay == pytest.approx(ey, rel=1e-9, abs=1e-9)
+
+    def test_coincident_bodies_do_not_recurse_forever(self) -> None:
+        balls = [make_ball(0, 0) for _ in range(10)] + [make_ball(100, 0)]
+        forces = barnes_hut_gravitation_forces(balls)
+        assert len(forces) == 11
+
+    def test_gravity_factor_scales_force(self) -> None:
+        balls = random_cluster(10)
+        f1 = barnes_hut_gravitation_forces(balls, 0.5, gravityFactor)
+        f2 = barnes_hut_gravitation_forces(balls, 0.5, 2 * gravityFactor)
+        assert f2[0][0] == pytest.approx(2 * f1[0][0])
+
+    def test_fewer_interactions_than_direct(self) -> None:
+        balls = random_cluster(500)
+        tree = BarnesHutTree(balls, theta=0.7)
+        tree.forces()
+        assert tree.interactions < 500 * 499 / 2
+
+    @pytest.mark.parametrize("theta", [0.3, 0.5, 0.8])
+    def test_error_small(self, theta: float) -> None:
+        report = gravitation_force_error(random_cluster(300, seed=3), theta)
+        assert report["mean"] < 0.05
+        assert report["interactions"] > 0
+
+    def test_error_grows_with_theta(self) -> None:
+        balls = random_cluster(300, seed=5)
+        assert (
+            gravitation_force_error(balls, 0.2)["rms"]
+            <= gravitation_force_error(balls, 1.0)["rms"]
+        )
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+class TestEngineSolver:
+    def make_engine(self, balls: list[Ball]) -> PhysicsEngine:
+        eng = PhysicsEngine([{"type": "ball"}])
+        eng.current_elements["ball"].extend(balls)
+        return eng
+
+    def test_auto_threshold(self) -> None:
+        eng = self.make_engine([])
+        assert not eng.uses_barnes_hut(eng.barnes_hut_threshold - 1)
+        assert eng.uses_barnes_hut(eng.barnes_hut_threshold)
+
+    def test_switch_back_to_direct(self) -> None:
+        eng = self.make_engine([])
+        eng.gravity_solver = "direct"
+        assert not eng.uses_barnes_hut(10_000)
+
+    def test_barnes_hut_applies_force(self) -> None:
+        b1 = make_ball(0, 0, mass=1000)
+        b2 = make_ball(100, 0, mass=1)
+        eng = self.make_engine([b1, b2])
+        eng.gravity_solver = "barnes_hut"
+        eng.apply_gravitation_force()
+        assert b2.acceleration.x < 0
+        assert b1.acceleration.x > 0
+
+    def test_barnes_hut_skips_non_gravitating(self) -> None:
+        b1 = make_ball(0, 0, mass=1000)
+        b2 = make_ball(100, 0, mass=1)
+        b2.gravitation = False
+        eng = self.make_engine([b1, b2])
+        eng.gravity_solver = "barnes_hut"
+        eng.apply_gravitation_force()
+        assert abs(b1.naturalForce) == 0
+        assert abs(b2.naturalForce) == 0
+
+    def test_gravitation_error_report(self) -> None:
+        eng = self.make_engine(random_cluster(100))
+        report = eng.gravitation_error(0.5)
+        assert set(report) == {"max", "mean", "rms", "interactions"}
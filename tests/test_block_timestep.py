@@ -0,0 +1,166 @@
+"""Unit tests for source.physics.block_timestep (hierarchical timesteps)."""
+
+from __future__ import annotations
+
+import math
+from functools import partial
+
+import pygame
+import pytest
+
+from source.basic import Ball, Vector2, Wall
+from source.physics.block_timestep import BlockTimestepIntegrator
+from source.physics.engine import PhysicsEngine
+from tests import helpers
+
+G = 1e5
+DT = 1 / 120
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, gravitation=True)
+
+
+def orbiter(center: Ball, distance: float, mass: float = 1) -> Ball:
+    """A ball on a circular orbit around ``center`` (to the right of it)."""
+    speed = math.sqrt(G * center.mass / distance)
+    return make_ball(center.position.x + distance, center.position.y,
+                     center.velocity.x, center.velocity.y + speed, mass=mass)
+
+
+def planet_with_moon() -> tuple[Ball, Ball, Ball]:
+    sun = make_ball(mass=1e6)
+    planet = orbiter(sun, 3000, 1e4)
+    moon = orbiter(planet, 40)
+    return sun, planet, moon
+
+
+def energy(balls: list[Ball]) -> float:
+    kinetic = sum(0.5 * b.mass * (b.velocity.x ** 2 + b.velocity.y ** 2) for b in balls)
+    potential = sum(
+        -G * a.mass * b.mass / a.position.distance(b.position)
+        for i, a in enumerate(balls) for b in balls[i + 1:]
+    )
+    return kinetic + potential
+
+
+# ---------------------------------------------------------------------------
+# Levels
+# ---------------------------------------------------------------------------
+
+class TestLevels:
+    def test_unforced_ball_takes_the_whole_step(self) -> None:
+        assert BlockTimestepIntegrator().level_for(0, 0, 0, 0, math.inf, DT) == 0
+
+    def test_level_halves_step_until_it_fits(self) -> None:
+        integrator = BlockTimestepIntegrator(eta=1)
+        # |a| / |ȧ| = DT / 5 needs DT / 8
+        assert integrator.level_for(1, 0, 5 / DT, 0, math.inf, DT) == 3
+        # the pair timescale binds as well
+        assert integrator.level_for(0, 0, 0, 0, DT / 5, DT) == 3
+
+    def test_level_is_capped(self) -> None:
+        integrator = BlockTimestepIntegrator(max_level=4)
+        assert integrator.level_for(1, 0, 1e12, 0, math.inf, DT) == 4
+
+    def test_moon_steps_finer_than_its_planet(self) -> None:
+        sun, planet, moon = planet_with_moon()
+        far = orbiter(sun, 20000, 1e4)
+        integrator = BlockTimestepIntegrator()
+        integrator.step([sun, planet, moon, far], DT, G)
+        levels = integrator.levels
+        assert levels[id(moon)] > levels[id(far)]
+        assert levels[id(sun)] < levels[id(moon)]
+        assert integrator.stats()["finest_level"] == levels[id(moon)]
+        assert sum(integrator.level_counts().values()) == 4
+
+
+# ---------------------------------------------------------------------------
+# Integration
+# ---------------------------------------------------------------------------
+
+class TestIntegration:
+    def test_circular_orbit_keeps_radius_and_energy(self) -> None:
+        sun = make_ball(mass=1e6)
+        planet = orbiter(sun, 1000)
+        e0 = energy([sun, planet])
+        integrator = BlockTimestepIntegrator()
+        # about one orbit
+        for _ in range(round(2 * math.pi * 1000 / math.sqrt(G * 1e6 / 1000) / DT)):
+            integrator.step([sun, planet], DT, G)
+        assert planet.position.distance(sun.position) == pytest.approx(1000, rel=1e-3)
+        assert energy([sun, planet]) == pytest.approx(e0, rel=1e-5)
+
+    def test_moon_stays_bound(self) -> None:
+        balls = list(planet_with_moon())
+        _, planet, moon = balls
+        e0 = energy(balls)
+        integrator = BlockTimestepIntegrator()
+        for _ in range(120):
+            integrator.step(balls, DT, G)
+        assert moon.position.distance(planet.position) == pytest.approx(40, rel=0.05)
+        assert energy(balls) == pytest.approx(e0, rel=1e-5)
+
+    def test_fewer_evaluations_than_shared_step(self) -> None:
+        def evaluations(shared: bool) -> int:
+            sun, planet, moon = planet_with_moon()
+            balls = [sun, planet, moon] + [orbiter(sun, 8000 + 2000 * i, 10) for i in range(6)]
+            integrator = BlockTimestepIntegrator(shared=shared)
+            return sum(integrator.step(balls, DT, G) for _ in range(10))
+
+        assert evaluations(False) < evaluations(True) / 2
+
+    def test_closing_accelerations_are_reused(self) -> None:
+        balls = list(planet_with_moon())
+        integrator = BlockTimestepIntegrator()
+        integrator.step(balls, DT, G)
+        first = integrator.evaluations
+        integrator.step(balls, DT, G)
+        assert integrator.evaluations == first - len(balls)
+        balls[2].position = balls[2].position + Vector2(1, 0)
+        integrator.step(balls, DT, G)
+        assert integrator.evaluations > first - len(balls)
+
+    def test_sleeping_ball_is_a_fixed_source(self) -> None:
+        sun, planet = make_ball(mass=1e6), make_ball(1000, 0)
+        sun.isSleeping = True
+        BlockTimestepIntegrator().step([sun, planet], DT, G)
+        assert sun.position == Vector2(0, 0)
+        assert sun.velocity == Vector2(0, 0)
+        assert planet.velocity.x < 0
+
+    def test_other_forces_are_held_constant(self) -> None:
+        ball = make_ball()
+        ball.artificialForce = Vector2(2, 0)
+        BlockTimestepIntegrator().step([ball], DT, G)
+        assert ball.velocity.x == pytest.approx(2 * DT)
+        assert ball.position.x == pytest.approx(DT * DT)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_block_timesteps_only_for_direct_sum_without_walls(self) -> None:
+        engine = PhysicsEngine([{"type": "ball"}])
+        assert engine.uses_block_timesteps(10)
+        assert not engine.uses_block_timesteps(engine.barnes_hut_threshold)
+        engine.current_elements["wall"].append(
+            Wall([Vector2(0, 0), Vector2(10, 0), Vector2(10, 10), Vector2(0, 10)],
+                 pygame.Color("black"))
+        )
+        assert not engine.uses_block_timesteps(10)
+
+    def test_engine_steps_gravitating_balls(self) -> None:
+        engine = PhysicsEngine([{"type": "ball"}])
+        sun, planet = make_ball(mass=1e6), make_ball(1000, 0)
+        inert = make_ball(50, 50)
+        inert.gravitation = False
+        engine.current_elements["ball"].extend([sun, planet, inert])
+        assert engine.step_block_timesteps(DT, G) == [sun, planet]
+        assert planet.velocity.x < 0
+        assert inert.position == Vector2(50, 50)
@@ -0,0 +1,152 @@
+"""Unit tests for source.physics.broad_phase."""
+
+from __future__ import annotations
+
+import math
+import random
+from functools import partial
+
+import pytest
+
+from source.basic import Ball
+from source.physics.broad_phase import (
+    BruteForceBroadPhase,
+    UniformGridBroadPhase,
+    make_broad_phase,
+)
+from source.physics.engine import PhysicsEngine
+from tests import helpers
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, radius=10, gravity=1)
+
+
+def touching_pairs(pairs: list[tuple[Ball, Ball]]) -> set[frozenset[int]]:
+    return {
+        frozenset((id(a), id(b))) for a, b in pairs if a.isCollidedByBall(b)
+    }
+
+
+# ---------------------------------------------------------------------------
+# Brute force
+# ---------------------------------------------------------------------------
+
+class TestBruteForce:
+    def test_all_unordered_pairs(self) -> None:
+        balls = [make_ball(i * 100, 0) for i in range(5)]
+        bp = BruteForceBroadPhase()
+        pairs = bp.candidate_pairs(balls)
+        assert len(pairs) == 10
+        assert bp.pair_tests == 10
+
+    def test_empty(self) -> None:
+        assert BruteForceBroadPhase().candidate_pairs([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Uniform grid
+# ---------------------------------------------------------------------------
+
+class TestUniformGrid:
+    def test_cell_size_from_max_radius(self) -> None:
+        bp = UniformGridBroadPhase()
+        bp.candidate_pairs([make_ball(0, 0, radius=3), make_ball(50, 0, radius=7)])
+        assert bp.cell_size == pytest.approx(14)
+
+    def test_fixed_cell_size_never_below_diameter(self) -> None:
+        bp = UniformGridBroadPhase(cell_size=5)
+        bp.candidate_pairs([make_ball(0, 0, radius=10)])
+        assert bp.cell_size == pytest.approx(20)
+
+    def test_far_apart_balls_not_paired(self) -> None:
+        bp = UniformGridBroadPhase()
+        pairs = bp.candidate_pairs([make_ball(0, 0), make_ball(1000, 1000)])
+        assert pairs == []
+        assert bp.pair_tests == 0
+
+    def test_neighbouring_cells_paired(self) -> None:
+        # Centres straddle a cell boundary (cell size 20) but still touch.
+        a = make_ball(19, 19)
+        b = make_ball(21, 21)
+        pairs = UniformGridBroadPhase().candidate_pairs([a, b])
+        assert touching_pairs(pairs) == {frozenset((id(a), id(b)))}
+
+    def test_negative_coordinates(self) -> None:
+        a = make_ball(-1, -1)
+        b = make_ball(1, 1)
+        pairs = UniformGridBroadPhase().candidate_pairs([a, b])
+        assert len(touching_pairs(pairs)) == 1
+
+    def test_no_duplicate_pairs(self) -> None:
+        rng = random.Random(1)
+        balls = [make_ball(rng.uniform(0, 200), rng.uniform(0, 200), radius=5)
+                 for _ in range(200)]
+        pairs = UniformGridBroadPhase().candidate_pairs(balls)
+        keys = [frozenset((id(a), id(b))) for a, b in pairs]
+        assert len(keys) == len(set(keys))
+
+    def test_matches_brute_force_contacts(self) -> None:
+        rng = random.Random(42)
+        balls = [
+            make_ball(rng.uniform(-300, 300), rng.uniform(-300, 300),
+                      radius=rng.uniform(2, 12))
+            for _ in range(300)
+        ]
+        grid = touching_pairs(UniformGridBroadPhase().candidate_pairs(balls))
+        brute = touching_pairs(BruteForceBroadPhase().candidate_pairs(balls))
+        assert grid == brute
+
+    def test_fewer_tests_than_brute_force(self) -> None:
+        rng = random.Random(7)
+        balls = [make_ball(rng.uniform(0, 2000), rng.uniform(0, 2000), radius=5)
+                 for _ in range(400)]
+        grid = UniformGridBroadPhase()
+        grid.candidate_pairs(balls)
+        assert grid.pair_tests < 400 * 399 // 2 // 20
+
+    def test_non_finite_positions_are_skipped(self) -> None:
+        a, b = make_ball(0, 0), make_ball(5, 0)
+        lost = [make_ball(math.inf, 0), make_ball(0, -math.inf), make_ball(math.nan, math.nan)]
+        pairs = UniformGridBroadPhase().candidate_pairs([a, *lost, b])
+        assert touching_pairs(pairs) == {frozenset((id(a), id(b)))}
+        assert all(ball not in pair for pair in pairs for ball in lost)
+
+
+# ---------------------------------------------------------------------------
+# Factory / engine integration
+# ---------------------------------------------------------------------------
+
+class TestEngineIntegration:
+    def test_make_broad_phase(self) -> None:
+        assert isinstance(make_broad_phase("grid"), UniformGridBroadPhase)
+        assert isinstance(make_broad_phase("brute"), BruteForceBroadPhase)
+
+    def test_unknown_broad_phase(self) -> None:
+        with pytest.raises(ValueError):
+            make_broad_phase("octree")
+
+    def test_engine_default_is_grid(self) -> None:
+        eng = PhysicsEngine([{"type": "ball"}])
+        assert isinstance(eng.broad_phase, UniformGridBroadPhase)
+
+    def test_engine_select_brute(self) -> None:
+        eng = PhysicsEngine([{"type": "ball"}], broad_phase="brute")
+        assert isinstance(eng.broad_phase, BruteForceBroadPhase)
+        eng.set_broad_phase("grid")
+        assert isinstance(eng.broad_phase, UniformGridBroadPhase)
+
+    @pytest.mark.parametrize("name", ["grid", "brute"])
+    def test_engine_resolves_overlap(self, name: str) -> None:
+        eng = PhysicsEngine([{"type": "ball"}], broad_phase=name)
+        b1 = make_ball(0, 0)
+        b2 = make_ball(5, 0)
+        eng.current_elements["ball"].extend([b1, b2])
+        eng.resolve_ball_collisions()
+        # The contact cache removes ``correction`` of the overlap beyond ``slop``
+        cache = eng.contact_cache
+        depth = cache.slop + (1 - cache.correction) * (15 - cache.slop)
+        assert b1.position.distance(b2.position) == pytest.approx(20 - depth)
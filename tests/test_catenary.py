@@ -0,0 +1,69 @@
+"""Unit tests for the cached catenary shapes used by Rope drawing."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from source.basic.catenary import (
+    SEGMENTS,
+    catenaryParameter,
+    catenaryShape,
+    clearCatenaryCache,
+    _cachedShape,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def arc_length(shape: tuple[float, ...]) -> float:
+    """Polyline length of a normalized shape (chord length 1)."""
+    step = 1 / SEGMENTS
+    return sum(math.hypot(step, b - a) for a, b in zip(shape, shape[1:]))
+
+
+# ---------------------------------------------------------------------------
+# Shape
+# ---------------------------------------------------------------------------
+
+class TestShape:
+    @pytest.mark.parametrize("ratio", [1.001, 1.05, 1.5, 3.0, 100.0])
+    def test_parameter_solves_the_catenary_equation(self, ratio: float) -> None:
+        z = catenaryParameter(ratio)
+        assert math.sinh(z) == pytest.approx(ratio * z, rel=1e-9)
+
+    def test_taut_rope_has_no_sag(self) -> None:
+        assert catenaryShape(1.0) == (0.0,) * (SEGMENTS + 1)
+        assert catenaryShape(0.5) == (0.0,) * (SEGMENTS + 1)
+
+    @pytest.mark.parametrize("ratio", [1.01, 1.2, 2.0, 10.0])
+    def test_shape_is_symmetric_and_pinned(self, ratio: float) -> None:
+        shape = catenaryShape(ratio)
+        assert len(shape) == SEGMENTS + 1
+        assert shape[0] == pytest.approx(0, abs=1e-12)
+        assert shape[-1] == pytest.approx(0, abs=1e-12)
+        assert shape == pytest.approx(shape[::-1])
+        assert max(shape) == shape[SEGMENTS // 2] > 0
+
+    @pytest.mark.parametrize("ratio", [1.05, 1.5, 3.0])
+    def test_curve_has_the_rope_length(self, ratio: float) -> None:
+        assert arc_length(catenaryShape(ratio)) == pytest.approx(ratio, rel=0.01)
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+class TestCache:
+    def test_nearby_ratios_share_a_shape(self) -> None:
+        assert catenaryShape(1.5) is catenaryShape(1.500001)
+
+    def test_repeated_lookups_hit_the_cache(self) -> None:
+        clearCatenaryCache()
+        for _ in range(10):
+            catenaryShape(1.25)
+        info = _cachedShape.cache_info()
+        assert (info.misses, info.hits) == (1, 9)
@@ -0,0 +1,185 @@
+"""Unit tests for source.physics.constraints.ConstraintSolver."""
+
+from __future__ import annotations
+
+import math
+from functools import partial
+
+import pygame
+import pytest
+
+from source.basic import Ball, Rod, Rope, Vector2, Wall
+from source.physics.constraints import ConstraintSolver
+from source.physics.engine import PhysicsEngine
+from tests import helpers
+from tests.helpers import make_anchor, make_engine
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, radius=3, gravity=1)
+
+
+def length(link: Rod | Rope) -> float:
+    return link.start.getPosition().distance(link.end.getPosition())
+
+
+def run(engine: PhysicsEngine, steps: int, dt: float = 1 / 120) -> None:
+    """Integrate and solve the way ``Game.physicsStep`` does."""
+    for _ in range(steps):
+        for _ in range(2):
+            for ball in engine.current_elements["ball"]:
+                ball.update(dt / 2)
+            engine.solve_constraints(dt / 2)
+
+
+def pendulum(link_type: type = Rope, length: float = 50) -> tuple[PhysicsEngine, Ball, Rod | Rope]:
+    engine = make_engine()
+    ball = make_ball(length, 0)
+    link = link_type(make_anchor(), ball, length, 2, pygame.Color("black"))
+    engine.current_elements["ball"].append(ball)
+    engine.current_elements[link.type].append(link)
+    return engine, ball, link
+
+
+def energy(ball: Ball) -> float:
+    return 0.5 * ball.mass * abs(ball.velocity) ** 2 - ball.mass * 98.6 * ball.position.y
+
+
+# ---------------------------------------------------------------------------
+# Projection
+# ---------------------------------------------------------------------------
+
+class TestProjection:
+    @pytest.mark.parametrize("link_type", [Rod, Rope])
+    def test_pendulum_keeps_its_length(self, link_type: type) -> None:
+        engine, _, link = pendulum(link_type)
+        run(engine, 240)
+        assert length(link) == pytest.approx(50, abs=1e-6)
+
+    def test_pendulum_conserves_energy(self) -> None:
+        engine, ball, _ = pendulum()
+        e0 = energy(ball)
+        run(engine, 600, dt=1 / 60)
+        assert abs(energy(ball) - e0) < 0.01 * ball.mass * 98.6 * 50
+
+    def test_slack_rope_does_nothing(self) -> None:
+        engine, ball, link = pendulum(Rope)
+        link.length = 80
+        ball.velocity = Vector2(3, 4)
+        engine.solve_constraints(1 / 120)
+        assert ball.position == Vector2(50, 0)
+        assert ball.velocity == Vector2(3, 4)
+        assert link.tension == 0
+
+    def test_rod_pushes_a_compressed_pair_apart(self) -> None:
+        engine = make_engine()
+        a, b = make_ball(0, 0, gravity=0), make_ball(10, 0, gravity=0)
+        engine.current_elements["ball"].extend([a, b])
+        engine.current_elements["rod"].append(Rod(a, b, 20, 2, pygame.Color("black")))
+        engine.solve_constraints(1 / 120)
+        assert a.position.x == pytest.approx(-5)
+        assert b.position.x == pytest.approx(15)
+        assert a.velocity.x < 0 < b.velocity.x
+
+    def test_heavier_ball_moves_less(self) -> None:
+        engine = make_engine()
+        light, heavy = make_ball(0, 0, mass=1, gravity=0), make_ball(30, 0, mass=3, gravity=0)
+        engine.current_elements["ball"].extend([light, heavy])
+        engine.current_elements["rope"].append(Rope(light, heavy, 20, 2, pygame.Color("black")))
+        engine.solve_constraints(1 / 120)
+        assert light.position.x == pytest.approx(7.5)
+        assert heavy.position.x == pytest.approx(27.5)
+
+    def test_anchor_does_not_move(self) -> None:
+        engine, _, link = pendulum(Rod)
+        run(engine, 60)
+        assert link.start.getPosition() == Vector2(0, 0)
+
+    def test_compliance_lets_the_rope_stretch(self) -> None:
+        stiff, ball_stiff, _ = pendulum()
+        soft, ball_soft, _ = pendulum()
+        soft.current_elements["rope"][0].compliance = 1e-3
+        run(stiff, 120)
+        run(soft, 120)
+        assert abs(ball_soft.position) > abs(ball_stiff.position) + 0.01
+
+    def test_hanging_rod_reports_the_weight(self) -> None:
+        engine, ball, rod = pendulum(Rod)
+        ball.position = Vector2(0, 50)
+        run(engine, 120)
+        assert rod.currentForce == pytest.approx(ball.mass * 98.6, rel=0.05)
+
+
+# ---------------------------------------------------------------------------
+# Bookkeeping
+# ---------------------------------------------------------------------------
+
+class TestBookkeeping:
+    def test_zero_step_only_moves_positions(self) -> None:
+        engine, ball, link = pendulum(Rope)
+        ball.position = Vector2(60, 0)
+        ball.velocity = Vector2(0, 7)
+        engine.solve_constraints(0)
+        assert length(link) == pytest.approx(50)
+        assert ball.velocity == Vector2(0, 7)
+
+    def test_sync_rebuilds_only_on_change(self) -> None:
+        engine, ball, _ = pendulum()
+        engine.solve_constraints(1 / 120)
+        engine.solve_constraints(1 / 120)
+        assert engine.constraint_solver.rebuilds == 1
+        engine.current_elements["rod"].append(
+            Rod(ball, make_ball(50, 20), 20, 2, pygame.Color("black"))
+        )
+        engine.solve_constraints(1 / 120)
+        assert engine.constraint_solver.rebuilds == 2
+
+    def test_link_made_illegal_is_released(self) -> None:
+        engine, ball, link = pendulum(Rod)
+        engine.solve_constraints(1 / 120)
+        link.isLegal = False
+        ball.position = Vector2(80, 0)
+        assert engine.solve_constraints(1 / 120) == 0
+        assert ball.position == Vector2(80, 0)
+        assert engine.constraint_solver.rebuilds == 2
+
+    def test_reattached_link_is_rebuilt(self) -> None:
+        engine, ball, link = pendulum(Rod)
+        engine.solve_constraints(1 / 120)
+        other = make_ball(0, 30)
+        engine.current_elements["ball"].append(other)
+        link.end = other
+        engine.solve_constraints(1 / 120)
+        assert engine.constraint_solver.bodies[-1] is other
+        assert length(link) == pytest.approx(50)
+
+    def test_rest_length_edits_apply_without_rebuild(self) -> None:
+        engine, ball, link = pendulum(Rod)
+        engine.solve_constraints(1 / 120)
+        link.restLength = 30
+        engine.solve_constraints(0)
+        assert length(link) == pytest.approx(30)
+        assert engine.constraint_solver.rebuilds == 1
+
+    def test_illegal_links_are_skipped(self) -> None:
+        solver = ConstraintSolver()
+        rope = Rope(make_anchor(), make_anchor(10, 0), 5, 2, pygame.Color("black"))
+        solver.build([], [rope])
+        assert solver.owners == []
+
+    def test_violated_constraint_wakes_sleeping_ball(self) -> None:
+        engine, ball, _ = pendulum(Rod)
+        ball.isSleeping = True
+        ball.position = Vector2(60, 0)
+        engine.solve_constraints(1 / 120)
+        assert not ball.isSleeping
+        assert math.isclose(abs(ball.position), 50)
+
+    def test_satisfied_constraint_leaves_sleeper_alone(self) -> None:
+        engine, ball, _ = pendulum(Rod)
+        ball.isSleeping = True
+        engine.solve_constraints(1 / 120)
+        assert ball.isSleeping
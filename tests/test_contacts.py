@@ -0,0 +1,210 @@
+"""Unit tests for source.physics.contacts (persistent warm-started contacts)."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import pygame
+import pytest
+
+from source.basic import Ball, Floor, Vector2
+from source.physics.contacts import ContactCache
+from source.physics.engine import PhysicsEngine
+from tests import helpers
+
+DT = 1 / 120
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, radius=10)
+
+
+def make_column(count: int) -> PhysicsEngine:
+    engine = PhysicsEngine([{"type": "ball"}])
+    engine.floor = Floor(0, pygame.Color("black"), 0.5)
+    for i in range(count):
+        ball = make_ball(0, -10 - 20 * i, gravity=1)
+        ball.collisionFactor = 0.5
+        engine.current_elements["ball"].append(ball)
+    return engine
+
+
+def step(engine: PhysicsEngine) -> None:
+    """Ground-mode ``Game.physicsStep`` for balls on the floor."""
+    balls = engine.current_elements["ball"]
+    for ball in balls:
+        engine.update_ball(ball, DT / 2)
+    for ball in balls:
+        ball.resetForce(True)
+    engine.resolve_ball_collisions()
+    engine.resolve_wall_collisions()
+    for ball in balls:
+        engine.update_ball(ball, DT / 2)
+    engine.update_islands()
+    engine.update_sleep_states()
+
+
+# ---------------------------------------------------------------------------
+# Impulses
+# ---------------------------------------------------------------------------
+
+class TestImpulses:
+    def test_fast_elastic_collision_swaps_velocities(self) -> None:
+        a, b = make_ball(0, 0, vx=50), make_ball(19.5, 0)
+        assert ContactCache().solve([(a, b)]) == 1
+        assert a.velocity.x == pytest.approx(0, abs=1e-9)
+        assert b.velocity.x == pytest.approx(50)
+
+    def test_slow_new_contact_bounces_like_legacy(self) -> None:
+        a, b = make_ball(0, 0, vx=8), make_ball(19.5, 0)
+        ContactCache().solve([(a, b)])
+        legacy_a, legacy_b = make_ball(0, 0, vx=8), make_ball(19.5, 0)
+        legacy_a.reboundByBall(legacy_b)
+        assert a.velocity.x == pytest.approx(0, abs=1e-9)
+        assert b.velocity.x == pytest.approx(8)
+        assert a.velocity.x == pytest.approx(legacy_a.velocity.x, abs=0.5)
+        assert b.velocity.x == pytest.approx(legacy_b.velocity.x, abs=0.5)
+
+    def test_slow_carried_over_contact_does_not_bounce(self) -> None:
+        a, b = make_ball(0, 0), make_ball(19.5, 0)
+        cache = ContactCache()
+        cache.solve([(a, b)])
+        a.velocity = Vector2(5, 0)
+        cache.solve([(a, b)])
+        assert cache.impacts == 0
+        assert a.velocity.x == pytest.approx(2.5)
+        assert b.velocity.x == pytest.approx(2.5)
+
+    def test_impact_travels_along_a_row(self) -> None:
+        balls = [make_ball(20 * i, 0) for i in range(4)]
+        balls[0].velocity = Vector2(50, 0)
+        cache = ContactCache()
+        cache.solve([(balls[2], balls[3]), (balls[1], balls[2]), (balls[0], balls[1])])
+        assert [ball.velocity.x for ball in balls] == pytest.approx([0, 0, 0, 50], abs=1e-9)
+        assert cache.impacts == 3
+        assert all(contact.impulse == 0 for contact in cache.contacts.values())
+
+    def test_separating_overlap_only_moves_positions(self) -> None:
+        a, b = make_ball(0, 0, vx=-1), make_ball(10, 0, vx=1)
+        cache = ContactCache()
+        cache.solve([(a, b)])
+        assert (a.velocity.x, b.velocity.x) == (-1, 1)
+        assert [contact.impulse for contact in cache.contacts.values()] == [0]
+        assert a.position.distance(b.position) > 10
+
+    def test_heavier_ball_moves_less(self) -> None:
+        a, b = make_ball(0, 0, mass=3), make_ball(16, 0)
+        ContactCache().solve([(a, b)])
+        assert abs(b.position.x - 16) == pytest.approx(3 * abs(a.position.x))
+
+    def test_sleeping_ball_is_fixed(self) -> None:
+        a, b = make_ball(0, 0), make_ball(19.5, 0, vx=-50)
+        a.isSleeping = True
+        ContactCache().solve([(a, b)])
+        assert a.velocity == Vector2(0, 0)
+        assert a.position == Vector2(0, 0)
+        assert b.velocity.x == pytest.approx(50)
+
+    def test_touching_balls_share_charge(self) -> None:
+        a, b = make_ball(0, 0), make_ball(19.5, 0)
+        a.electricCharge = 4
+        ContactCache().solve([(a, b)])
+        assert a.electricCharge == b.electricCharge == 2
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+class TestPersistence:
+    def test_contacts_are_keyed_by_pair(self) -> None:
+        a, b = make_ball(0, 0), make_ball(19.5, 0)
+        cache = ContactCache()
+        cache.solve([(a, b)])
+        assert cache.stats()["created"] == 1
+        cache.solve([(b, a)])
+        assert (cache.created, cache.persisted) == (0, 1)
+        assert len(cache) == 1
+
+    def test_separated_contacts_are_dropped(self) -> None:
+        a, b = make_ball(0, 0), make_ball(19.5, 0)
+        cache = ContactCache()
+        cache.solve([(a, b)])
+        b.position = Vector2(30, 0)
+        assert cache.solve([(a, b)]) == 0
+        assert len(cache) == 0
+
+    def test_floor_contacts_only_under_touching_pairs(self) -> None:
+        floor = Floor(0, pygame.Color("black"))
+        a, b, c = make_ball(0, -10), make_ball(0, -30), make_ball(50, -10)
+        assert ContactCache().solve([(a, b)], floor) == 2
+
+    def test_warm_started_stack_converges_in_one_sweep(self) -> None:
+        floor = Floor(0, pygame.Color("black"))
+        a, b = make_ball(0, -10, gravity=1), make_ball(0, -30, gravity=1)
+        cache = ContactCache()
+        sweeps = []
+        for _ in range(20):
+            for ball in (a, b):
+                ball.velocity = ball.velocity + Vector2(0, 98.6 * DT)
+            cache.solve([(a, b)], floor)
+            sweeps.append(cache.sweeps)
+        assert sweeps[-1] == 1
+        floor_contact = cache.contacts[(id(a), id(floor))]
+        assert floor_contact.impulse == pytest.approx(2 * 98.6 * DT, rel=1e-3)
+        assert abs(a.velocity) < 1e-2 and abs(b.velocity) < 1e-2
+
+    def test_cold_start_needs_more_sweeps(self) -> None:
+        def resting_sweeps(warm_starting: bool) -> int:
+            engine = make_column(8)
+            engine.contact_cache.warm_starting = warm_starting
+            for _ in range(40):
+                step(engine)
+            return engine.contact_cache.sweeps
+
+        assert resting_sweeps(True) <= 2 < resting_sweeps(False)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_column_falls_asleep(self) -> None:
+        engine = make_column(6)
+        for _ in range(3 * Ball.sleepFrames):
+            step(engine)
+        assert engine.sleeping_balls == 6
+        for i, ball in enumerate(engine.current_elements["ball"]):
+            assert ball.position.y == pytest.approx(-10 - 20 * i, abs=0.5)
+
+    def test_resting_ball_does_not_wake_what_it_rests_on(self) -> None:
+        a, b = make_ball(), make_ball(0, -20)
+        a.isSleeping = True
+        b.restingFrames = 5
+        PhysicsEngine.wake_touching(a, b)
+        assert a.isSleeping
+        b.restingFrames = 0
+        PhysicsEngine.wake_touching(a, b)
+        assert not a.isSleeping
+
+    def test_floor_contact_is_not_resolved_twice(self) -> None:
+        engine = make_column(2)
+        bottom, top = engine.current_elements["ball"]
+        bottom.position = Vector2(0, -9)
+        top.position = Vector2(0, -28.5)
+        bottom.velocity = Vector2(0, 3)
+        engine.resolve_ball_collisions()
+        assert engine.floor_contact_balls() == {id(bottom)}
+        position, velocity = bottom.position, bottom.velocity
+        engine.resolve_wall_collisions()
+        assert (bottom.position, bottom.velocity) == (position, velocity)
+
+    def test_legacy_rebound_bypasses_cache(self) -> None:
+        engine = make_column(2)
+        engine.persistent_contacts = False
+        step(engine)
+        assert len(engine.contact_cache) == 0
@@ -0,0 +1,121 @@
+"""Unit tests for element bounding boxes and view culling."""
+
+from __future__ import annotations
+
+import math
+from functools import partial
+
+import pygame
+import pytest
+
+from source.basic import Rod, Rope, SoftBody, Spring, Vector2, Wall, WallPosition
+from tests import helpers
+from tests.helpers import make_engine
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, radius=3)
+
+
+def make_wall(x: float, y: float, size: float = 10) -> Wall:
+    return Wall([Vector2(x, y), Vector2(x + size, y), Vector2(x + size, y + size),
+                 Vector2(x, y + size)], pygame.Color("blue"))
+
+
+def make_anchor(x: float = 0, y: float = 0) -> WallPosition:
+    wall = make_wall(x - 5, y - 5)
+    return WallPosition(wall, Vector2(x, y))
+
+
+# ---------------------------------------------------------------------------
+# Bounding boxes
+# ---------------------------------------------------------------------------
+
+class TestBoundingBoxes:
+    def test_ball_covers_its_highlight(self) -> None:
+        assert make_ball(10, 20, radius=3).boundingBox() == (6.5, 16.5, 13.5, 23.5)
+
+    def test_ball_covers_its_trail(self) -> None:
+        ball = make_ball()
+        ball.leaveTrail = True
+        ball.trailPoints = [Vector2(-50, 5), Vector2(40, 100)]
+        assert ball.boundingBox() == (-50, -3.5, 40, 100)
+        ball.leaveTrail = False
+        assert ball.boundingBox() == (-3.5, -3.5, 3.5, 3.5)
+
+    def test_wall_covers_its_vertices(self) -> None:
+        assert make_wall(0, 0, 10).boundingBox() == (-1, -1, 11, 11)
+
+    def test_slack_rope_covers_its_sag(self) -> None:
+        rope = Rope(make_anchor(0, 0), make_anchor(30, 0), 50, 2, pygame.Color("black"))
+        x0, y0, x1, y1 = rope.boundingBox()
+        sag = math.sqrt(50**2 - 30**2) / 2
+        assert (x0, y0, x1, y1) == pytest.approx((-sag, -sag, 30 + sag, sag))
+
+    def test_taut_rope_is_its_chord(self) -> None:
+        rope = Rope(make_anchor(0, 0), make_anchor(30, 40), 50, 2, pygame.Color("black"))
+        assert rope.boundingBox() == pytest.approx((0, 0, 30, 40))
+
+    def test_spring_covers_its_coils(self) -> None:
+        spring = Spring(make_ball(0, 0, radius=4), make_ball(50, 0, radius=6), 50, 1, 1, pygame.Color("green"))
+        assert spring.boundingBox() == (-6, -6, 56, 6)
+
+    def test_rod_is_its_segment(self) -> None:
+        rod = Rod(make_ball(0, 10), make_ball(20, -5), 25, 2, pygame.Color("black"))
+        assert rod.boundingBox() == (0, -5, 20, 10)
+
+    def test_soft_body_covers_its_balls(self) -> None:
+        balls = [make_ball(0, 0), make_ball(10, -4), make_ball(3, 8)]
+        body = SoftBody(balls, [(0, 1), (1, 2)], 1, 0, pygame.Color("black"))
+        assert body.boundingBox() == (0, -4, 10, 8)
+
+
+# ---------------------------------------------------------------------------
+# View
+# ---------------------------------------------------------------------------
+
+class TestView:
+    def test_only_elements_touching_the_view_in_draw_order(self) -> None:
+        near, far, edge = make_ball(0, 0), make_ball(500, 0), make_ball(102, 0)
+        rope = Rope(make_ball(-200, 0), make_ball(-150, 0), 120, 1, pygame.Color("black"))
+        engine = make_engine(far, near, rope, edge)
+        assert engine.elements_in_view(-100, -100, 100, 100) == [near, rope, edge]
+
+    def test_unbounded_elements_are_always_drawn(self) -> None:
+        body = SoftBody([], [], 1, 0, pygame.Color("black"))
+        engine = make_engine(make_ball(500, 500))
+        engine.current_elements["all"].append(body)
+        assert engine.elements_in_view(0, 0, 10, 10) == [body]
+
+    def test_walls_come_from_the_bvh(self) -> None:
+        engine = make_engine()
+        walls = [make_wall(20 * i, 0) for i in range(engine.wall_bvh_threshold)]
+        engine.current_elements["wall"].extend(walls)
+        engine.current_elements["all"].extend(walls)
+        assert engine.elements_in_view(-5, -5, 45, 5) == walls[:3]
+        assert engine.wall_bvh.rebuilds == 1
+        assert engine.wall_pair_tests == 0
+
+    def test_view_inside_a_large_wall_draws_it(self) -> None:
+        engine = make_engine()
+        big = make_wall(0, 0, 1000)
+        walls = [big] + [make_wall(2000 + 20 * i, 0) for i in range(engine.wall_bvh_threshold)]
+        engine.current_elements["wall"].extend(walls)
+        engine.current_elements["all"].extend(walls)
+        assert engine.elements_in_view(400, 400, 600, 600) == [big]
+        engine.wall_bvh_threshold = 10**9
+        assert engine.elements_in_view(400, 400, 600, 600) == [big]
+
+    def test_bvh_walls_match_bounding_boxes(self) -> None:
+        engine = make_engine()
+        walls = [make_wall(20 * i, 0) for i in range(engine.wall_bvh_threshold)]
+        engine.current_elements["wall"].extend(walls)
+        engine.current_elements["all"].extend(walls)
+        boxes = [(-5, -5, 59.5, 5), (70.5, 11, 75, 20), (0, -30, 400, -10.5)]
+        with_bvh = [engine.elements_in_view(*box) for box in boxes]
+        engine.wall_bvh_threshold = 10**9
+        assert with_bvh == [engine.elements_in_view(*box) for box in boxes]
+        assert with_bvh[0] == walls[:4]
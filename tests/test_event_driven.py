@@ -0,0 +1,198 @@
+"""Unit tests for source.physics.event_driven."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pygame
+import pytest
+
+from source.basic import Ball, Vector2, Wall
+from source.physics.event_driven import (
+    EventDrivenSimulation,
+    ball_contact_time,
+    edge_contact_time,
+)
+from tests.helpers import add, make_ball, make_engine
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_wall(x0: float, y0: float, x1: float, y1: float) -> Wall:
+    return Wall(
+        [Vector2(x0, y0), Vector2(x1, y0), Vector2(x1, y1), Vector2(x0, y1)],
+        pygame.Color("blue"),
+    )
+
+
+def make_box(size: float, thickness: float = 10) -> list[Wall]:
+    t = thickness
+    return [
+        make_wall(-t, -t, size + t, 0),
+        make_wall(-t, size, size + t, size + t),
+        make_wall(-t, 0, 0, size),
+        make_wall(size, 0, size + t, size),
+    ]
+
+
+def kinetic_energy(balls: list[Ball]) -> float:
+    return sum(0.5 * b.mass * (b.velocity.x ** 2 + b.velocity.y ** 2) for b in balls)
+
+
+# ---------------------------------------------------------------------------
+# Contact times
+# ---------------------------------------------------------------------------
+
+class TestContactTimes:
+    def test_head_on(self) -> None:
+        # Gap of 10 closing at 4 units/s
+        assert ball_contact_time(20, 0, -4, 0, 10) == pytest.approx(2.5)
+
+    def test_separating_never_touch(self) -> None:
+        assert ball_contact_time(20, 0, 4, 0, 10) == math.inf
+
+    def test_miss(self) -> None:
+        assert ball_contact_time(20, 30, -4, 0, 10) == math.inf
+
+    def test_overlapping_and_approaching_is_immediate(self) -> None:
+        assert ball_contact_time(5, 0, -1, 0, 10) == 0
+
+    def test_edge_interior(self) -> None:
+        t = edge_contact_time(0, 10, 0, -2, 5, -10, 0, 10, 0)
+        assert t == pytest.approx(2.5)
+
+    def test_edge_past_end_left_to_vertex(self) -> None:
+        assert edge_contact_time(20, 10, 0, -2, 5, -10, 0, 10, 0) == math.inf
+
+    def test_infinite_line(self) -> None:
+        t = edge_contact_time(20, 10, 0, -2, 5, -10, 0, 10, 0, infinite=True)
+        assert t == pytest.approx(2.5)
+
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+class TestSimulation:
+    def test_free_flight(self) -> None:
+        ball = make_ball(0, 0, 3, -4)
+        EventDrivenSimulation().advance([ball], [], 2)
+        assert ball.position == Vector2(6, -8)
+
+    def test_equal_masses_swap_velocities(self) -> None:
+        a = make_ball(0, 0, 10, 0)
+        b = make_ball(30, 0, -10, 0)
+        sim = EventDrivenSimulation()
+        assert sim.advance([a, b], [], 2) == 1
+        assert a.velocity.x == pytest.approx(-10)
+        assert b.velocity.x == pytest.approx(10)
+        # Contact at t = 1 (x = 10 and 20), then 1 s apart again
+        assert a.position.x == pytest.approx(0)
+        assert b.position.x == pytest.approx(30)
+
+    def test_collision_factor_scales_normal_velocity(self) -> None:
+        a = make_ball(0, 0, 10, 0)
+        b = make_ball(30, 0, -10, 0)
+        a.collisionFactor = 0.5
+        EventDrivenSimulation().advance([a, b], [], 2)
+        assert a.velocity.x == pytest.approx(-5)
+        assert b.velocity.x == pytest.approx(5)
+
+    def test_wall_bounce(self) -> None:
+        ball = make_ball(0, 20, 0, -10)
+        EventDrivenSimulation().advance([ball], [make_wall(-50, -10, 50, 0)], 3)
+        assert ball.velocity.y == pytest.approx(10)
+        # Touches at y = 5 after 1.5 s, then 1.5 s back up
+        assert ball.position.y == pytest.approx(20)
+
+    def test_vertex_bounce(self) -> None:
+        # Aimed straight at a corner of the wall
+        ball = make_ball(-20, 20, 10, -10)
+        EventDrivenSimulation().advance([ball], [make_wall(0, -10, 10, 0)], 4)
+        assert ball.velocity.x == pytest.approx(-10)
+        assert ball.velocity.y == pytest.approx(10)
+
+    def test_gas_in_box_conserves_energy_without_overlap(self) -> None:
+        rng = random.Random(4)
+        size = 300
+        balls = [
+            make_ball(
+                (k % 15 + 0.5) * 20, (k // 15 + 0.5) * 20,
+                rng.uniform(-80, 80), rng.uniform(-80, 80),
+                radius=3, mass=rng.uniform(1, 4),
+            )
+            for k in range(200)
+        ]
+        energy = kinetic_energy(balls)
+        sim = EventDrivenSimulation()
+        for _ in range(30):
+            sim.advance(balls, make_box(size), 1 / 60)
+        assert sim.collisions > 0
+        assert kinetic_energy(balls) == pytest.approx(energy, rel=1e-9)
+        for i, a in enumerate(balls):
+            assert 0 <= a.position.x <= size and 0 <= a.position.y <= size
+            for b in balls[i + 1:]:
+                assert a.position.distance(b.position) >= a.radius + b.radius - 1e-6
+
+    def test_event_cap(self) -> None:
+        a = make_ball(0, 0, 10, 0)
+        b = make_ball(30, 0, -10, 0)
+        sim = EventDrivenSimulation(max_events=0)
+        assert sim.advance([a, b], [], 2) == 0
+        assert a.velocity.x == 10
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_default_is_step(self) -> None:
+        eng = make_engine()
+        add(eng, make_ball(0, 0))
+        assert eng.supports_event_driven()
+        assert not eng.uses_event_driven()
+
+    def test_unknown_engine_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            make_engine().set_collision_engine("magic")
+
+    @pytest.mark.parametrize(
+        "attr, value",
+        [("gravity", 1), ("airResistance", 0.5), ("electricCharge", 1)],
+    )
+    def test_continuous_forces_disable_events(self, attr: str, value: float) -> None:
+        eng = make_engine()
+        balls = [make_ball(0, 0), make_ball(50, 0)]
+        for ball in balls:
+            setattr(ball, attr, value)
+            add(eng, ball)
+        assert not eng.supports_event_driven()
+
+    def test_applied_force_disables_events(self) -> None:
+        eng = make_engine()
+        ball = make_ball(0, 0)
+        ball.force(Vector2(1, 0))
+        add(eng, ball)
+        assert not eng.supports_event_driven()
+
+    def test_other_elements_disable_events(self) -> None:
+        eng = make_engine()
+        add(eng, make_ball(0, 0))
+        eng.current_elements["all"].append(object())
+        assert not eng.supports_event_driven()
+
+    def test_step_event_driven_uses_walls_and_wakes(self) -> None:
+        eng = make_engine()
+        eng.set_collision_engine("event")
+        ball = make_ball(0, 20, 0, -10)
+        ball.isSleeping = True
+        add(eng, ball)
+        add(eng, make_wall(-50, -10, 50, 0))
+        assert eng.uses_event_driven()
+        assert eng.step_event_driven(3) == 1
+        assert ball.position.y == pytest.approx(20)
+        assert not ball.isSleeping
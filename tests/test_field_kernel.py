@@ -0,0 +1,136 @@
+"""Unit tests for source.physics.field_kernel."""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from source.basic import Ball  # noqa: E402
+from source.physics.engine import PhysicsEngine  # noqa: E402
+from source.physics.field_kernel import (  # noqa: E402
+    apply_field_forces,
+    fused_field_accelerations,
+    fused_field_forces,
+)
+from tests import helpers  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, gravity=1)
+
+
+def random_balls(n: int, seed: int = 0) -> list[Ball]:
+    rng = random.Random(seed)
+    return [
+        make_ball(
+            rng.uniform(-300, 300), rng.uniform(-300, 300),
+            mass=rng.uniform(1, 50),
+            charge=rng.choice([0, -3, 2]),
+            gravitation=rng.random() < 0.7,
+        )
+        for _ in range(n)
+    ]
+
+
+def as_arrays(balls: list[Ball]) -> tuple[np.ndarray, ...]:
+    pos = np.array([[b.position.x, b.position.y] for b in balls])
+    mass = np.array([b.mass for b in balls])
+    charge = np.array([b.electricCharge for b in balls])
+    gravitation = np.array([b.gravitation for b in balls])
+    return pos, mass, charge, gravitation
+
+
+def reference_forces(balls: list[Ball]) -> np.ndarray:
+    """Net natural force from Ball.gravitate / Ball.electricForce per pair."""
+    for i, b1 in enumerate(balls):
+        for b2 in balls[i + 1:]:
+            if b1.gravitation and b2.gravitation:
+                b1.gravitate(b2)
+            if b1.electricCharge and b2.electricCharge:
+                b1.electricForce(b2)
+    out = np.array([[b.naturalForce.x, b.naturalForce.y] for b in balls])
+    for b in balls:
+        b.resetForce(True)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Kernel
+# ---------------------------------------------------------------------------
+
+class TestKernel:
+    def test_matches_ball_methods(self) -> None:
+        balls = random_balls(40)
+        expected = reference_forces(balls)
+        actual = fused_field_forces(*as_arrays(balls))
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9)
+
+    @pytest.mark.parametrize("tile_size", [1, 7, 64])
+    def test_tiling_does_not_change_result(self, tile_size: int) -> None:
+        arrays = as_arrays(random_balls(50, seed=3))
+        full = fused_field_forces(*arrays, tile_size=1024)
+        tiled = fused_field_forces(*arrays, tile_size=tile_size)
+        np.testing.assert_allclose(tiled, full, rtol=1e-12, atol=1e-9)
+
+    def test_gravity_needs_both_flags(self) -> None:
+        balls = [make_ball(0, 0, gravitation=True), make_ball(10, 0)]
+        forces = fused_field_forces(*as_arrays(balls))
+        assert not forces.any()
+
+    def test_like_charges_repel(self) -> None:
+        balls = [make_ball(0, 0, charge=2), make_ball(10, 0, charge=2)]
+        forces = fused_field_forces(*as_arrays(balls))
+        assert forces[0, 0] < 0 < forces[1, 0]
+
+    def test_coincident_bodies_are_skipped(self) -> None:
+        balls = [make_ball(5, 5, gravitation=True), make_ball(5, 5, gravitation=True)]
+        forces = fused_field_forces(*as_arrays(balls))
+        assert np.isfinite(forces).all()
+        assert not forces.any()
+
+    def test_accelerations_divide_by_mass(self) -> None:
+        arrays = as_arrays(random_balls(20, seed=5))
+        forces = fused_field_forces(*arrays)
+        acc = fused_field_accelerations(*arrays)
+        np.testing.assert_allclose(acc * arrays[1][:, None], forces)
+
+    def test_apply_field_forces_matches_ball_methods(self) -> None:
+        balls = random_balls(30, seed=9)
+        expected = reference_forces(balls)
+        apply_field_forces(balls)
+        for ball, (fx, fy) in zip(balls, expected):
+            assert ball.naturalForce.x == pytest.approx(fx, abs=1e-9)
+            assert ball.naturalForce.y == pytest.approx(fy, abs=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_vectorized_matches_fallback(self) -> None:
+        fast = PhysicsEngine([{"type": "ball"}])
+        slow = PhysicsEngine([{"type": "ball"}])
+        slow.vectorized_fields = False
+        fast.current_elements["ball"].extend(random_balls(25, seed=11))
+        slow.current_elements["ball"].extend(random_balls(25, seed=11))
+
+        fast.apply_field_forces()
+        slow.apply_field_forces()
+        for a, b in zip(fast.current_elements["ball"], slow.current_elements["ball"]):
+            assert a.naturalForce.x == pytest.approx(b.naturalForce.x, abs=1e-9)
+            assert a.naturalForce.y == pytest.approx(b.naturalForce.y, abs=1e-9)
+
+    def test_zero_factor_skips_field(self) -> None:
+        eng = PhysicsEngine([{"type": "ball"}])
+        balls = [make_ball(0, 0, gravitation=True), make_ball(10, 0, gravitation=True)]
+        eng.current_elements["ball"].extend(balls)
+        eng.apply_field_forces(gravity_factor=0)
+        assert all(abs(b.naturalForce) == 0 for b in balls)
@@ -0,0 +1,94 @@
+"""Unit tests for the half-plane Floor."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from source.basic import Ball, Floor
+from tests.helpers import make_ball, make_engine
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Contact test and response
+# ---------------------------------------------------------------------------
+
+class TestContact:
+    def test_touching_is_a_height_comparison(self) -> None:
+        floor = Floor(0, (200, 200, 200))
+        assert not floor.isBallTouching(make_ball(1e6, -5.5))
+        assert floor.isBallTouching(make_ball(-1e6, -4.5))
+        assert floor.isBallTouching(make_ball(0, 20))
+
+    def test_ball_above_is_untouched(self) -> None:
+        floor = Floor(0, (200, 200, 200))
+        ball = make_ball(0, -6, vy=100)
+        assert floor.checkCollision(ball) is False
+        assert ball.position.y == -6
+        assert ball.velocity.y == 100
+
+    def test_falling_ball_is_pushed_out_and_bounces(self) -> None:
+        floor = Floor(0, (200, 200, 200))
+        ball = make_ball(30, -4, vx=7, vy=100)
+        assert floor.checkCollision(ball) is True
+        assert ball.position.y + ball.radius <= 0
+        assert ball.position.x == 30
+        assert ball.velocity.x == pytest.approx(7)
+        assert ball.velocity.y == pytest.approx(-100)
+
+    def test_collision_factor_scales_the_bounce(self) -> None:
+        floor = Floor(0, (200, 200, 200), collisionFactor=0.5)
+        ball = make_ball(0, -4, vy=100)
+        floor.checkCollision(ball)
+        assert ball.velocity.y == pytest.approx(-50)
+
+    def test_rising_ball_keeps_its_velocity(self) -> None:
+        floor = Floor(0, (200, 200, 200))
+        ball = make_ball(0, -4, vy=-100)
+        floor.checkCollision(ball)
+        assert ball.velocity.y == pytest.approx(-100)
+
+    def test_surface_line_follows_y(self) -> None:
+        floor = Floor(0, (200, 200, 200))
+        floor.y = 12
+        (line,) = floor.lines
+        assert line.isLine
+        assert line.start.y == line.end.y == 12
+        assert floor.thickness == math.inf
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_resolve_wall_collisions_uses_floor(self) -> None:
+        engine = make_engine(floor_y=0)
+        ball = make_ball(1e5, -2, vy=50)
+        engine.current_elements["ball"].append(ball)
+        engine.resolve_wall_collisions()
+        assert ball.velocity.y < 0
+        assert ball.position.y + ball.radius <= 0
+
+    def test_floor_does_not_limit_substeps(self) -> None:
+        assert make_engine(floor_y=0).min_wall_thickness() == math.inf
+
+    def test_sweep_stops_fast_ball_at_floor(self) -> None:
+        engine = make_engine(floor_y=0)
+        ball = make_ball(0, -100, vy=30000)
+        engine.sweep_ball(ball, 1 / 120)
+        assert ball.position.y + ball.radius <= 1e-6
+        assert ball.velocity.y < 0
+
+    def test_event_engine_bounces_off_floor(self) -> None:
+        engine = make_engine(floor_y=0)
+        ball = make_ball(0, -15, vy=100)
+        engine.current_elements["ball"].append(ball)
+        assert engine.step_event_driven(0.2) == 1
+        assert ball.position.y == pytest.approx(-15)
+        assert ball.velocity.y == pytest.approx(-100)
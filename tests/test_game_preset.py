@@ -0,0 +1,88 @@
+"""Preset save/load round trip of Game's basic attributes."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+if sys.version_info < (3, 12):
+    pytest.skip("source/game/game.py needs Python 3.12", allow_module_level=True)
+
+from source.basic import Vector2  # noqa: E402
+from source.game.game import Game  # noqa: E402
+from tests.helpers import add, make_ball, make_engine  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_game() -> Game:
+    """A Game with just the state savePreset/loadPreset touch (no window)."""
+    game = Game.__new__(Game)
+    game._physics = make_engine(floor_y=-10)
+    game.elementMenu = SimpleNamespace(x=0, y=0, width=0, height=0, options=[])
+    game.wall_positions = []
+    game.icon = ""
+    game.ratio = 5
+    game.speed = 1
+    game.physicsHz = 120
+    game.viewCulling = True
+    game.physicsAccumulator = 0
+    game.previousPositions = {}
+    game.lastWakeSignature = ()
+    return game
+
+
+# ---------------------------------------------------------------------------
+# Round trip
+# ---------------------------------------------------------------------------
+
+class TestPresetRoundTrip:
+    @pytest.fixture(autouse=True)
+    def in_tmp_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+
+    def test_runtime_state_is_not_saved_and_starts_fresh(self) -> None:
+        saved = make_game()
+        ball = make_ball(10, 20)
+        ball.id = 1
+        add(saved._physics, ball)
+        saved.speed = 3
+        saved.physicsAccumulator = 0.007
+        saved.previousPositions = {id(ball): (9.0, 19.0)}
+        saved.lastWakeSignature = ((1.0,), 1)
+        saved.physicsHz = 30
+        saved.viewCulling = False
+        saved.savePreset("roundtrip")
+
+        loaded = make_game()
+        loaded.physicsAccumulator = 0.005
+        loaded.previousPositions = {1: (0.0, 0.0)}
+        loaded.loadPreset("roundtrip")
+
+        assert loaded.speed == 3
+        assert [b.position for b in loaded.elements["ball"]] == [Vector2(10, 20)]
+        assert loaded.physicsAccumulator == 0
+        assert loaded.previousPositions == {}
+        assert loaded.lastWakeSignature == ()
+        # Engine settings belong to the loading machine
+        assert loaded.physicsHz == 120
+        assert loaded.viewCulling is True
+
+    def test_old_presets_with_runtime_state_are_ignored(self) -> None:
+        make_game().savePreset("old")
+        path = Path("savefile/old.json")
+        text = path.read_text(encoding="utf-8")
+        path.write_text(
+            text.replace('"attributes": {', '"attributes": {"physicsAccumulator": 0.5, "maxPhysicsSteps": 1, ', 1),
+            encoding="utf-8",
+        )
+        loaded = make_game()
+        loaded.maxPhysicsSteps = 8
+        loaded.loadPreset("old")
+        assert loaded.physicsAccumulator == 0
+        assert loaded.maxPhysicsSteps == 8
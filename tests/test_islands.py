@@ -0,0 +1,207 @@
+"""Unit tests for source.physics.islands and island-level sleeping."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import pygame
+import pytest
+
+from source.basic import Ball, Rod, Rope, SoftBody, Spring, Vector2, Wall
+from source.physics.islands import DisjointSet, IslandGraph, link_pairs
+from tests import helpers
+from tests.helpers import make_anchor, make_engine
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, radius=3)
+
+
+def island_sets(graph: IslandGraph, contacts: list[tuple[Ball, Ball]] = ()) -> set[frozenset[int]]:
+    return {frozenset(id(ball) for ball in island) for island in graph.merge_contacts(list(contacts))}
+
+
+def ids(*balls: Ball) -> frozenset[int]:
+    return frozenset(id(ball) for ball in balls)
+
+
+# ---------------------------------------------------------------------------
+# DisjointSet
+# ---------------------------------------------------------------------------
+
+class TestDisjointSet:
+    def test_union_and_groups(self) -> None:
+        sets = DisjointSet(5)
+        assert sets.union(0, 1)
+        assert sets.union(3, 4)
+        assert not sets.union(1, 0)
+        assert sets.add() == 5
+        assert sets.groups() == [[0, 1], [2], [3, 4], [5]]
+
+
+# ---------------------------------------------------------------------------
+# IslandGraph
+# ---------------------------------------------------------------------------
+
+class TestIslandGraph:
+    def test_links_merge_islands(self) -> None:
+        a, b, c = make_ball(), make_ball(), make_ball()
+        graph = IslandGraph()
+        graph.sync([a, b, c], [(a, b)])
+        assert island_sets(graph) == {ids(a, b), ids(c)}
+        graph.sync([a, b, c], [(a, b), (b, c)])
+        assert island_sets(graph) == {ids(a, b, c)}
+        assert graph.merges == 2
+        assert graph.splits == 0
+
+    def test_removing_a_link_splits_only_its_island(self) -> None:
+        a, b, c, d, e = (make_ball() for _ in range(5))
+        graph = IslandGraph()
+        graph.sync([a, b, c, d, e], [(a, b), (b, c), (d, e)])
+        label = graph.island_of(d)
+        graph.sync([a, b, c, d, e], [(a, b), (d, e)])
+        assert island_sets(graph) == {ids(a, b), ids(c), ids(d, e)}
+        assert graph.splits == 1
+        assert graph.island_of(d) == label
+
+    def test_duplicate_links_need_both_removed(self) -> None:
+        a, b = make_ball(), make_ball()
+        graph = IslandGraph()
+        graph.sync([a, b], [(a, b), (b, a)])
+        graph.sync([a, b], [(a, b)])
+        assert island_sets(graph) == {ids(a, b)}
+        graph.sync([a, b], [])
+        assert island_sets(graph) == {ids(a), ids(b)}
+
+    def test_removing_a_ball_splits_its_island(self) -> None:
+        a, b, c = make_ball(), make_ball(), make_ball()
+        graph = IslandGraph()
+        graph.sync([a, b, c], [(a, b), (b, c)])
+        graph.sync([a, c], [(a, b), (b, c)])
+        assert island_sets(graph) == {ids(a), ids(c)}
+
+    def test_contacts_join_islands_for_one_step(self) -> None:
+        a, b, c = make_ball(), make_ball(), make_ball()
+        graph = IslandGraph()
+        graph.sync([a, b, c], [(a, b)])
+        assert island_sets(graph, [(b, c)]) == {ids(a, b, c)}
+        assert graph.contact_merges == 1
+        assert island_sets(graph) == {ids(a, b), ids(c)}
+        assert graph.persistent_count == 2
+
+    def test_islands_are_sorted_largest_first(self) -> None:
+        a, b, c = make_ball(), make_ball(), make_ball()
+        graph = IslandGraph()
+        graph.sync([c, a, b], [(a, b)])
+        assert [len(island) for island in graph.merge_contacts([])] == [2, 1]
+
+    def test_link_pairs_skip_wall_anchors(self) -> None:
+        a, b = make_ball(), make_ball(30)
+        anchor = make_anchor()
+        body = SoftBody.grid(Vector2(0, 0), 2, 1, 10, 2, 1, pygame.Color("black"), 10)
+        elements = {
+            "rope": [Rope(anchor, a, 10, 1, pygame.Color("black"))],
+            "rod": [Rod(a, b, 30, 1, pygame.Color("black"))],
+            "spring": [Spring(anchor, b, 10, 1, 1, pygame.Color("green"))],
+            "softbody": [body],
+        }
+        assert link_pairs(elements) == [(a, b), (body.balls[0], body.balls[1])]
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_pendulums_on_one_wall_are_separate_islands(self) -> None:
+        engine = make_engine()
+        a, b = make_ball(10), make_ball(-10)
+        anchor = make_anchor()
+        engine.current_elements["ball"].extend([a, b])
+        engine.current_elements["rope"].extend(
+            [Rope(anchor, a, 10, 1, pygame.Color("black")), Rope(anchor, b, 10, 1, pygame.Color("black"))]
+        )
+        assert engine.update_islands() == 2
+
+    def test_resync_only_on_change(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        engine = make_engine()
+        a, b = make_ball(), make_ball(10)
+        engine.current_elements["ball"].extend([a, b])
+        calls = []
+        original = engine.island_graph.sync
+        monkeypatch.setattr(engine.island_graph, "sync", lambda *args: calls.append(1) or original(*args))
+        engine.update_islands()
+        engine.update_islands()
+        assert len(calls) == 1
+        engine.current_elements["rod"].append(Rod(a, b, 10, 1, pygame.Color("black")))
+        assert engine.update_islands() == 1
+        assert len(calls) == 2
+
+    def test_recorded_contacts_are_used_once(self) -> None:
+        engine = make_engine()
+        a, b = make_ball(), make_ball(5)
+        engine.current_elements["ball"].extend([a, b])
+        engine.resolve_ball_collisions()
+        assert engine.update_islands() == 1
+        assert engine.update_islands() == 2
+
+    def test_moving_ball_wakes_its_island(self) -> None:
+        engine = make_engine()
+        a, b, c = make_ball(), make_ball(20), make_ball(100)
+        engine.current_elements["ball"].extend([a, b, c])
+        engine.current_elements["rod"].append(Rod(a, b, 20, 1, pygame.Color("black")))
+        engine.update_islands()
+        b.isSleeping = True
+        c.isSleeping = True
+        a.velocity = Vector2(50, 0)
+        engine.update_sleep_states()
+        assert not b.isSleeping
+        assert c.isSleeping
+        assert engine.island_stats()["sleeping_islands"] == 1
+
+    def test_resting_island_falls_asleep_together(self) -> None:
+        engine = make_engine()
+        a, b = make_ball(), make_ball(20)
+        engine.current_elements["ball"].extend([a, b])
+        engine.current_elements["rod"].append(Rod(a, b, 20, 1, pygame.Color("black")))
+        engine.update_islands()
+        b.restingFrames = 10
+        for _ in range(Ball.sleepFrames):
+            engine.update_sleep_states()
+        assert a.isSleeping and b.isSleeping
+        assert engine.island_stats()["sleeping_islands"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Constraint solver
+# ---------------------------------------------------------------------------
+
+class TestConstraintIslands:
+    def test_satisfied_islands_exit_after_one_sweep(self) -> None:
+        engine = make_engine()
+        anchor = make_anchor()
+        for x in (-40, 40):
+            a, b = make_ball(x, 10), make_ball(x, 30)
+            engine.current_elements["ball"].extend([a, b])
+            engine.current_elements["rod"].extend(
+                [Rod(anchor, a, a.position.distance(anchor.getPosition()), 1, pygame.Color("black")),
+                 Rod(a, b, 20, 1, pygame.Color("black"))]
+            )
+        engine.solve_constraints(1 / 120)
+        solver = engine.constraint_solver
+        assert solver.islands == 2
+        assert solver.sweeps == 2
+
+    def test_violated_island_keeps_iterating(self) -> None:
+        engine = make_engine()
+        a, b, c = make_ball(0), make_ball(30), make_ball(50)
+        engine.current_elements["ball"].extend([a, b, c])
+        engine.current_elements["rod"].extend(
+            [Rod(a, b, 20, 1, pygame.Color("black")), Rod(b, c, 20, 1, pygame.Color("black"))]
+        )
+        engine.solve_constraints(1 / 120)
+        assert engine.constraint_solver.sweeps > 1
+        assert a.position.distance(b.position) == pytest.approx(20, abs=1e-3)
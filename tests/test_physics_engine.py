@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 import pygame
 
-from source.basic import Ball, Vector2, Wall, ZERO
+from source.basic import Ball, Floor, Vector2, Wall, ZERO
 from source.physics.engine import PhysicsEngine
 
 
@@ -52,8 +52,8 @@ class TestConstruction:
     def test_per_type_buckets(self) -> None:
         """Per-type buckets: options_list types overlapping with standard keys are skipped."""
         eng = make_engine()
-        # standard: all, ball, wall, rope, controlling (5)
-        assert len(eng.ground_elements) == 5
+        # standard: all, ball, wall, rope, softbody, controlling (6)
+        assert len(eng.ground_elements) == 6
 
     def test_default_active_set_is_ground(self) -> None:
         eng = make_engine()
@@ -168,8 +168,7 @@ class TestApplyEnvironment:
 
     def test_collision_factor_applied_to_floor(self) -> None:
         eng = make_engine()
-        floor = Wall([Vector2(0, 0), Vector2(100, 0), Vector2(100, 10), Vector2(0, 10)],
-                      (200,) * 3, True)
+        floor = Floor(0, (200,) * 3)
         eng.floor = floor
         # Need at least one ball in active set for the per-ball loop
         ball = make_ball(0, 0)
@@ -255,14 +254,30 @@ class TestCollisionResolution:
         b2 = make_ball(1, 0, radius=10)  # within 2*radius = 20
         eng.current_elements["ball"].extend([b1, b2])
 
-        # Record velocities before
-        v1_before = b1.velocity.copy()
-        v2_before = b2.velocity.copy()
+        eng.resolve_ball_collisions()
+
+        # Resting overlap: pushed apart without injected separation velocity
+        assert b1.position.distance(b2.position) > 1
+        assert b1.velocity == b2.velocity == Vector2(0, 0)
 
+    def test_approaching_balls_rebound(self) -> None:
+        eng = make_engine()
+        b1 = make_ball(0, 0, radius=10)
+        b2 = make_ball(19, 0, radius=10)
+        b1.velocity = Vector2(50, 0)
+        eng.current_elements["ball"].extend([b1, b2])
         eng.resolve_ball_collisions()
+        assert b1.velocity.x < b2.velocity.x
 
-        # After collision, velocities should have changed
-        assert (b1.velocity != v1_before or b2.velocity != v2_before)
+    def test_legacy_rebound(self) -> None:
+        eng = make_engine()
+        eng.persistent_contacts = False
+        b1 = make_ball(0, 0, radius=10)
+        b2 = make_ball(1, 0, radius=10)
+        eng.current_elements["ball"].extend([b1, b2])
+        eng.resolve_ball_collisions()
+        assert b1.velocity != Vector2(0, 0) or b2.velocity != Vector2(0, 0)
+        assert len(eng.contact_cache) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -276,3 +291,154 @@ class TestFloor:
         assert eng.is_floor_illegal is False
         eng.is_floor_illegal = True
         assert eng.is_floor_illegal is True
+
+
+# ---------------------------------------------------------------------------
+# Adaptive substepping
+# ---------------------------------------------------------------------------
+
+def make_wall(x0: float, y0: float, x1: float, y1: float) -> Wall:
+    return Wall(
+        [Vector2(x0, y0), Vector2(x1, y0), Vector2(x1, y1), Vector2(x0, y1)],
+        pygame.Color("black"),
+    )
+
+
+class TestSubstepping:
+    def test_wall_thickness_is_smallest_side(self) -> None:
+        eng = make_engine()
+        eng.current_elements["wall"].append(make_wall(0, 0, 100, 4))
+        assert eng.min_wall_thickness() == pytest.approx(4)
+
+    def test_no_walls_is_infinitely_thick(self) -> None:
+        assert make_engine().min_wall_thickness() == float("inf")
+
+    def test_resting_ball_takes_one_substep(self) -> None:
+        eng = make_engine()
+        ball = make_ball(0, 0, gravitation=False)
+        assert eng.update_ball(ball, 1 / 240, wall_thickness=1) == 1
+        assert eng.substeps == 1
+
+    def test_fast_ball_is_split_and_capped(self) -> None:
+        eng = make_engine()
+        eng.continuous_collision = False
+        ball = make_ball(0, 0, radius=1, gravitation=False)
+        ball.velocity = Vector2(1e6, 0)
+        assert eng.update_ball(ball, 1 / 240, wall_thickness=1) == Ball.maxSubsteps
+
+    @pytest.mark.parametrize("continuous", [False, True])
+    def test_substeps_stop_thin_wall_tunnelling(self, continuous: bool) -> None:
+        eng = make_engine()
+        eng.continuous_collision = continuous
+        eng.current_elements["wall"].append(make_wall(50, -100, 54, 100))
+        ball = make_ball(0, 0, radius=5, gravitation=False)
+        ball.gravity = 0
+        ball.velocity = Vector2(6000, 0)  # 25 units per 1/240 s step
+        thickness = eng.min_wall_thickness()
+        for _ in range(8):
+            eng.update_ball(ball, 1 / 240, thickness)
+        assert ball.position.x < 50
+        assert ball.velocity.x < 0
+
+
+# ---------------------------------------------------------------------------
+# Sleeping
+# ---------------------------------------------------------------------------
+
+class TestSleeping:
+    def test_counts_awake_and_sleeping(self) -> None:
+        eng = make_engine()
+        a, b = make_ball(0, 0), make_ball(100, 0)
+        b.isSleeping = True
+        eng.current_elements["ball"].extend([a, b])
+        assert eng.update_sleep_states() == 1
+        assert (eng.awake_balls, eng.sleeping_balls) == (1, 1)
+
+    def test_counts_static_and_kinematic_walls(self) -> None:
+        eng = make_engine()
+        still, moved = make_wall(0, 0, 10, 10), make_wall(20, 0, 30, 10)
+        still.isStatic = True
+        eng.current_elements["wall"].extend([still, moved])
+        assert eng.count_wall_states() == 1
+        assert (eng.static_walls, eng.kinematic_walls) == (1, 1)
+
+    def test_sleeping_ball_takes_no_substeps(self) -> None:
+        eng = make_engine()
+        ball = make_ball(0, 0)
+        ball.isSleeping = True
+        assert eng.update_ball(ball, 1 / 120, wall_thickness=1) == 0
+        assert eng.substeps == 0
+
+    def test_contact_wakes_sleeping_ball(self) -> None:
+        eng = make_engine()
+        sleeper = make_ball(0, 0)
+        sleeper.isSleeping = True
+        mover = make_ball(15, 0)
+        mover.velocity = Vector2(-10, 0)
+        eng.current_elements["ball"].extend([sleeper, mover])
+        eng.resolve_ball_collisions()
+        assert not sleeper.isSleeping
+
+    def test_two_sleepers_are_not_tested(self) -> None:
+        eng = make_engine()
+        a, b = make_ball(0, 0), make_ball(15, 0)
+        a.isSleeping = b.isSleeping = True
+        eng.current_elements["ball"].extend([a, b])
+        eng.resolve_ball_collisions()
+        assert a.isSleeping and b.isSleeping
+
+    def test_wake_all(self) -> None:
+        eng = make_engine()
+        balls = [make_ball(0, 0), make_ball(100, 0)]
+        for ball in balls:
+            ball.isSleeping = True
+        eng.current_elements["ball"].extend(balls)
+        eng.wake_all()
+        assert not any(ball.isSleeping for ball in balls)
+        assert eng.sleeping_balls == 0
+
+
+# ---------------------------------------------------------------------------
+# Continuous collision
+# ---------------------------------------------------------------------------
+
+class TestContinuousCollision:
+    def test_fast_ball_takes_one_leg_per_contact(self) -> None:
+        eng = make_engine()
+        eng.current_elements["wall"].append(make_wall(50, -100, 52, 100))
+        ball = make_ball(0, 0, radius=5, gravitation=False)
+        ball.gravity = 0
+        ball.velocity = Vector2(12000, 0)  # 100 units per 1/120 s step
+        assert eng.update_ball(ball, 1 / 120, eng.min_wall_thickness()) == 2
+        assert ball.velocity.x == pytest.approx(-12000)
+        # Touches at x = 45 after 45 units, then travels 55 back
+        assert ball.position.x == pytest.approx(-10)
+
+    def test_slow_ball_is_not_swept(self) -> None:
+        eng = make_engine()
+        eng.current_elements["wall"].append(make_wall(50, -100, 52, 100))
+        ball = make_ball(0, 0, gravitation=False)
+        ball.velocity = Vector2(10, 0)
+        assert eng.update_ball(ball, 1 / 120, eng.min_wall_thickness()) == 1
+
+    def test_vertex_contact(self) -> None:
+        eng = make_engine()
+        eng.current_elements["wall"].append(make_wall(50, 50, 52, 100))
+        ball = make_ball(0, 0, radius=5, gravitation=False)
+        ball.gravity = 0
+        # Aimed at the corner (50, 50) along the diagonal
+        ball.velocity = Vector2(6000, 6000)
+        eng.update_ball(ball, 1 / 60, eng.min_wall_thickness())
+        assert ball.velocity.x == pytest.approx(-6000)
+        assert ball.velocity.y == pytest.approx(-6000)
+
+    def test_impacts_are_capped(self) -> None:
+        eng = make_engine()
+        eng.max_impacts = 1
+        # Narrow corridor: the ball would bounce many times in one step
+        eng.current_elements["wall"].append(make_wall(-20, -100, -18, 100))
+        eng.current_elements["wall"].append(make_wall(18, -100, 20, 100))
+        ball = make_ball(0, 0, radius=5, gravitation=False)
+        ball.gravity = 0
+        ball.velocity = Vector2(30000, 0)
+        assert eng.update_ball(ball, 1 / 120, eng.min_wall_thickness()) == 2
@@ -0,0 +1,198 @@
+"""Unit tests for source.physics.spring_kernel and SoftBody."""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from source.basic import Ball, SoftBody, Spring, Vector2, Wall  # noqa: E402
+from source.physics.spring_kernel import SpringNetwork, spring_forces  # noqa: E402
+from tests import helpers  # noqa: E402
+from tests.helpers import make_anchor, make_engine  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, radius=3)
+
+
+def random_springs(n_balls: int = 12, n_springs: int = 30, seed: int = 0) -> tuple[list[Ball], list[Spring]]:
+    rng = random.Random(seed)
+    balls = [
+        make_ball(rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-5, 5), rng.uniform(-5, 5))
+        for _ in range(n_balls)
+    ]
+    springs = []
+    for _ in range(n_springs):
+        a, b = rng.sample(balls, 2)
+        springs.append(Spring(a, b, rng.uniform(5, 40), rng.uniform(1, 50), 2,
+                              pygame.Color("green"), rng.uniform(0, 1)))
+    return balls, springs
+
+
+def forces(balls: list[Ball]) -> list[tuple[float, float]]:
+    return [(ball.naturalForce.x, ball.naturalForce.y) for ball in balls]
+
+
+# ---------------------------------------------------------------------------
+# Kernel
+# ---------------------------------------------------------------------------
+
+class TestKernel:
+    def test_stretched_spring_pulls_ends_together(self) -> None:
+        pos = np.array([[0.0, 0.0], [20.0, 0.0]])
+        out, deformation = spring_forces(
+            pos, np.zeros((2, 2)), np.array([0]), np.array([1]), np.array([10.0]), 3.0, 0.0
+        )
+        assert deformation.tolist() == [10.0]
+        assert out.tolist() == [[30.0, 0.0], [-30.0, 0.0]]
+
+    def test_damping_opposes_separation(self) -> None:
+        pos = np.array([[0.0, 0.0], [10.0, 0.0]])
+        vel = np.array([[0.0, 0.0], [4.0, 0.0]])
+        out, _ = spring_forces(pos, vel, np.array([0]), np.array([1]), np.array([10.0]), 3.0, 0.5)
+        assert out[1, 0] == pytest.approx(-2.0)
+
+    def test_degenerate_spring_exerts_no_force(self) -> None:
+        pos = np.zeros((2, 2))
+        out, deformation = spring_forces(
+            pos, np.zeros((2, 2)), np.array([0]), np.array([1]), np.array([10.0]), 3.0, 0.5
+        )
+        assert not out.any()
+        assert deformation.tolist() == [0.0]
+
+    def test_matches_spring_calculate_force(self) -> None:
+        balls, springs = random_springs()
+        for spring in springs:
+            spring.calculateForce()
+        expected = forces(balls)
+        expected_state = [(s.deformation, s.currentForce, s.potentialEnergy) for s in springs]
+        for ball in balls:
+            ball.resetForce(True)
+
+        network = SpringNetwork()
+        network.sync(springs, [])
+        assert network.apply() == len(springs)
+        for (fx, fy), (ex, ey) in zip(forces(balls), expected):
+            assert fx == pytest.approx(ex, abs=1e-9)
+            assert fy == pytest.approx(ey, abs=1e-9)
+        for spring, state in zip(springs, expected_state):
+            assert (spring.deformation, spring.currentForce, spring.potentialEnergy) == pytest.approx(state)
+
+    def test_wall_anchor_is_fixed(self) -> None:
+        anchor, ball = make_anchor(), make_ball(30, 0)
+        network = SpringNetwork()
+        network.sync([Spring(anchor, ball, 10, 2, 2, pygame.Color("green"))], [])
+        network.apply()
+        assert ball.naturalForce == Vector2(-40, 0)
+
+
+# ---------------------------------------------------------------------------
+# Soft body
+# ---------------------------------------------------------------------------
+
+class TestSoftBody:
+    def test_grid_links(self) -> None:
+        body = SoftBody.grid(Vector2(0, 0), 4, 3, 10, 2, 1, pygame.Color("black"), 100)
+        assert len(body.balls) == 12
+        # 3·3 + 4·2 structural, 2·3·2 shear
+        assert body.linkCount() == 17 + 12
+        assert body.restLengths[0] == pytest.approx(10)
+        plain = SoftBody.grid(Vector2(0, 0), 4, 3, 10, 2, 1, pygame.Color("black"), 100, shear=False)
+        assert plain.linkCount() == 17
+
+    def test_grid_at_rest_feels_no_force(self) -> None:
+        body = SoftBody.grid(Vector2(0, 0), 5, 5, 10, 2, 1, pygame.Color("black"), 100)
+        engine = make_engine()
+        engine.current_elements["softbody"].append(body)
+        engine.apply_spring_forces()
+        assert all(abs(ball.naturalForce) < 1e-9 for ball in body.balls)
+
+    def test_remove_ball_drops_its_links(self) -> None:
+        body = SoftBody.grid(Vector2(0, 0), 3, 1, 10, 2, 1, pygame.Color("black"), 100)
+        first, middle, last = body.balls
+        assert body.removeBall(middle)
+        assert body.balls == [first, last]
+        assert body.linkCount() == 0
+        assert body.revision == 1
+        assert not body.removeBall(middle)
+
+    def test_remove_ball_reindexes_links(self) -> None:
+        body = SoftBody.grid(Vector2(0, 0), 3, 1, 10, 2, 1, pygame.Color("black"), 100)
+        body.removeBall(body.balls[0])
+        assert (body.linkStarts, body.linkEnds) == ([0], [1])
+
+    def test_kernel_matches_fallback(self) -> None:
+        body = SoftBody.grid(Vector2(0, 0), 4, 4, 10, 2, 1, pygame.Color("black"), 100, 0.3)
+        rng = random.Random(1)
+        for ball in body.balls:
+            ball.position = ball.position + Vector2(rng.uniform(-3, 3), rng.uniform(-3, 3))
+            ball.velocity = Vector2(rng.uniform(-5, 5), rng.uniform(-5, 5))
+
+        body.calculateForce()
+        expected = forces(body.balls)
+        for ball in body.balls:
+            ball.resetForce(True)
+
+        engine = make_engine()
+        engine.current_elements["softbody"].append(body)
+        assert engine.apply_spring_forces() == body.linkCount()
+        for (fx, fy), (ex, ey) in zip(forces(body.balls), expected):
+            assert fx == pytest.approx(ex, abs=1e-9)
+            assert fy == pytest.approx(ey, abs=1e-9)
+
+    def test_round_trips_through_to_dict(self) -> None:
+        body = SoftBody.grid(Vector2(0, 0), 2, 2, 10, 2, 1, pygame.Color("black"), 100)
+        data = body.to_dict()
+        assert data["ball_ids"] == [ball.id for ball in body.balls]
+        assert len(data["links"]) == len(data["restLengths"]) == body.linkCount()
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_sync_rebuilds_only_on_change(self) -> None:
+        engine = make_engine()
+        body = SoftBody.grid(Vector2(0, 0), 3, 3, 10, 2, 1, pygame.Color("black"), 100)
+        engine.current_elements["softbody"].append(body)
+        engine.apply_spring_forces()
+        engine.apply_spring_forces()
+        assert engine.spring_network.rebuilds == 1
+        body.removeBall(body.balls[4])
+        engine.apply_spring_forces()
+        assert engine.spring_network.rebuilds == 2
+
+    def test_edited_stiffness_is_picked_up(self) -> None:
+        engine = make_engine()
+        a, b = make_ball(0, 0), make_ball(20, 0)
+        spring = Spring(a, b, 10, 1, 2, pygame.Color("green"), 0)
+        engine.current_elements["spring"].append(spring)
+        engine.apply_spring_forces()
+        a.resetForce(True)
+        spring.stiffness = 5
+        engine.apply_spring_forces()
+        assert a.naturalForce == Vector2(50, 0)
+
+    def test_fallback_without_vectorization(self) -> None:
+        balls, springs = random_springs(seed=3)
+        engine = make_engine()
+        engine.current_elements["spring"].extend(springs)
+        engine.vectorized_springs = False
+        engine.apply_spring_forces()
+        expected = forces(balls)
+        for ball in balls:
+            ball.resetForce(True)
+        engine.vectorized_springs = True
+        engine.apply_spring_forces()
+        for (fx, fy), (ex, ey) in zip(forces(balls), expected):
+            assert fx == pytest.approx(ex, abs=1e-9)
+            assert fy == pytest.approx(ey, abs=1e-9)
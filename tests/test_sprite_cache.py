@@ -0,0 +1,166 @@
+"""Unit tests for the gradient sprite cache used by Ball and Option drawing."""
+
+from __future__ import annotations
+
+import pygame
+import pytest
+
+from source.basic.sprite_cache import (
+    EXACT_RADIUS,
+    SpriteCache,
+    drawGradientCircle,
+    drawGradientLayers,
+    gradientSprite,
+    gradientSprites,
+    radiusBucket,
+    renderText,
+    textSprites,
+)
+
+RED = (200, 30, 30)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def canvas() -> pygame.Surface:
+    surface = pygame.Surface((120, 120))
+    surface.fill((255, 255, 255))
+    return surface
+
+
+def surface_of(size: int) -> pygame.Surface:
+    return pygame.Surface((size, size), pygame.SRCALPHA)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache() -> None:
+    for cache in (gradientSprites, textSprites):
+        cache.clear()
+        cache.resetStats()
+
+
+@pytest.fixture(scope="module")
+def font() -> pygame.font.Font:
+    pygame.font.init()
+    return pygame.font.Font(None, 16)
+
+
+# ---------------------------------------------------------------------------
+# Buckets
+# ---------------------------------------------------------------------------
+
+class TestBuckets:
+    def test_small_radii_are_whole_pixels(self) -> None:
+        assert [radiusBucket(r) for r in (0.4, 1.0, 7.9, 63.5)] == [0, 1, 7, 63]
+
+    def test_large_radii_are_geometric(self) -> None:
+        buckets = {radiusBucket(r / 10) for r in range(2000, 4000)}
+        assert len(buckets) < 35
+        for r in (100.0, 333.3, 1000.0):
+            assert radiusBucket(r) == pytest.approx(r, rel=0.012)
+
+    def test_buckets_are_monotonic(self) -> None:
+        radii = [EXACT_RADIUS / 2 + i * 0.37 for i in range(1000)]
+        buckets = [radiusBucket(r) for r in radii]
+        assert buckets == sorted(buckets)
+
+
+# ---------------------------------------------------------------------------
+# Sprites
+# ---------------------------------------------------------------------------
+
+class TestSprites:
+    def test_sprite_matches_layered_drawing(self) -> None:
+        expected, actual = canvas(), canvas()
+        drawGradientLayers(expected, RED, (60, 60), 30)
+        drawGradientCircle(actual, RED, (60, 60), 30)
+        for point in [(60, 60), (45, 60), (60, 35), (80, 75), (31, 60), (10, 10)]:
+            a, b = expected.get_at(point), actual.get_at(point)
+            assert all(abs(x - y) <= 2 for x, y in zip(a, b)), point
+
+    def test_same_color_and_bucket_reuse_one_sprite(self) -> None:
+        first = gradientSprite(RED, 12)
+        assert gradientSprite(pygame.Color(*RED), 12) is first
+        assert gradientSprite((*RED, 128), 12) is first
+        assert gradientSprite(RED, 13) is not first
+        assert gradientSprites.stats()["hits"] == 2
+        assert gradientSprites.stats()["misses"] == 2
+        assert gradientSprites.hitRate() == 0.5
+
+    def test_zoom_reuses_bucketed_sprites(self) -> None:
+        surface = pygame.Surface((400, 400))
+        for frame in range(200):
+            drawGradientCircle(surface, RED, (200, 200), 100 + frame * 0.1)
+        assert gradientSprites.misses < 10
+
+    def test_tiny_circles_are_skipped(self) -> None:
+        drawGradientCircle(canvas(), RED, (60, 60), 0.5)
+        assert len(gradientSprites) == 0
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+class TestCache:
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = SpriteCache(maxBytes=3 * 10 * 10 * 4)
+        for key in "abc":
+            cache.get(key, lambda: surface_of(10))
+        cache.get("a", lambda: surface_of(10))
+        cache.get("d", lambda: surface_of(10))
+        assert list(cache.sprites) == ["c", "a", "d"]
+        assert cache.evictions == 1
+        assert cache.bytes == 3 * 10 * 10 * 4
+
+    def test_oversized_sprite_is_not_cached(self) -> None:
+        cache = SpriteCache(maxBytes=100)
+        sprite = cache.get("big", lambda: surface_of(10))
+        assert sprite.get_size() == (10, 10)
+        assert len(cache) == 0 and cache.bytes == 0
+
+    def test_oversized_circle_is_drawn_directly(self) -> None:
+        cache_limit = gradientSprites.maxBytes
+        gradientSprites.maxBytes = 1000
+        try:
+            surface = canvas()
+            drawGradientCircle(surface, RED, (60, 60), 30)
+        finally:
+            gradientSprites.maxBytes = cache_limit
+        assert len(gradientSprites) == 0
+        assert surface.get_at((60, 35))[:3] != (255, 255, 255)
+
+    def test_clear_keeps_statistics(self) -> None:
+        cache = SpriteCache()
+        cache.get("a", lambda: surface_of(4))
+        cache.clear()
+        assert (len(cache), cache.bytes, cache.misses) == (0, 0, 1)
+
+
+# ---------------------------------------------------------------------------
+# Text
+# ---------------------------------------------------------------------------
+
+class TestText:
+    def test_unchanged_line_is_not_rendered_again(self, font: pygame.font.Font) -> None:
+        first = renderText(font, "fps = 60", True, "black")
+        for _ in range(5):
+            assert renderText(font, "fps = 60", True, "black") is first
+        assert (textSprites.hits, textSprites.misses) == (5, 1)
+
+    def test_changed_value_or_color_is_rendered(self, font: pygame.font.Font) -> None:
+        first = renderText(font, "fps = 60", True, "black")
+        assert renderText(font, "fps = 59", True, "black") is not first
+        assert renderText(font, "fps = 60", True, "red") is not first
+        assert textSprites.misses == 3
+
+    def test_color_objects_share_the_tuple_entry(self, font: pygame.font.Font) -> None:
+        first = renderText(font, "x", True, (10, 20, 30, 255))
+        assert renderText(font, "x", True, pygame.Color(10, 20, 30)) is first
+
+    def test_matches_font_render(self, font: pygame.font.Font) -> None:
+        expected = font.render("质量： 1.0", True, "darkgreen")
+        actual = renderText(font, "质量： 1.0", True, "darkgreen")
+        assert pygame.image.tostring(actual, "RGBA") == pygame.image.tostring(expected, "RGBA")
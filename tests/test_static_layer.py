@@ -0,0 +1,144 @@
+"""Unit tests for the off-screen layer of static walls."""
+
+from __future__ import annotations
+
+import pygame
+
+from source.basic import StaticLayer, Vector2, Wall
+from source.basic.static_layer import COLOR_KEY
+
+WIDTH, HEIGHT = 200, 150
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class View:
+    """The parts of ``Game`` that ``Wall.draw`` and the layer use."""
+
+    def __init__(self) -> None:
+        self.screen = pygame.Surface((WIDTH, HEIGHT))
+        self.x = 0.0
+        self.y = 0.0
+        self.ratio = 1.0
+
+    def realToScreen(self, r: float, x: float | None = None) -> float:
+        return (r + (x or 0)) * self.ratio
+
+
+def make_wall(x: float, y: float, color="blue", static: bool = True) -> Wall:
+    wall = Wall([Vector2(x, y), Vector2(x + 40, y), Vector2(x + 40, y + 10),
+                 Vector2(x, y + 10)], color)
+    wall.isStatic = static
+    return wall
+
+
+def settled(layer: StaticLayer, view: View, walls: list[Wall]) -> bool:
+    """Draw one frame after the camera has stayed put for a frame."""
+    layer.endFrame(view)
+    view.screen.fill((255, 255, 255))
+    return layer.draw(view, walls)
+
+
+def direct(view: View, walls: list[Wall]) -> bytes:
+    view.screen.fill((255, 255, 255))
+    for wall in walls:
+        wall.draw(view)
+    return pygame.image.tostring(view.screen, "RGB")
+
+
+# ---------------------------------------------------------------------------
+# Drawing
+# ---------------------------------------------------------------------------
+
+class TestDrawing:
+    def test_layer_matches_direct_drawing(self) -> None:
+        view, layer = View(), StaticLayer()
+        walls = [make_wall(10, 10), make_wall(30, 15, "red"), make_wall(120, 100, "black")]
+        assert settled(layer, view, walls)
+        cached = pygame.image.tostring(view.screen, "RGB")
+        assert cached == direct(view, walls)
+
+    def test_kinematic_walls_are_left_out(self) -> None:
+        view, layer = View(), StaticLayer()
+        static, moving = make_wall(10, 10), make_wall(100, 100, static=False)
+        assert settled(layer, view, [static, moving])
+        assert layer.walls == [static]
+        assert view.screen.get_at((120, 105))[:3] == (255, 255, 255)
+
+    def test_no_static_walls_means_no_layer(self) -> None:
+        view, layer = View(), StaticLayer()
+        assert not settled(layer, view, [make_wall(10, 10, static=False)])
+        assert layer.stats()["rebuilds"] == 0
+
+    def test_highlight_is_not_baked_in(self) -> None:
+        view, layer = View(), StaticLayer()
+        wall = make_wall(10, 10)
+        wall.highLighted = True
+        assert settled(layer, view, [wall])
+        assert wall.highLighted
+        assert view.screen.get_at((9, 9))[:3] == (255, 255, 255)
+
+    def test_color_key_avoids_wall_colors(self) -> None:
+        view, layer = View(), StaticLayer()
+        wall = make_wall(10, 10, pygame.Color(*COLOR_KEY))
+        assert settled(layer, view, [wall])
+        assert view.screen.get_at((20, 15))[:3] == COLOR_KEY
+        assert StaticLayer.colorKeyFor([wall]) != COLOR_KEY
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+class TestInvalidation:
+    def test_unchanged_scene_reuses_the_layer(self) -> None:
+        view, layer = View(), StaticLayer()
+        walls = [make_wall(10, 10)]
+        for _ in range(5):
+            assert settled(layer, view, walls)
+        assert layer.rebuilds == 1
+        assert layer.blits == 5
+
+    def test_moving_camera_draws_directly_until_it_stops(self) -> None:
+        view, layer = View(), StaticLayer()
+        walls = [make_wall(10, 10)]
+        settled(layer, view, walls)
+        for _ in range(3):
+            view.x += 5
+            assert not layer.draw(view, walls)
+            layer.endFrame(view)
+        assert layer.misses == 3
+        view.screen.fill((255, 255, 255))
+        assert layer.draw(view, walls)
+        assert layer.rebuilds == 2
+        assert pygame.image.tostring(view.screen, "RGB") == direct(view, walls)
+
+    def test_zoom_invalidates(self) -> None:
+        view, layer = View(), StaticLayer()
+        walls = [make_wall(10, 10)]
+        settled(layer, view, walls)
+        view.ratio = 2
+        settled(layer, view, walls)
+        assert layer.rebuilds == 2
+        assert view.screen.get_at((90, 30))[:3] == (0, 0, 255)
+
+    def test_wall_changes_invalidate(self) -> None:
+        view, layer = View(), StaticLayer()
+        wall = make_wall(10, 10)
+        walls = [wall]
+        settled(layer, view, walls)
+
+        walls.append(make_wall(100, 100))  # created
+        settled(layer, view, walls)
+        wall.color = "red"  # edited
+        settled(layer, view, walls)
+        walls.pop()  # deleted
+        settled(layer, view, walls)
+        assert layer.rebuilds == 4
+
+        wall.position = Vector2(60, 60)  # dragged: moves on update, then turns kinematic
+        wall.update(0)
+        assert not settled(layer, view, walls)
+        assert layer.surface is None
@@ -0,0 +1,142 @@
+"""Unit tests for the Wall geometry cache."""
+
+from __future__ import annotations
+
+import pygame
+import pytest
+
+from source.basic import Vector2, Wall
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_wall(points: list[tuple[float, float]], isLine: bool = False) -> Wall:
+    return Wall([Vector2(x, y) for x, y in points], pygame.Color("blue"), isLine)
+
+
+def make_box(x0: float = 0, y0: float = 0, x1: float = 10, y1: float = 4) -> Wall:
+    return make_wall([(x0, y0), (x1, y0), (x1, y1), (x0, y1)])
+
+
+# ---------------------------------------------------------------------------
+# Cached geometry
+# ---------------------------------------------------------------------------
+
+class TestGeometry:
+    def test_aabb_and_thickness(self) -> None:
+        wall = make_box()
+        assert wall.aabb == (0, 0, 10, 4)
+        assert wall.thickness == pytest.approx(4)
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_normals_point_outwards_for_either_winding(self, reverse: bool) -> None:
+        points = [(0, 0), (10, 0), (10, 4), (0, 4)]
+        wall = make_wall(points[::-1] if reverse else points)
+        center = Vector2(5, 2)
+        for (nx, ny), offset in zip(wall.normals, wall.offsets):
+            assert nx * center.x + ny * center.y < offset
+
+    def test_convexity(self) -> None:
+        assert make_box().isConvex
+        dart = make_wall([(0, 0), (10, 5), (0, 10), (3, 5)])
+        assert not dart.isConvex
+
+    def test_degenerate_wall_contains_nothing(self) -> None:
+        line = make_wall([(0, 0), (10, 0), (10, 0), (0, 0)], isLine=True)
+        assert line.isDegenerate
+        assert not line.isPosOn(None, Vector2(5, 0))
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+class TestQueries:
+    @pytest.mark.parametrize(
+        "point, inside",
+        [((5, 2), True), ((11, 2), False), ((5, -1), False), ((0.5, 3.5), True)],
+    )
+    def test_convex_containment(self, point: tuple[float, float], inside: bool) -> None:
+        assert make_box().isPosOn(None, Vector2(*point)) is inside
+
+    @pytest.mark.parametrize(
+        "point, inside",
+        [((5, 5), True), ((2, 5), False), ((1, 1), True), ((9, 9), False)],
+    )
+    def test_concave_containment(self, point: tuple[float, float], inside: bool) -> None:
+        dart = make_wall([(0, 0), (10, 5), (0, 10), (3, 5)])
+        assert dart.isPosOn(None, Vector2(*point)) is inside
+
+    def test_closest_edge(self) -> None:
+        wall = make_box()
+        index, distance = wall.getClosestEdge(Vector2(5, 3.5))
+        assert index == 2  # (10, 4) -> (0, 4)
+        assert distance == pytest.approx(-0.5)
+
+        index, distance = wall.getClosestEdge(Vector2(13, 2))
+        assert index == 1
+        assert distance == pytest.approx(3)
+
+
+# ---------------------------------------------------------------------------
+# Cache invalidation
+# ---------------------------------------------------------------------------
+
+class TestUpdate:
+    def test_unmoved_wall_keeps_lines(self) -> None:
+        wall = make_box()
+        wall.update(1 / 60)
+        lines = wall.lines
+        wall.update(1 / 60)
+        assert wall.lines is lines
+
+    def test_moving_wall_refreshes_geometry(self) -> None:
+        wall = make_box()
+        wall.update(1 / 60)
+        wall.position = wall.position + Vector2(100, 0)
+        wall.update(1 / 60)
+        assert wall.aabb == (100, 0, 110, 4)
+        assert wall.lines[0].start == Vector2(100, 0)
+        assert wall.isPosOn(None, Vector2(105, 2))
+        assert not wall.isPosOn(None, Vector2(5, 2))
+
+    def test_first_update_keeps_only_first_line_infinite(self) -> None:
+        floor = make_wall([(0, 0), (10, 0), (10, 4), (0, 4)], isLine=True)
+        assert all(line.isLine for line in floor.lines)
+        floor.update(1 / 60)
+        assert [line.isLine for line in floor.lines] == [True, False, False, False]
+
+
+# ---------------------------------------------------------------------------
+# Static / kinematic state
+# ---------------------------------------------------------------------------
+
+class TestStaticState:
+    def settle(self, wall: Wall) -> None:
+        for _ in range(Wall.staticFrames + 1):
+            wall.update(1 / 60)
+
+    def test_new_wall_is_kinematic_until_settled(self) -> None:
+        wall = make_box()
+        assert not wall.isStatic
+        self.settle(wall)
+        assert wall.isStatic
+
+    def test_moving_wall_becomes_kinematic(self) -> None:
+        wall = make_box()
+        self.settle(wall)
+        wall.position = wall.position + Vector2(5, 0)
+        wall.update(0)
+        assert not wall.isStatic
+        assert wall.aabb == (5, 0, 15, 4)
+        self.settle(wall)
+        assert wall.isStatic
+
+    def test_make_kinematic_resets_the_countdown(self) -> None:
+        wall = make_box()
+        self.settle(wall)
+        wall.makeKinematic()
+        assert not wall.isStatic
+        assert wall.stillFrames == 0
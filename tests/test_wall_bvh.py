@@ -0,0 +1,204 @@
+"""Unit tests for source.physics.wall_bvh."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pygame
+import pytest
+
+from source.basic import Ball, Vector2, Wall
+from source.physics.engine import PhysicsEngine
+from source.physics.wall_bvh import WallBVH
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_plank(x: float, y: float, length: float, angle: float, width: float = 4) -> Wall:
+    """A ``length`` × ``width`` rectangle centred on ``(x, y)``, rotated."""
+    c, s = math.cos(angle), math.sin(angle)
+    corners = [(-length / 2, -width / 2), (length / 2, -width / 2),
+               (length / 2, width / 2), (-length / 2, width / 2)]
+    return Wall(
+        [Vector2(x + c * u - s * v, y + s * u + c * v) for u, v in corners],
+        pygame.Color("blue"),
+    )
+
+
+def make_course(n: int, seed: int = 0) -> list[Wall]:
+    rng = random.Random(seed)
+    return [
+        make_plank(rng.uniform(0, 1000), rng.uniform(0, 1000),
+                   rng.uniform(10, 60), rng.uniform(0, math.pi))
+        for _ in range(n)
+    ]
+
+
+def brute_query(walls: list[Wall], x0: float, y0: float, x1: float, y1: float) -> list[int]:
+    found = []
+    for i, wall in enumerate(walls):
+        if any(line.isLine for line in wall.lines):
+            found.append(i)
+            continue
+        xs = [v.x for v in wall.vertexes]
+        ys = [v.y for v in wall.vertexes]
+        if not (min(xs) > x1 or max(xs) < x0 or min(ys) > y1 or max(ys) < y0):
+            found.append(i)
+    return found
+
+
+def random_boxes(n: int, seed: int = 1) -> list[tuple[float, float, float, float]]:
+    rng = random.Random(seed)
+    boxes = []
+    for _ in range(n):
+        x, y, r = rng.uniform(-50, 1050), rng.uniform(-50, 1050), rng.uniform(1, 40)
+        boxes.append((x - r, y - r, x + r, y + r))
+    return boxes
+
+
+# ---------------------------------------------------------------------------
+# Tree
+# ---------------------------------------------------------------------------
+
+class TestQuery:
+    def test_matches_brute_force(self) -> None:
+        walls = make_course(300)
+        tree = WallBVH()
+        tree.build(walls)
+        for box in random_boxes(200):
+            assert tree.query(*box) == brute_query(walls, *box)
+
+    def test_empty(self) -> None:
+        tree = WallBVH()
+        tree.build([])
+        assert tree.query(0, 0, 10, 10) == []
+
+    def test_infinite_lines_always_returned(self) -> None:
+        floor = Wall([Vector2(0, 0), Vector2(10, 0), Vector2(10, 5), Vector2(0, 5)],
+                     pygame.Color("grey"), True)
+        tree = WallBVH()
+        tree.build([make_plank(500, 500, 10, 0), floor])
+        assert tree.query(-1000, -1000, -900, -900) == [1]
+
+
+    def test_box_inside_a_large_wall_finds_it(self) -> None:
+        big = Wall([Vector2(0, 0), Vector2(1000, 0), Vector2(1000, 1000), Vector2(0, 1000)],
+                   pygame.Color("grey"))
+        tree = WallBVH()
+        tree.build([big] + make_course(20, seed=5))
+        assert 0 in tree.query(490, 490, 510, 510)
+
+
+class TestSync:
+    def test_dragged_wall_is_refitted(self) -> None:
+        walls = make_course(100)
+        tree = WallBVH()
+        tree.sync(walls)
+        walls[7].position = Vector2(5000, 5000)
+        walls[7].update(0)
+        tree.sync(walls)
+        assert (tree.rebuilds, tree.refits) == (1, 1)
+        assert 7 in tree.query(4990, 4990, 5010, 5010)
+        for box in random_boxes(100, seed=2):
+            assert tree.query(*box) == brute_query(walls, *box)
+
+    def test_unchanged_walls_do_nothing(self) -> None:
+        walls = make_course(50)
+        tree = WallBVH()
+        tree.sync(walls)
+        tree.sync(walls)
+        assert (tree.rebuilds, tree.refits) == (1, 0)
+
+    def test_static_walls_are_frozen(self) -> None:
+        walls = make_course(20)
+        for wall in walls:
+            for _ in range(Wall.staticFrames + 1):
+                wall.update(0)
+        tree = WallBVH()
+        tree.sync(walls)
+        walls[3].position = Vector2(5000, 5000)
+        walls[3].update(0)
+        walls[4].vertexes[0] = Vector2(9000, 9000)  # not via update: unseen
+        walls[4].updateGeometry()
+        tree.sync(walls)
+        assert (tree.rebuilds, tree.refits) == (1, 1)
+        assert tree.query(8990, 8990, 9010, 9010) == []
+
+    def test_added_wall_rebuilds(self) -> None:
+        walls = make_course(50)
+        tree = WallBVH()
+        tree.sync(walls)
+        walls.append(make_plank(2000, 2000, 20, 0))
+        tree.sync(walls)
+        assert tree.rebuilds == 2
+        assert tree.query(1990, 1990, 2010, 2010) == [50]
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+def run_course(threshold: int, steps: int = 10) -> list[tuple[float, float]]:
+    eng = PhysicsEngine([{"type": "ball"}, {"type": "wall"}])
+    eng.wall_bvh_threshold = threshold
+    eng.current_elements["wall"].extend(make_course(100, seed=3))
+    rng = random.Random(4)
+    balls = [
+        Ball(Vector2(rng.uniform(0, 1000), rng.uniform(0, 1000)), 5,
+             pygame.Color("red"), 1,
+             Vector2(rng.uniform(-300, 300), rng.uniform(-300, 300)), [], gravity=1)
+        for _ in range(60)
+    ]
+    eng.current_elements["ball"].extend(balls)
+    for _ in range(steps):
+        for ball in balls:
+            ball.update(1 / 120)
+        eng.resolve_wall_collisions()
+        eng.resolve_vertex_collisions()
+        eng.resolve_line_collisions()
+    return [(b.position.x, b.position.y) for b in balls]
+
+
+class TestEngine:
+    def test_bvh_matches_all_walls(self) -> None:
+        expected = run_course(threshold=10**9)
+        actual = run_course(threshold=0)
+        for (ax, ay), (bx, by) in zip(actual, expected):
+            assert ax == pytest.approx(bx)
+            assert ay == pytest.approx(by)
+
+    def test_ball_deep_inside_a_large_wall_is_pushed_out(self) -> None:
+        def push_out(threshold: int) -> tuple[float, float, float, float]:
+            eng = PhysicsEngine([{"type": "ball"}, {"type": "wall"}])
+            eng.wall_bvh_threshold = threshold
+            big = Wall([Vector2(0, 0), Vector2(1000, 0), Vector2(1000, 1000), Vector2(0, 1000)],
+                       pygame.Color("grey"))
+            eng.current_elements["wall"].extend([big] + make_course(20, seed=6))
+            ball = Ball(Vector2(520, 510), 5, pygame.Color("red"), 1, Vector2(30, 0), [])
+            eng.current_elements["ball"].append(ball)
+            assert big in eng.walls_near_ball(ball)
+            eng.resolve_wall_collisions()
+            return ball.position.x, ball.position.y, ball.velocity.x, ball.velocity.y
+
+        plain = push_out(threshold=10**9)
+        assert push_out(threshold=0) == pytest.approx(plain)
+        assert plain[0] > 520
+
+    def test_walls_near_counts_candidates(self) -> None:
+        eng = PhysicsEngine([{"type": "ball"}, {"type": "wall"}])
+        eng.wall_bvh_threshold = 0
+        eng.current_elements["wall"].extend(make_course(100))
+        eng.refresh_wall_tree()
+        near = eng.walls_near(-100, -100, -90, -90)
+        assert near == []
+        assert eng.wall_pair_tests == 0
+
+    def test_below_threshold_returns_every_wall(self) -> None:
+        eng = PhysicsEngine([{"type": "ball"}, {"type": "wall"}])
+        walls = make_course(5)
+        eng.current_elements["wall"].extend(walls)
+        assert eng.walls_near(-100, -100, -90, -90) == walls
+        assert eng.wall_pair_tests == 5
@@ -0,0 +1,185 @@
+"""Unit tests for source.physics.world_state.WorldState."""
+
+from __future__ import annotations
+
+import copy
+import random
+from functools import partial
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from source.basic import Ball, Vector2  # noqa: E402
+from source.physics.engine import PhysicsEngine  # noqa: E402
+from source.physics.world_state import ArrayBall, RowVector2, WorldState  # noqa: E402
+from tests import helpers  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+make_ball = partial(helpers.make_ball, gravity=1)
+
+
+def random_balls(n: int, seed: int = 0) -> list[Ball]:
+    rng = random.Random(seed)
+    return [
+        make_ball(
+            rng.uniform(-500, 500), rng.uniform(-500, 500),
+            rng.uniform(-20, 20), rng.uniform(-20, 20),
+            mass=rng.uniform(1, 50),
+            charge=rng.choice([0, -3, 2]),
+            gravitation=True,
+        )
+        for _ in range(n)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Binding / views
+# ---------------------------------------------------------------------------
+
+class TestBinding:
+    def test_add_makes_view(self) -> None:
+        ws = WorldState()
+        ball = make_ball(3, 4, 1, 2, mass=7)
+        ws.add(ball)
+        assert isinstance(ball, ArrayBall)
+        assert isinstance(ball.position, RowVector2)
+        assert ball.position.x == 3
+        assert ball.mass == 7
+        assert ws.view("vel")[0].tolist() == [1, 2]
+
+    def test_attribute_writes_reach_arrays(self) -> None:
+        ws = WorldState()
+        ball = ws.add(make_ball(0, 0))
+        ball.position.x = 10
+        ball.velocity = Vector2(5, 6)
+        ball.position += Vector2(1, 1)
+        ball.mass = 3
+        assert ws.pos[0].tolist() == [11, 1]
+        assert ws.vel[0].tolist() == [5, 6]
+        assert ws.mass[0] == 3
+
+    def test_grows_past_capacity(self) -> None:
+        ws = WorldState(capacity=2)
+        balls = [ws.add(make_ball(i, 0)) for i in range(5)]
+        assert ws.capacity >= 5
+        assert [b.position.x for b in balls] == [0, 1, 2, 3, 4]
+
+    def test_remove_restores_plain_ball(self) -> None:
+        ws = WorldState()
+        a, b, c = (ws.add(make_ball(i, 0)) for i in range(3))
+        ws.remove(a)
+        assert type(a) is Ball
+        assert a.position == Vector2(0, 0)
+        assert len(ws) == 2
+        # Last row was moved into the hole
+        assert c.position.x == 2
+        assert b.position.x == 1
+
+    def test_sync(self) -> None:
+        ws = WorldState()
+        a, b = make_ball(0, 0), make_ball(1, 0)
+        ws.sync([a, b])
+        assert len(ws) == 2
+        ws.sync([b])
+        assert type(a) is Ball
+        assert b in ws
+
+    def test_deepcopy_is_detached(self) -> None:
+        ws = WorldState()
+        ball = ws.add(make_ball(2, 3))
+        clone = copy.deepcopy(ball)
+        assert type(clone) is Ball
+        clone.position.x = 100
+        assert ball.position.x == 2
+
+
+# ---------------------------------------------------------------------------
+# Whole-array kernels vs. object path
+# ---------------------------------------------------------------------------
+
+class TestKernels:
+    def test_environment(self) -> None:
+        ws = WorldState()
+        ball = ws.add(make_ball(0, 0))
+        ws.apply_environment([
+            {"type": "gravity", "value": "0.5"},
+            {"type": "airResistance", "value": "0.9"},
+            {"type": "collisionFactor", "value": "0.7"},
+        ])
+        assert ball.gravity == 0.5
+        assert ball.airResistance == 0.9
+        assert ball.collisionFactor == 0.7
+
+    def test_step_matches_object_path(self) -> None:
+        reference = random_balls(12)
+        for i in range(len(reference)):
+            for j in range(i + 1, len(reference)):
+                reference[i].gravitate(reference[j])
+                if reference[i].electricCharge and reference[j].electricCharge:
+                    reference[i].electricForce(reference[j])
+        for ball in reference:
+            ball.update(0.01)
+
+        ws = WorldState()
+        for ball in random_balls(12):
+            ws.add(ball)
+        ws.step(0.01)
+
+        for expected, actual in zip(reference, ws.balls):
+            assert actual.position.x == pytest.approx(expected.position.x)
+            assert actual.position.y == pytest.approx(expected.position.y)
+            assert actual.velocity.x == pytest.approx(expected.velocity.x)
+            assert actual.velocity.y == pytest.approx(expected.velocity.y)
+
+    def test_air_resistance_matches_object_path(self) -> None:
+        reference = make_ball(0, 0, vx=30, vy=-10)
+        reference.airResistance = 0.5
+        reference.update(0.1)
+
+        ws = WorldState()
+        ball = ws.add(make_ball(0, 0, vx=30, vy=-10))
+        ball.airResistance = 0.5
+        ws.step(0.1)
+
+        assert ball.velocity.x == pytest.approx(reference.velocity.x)
+        assert ball.velocity.y == pytest.approx(reference.velocity.y)
+        assert ball.position.x == pytest.approx(reference.position.x)
+        assert ball.position.y == pytest.approx(reference.position.y)
+
+    def test_ball_accelerate_includes_field_force(self) -> None:
+        ws = WorldState()
+        a = ws.add(make_ball(0, 0, mass=10, gravitation=True))
+        ws.add(make_ball(100, 0, mass=10, gravitation=True))
+        a.gravity = 0
+        ws.apply_gravitation()
+        assert a.accelerate().x > 0
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+class TestEngine:
+    def test_enable_and_disable(self) -> None:
+        eng = PhysicsEngine([{"type": "ball"}])
+        ball = make_ball(0, 0)
+        eng.current_elements["ball"].append(ball)
+        eng.enable_array_state()
+        assert isinstance(ball, ArrayBall)
+        eng.enable_array_state(False)
+        assert type(ball) is Ball
+        assert eng.world_state is None
+
+    def test_step_binds_new_balls(self) -> None:
+        eng = PhysicsEngine([{"type": "ball"}])
+        eng.enable_array_state()
+        ball = make_ball(0, 0, vx=10)
+        eng.current_elements["ball"].append(ball)
+        eng.step_array_state(0.1, [{"type": "gravity", "value": "0"}])
+        assert ball in eng.world_state
+        assert ball.position.x == pytest.approx(1.0)